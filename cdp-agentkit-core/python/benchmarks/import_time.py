@@ -0,0 +1,66 @@
+"""Benchmark the cold-start cost of describing every CDP action.
+
+Each scenario runs in a fresh interpreter so module caches do not carry over between runs.
+
+Usage:
+    python benchmarks/import_time.py [--runs N]
+"""
+
+import argparse
+import importlib.util
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    # The pre-registry behaviour: import every action module and instantiate every action.
+    "eager (CDP_ACTIONS)": (
+        "from cdp_agentkit_core.actions import CDP_ACTIONS\n"
+        "[(a.name, a.description, a.args_schema) for a in CDP_ACTIONS]"
+    ),
+    # The manifest-backed registry used by toolkits.
+    "lazy (manifest)": (
+        "from cdp_agentkit_core.actions import get_cdp_action_specs\n"
+        "[(s.name, s.description, s.args_schema) for s in get_cdp_action_specs()]"
+    ),
+    "lazy + first invocation (pyth_fetch_price_feed_id)": (
+        "from cdp_agentkit_core.actions import load_cdp_action\n"
+        "load_cdp_action('pyth_fetch_price_feed_id')"
+    ),
+    # What an agent pays to build its tools; needs cdp-langchain installed.
+    "toolkit (cdp_langchain.agent_toolkits)": "import cdp_langchain.agent_toolkits",
+    "baseline (python -c pass)": "pass",
+}
+
+
+def time_scenario(code: str, runs: int) -> list[float]:
+    """Run a snippet in fresh interpreters and return the wall-clock time of each run in ms."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    """Print the median and min cold-start time of each scenario."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10, help="Interpreter launches per scenario")
+    args = parser.parse_args()
+
+    # Warm the OS file cache so the first scenario is not penalised.
+    time_scenario(SCENARIOS["eager (CDP_ACTIONS)"], 1)
+
+    print(f"{'scenario':<52} {'median ms':>10} {'min ms':>10}")
+    for name, code in SCENARIOS.items():
+        if "cdp_langchain" in code and importlib.util.find_spec("cdp_langchain") is None:
+            print(f"{name:<52} {'skipped: cdp-langchain is not installed':>21}")
+            continue
+        timings = time_scenario(code, args.runs)
+        print(f"{name:<52} {statistics.median(timings):>10.1f} {min(timings):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
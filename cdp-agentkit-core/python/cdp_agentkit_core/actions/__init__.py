@@ -1,42 +1,55 @@
+import importlib
+from typing import Any
+
 from cdp_agentkit_core.actions.cdp_action import CdpAction
-from cdp_agentkit_core.actions.deploy_nft import DeployNftAction
-from cdp_agentkit_core.actions.deploy_token import DeployTokenAction
-from cdp_agentkit_core.actions.get_balance import GetBalanceAction
-from cdp_agentkit_core.actions.get_balance_nft import GetBalanceNftAction
-from cdp_agentkit_core.actions.get_wallet_details import GetWalletDetailsAction
-from cdp_agentkit_core.actions.mint_nft import MintNftAction
-from cdp_agentkit_core.actions.pyth.fetch_price import PythFetchPriceAction
-from cdp_agentkit_core.actions.pyth.fetch_price_feed_id import PythFetchPriceFeedIDAction
-from cdp_agentkit_core.actions.register_basename import RegisterBasenameAction
-from cdp_agentkit_core.actions.request_faucet_funds import RequestFaucetFundsAction
-from cdp_agentkit_core.actions.trade import TradeAction
-from cdp_agentkit_core.actions.transfer import TransferAction
-from cdp_agentkit_core.actions.transfer_nft import TransferNftAction
-from cdp_agentkit_core.actions.wow.buy_token import WowBuyTokenAction
-from cdp_agentkit_core.actions.wow.create_token import WowCreateTokenAction
-from cdp_agentkit_core.actions.wow.sell_token import WowSellTokenAction
-from cdp_agentkit_core.actions.wrap_eth import WrapEthAction
-
-
-# WARNING: All new CdpAction subclasses must be imported above, otherwise they will not be discovered
-# by get_all_cdp_actions(). The import ensures the class is registered as a subclass of CdpAction.
+from cdp_agentkit_core.actions.registry import (
+    CDP_ACTION_MODULES,
+    CdpActionSpec,
+    get_cdp_action_specs,
+    import_cdp_action_modules,
+    load_cdp_action,
+)
+
+
+# WARNING: All new CdpAction subclasses must be registered in CDP_ACTION_MODULES
+# (cdp_agentkit_core/actions/registry.py), otherwise they will not be discovered by
+# get_all_cdp_actions(). Action modules are imported lazily, on first attribute access.
 def get_all_cdp_actions() -> list[type[CdpAction]]:
     """Retrieve all subclasses of CdpAction defined in the package."""
+    import_cdp_action_modules()
+
     actions = []
     for action in CdpAction.__subclasses__():
         actions.append(action())
     return actions
 
 
-CDP_ACTIONS = get_all_cdp_actions()
+def __getattr__(name: str) -> Any:
+    """Import action classes and CDP_ACTIONS on first access."""
+    if name == "CDP_ACTIONS":
+        value: Any = get_all_cdp_actions()
+    elif name in CDP_ACTION_MODULES:
+        value = getattr(importlib.import_module(CDP_ACTION_MODULES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CDP_ACTIONS",
+    "BatchMintNftAction",
+    "BatchTransferAction",
+    "BatchTransferNftAction",
     "CdpAction",
+    "CdpActionSpec",
     "DeployNftAction",
     "DeployTokenAction",
     "GetBalanceAction",
     "GetBalanceNftAction",
+    "GetPortfolioAction",
+    "GetTransactionStatusAction",
     "GetWalletDetailsAction",
     "MintNftAction",
     "RegisterBasenameAction",
@@ -46,8 +59,11 @@ __all__ = [
     "TransferNftAction",
     "WowBuyTokenAction",
     "WowCreateTokenAction",
+    "WowQuoteLadderAction",
     "WowSellTokenAction",
     "WrapEthAction",
     "PythFetchPriceFeedIDAction",
     "PythFetchPriceAction",
+    "get_cdp_action_specs",
+    "load_cdp_action",
 ]
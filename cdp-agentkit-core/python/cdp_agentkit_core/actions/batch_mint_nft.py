@@ -0,0 +1,168 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from cdp import Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.batch import (
+    BatchSubmission,
+    aconfirm_batch,
+    asubmit_batch,
+    confirm_batch,
+    format_batch,
+    submit_batch,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
+
+BATCH_MINT_NFT_PROMPT = """
+This tool will mint NFTs (ERC-721) from a contract to many destination addresses in a single call, e.g. for a collection drop. Use it instead of calling mint_nft once per NFT.
+It takes the contract address of the NFT onchain and the list of destination addresses onchain that will receive the NFTs, each with the number of NFTs to mint to it.
+Do not use the contract address as a destination address. If you are unsure of the destination addresses, please ask the user before proceeding.
+The result lists the outcome of every mint; mints that are still pending can be checked on with get_transaction_status.
+"""
+
+
+class BatchMintNftRecipient(BaseModel):
+    """A destination of a batch NFT mint."""
+
+    destination: str = Field(
+        ...,
+        description="The destination address that will receive the NFTs onchain, e.g. `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+    )
+    quantity: str = Field(
+        default="1", description="The number of NFTs to mint to the destination, e.g. `1`, `5`"
+    )
+
+
+class BatchMintNftInput(BaseModel):
+    """Input argument schema for batch mint NFT action."""
+
+    contract_address: str = Field(
+        ...,
+        description="The contract address of the NFT (ERC-721) to mint, e.g. `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+    )
+    recipients: list[BatchMintNftRecipient] = Field(
+        ...,
+        min_length=1,
+        description="The destination addresses and the number of NFTs to mint to each of them",
+    )
+
+
+def _group_recipients(
+    recipients: list[dict | BatchMintNftRecipient],
+) -> list[BatchMintNftRecipient]:
+    """Merge the recipients per destination, so each destination takes a single mint call."""
+    quantities: dict[str, int] = {}
+    for recipient in recipients:
+        if not isinstance(recipient, BatchMintNftRecipient):
+            recipient = BatchMintNftRecipient(**recipient)
+        if not recipient.quantity.isdigit() or int(recipient.quantity) < 1:
+            raise ValueError(f"Invalid quantity {recipient.quantity} for {recipient.destination}")
+        quantities[recipient.destination] = quantities.get(recipient.destination, 0) + int(
+            recipient.quantity
+        )
+
+    return [
+        BatchMintNftRecipient(destination=destination, quantity=str(quantity))
+        for destination, quantity in quantities.items()
+    ]
+
+
+def _mint_to(wallet: Wallet, contract_address: str) -> Callable[[BatchMintNftRecipient], Any]:
+    return lambda recipient: call_upstream(
+        wallet.invoke_contract,
+        contract_address=contract_address,
+        method="mint",
+        args={"to": recipient.destination, "quantity": recipient.quantity},
+    )
+
+
+def _describe(contract_address: str) -> Callable[[BatchMintNftRecipient], str]:
+    return lambda recipient: (
+        f"mint of {recipient.quantity} NFTs from contract {contract_address} to {recipient.destination}"
+    )
+
+
+def _format_mints(
+    wallet: Wallet,
+    contract_address: str,
+    submissions: list[BatchSubmission[BatchMintNftRecipient]],
+) -> str:
+    """Format the outcome of every mint of the batch."""
+    total = sum(int(submission.item.quantity) for submission in submissions)
+    return format_batch(
+        f"Batch mint of {total} NFTs from contract {contract_address} to {len(submissions)} addresses on network {wallet.network_id}:",
+        ["destination", "quantity"],
+        [
+            ([submission.item.destination, submission.item.quantity], submission)
+            for submission in submissions
+        ],
+    )
+
+
+def batch_mint_nft(
+    wallet: Wallet, contract_address: str, recipients: list[dict | BatchMintNftRecipient]
+) -> str:
+    """Mint NFTs (ERC-721) to many destination addresses, submitting every mint before waiting for any of them.
+
+    Args:
+        wallet (Wallet): The wallet to mint the NFTs from.
+        contract_address (str): The contract address of the NFT (ERC-721) to mint, e.g. `0x036CbD53842c5426634e7929541eC2318f3dCF7e`.
+        recipients (list[dict | BatchMintNftRecipient]): The destination addresses and the number of NFTs to mint to each.
+
+    Returns:
+        str: A table of the outcome of every mint.
+
+    """
+    try:
+        recipients = _group_recipients(recipients)
+    except Exception as e:
+        return f"Error minting NFTs {e!s}"
+
+    submissions = submit_batch(
+        _mint_to(wallet, contract_address), recipients, _describe(contract_address)
+    )
+    confirm_batch(submissions)
+
+    return _format_mints(wallet, contract_address, submissions)
+
+
+async def abatch_mint_nft(
+    wallet: Wallet, contract_address: str, recipients: list[dict | BatchMintNftRecipient]
+) -> str:
+    """Mint NFTs (ERC-721) to many destination addresses, submitting every mint before waiting for any of them.
+
+    Async version of `batch_mint_nft`.
+
+    Args:
+        wallet (Wallet): The wallet to mint the NFTs from.
+        contract_address (str): The contract address of the NFT (ERC-721) to mint, e.g. `0x036CbD53842c5426634e7929541eC2318f3dCF7e`.
+        recipients (list[dict | BatchMintNftRecipient]): The destination addresses and the number of NFTs to mint to each.
+
+    Returns:
+        str: A table of the outcome of every mint.
+
+    """
+    try:
+        recipients = _group_recipients(recipients)
+    except Exception as e:
+        return f"Error minting NFTs {e!s}"
+
+    submissions = await asubmit_batch(
+        _mint_to(wallet, contract_address), recipients, _describe(contract_address)
+    )
+    await aconfirm_batch(submissions)
+
+    return _format_mints(wallet, contract_address, submissions)
+
+
+class BatchMintNftAction(CdpAction):
+    """Batch mint NFT action."""
+
+    name: str = "batch_mint_nft"
+    description: str = BATCH_MINT_NFT_PROMPT
+    args_schema: type[BaseModel] | None = BatchMintNftInput
+    func: Callable[..., str] = batch_mint_nft
+    afunc: Callable[..., Awaitable[str]] = abatch_mint_nft
+    writes: bool = True
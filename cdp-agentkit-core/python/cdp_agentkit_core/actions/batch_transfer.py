@@ -0,0 +1,219 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from cdp import Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.batch import (
+    BatchSubmission,
+    aconfirm_batch,
+    asubmit_batch,
+    confirm_batch,
+    format_batch,
+    submit_batch,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
+
+BATCH_TRANSFER_PROMPT = """
+This tool will transfer an asset from the wallet to many onchain addresses in a single call, e.g. to pay contributors or airdrop tokens. Use it instead of calling transfer once per recipient.
+
+It takes the following inputs:
+- assetId: The asset ID to transfer
+- recipients: The list of recipients, each with a destination (an onchain address, ENS 'example.eth', or Basename 'example.base.eth') and an amount
+- gasless: Whether to do gasless transfers
+
+Important notes:
+- Gasless transfers are only available on base-sepolia and base-mainnet (base) networks for 'usdc' asset
+- Always use gasless transfers when available
+- Always use asset ID 'usdc' when transferring USDC
+- The total of the amounts is checked against the balance of the asset before anything is sent
+- When sending native assets (e.g. 'eth' on base-mainnet), ensure there is sufficient balance for the transfers themselves AND the gas cost of every transfer
+- The result lists the outcome of every transfer; transfers that are still pending can be checked on with get_transaction_status
+"""
+
+
+class BatchTransferRecipient(BaseModel):
+    """A recipient of a batch transfer."""
+
+    destination: str = Field(
+        ...,
+        description="The destination to transfer the funds, e.g. `0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027`, `example.eth`, `example.base.eth`",
+    )
+    amount: str = Field(
+        ..., description="The amount of the asset to transfer, e.g. `15`, `0.000001`"
+    )
+
+
+class BatchTransferInput(BaseModel):
+    """Input argument schema for batch transfer action."""
+
+    asset_id: str = Field(
+        ...,
+        description="The asset ID to transfer, e.g. `eth`, `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+    )
+    recipients: list[BatchTransferRecipient] = Field(
+        ...,
+        min_length=1,
+        description="The recipients and the amount to transfer to each of them",
+    )
+    gasless: bool = Field(
+        default=False,
+        description="whether to do gasless transfers (gasless is available on Base Sepolia and Mainnet for USDC) Always do the gasless option when it is available.",
+    )
+
+
+def _parse_recipients(
+    recipients: list[dict | BatchTransferRecipient],
+) -> list[BatchTransferRecipient]:
+    """Parse the recipients, which arrive as dicts once the input has been validated."""
+    return [
+        recipient
+        if isinstance(recipient, BatchTransferRecipient)
+        else BatchTransferRecipient(**recipient)
+        for recipient in recipients
+    ]
+
+
+def _batch_total(recipients: list[BatchTransferRecipient]) -> Decimal:
+    """Add up the amounts of a batch, rejecting amounts that are not positive numbers."""
+    total = Decimal(0)
+    for recipient in recipients:
+        try:
+            amount = Decimal(recipient.amount)
+        except InvalidOperation:
+            raise ValueError(
+                f"Invalid amount {recipient.amount} for {recipient.destination}"
+            ) from None
+        if not amount.is_finite() or amount <= 0:
+            raise ValueError(f"Invalid amount {recipient.amount} for {recipient.destination}")
+        total += amount
+    return total
+
+
+def _check_balance(total: Decimal, balance: Decimal, asset_id: str) -> None:
+    if total > balance:
+        raise ValueError(
+            f"Insufficient balance: the batch sends {total} of {asset_id}, but the wallet holds {balance}"
+        )
+
+
+def _format_transfers(
+    asset_id: str, total: Decimal, submissions: list[BatchSubmission[BatchTransferRecipient]]
+) -> str:
+    """Format the outcome of every transfer of the batch."""
+    return format_batch(
+        f"Batch transfer of {total} of {asset_id} to {len(submissions)} recipients:",
+        ["destination", "amount"],
+        [
+            ([submission.item.destination, submission.item.amount], submission)
+            for submission in submissions
+        ],
+    )
+
+
+def _transfer_to(
+    wallet: Wallet, asset_id: str, gasless: bool
+) -> Callable[[BatchTransferRecipient], Any]:
+    return lambda recipient: call_upstream(
+        wallet.transfer,
+        amount=recipient.amount,
+        asset_id=asset_id,
+        destination=recipient.destination,
+        gasless=gasless,
+    )
+
+
+def _describe(asset_id: str) -> Callable[[BatchTransferRecipient], str]:
+    return lambda recipient: (
+        f"transfer of {recipient.amount} of {asset_id} to {recipient.destination}"
+    )
+
+
+def batch_transfer(
+    wallet: Wallet,
+    asset_id: str,
+    recipients: list[dict | BatchTransferRecipient],
+    gasless: bool = False,
+) -> str:
+    """Transfer an asset to many destinations onchain, submitting every transfer before waiting for any of them.
+
+    Args:
+        wallet (Wallet): The wallet to transfer the asset from.
+        asset_id (str): The asset ID to transfer (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e").
+        recipients (list[dict | BatchTransferRecipient]): The destination and amount of each transfer.
+        gasless (bool): Whether to send gasless transfers (Defaults to False.).
+
+    Returns:
+        str: A table of the outcome of every transfer.
+
+    """
+    recipients = _parse_recipients(recipients)
+
+    try:
+        total = _batch_total(recipients)
+        _check_balance(total, call_upstream(wallet.balance, asset_id), asset_id)
+    except Exception as e:
+        return f"Error transferring the assets {e!s}"
+
+    submissions = submit_batch(
+        _transfer_to(wallet, asset_id, gasless),
+        recipients,
+        _describe(asset_id),
+    )
+    confirm_batch(submissions)
+
+    return _format_transfers(asset_id, total, submissions)
+
+
+async def abatch_transfer(
+    wallet: Wallet,
+    asset_id: str,
+    recipients: list[dict | BatchTransferRecipient],
+    gasless: bool = False,
+) -> str:
+    """Transfer an asset to many destinations onchain, submitting every transfer before waiting for any of them.
+
+    Async version of `batch_transfer`.
+
+    Args:
+        wallet (Wallet): The wallet to transfer the asset from.
+        asset_id (str): The asset ID to transfer (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e").
+        recipients (list[dict | BatchTransferRecipient]): The destination and amount of each transfer.
+        gasless (bool): Whether to send gasless transfers (Defaults to False.).
+
+    Returns:
+        str: A table of the outcome of every transfer.
+
+    """
+    recipients = _parse_recipients(recipients)
+
+    try:
+        total = _batch_total(recipients)
+        _check_balance(
+            total, await asyncio.to_thread(call_upstream, wallet.balance, asset_id), asset_id
+        )
+    except Exception as e:
+        return f"Error transferring the assets {e!s}"
+
+    submissions = await asubmit_batch(
+        _transfer_to(wallet, asset_id, gasless),
+        recipients,
+        _describe(asset_id),
+    )
+    await aconfirm_batch(submissions)
+
+    return _format_transfers(asset_id, total, submissions)
+
+
+class BatchTransferAction(CdpAction):
+    """Batch transfer action."""
+
+    name: str = "batch_transfer"
+    description: str = BATCH_TRANSFER_PROMPT
+    args_schema: type[BaseModel] | None = BatchTransferInput
+    func: Callable[..., str] = batch_transfer
+    afunc: Callable[..., Awaitable[str]] = abatch_transfer
+    writes: bool = True
@@ -0,0 +1,222 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from cdp import Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.batch import (
+    BatchSubmission,
+    aconfirm_batch,
+    asubmit_batch,
+    confirm_batch,
+    format_batch,
+    submit_batch,
+)
+from cdp_agentkit_core.utils.preflight import (
+    PreflightError,
+    erc721_transfer_checks,
+    preflight_many,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
+
+BATCH_TRANSFER_NFT_PROMPT = """
+This tool will transfer many NFTs (ERC721 tokens) of one contract from the wallet to other onchain addresses in a single call. Use it instead of calling transfer_nft once per NFT.
+
+It takes the following inputs:
+- contract_address: The NFT contract address
+- transfers: The list of transfers, each with the ID of the NFT to transfer and its destination (can be an onchain address, ENS 'example.eth', or Basename 'example.base.eth')
+- from_address: The address to transfer from, if not the wallet's default address
+
+Important notes:
+- Ensure you have ownership of the NFTs before attempting transfer
+- Ensure there is sufficient native token balance for the gas fees of every transfer
+- The wallet must either own the NFTs or have approval to transfer them
+- Ownership and approval of every NFT are checked onchain first, and NFTs that cannot be transferred are skipped
+- The result lists the outcome of every transfer; transfers that are still pending can be checked on with get_transaction_status
+"""
+
+
+class BatchNftTransfer(BaseModel):
+    """A transfer of a batch NFT transfer."""
+
+    token_id: str = Field(..., description="The ID of the NFT to transfer")
+    destination: str = Field(
+        ...,
+        description="The destination to transfer the NFT, e.g. `0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027`, `example.eth`, `example.base.eth`",
+    )
+
+
+class BatchTransferNftInput(BaseModel):
+    """Input argument schema for batch NFT transfer action."""
+
+    contract_address: str = Field(..., description="The NFT contract address to interact with")
+    transfers: list[BatchNftTransfer] = Field(
+        ..., min_length=1, description="The ID and destination of every NFT to transfer"
+    )
+    from_address: str = Field(
+        default=None,
+        description="The address to transfer from. If not provided, defaults to the wallet's default address",
+    )
+
+
+def _parse_transfers(transfers: list[dict | BatchNftTransfer]) -> list[BatchNftTransfer]:
+    """Parse the transfers, rejecting NFTs that appear more than once."""
+    parsed = [
+        transfer if isinstance(transfer, BatchNftTransfer) else BatchNftTransfer(**transfer)
+        for transfer in transfers
+    ]
+
+    seen: set[str] = set()
+    for transfer in parsed:
+        if transfer.token_id in seen:
+            raise ValueError(f"NFT (ID: {transfer.token_id}) is transferred more than once")
+        seen.add(transfer.token_id)
+    return parsed
+
+
+def _simulate_transfers(
+    wallet: Wallet, contract_address: str, from_addr: str, transfers: list[BatchNftTransfer]
+) -> dict[str, PreflightError]:
+    """Simulate every transfer of the batch with a single read.
+
+    Returns:
+        dict[str, PreflightError]: The error rejecting each NFT that cannot be transferred.
+
+    """
+    rejections = preflight_many(
+        wallet.network_id,
+        [
+            erc721_transfer_checks(
+                contract_address, transfer.token_id, from_addr, wallet.default_address.address_id
+            )
+            for transfer in transfers
+        ],
+    )
+    return {
+        transfer.token_id: rejection
+        for transfer, rejection in zip(transfers, rejections, strict=True)
+        if rejection is not None
+    }
+
+
+def _transfer_from(
+    wallet: Wallet, contract_address: str, from_addr: str, rejections: dict[str, PreflightError]
+) -> Callable[[BatchNftTransfer], Any]:
+    def transfer_from(transfer: BatchNftTransfer) -> Any:
+        if transfer.token_id in rejections:
+            raise rejections[transfer.token_id]
+        return call_upstream(
+            wallet.invoke_contract,
+            contract_address=contract_address,
+            method="transferFrom",
+            args={"from": from_addr, "to": transfer.destination, "tokenId": transfer.token_id},
+        )
+
+    return transfer_from
+
+
+def _describe(contract_address: str) -> Callable[[BatchNftTransfer], str]:
+    return lambda transfer: (
+        f"transfer of NFT (ID: {transfer.token_id}) from contract {contract_address} to {transfer.destination}"
+    )
+
+
+def _format_transfers(
+    contract_address: str, from_addr: str, submissions: list[BatchSubmission[BatchNftTransfer]]
+) -> str:
+    """Format the outcome of every transfer of the batch."""
+    return format_batch(
+        f"Batch transfer of {len(submissions)} NFTs from contract {contract_address} from {from_addr}:",
+        ["token ID", "destination"],
+        [
+            ([submission.item.token_id, submission.item.destination], submission)
+            for submission in submissions
+        ],
+    )
+
+
+def batch_transfer_nft(
+    wallet: Wallet,
+    contract_address: str,
+    transfers: list[dict | BatchNftTransfer],
+    from_address: str | None = None,
+) -> str:
+    """Transfer many NFTs (ERC721 tokens), submitting every transfer before waiting for any of them.
+
+    Args:
+        wallet (Wallet): The wallet to transfer the NFTs from.
+        contract_address (str): The NFT contract address.
+        transfers (list[dict | BatchNftTransfer]): The ID and destination of every NFT to transfer.
+        from_address (str | None): The address to transfer from. Defaults to wallet's default address.
+
+    Returns:
+        str: A table of the outcome of every transfer.
+
+    """
+    try:
+        transfers = _parse_transfers(transfers)
+        from_addr = from_address if from_address is not None else wallet.default_address.address_id
+    except Exception as e:
+        return f"Error transferring the NFTs (contract: {contract_address}): {e!s}"
+
+    rejections = _simulate_transfers(wallet, contract_address, from_addr, transfers)
+    submissions = submit_batch(
+        _transfer_from(wallet, contract_address, from_addr, rejections),
+        transfers,
+        _describe(contract_address),
+    )
+    confirm_batch(submissions)
+
+    return _format_transfers(contract_address, from_addr, submissions)
+
+
+async def abatch_transfer_nft(
+    wallet: Wallet,
+    contract_address: str,
+    transfers: list[dict | BatchNftTransfer],
+    from_address: str | None = None,
+) -> str:
+    """Transfer many NFTs (ERC721 tokens), submitting every transfer before waiting for any of them.
+
+    Async version of `batch_transfer_nft`.
+
+    Args:
+        wallet (Wallet): The wallet to transfer the NFTs from.
+        contract_address (str): The NFT contract address.
+        transfers (list[dict | BatchNftTransfer]): The ID and destination of every NFT to transfer.
+        from_address (str | None): The address to transfer from. Defaults to wallet's default address.
+
+    Returns:
+        str: A table of the outcome of every transfer.
+
+    """
+    try:
+        transfers = _parse_transfers(transfers)
+        from_addr = from_address if from_address is not None else wallet.default_address.address_id
+    except Exception as e:
+        return f"Error transferring the NFTs (contract: {contract_address}): {e!s}"
+
+    rejections = await asyncio.to_thread(
+        _simulate_transfers, wallet, contract_address, from_addr, transfers
+    )
+    submissions = await asubmit_batch(
+        _transfer_from(wallet, contract_address, from_addr, rejections),
+        transfers,
+        _describe(contract_address),
+    )
+    await aconfirm_batch(submissions)
+
+    return _format_transfers(contract_address, from_addr, submissions)
+
+
+class BatchTransferNftAction(CdpAction):
+    """Batch transfer NFT action."""
+
+    name: str = "batch_transfer_nft"
+    description: str = BATCH_TRANSFER_NFT_PROMPT
+    args_schema: type[BaseModel] | None = BatchTransferNftInput
+    func: Callable[..., str] = batch_transfer_nft
+    afunc: Callable[..., Awaitable[str]] = abatch_transfer_nft
+    writes: bool = True
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from pydantic import BaseModel
 
@@ -10,3 +10,6 @@ class CdpAction(BaseModel):
     description: str
     args_schema: type[BaseModel] | None = None
     func: Callable[..., str]
+    afunc: Callable[..., Awaitable[str]] | None = None
+    # Whether the action sends transactions from the wallet's default address.
+    writes: bool = False
@@ -1,9 +1,16 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 DEPLOY_NFT_PROMPT = """
 This tool will deploy an NFT (ERC-721) contract onchain from the wallet.
@@ -42,10 +49,43 @@ def deploy_nft(wallet: Wallet, name: str, symbol: str, base_uri: str) -> str:
 
     """
     try:
-        nft_contract = wallet.deploy_nft(name=name, symbol=symbol, base_uri=base_uri).wait()
+        nft_contract = call_upstream(wallet.deploy_nft, name=name, symbol=symbol, base_uri=base_uri)
+        nft_contract = wait_or_submit(nft_contract, f"deployment of NFT collection {name}")
     except Exception as e:
         return f"Error deploying NFT {e!s}"
 
+    if isinstance(nft_contract, PendingTransaction):
+        return nft_contract.submitted_message()
+
+    return f"Deployed NFT Collection {name} to address {nft_contract.contract_address} on network {wallet.network_id}.\nTransaction hash for the deployment: {nft_contract.transaction.transaction_hash}\nTransaction link for the deployment: {nft_contract.transaction.transaction_link}"
+
+
+async def adeploy_nft(wallet: Wallet, name: str, symbol: str, base_uri: str) -> str:
+    """Deploy an NFT (ERC-721) token collection onchain from the wallet.
+
+    Async version of `deploy_nft`.
+
+    Args:
+        wallet (Wallet): The wallet to deploy the NFT from.
+        name (str): The name of the NFT (ERC-721) token collection to deploy, e.g. `Helpful Hippos`.
+        symbol (str): The symbol of the NFT (ERC-721) token collection to deploy, e.g. `HIPPO`.
+        base_uri (str): The base URI for the NFT (ERC-721) token collection's metadata, e.g. `https://www.helpfulhippos.xyz/metadata/`.
+
+    Returns:
+        str: A message containing the NFT token deployment details.
+
+    """
+    try:
+        nft_contract = await asyncio.to_thread(
+            call_upstream, wallet.deploy_nft, name=name, symbol=symbol, base_uri=base_uri
+        )
+        nft_contract = await await_or_submit(nft_contract, f"deployment of NFT collection {name}")
+    except Exception as e:
+        return f"Error deploying NFT {e!s}"
+
+    if isinstance(nft_contract, PendingTransaction):
+        return nft_contract.submitted_message()
+
     return f"Deployed NFT Collection {name} to address {nft_contract.contract_address} on network {wallet.network_id}.\nTransaction hash for the deployment: {nft_contract.transaction.transaction_hash}\nTransaction link for the deployment: {nft_contract.transaction.transaction_link}"
 
 
@@ -56,3 +96,5 @@ class DeployNftAction(CdpAction):
     description: str = DEPLOY_NFT_PROMPT
     args_schema: type[BaseModel] | None = DeployNftInput
     func: Callable[..., str] = deploy_nft
+    afunc: Callable[..., Awaitable[str]] = adeploy_nft
+    writes: bool = True
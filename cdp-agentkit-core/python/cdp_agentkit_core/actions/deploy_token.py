@@ -1,9 +1,16 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 DEPLOY_TOKEN_PROMPT = """
 This tool will deploy an ERC20 token smart contract. It takes the token name, symbol, and total supply as input.
@@ -35,12 +42,51 @@ def deploy_token(wallet: Wallet, name: str, symbol: str, total_supply: str) -> s
 
     """
     try:
-        token_contract = wallet.deploy_token(name=name, symbol=symbol, total_supply=total_supply)
+        token_contract = call_upstream(
+            wallet.deploy_token, name=name, symbol=symbol, total_supply=total_supply
+        )
 
-        token_contract.wait()
+        result = wait_or_submit(
+            token_contract, f"deployment of ERC20 token contract {name} ({symbol})"
+        )
     except Exception as e:
         return f"Error deploying token {e!s}"
 
+    if isinstance(result, PendingTransaction):
+        return result.submitted_message()
+
+    return f"Deployed ERC20 token contract {name} ({symbol}) with total supply of {total_supply} tokens at address {token_contract.contract_address}. Transaction link: {token_contract.transaction.transaction_link}"
+
+
+async def adeploy_token(wallet: Wallet, name: str, symbol: str, total_supply: str) -> str:
+    """Deploy an ERC20 token smart contract.
+
+    Async version of `deploy_token`.
+
+    Args:
+        wallet (wallet): The wallet to deploy the Token from.
+        name (str): The name of the token (e.g., "My Token")
+        symbol (str): The token symbol (e.g., "USDC", "MEME", "SYM")
+        total_supply (str): The total supply of tokens to mint (e.g., "1000000")
+
+    Returns:
+        str: A message containing the deployed token contract address and details
+
+    """
+    try:
+        token_contract = await asyncio.to_thread(
+            call_upstream, wallet.deploy_token, name=name, symbol=symbol, total_supply=total_supply
+        )
+
+        result = await await_or_submit(
+            token_contract, f"deployment of ERC20 token contract {name} ({symbol})"
+        )
+    except Exception as e:
+        return f"Error deploying token {e!s}"
+
+    if isinstance(result, PendingTransaction):
+        return result.submitted_message()
+
     return f"Deployed ERC20 token contract {name} ({symbol}) with total supply of {total_supply} tokens at address {token_contract.contract_address}. Transaction link: {token_contract.transaction.transaction_link}"
 
 
@@ -51,3 +97,5 @@ class DeployTokenAction(CdpAction):
     description: str = DEPLOY_TOKEN_PROMPT
     args_schema: type[BaseModel] | None = DeployTokenInput
     func: Callable[..., str] = deploy_token
+    afunc: Callable[..., Awaitable[str]] = adeploy_token
+    writes: bool = True
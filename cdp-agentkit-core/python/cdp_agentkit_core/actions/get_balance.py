@@ -1,15 +1,21 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.concurrency import FanOutResult, amap_bounded, map_bounded
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 GET_BALANCE_PROMPT = """
 This tool will get the balance of all the addresses in the wallet for a given asset.
 It takes the asset ID as input. Always use 'eth' for the native asset ETH and 'usdc' for USDC.
 """
 
+# Maximum number of addresses whose balances are fetched concurrently.
+GET_BALANCE_MAX_WORKERS = 8
+
 
 class GetBalanceInput(BaseModel):
     """Input argument schema for get balance action."""
@@ -20,31 +26,76 @@ class GetBalanceInput(BaseModel):
     )
 
 
-def get_balance(wallet: Wallet, asset_id: str) -> str:
+def _format_balances(wallet: Wallet, results: list[FanOutResult]) -> str:
+    """Format per-address balance results, reporting failures next to their address."""
+    balance_lines = []
+    for result in results:
+        if result.ok:
+            balance_lines.append(f"  {result.item.address_id}: {result.value}")
+        else:
+            balance_lines.append(
+                f"  {result.item.address_id}: Error getting balance {result.error!s}"
+            )
+
+    formatted_balances = "\n".join(balance_lines)
+    return f"Balances for wallet {wallet.id}:\n{formatted_balances}"
+
+
+def get_balance(wallet: Wallet, asset_id: str, max_workers: int | None = None) -> str:
     """Get balance for all addresses in the wallet for a given asset.
 
+    Balances are fetched concurrently, at most `max_workers` addresses at a time. An address whose
+    balance cannot be fetched is reported with its error instead of failing the whole call.
+
     Args:
         wallet (Wallet): The wallet to get the balance for.
         asset_id (str): The asset ID to get the balance for (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e")
+        max_workers (int | None): The maximum number of concurrent balance requests. Defaults to `GET_BALANCE_MAX_WORKERS`.
 
     Returns:
         str: A message containing the balance information of all addresses in the wallet.
 
     """
-    # for each address in the wallet, get the balance for the asset
-    balances = {}
+    try:
+        addresses = call_upstream(lambda: wallet.addresses)
+    except Exception as e:
+        return f"Error getting balance for all addresses in the wallet {e!s}"
+
+    results = map_bounded(
+        lambda address: call_upstream(address.balance, asset_id),
+        addresses,
+        max_workers=max_workers or GET_BALANCE_MAX_WORKERS,
+    )
 
+    return _format_balances(wallet, results)
+
+
+async def aget_balance(wallet: Wallet, asset_id: str, max_workers: int | None = None) -> str:
+    """Get balance for all addresses in the wallet for a given asset.
+
+    Async version of `get_balance`.
+
+    Args:
+        wallet (Wallet): The wallet to get the balance for.
+        asset_id (str): The asset ID to get the balance for (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e")
+        max_workers (int | None): The maximum number of concurrent balance requests. Defaults to `GET_BALANCE_MAX_WORKERS`.
+
+    Returns:
+        str: A message containing the balance information of all addresses in the wallet.
+
+    """
     try:
-        for address in wallet.addresses:
-            balance = address.balance(asset_id)
-            balances[address.address_id] = balance
+        addresses = await asyncio.to_thread(call_upstream, lambda: wallet.addresses)
     except Exception as e:
         return f"Error getting balance for all addresses in the wallet {e!s}"
 
-    # Format each balance entry on a new line
-    balance_lines = [f"  {addr}: {balance}" for addr, balance in balances.items()]
-    formatted_balances = "\n".join(balance_lines)
-    return f"Balances for wallet {wallet.id}:\n{formatted_balances}"
+    results = await amap_bounded(
+        lambda address: call_upstream(address.balance, asset_id),
+        addresses,
+        max_workers=max_workers or GET_BALANCE_MAX_WORKERS,
+    )
+
+    return _format_balances(wallet, results)
 
 
 class GetBalanceAction(CdpAction):
@@ -54,3 +105,4 @@ class GetBalanceAction(CdpAction):
     description: str = GET_BALANCE_PROMPT
     args_schema: type[BaseModel] | None = GetBalanceInput
     func: Callable[..., str] = get_balance
+    afunc: Callable[..., Awaitable[str]] = aget_balance
@@ -1,10 +1,11 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
-from cdp.smart_contract import SmartContract
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.retry import read_contract
 
 GET_BALANCE_NFT_PROMPT = """
 This tool will get the NFTs (ERC721 tokens) owned by the wallet for a specific NFT contract.
@@ -44,7 +45,7 @@ def get_balance_nft(
     try:
         check_address = address if address is not None else wallet.default_address.address_id
 
-        owned_tokens = SmartContract.read(
+        owned_tokens = read_contract(
             wallet.network_id, contract_address, "tokensOfOwner", args={"owner": check_address}
         )
 
@@ -58,6 +59,44 @@ def get_balance_nft(
         return f"Error getting NFT balance for address {check_address} in contract {contract_address}: {e!s}"
 
 
+async def aget_balance_nft(
+    wallet: Wallet,
+    contract_address: str,
+    address: str | None = None,
+) -> str:
+    """Get NFT balance for a specific contract.
+
+    Async version of `get_balance_nft`.
+
+    Args:
+        wallet (Wallet): The wallet to check balance from.
+        contract_address (str): The NFT contract address.
+        address (str | None): The address to check balance for. Defaults to wallet's default address.
+
+    Returns:
+        str: A message containing the NFT balance details.
+
+    """
+    try:
+        check_address = address if address is not None else wallet.default_address.address_id
+
+        owned_tokens = await asyncio.to_thread(
+            read_contract,
+            wallet.network_id,
+            contract_address,
+            "tokensOfOwner",
+            args={"owner": check_address},
+        )
+    except Exception as e:
+        return f"Error getting NFT balance for address {check_address} in contract {contract_address}: {e!s}"
+
+    if not owned_tokens:
+        return f"Address {check_address} owns no NFTs in contract {contract_address}"
+
+    token_list = ", ".join(str(token_id) for token_id in owned_tokens)
+    return f"Address {check_address} owns {len(owned_tokens)} NFTs in contract {contract_address}.\nToken IDs: {token_list}"
+
+
 class GetBalanceNftAction(CdpAction):
     """Get NFT balance action."""
 
@@ -65,3 +104,4 @@ class GetBalanceNftAction(CdpAction):
     description: str = GET_BALANCE_NFT_PROMPT
     args_schema: type[BaseModel] | None = GetBalanceNftInput
     func: Callable[..., str] = get_balance_nft
+    afunc: Callable[..., Awaitable[str]] = aget_balance_nft
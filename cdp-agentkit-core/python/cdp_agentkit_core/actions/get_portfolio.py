@@ -0,0 +1,172 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+
+from cdp import Address, Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.concurrency import FanOutResult, amap_bounded, map_bounded
+from cdp_agentkit_core.utils.upstream import call_upstream
+
+GET_PORTFOLIO_PROMPT = """
+This tool will get the balances of every asset held by every address in the wallet in a single call.
+Use it instead of calling get_balance once per asset. It optionally takes a list of asset IDs to
+report; if none are given, it reports every asset with a balance. Always use 'eth' for the native
+asset ETH and 'usdc' for USDC.
+"""
+
+# Maximum number of concurrent balance requests.
+GET_PORTFOLIO_MAX_WORKERS = 8
+
+
+class GetPortfolioInput(BaseModel):
+    """Input argument schema for get portfolio action."""
+
+    asset_ids: list[str] | None = Field(
+        None,
+        description="Optional list of asset IDs to report, e.g. `['eth', 'usdc', '0x036CbD53842c5426634e7929541eC2318f3dCF7e']`. Reports every asset with a balance if omitted.",
+    )
+
+
+def _lookup(balances: dict[str, Decimal], asset_id: str) -> Decimal | None:
+    """Look up an asset's balance in an address balance map, ignoring case."""
+    asset_id = asset_id.lower()
+    for key, amount in balances.items():
+        if key.lower() == asset_id:
+            return amount
+    return None
+
+
+def _missing_pairs(
+    balance_maps: list[FanOutResult[Address, dict[str, Decimal]]], asset_ids: list[str]
+) -> list[tuple[Address, str]]:
+    """List the (address, asset) pairs that the batched balance listing did not cover."""
+    pairs = []
+    for result in balance_maps:
+        for asset_id in asset_ids:
+            if not result.ok or _lookup(result.value, asset_id) is None:
+                pairs.append((result.item, asset_id))
+    return pairs
+
+
+def _format_portfolio(
+    wallet: Wallet,
+    balance_maps: list[FanOutResult[Address, dict[str, Decimal]]],
+    asset_ids: list[str] | None,
+    single_reads: list[FanOutResult[tuple[Address, str], Decimal]],
+) -> str:
+    """Format an address x asset balance table, reporting failures next to their entry."""
+    reads = {(result.item[0].address_id, result.item[1]): result for result in single_reads}
+
+    lines = [f"Portfolio for wallet {wallet.id}:"]
+    for result in balance_maps:
+        address_id = result.item.address_id
+        lines.append(f"  {address_id}:")
+
+        if asset_ids is None:
+            if not result.ok:
+                lines.append(f"    Error getting balances {result.error!s}")
+            elif not result.value:
+                lines.append("    No balances")
+            for asset_id, amount in (result.value or {}).items():
+                lines.append(f"    {asset_id}: {amount}")
+            continue
+
+        for asset_id in asset_ids:
+            read = reads.get((address_id, asset_id))
+            if read is None:
+                lines.append(f"    {asset_id}: {_lookup(result.value, asset_id)}")
+            elif read.ok:
+                lines.append(f"    {asset_id}: {read.value}")
+            else:
+                lines.append(f"    {asset_id}: Error getting balance {read.error!s}")
+
+    return "\n".join(lines)
+
+
+def get_portfolio(
+    wallet: Wallet, asset_ids: list[str] | None = None, max_workers: int | None = None
+) -> str:
+    """Get the balance of every asset for every address in the wallet.
+
+    Each address's balances are listed with a single batched request. Requested assets that the
+    listing does not include (e.g. ERC20 tokens without a CDP asset ID) are read individually.
+
+    Args:
+        wallet (Wallet): The wallet to get the portfolio for.
+        asset_ids (list[str] | None): The asset IDs to report. Reports every asset with a balance if None.
+        max_workers (int | None): The maximum number of concurrent balance requests. Defaults to `GET_PORTFOLIO_MAX_WORKERS`.
+
+    Returns:
+        str: A message containing the balance of each asset for each address in the wallet.
+
+    """
+    max_workers = max_workers or GET_PORTFOLIO_MAX_WORKERS
+
+    try:
+        addresses = call_upstream(lambda: wallet.addresses)
+    except Exception as e:
+        return f"Error getting portfolio for wallet {e!s}"
+
+    balance_maps = map_bounded(
+        lambda address: call_upstream(address.balances), addresses, max_workers
+    )
+
+    single_reads = []
+    if asset_ids is not None:
+        single_reads = map_bounded(
+            lambda pair: call_upstream(pair[0].balance, pair[1]),
+            _missing_pairs(balance_maps, asset_ids),
+            max_workers,
+        )
+
+    return _format_portfolio(wallet, balance_maps, asset_ids, single_reads)
+
+
+async def aget_portfolio(
+    wallet: Wallet, asset_ids: list[str] | None = None, max_workers: int | None = None
+) -> str:
+    """Get the balance of every asset for every address in the wallet.
+
+    Async version of `get_portfolio`.
+
+    Args:
+        wallet (Wallet): The wallet to get the portfolio for.
+        asset_ids (list[str] | None): The asset IDs to report. Reports every asset with a balance if None.
+        max_workers (int | None): The maximum number of concurrent balance requests. Defaults to `GET_PORTFOLIO_MAX_WORKERS`.
+
+    Returns:
+        str: A message containing the balance of each asset for each address in the wallet.
+
+    """
+    max_workers = max_workers or GET_PORTFOLIO_MAX_WORKERS
+
+    try:
+        addresses = await asyncio.to_thread(call_upstream, lambda: wallet.addresses)
+    except Exception as e:
+        return f"Error getting portfolio for wallet {e!s}"
+
+    balance_maps = await amap_bounded(
+        lambda address: call_upstream(address.balances), addresses, max_workers
+    )
+
+    single_reads = []
+    if asset_ids is not None:
+        single_reads = await amap_bounded(
+            lambda pair: call_upstream(pair[0].balance, pair[1]),
+            _missing_pairs(balance_maps, asset_ids),
+            max_workers,
+        )
+
+    return _format_portfolio(wallet, balance_maps, asset_ids, single_reads)
+
+
+class GetPortfolioAction(CdpAction):
+    """Get wallet portfolio action."""
+
+    name: str = "get_portfolio"
+    description: str = GET_PORTFOLIO_PROMPT
+    args_schema: type[BaseModel] | None = GetPortfolioInput
+    func: Callable[..., str] = get_portfolio
+    afunc: Callable[..., Awaitable[str]] = aget_portfolio
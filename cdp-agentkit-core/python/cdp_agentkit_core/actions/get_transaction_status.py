@@ -0,0 +1,76 @@
+from collections.abc import Awaitable, Callable
+
+from cdp import Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import get_confirmation_poller
+
+GET_TRANSACTION_STATUS_PROMPT = """
+This tool reports the status of transactions that were submitted without waiting for confirmation, i.e. when a write action returned a pending transaction ID. It takes an optional transaction ID; if none is given, it reports every submitted transaction of the wallet. The status is one of 'pending', 'complete', 'failed', 'replaced' (another transaction from the same address used its nonce) or 'timed_out'. It does not wait for transactions to confirm.
+"""
+
+
+class GetTransactionStatusInput(BaseModel):
+    """Input argument schema for get transaction status action."""
+
+    transaction_id: str | None = Field(
+        None,
+        description="The pending transaction ID returned by a write action, e.g. `0b6e1c0e-3c9e-4b8a-9d55-2d6cf3f5f0a1`. Reports every submitted transaction of the wallet if omitted.",
+    )
+
+
+def get_transaction_status(wallet: Wallet, transaction_id: str | None = None) -> str:
+    """Get the status of submitted transactions from the confirmation poller.
+
+    Only the poller's state is read, so this never calls the network. Only the transactions of the
+    wallet are reported.
+
+    Args:
+        wallet (Wallet): The wallet whose transactions to report.
+        transaction_id (str | None): The pending transaction ID. Reports every transaction of the wallet if None.
+
+    Returns:
+        str: A message containing the status of the transactions.
+
+    """
+    poller = get_confirmation_poller()
+
+    if transaction_id:
+        transaction = poller.get(transaction_id)
+        # Transactions of other wallets are reported as unknown, so their IDs reveal nothing.
+        if transaction is None or transaction.wallet_id != wallet.id:
+            return f"No submitted transaction found with ID {transaction_id}"
+        return transaction.summary()
+
+    transactions = poller.transactions(wallet.id)
+    if not transactions:
+        return f"No submitted transactions for wallet {wallet.id}"
+    return "\n\n".join(transaction.summary() for transaction in transactions)
+
+
+async def aget_transaction_status(wallet: Wallet, transaction_id: str | None = None) -> str:
+    """Get the status of submitted transactions from the confirmation poller.
+
+    Async version of `get_transaction_status`. The poller's state is in memory, so no thread is
+    needed.
+
+    Args:
+        wallet (Wallet): The wallet whose transactions to report.
+        transaction_id (str | None): The pending transaction ID. Reports every transaction of the wallet if None.
+
+    Returns:
+        str: A message containing the status of the transactions.
+
+    """
+    return get_transaction_status(wallet, transaction_id)
+
+
+class GetTransactionStatusAction(CdpAction):
+    """Get transaction status action."""
+
+    name: str = "get_transaction_status"
+    description: str = GET_TRANSACTION_STATUS_PROMPT
+    args_schema: type[BaseModel] | None = GetTransactionStatusInput
+    func: Callable[..., str] = get_transaction_status
+    afunc: Callable[..., Awaitable[str]] = aget_transaction_status
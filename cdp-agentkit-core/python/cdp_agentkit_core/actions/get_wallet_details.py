@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel
@@ -23,6 +23,21 @@ def get_wallet_details(wallet: Wallet) -> str:
     return f"Wallet: {wallet.id} on network: {wallet.network_id} with default address: {wallet.default_address.address_id}"
 
 
+async def aget_wallet_details(wallet: Wallet) -> str:
+    """Get a wallet's details.
+
+    Async version of `get_wallet_details`.
+
+    Args:
+        wallet (Wallet): The wallet to trade the asset from.
+
+    Returns:
+        str: A message containing the wallet details.
+
+    """
+    return get_wallet_details(wallet)
+
+
 class GetWalletDetailsAction(CdpAction):
     """Get wallet details action."""
 
@@ -30,3 +45,4 @@ class GetWalletDetailsAction(CdpAction):
     description: str = "This tool will get details about the MPC Wallet."
     args_schema: type[BaseModel] | None = GetWalletDetailsInput
     func: Callable[..., str] = get_wallet_details
+    afunc: Callable[..., Awaitable[str]] = aget_wallet_details
@@ -1,9 +1,17 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.receipts import minted_token_ids
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 MINT_NFT_PROMPT = """
 This tool will mint an NFT (ERC-721) to a specified destination address onchain via a contract invocation.
@@ -40,13 +48,59 @@ def mint_nft(wallet: Wallet, contract_address: str, destination: str) -> str:
     mint_args = {"to": destination, "quantity": "1"}
 
     try:
-        mint_invocation = wallet.invoke_contract(
-            contract_address=contract_address, method="mint", args=mint_args
-        ).wait()
+        mint_invocation = call_upstream(
+            wallet.invoke_contract, contract_address=contract_address, method="mint", args=mint_args
+        )
+        mint_invocation = wait_or_submit(
+            mint_invocation, f"mint of an NFT from contract {contract_address} to {destination}"
+        )
     except Exception as e:
         return f"Error minting NFT {e!s}"
 
-    return f"Minted NFT from contract {contract_address} to address {destination} on network {wallet.network_id}.\nTransaction hash for the mint: {mint_invocation.transaction.transaction_hash}\nTransaction link for the mint: {mint_invocation.transaction.transaction_link}"
+    if isinstance(mint_invocation, PendingTransaction):
+        return mint_invocation.submitted_message()
+
+    token_ids = minted_token_ids(mint_invocation, contract_address, destination)
+    token_ids_line = f"\nMinted token IDs: {', '.join(token_ids)}" if token_ids else ""
+    return f"Minted NFT from contract {contract_address} to address {destination} on network {wallet.network_id}.\nTransaction hash for the mint: {mint_invocation.transaction.transaction_hash}\nTransaction link for the mint: {mint_invocation.transaction.transaction_link}{token_ids_line}"
+
+
+async def amint_nft(wallet: Wallet, contract_address: str, destination: str) -> str:
+    """Mint an NFT (ERC-721) to a specified destination address onchain via a contract invocation.
+
+    Async version of `mint_nft`.
+
+    Args:
+        wallet (Wallet): The wallet to trade the asset from.
+        contract_address (str): The contract address of the NFT (ERC-721) to mint, e.g. `0x036CbD53842c5426634e7929541eC2318f3dCF7e`.
+        destination (str): The destination address that will receive the NFT onchain, e.g. `0x036CbD53842c5426634e7929541eC2318f3dCF7e`.
+
+    Returns:
+        str: A message containing the NFT mint details.
+
+    """
+    mint_args = {"to": destination, "quantity": "1"}
+
+    try:
+        mint_invocation = await asyncio.to_thread(
+            call_upstream,
+            wallet.invoke_contract,
+            contract_address=contract_address,
+            method="mint",
+            args=mint_args,
+        )
+        mint_invocation = await await_or_submit(
+            mint_invocation, f"mint of an NFT from contract {contract_address} to {destination}"
+        )
+    except Exception as e:
+        return f"Error minting NFT {e!s}"
+
+    if isinstance(mint_invocation, PendingTransaction):
+        return mint_invocation.submitted_message()
+
+    token_ids = minted_token_ids(mint_invocation, contract_address, destination)
+    token_ids_line = f"\nMinted token IDs: {', '.join(token_ids)}" if token_ids else ""
+    return f"Minted NFT from contract {contract_address} to address {destination} on network {wallet.network_id}.\nTransaction hash for the mint: {mint_invocation.transaction.transaction_hash}\nTransaction link for the mint: {mint_invocation.transaction.transaction_link}{token_ids_line}"
 
 
 class MintNftAction(CdpAction):
@@ -56,3 +110,5 @@ class MintNftAction(CdpAction):
     description: str = MINT_NFT_PROMPT
     args_schema: type[BaseModel] | None = MintNftInput
     func: Callable[..., str] = mint_nft
+    afunc: Callable[..., Awaitable[str]] = amint_nft
+    writes: bool = True
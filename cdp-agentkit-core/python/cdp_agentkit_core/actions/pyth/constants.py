@@ -0,0 +1,5 @@
+# How long to wait for the Pyth Hermes API to respond, per request.
+PYTH_HTTP_TIMEOUT_SECONDS = 10.0
+
+# The name of the Pyth Hermes API's load control (see `cdp_agentkit_core.utils.upstream`).
+PYTH_UPSTREAM = "pyth"
@@ -1,9 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
-import requests
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.pyth.utils import afetch_json, fetch_json
 
 PYTH_FETCH_PRICE_PROMPT = """
 Fetch the price of a given price feed from Pyth. First fetch the price feed ID forusing the pyth_fetch_price_feed_id action.
@@ -28,9 +28,17 @@ class PythFetchPriceInput(BaseModel):
 def pyth_fetch_price(price_feed_id: str) -> str:
     """Fetch the price of a given price feed from Pyth."""
     url = f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
+    return _format_price(fetch_json(url), price_feed_id)
+
+
+async def apyth_fetch_price(price_feed_id: str) -> str:
+    """Fetch the price of a given price feed from Pyth without blocking the event loop."""
+    url = f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
+    return _format_price(await afetch_json(url), price_feed_id)
+
+
+def _format_price(data: dict, price_feed_id: str) -> str:
+    """Format the latest price from a Pyth price update response."""
     parsed_data = data["parsed"]
 
     if not parsed_data:
@@ -58,3 +66,4 @@ class PythFetchPriceAction(CdpAction):
     description: str = PYTH_FETCH_PRICE_PROMPT
     args_schema: type[BaseModel] | None = PythFetchPriceInput
     func: Callable[..., str] = pyth_fetch_price
+    afunc: Callable[..., Awaitable[str]] = apyth_fetch_price
@@ -1,9 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
-import requests
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.pyth.utils import afetch_json, fetch_json
 
 PYTH_FETCH_PRICE_FEED_ID_PROMPT = """
 Fetch the price feed ID for a given token symbol (e.g. BTC, ETH, etc.) from Pyth.
@@ -19,10 +19,17 @@ class PythFetchPriceFeedIDInput(BaseModel):
 def pyth_fetch_price_feed_id(token_symbol: str) -> str:
     """Fetch the price feed ID for a given token symbol from Pyth."""
     url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
+    return _find_price_feed_id(fetch_json(url), token_symbol)
 
+
+async def apyth_fetch_price_feed_id(token_symbol: str) -> str:
+    """Fetch the price feed ID for a given token symbol from Pyth without blocking the event loop."""
+    url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
+    return _find_price_feed_id(await afetch_json(url), token_symbol)
+
+
+def _find_price_feed_id(data: list, token_symbol: str) -> str:
+    """Find the price feed ID matching a token symbol in a Pyth price feeds response."""
     if not data:
         raise ValueError(f"No price feed found for {token_symbol}")
 
@@ -42,3 +49,4 @@ class PythFetchPriceFeedIDAction(CdpAction):
     description: str = PYTH_FETCH_PRICE_FEED_ID_PROMPT
     args_schema: type[BaseModel] | None = PythFetchPriceFeedIDInput
     func: Callable[..., str] = pyth_fetch_price_feed_id
+    afunc: Callable[..., Awaitable[str]] = apyth_fetch_price_feed_id
@@ -0,0 +1,50 @@
+from typing import Any
+
+import requests
+
+from cdp_agentkit_core.actions.pyth.constants import PYTH_HTTP_TIMEOUT_SECONDS, PYTH_UPSTREAM
+from cdp_agentkit_core.utils.deadline import bounded_timeout, check_deadline
+from cdp_agentkit_core.utils.retry import aretry_call, retry_call
+from cdp_agentkit_core.utils.upstream import get_upstream
+
+
+def _get_json(url: str) -> Any:
+    """Make a single GET request to the Pyth Hermes API, within the current deadline."""
+    check_deadline("requesting the Pyth Hermes API")
+    response = requests.get(url, timeout=bounded_timeout(PYTH_HTTP_TIMEOUT_SECONDS))
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_json(url: str) -> Any:
+    """Fetch JSON from the Pyth Hermes API under load control, retrying transient failures.
+
+    Args:
+        url: The URL to fetch.
+
+    Returns:
+        Any: The decoded JSON response.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails, after any retries.
+
+    """
+    return retry_call(get_upstream(PYTH_UPSTREAM).call, _get_json, url)
+
+
+async def afetch_json(url: str) -> Any:
+    """Fetch JSON from the Pyth Hermes API under load control, retrying transient failures.
+
+    Async version of `fetch_json`; requests run in a worker thread.
+
+    Args:
+        url: The URL to fetch.
+
+    Returns:
+        Any: The decoded JSON response.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails, after any retries.
+
+    """
+    return await aretry_call(get_upstream(PYTH_UPSTREAM).call, _get_json, url)
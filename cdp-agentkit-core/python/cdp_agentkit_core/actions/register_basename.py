@@ -1,4 +1,6 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
@@ -6,6 +8,14 @@ from web3 import Web3
 from web3.exceptions import ContractLogicError
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.multicall import Call
+from cdp_agentkit_core.utils.preflight import Check, PreflightError, apreflight, preflight
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 # Constants
 REGISTER_BASENAME_PROMPT = """
@@ -65,7 +75,9 @@ def register_basename(wallet: Wallet, basename: str, amount: str = "0.002") -> s
             else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
         )
 
-        invocation = wallet.invoke_contract(
+        preflight(wallet.network_id, registration_checks(contract_address, register_args, amount))
+        invocation = call_upstream(
+            wallet.invoke_contract,
             contract_address=contract_address,
             method="register",
             args=register_args,
@@ -73,9 +85,13 @@ def register_basename(wallet: Wallet, basename: str, amount: str = "0.002") -> s
             amount=amount,
             asset_id="eth",
         )
-        invocation.wait()
+        result = wait_or_submit(
+            invocation, f"registration of basename {basename} for address {address_id}"
+        )
+        if isinstance(result, PendingTransaction):
+            return result.submitted_message()
         return f"Successfully registered basename {basename} for address {address_id}"
-    except ContractLogicError as e:
+    except (ContractLogicError, PreflightError) as e:
         return f"Error registering basename: {e!s}"
     except Exception as e:
         return f"Unexpected error registering basename: {e!s}"
@@ -118,6 +134,50 @@ def create_register_contract_method_args(base_name: str, address_id: str, is_mai
     return register_args
 
 
+def registration_checks(contract_address: str, register_args: dict, amount: str) -> list[Check]:
+    """Create the onchain checks a Basename registration needs to pass.
+
+    Args:
+        contract_address (str): The registrar controller address
+        register_args (dict): The arguments of the register contract method
+        amount (str): The amount of ETH paid for the registration
+
+    Returns:
+        list[Check]: The availability check, and the price check if the amount is a number
+
+    """
+    name, _, duration, *_ = register_args["request"]
+    checks = [
+        Check(
+            calls=(Call(contract_address, registrar_abi, "available", {"name": name}),),
+            passes=lambda available: available,
+            reason=lambda _: f"Basename {name} is not available",
+        )
+    ]
+
+    try:
+        amount_wei = int(Decimal(amount) * 10**18)
+    except (ArithmeticError, ValueError):
+        return checks
+    checks.append(
+        Check(
+            calls=(
+                Call(
+                    contract_address,
+                    registrar_abi,
+                    "registerPrice",
+                    {"name": name, "duration": duration},
+                ),
+            ),
+            passes=lambda price: price <= amount_wei,
+            reason=lambda price: (
+                f"Registering {name} costs {Decimal(price) / 10**18} ETH, more than the {amount} ETH paid"
+            ),
+        )
+    )
+    return checks
+
+
 # ABIs for smart contracts (used in basename registration)
 l2_resolver_abi = [
     {
@@ -163,10 +223,93 @@ registrar_abi = [
         "outputs": [],
         "stateMutability": "payable",
         "type": "function",
-    }
+    },
+    {
+        "inputs": [{"internalType": "string", "name": "name", "type": "string"}],
+        "name": "available",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "name", "type": "string"},
+            {"internalType": "uint256", "name": "duration", "type": "uint256"},
+        ],
+        "name": "registerPrice",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "duration", "type": "uint256"}],
+        "name": "DurationTooShort",
+        "type": "error",
+    },
+    {"inputs": [], "name": "InsufficientValue", "type": "error"},
+    {
+        "inputs": [{"internalType": "string", "name": "name", "type": "string"}],
+        "name": "NameNotAvailable",
+        "type": "error",
+    },
 ]
 
 
+async def aregister_basename(wallet: Wallet, basename: str, amount: str = "0.002") -> str:
+    """Register a Basename for the agent.
+
+    Async version of `register_basename`.
+
+    Args:
+        wallet (Wallet): The wallet to register the Basename with.
+        basename (str): The Basename to assign to the agent.
+        amount (str): The amount of ETH to pay for the registration. The default is set to 0.002.
+
+    Returns:
+        str: Confirmation message with the basename.
+
+    """
+    address_id = wallet.default_address.address_id
+    is_mainnet = wallet.network_id == "base-mainnet"
+
+    suffix = ".base.eth" if is_mainnet else ".basetest.eth"
+    if not basename.endswith(suffix):
+        basename += suffix
+
+    register_args = create_register_contract_method_args(basename, address_id, is_mainnet)
+
+    try:
+        contract_address = (
+            BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET
+            if is_mainnet
+            else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
+        )
+
+        await apreflight(
+            wallet.network_id, registration_checks(contract_address, register_args, amount)
+        )
+        invocation = await asyncio.to_thread(
+            call_upstream,
+            wallet.invoke_contract,
+            contract_address=contract_address,
+            method="register",
+            args=register_args,
+            abi=registrar_abi,
+            amount=amount,
+            asset_id="eth",
+        )
+        result = await await_or_submit(
+            invocation, f"registration of basename {basename} for address {address_id}"
+        )
+        if isinstance(result, PendingTransaction):
+            return result.submitted_message()
+        return f"Successfully registered basename {basename} for address {address_id}"
+    except (ContractLogicError, PreflightError) as e:
+        return f"Error registering basename: {e!s}"
+    except Exception as e:
+        return f"Unexpected error registering basename: {e!s}"
+
+
 class RegisterBasenameAction(CdpAction):
     """Register Basename action."""
 
@@ -174,3 +317,5 @@ class RegisterBasenameAction(CdpAction):
     description: str = REGISTER_BASENAME_PROMPT
     args_schema: type[BaseModel] | None = RegisterBasenameInput
     func: Callable[..., str] = register_basename
+    afunc: Callable[..., Awaitable[str]] = aregister_basename
+    writes: bool = True
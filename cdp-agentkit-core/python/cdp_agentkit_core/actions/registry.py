@@ -0,0 +1,240 @@
+"""Lazy registry of CDP actions backed by a precomputed manifest.
+
+The manifest (``manifest.json``) records the name, description and args schema of every
+CDP action, so toolkits can describe the actions without importing the action modules
+(and with them ``cdp``, ``web3`` and the Zora Wow ABI tables). An action module is only
+imported the first time the action is invoked.
+
+Regenerate the manifest with ``make manifest`` whenever an action is added or changed.
+"""
+
+import asyncio
+import importlib
+import inspect
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from cdp_agentkit_core.actions.cdp_action import CdpAction
+
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+# Maps every CdpAction subclass to the module that defines it.
+# WARNING: All new CdpAction subclasses must be listed here, otherwise they will not be discovered
+# by get_all_cdp_actions() or included in the manifest.
+CDP_ACTION_MODULES: dict[str, str] = {
+    "BatchMintNftAction": "cdp_agentkit_core.actions.batch_mint_nft",
+    "BatchTransferAction": "cdp_agentkit_core.actions.batch_transfer",
+    "BatchTransferNftAction": "cdp_agentkit_core.actions.batch_transfer_nft",
+    "DeployNftAction": "cdp_agentkit_core.actions.deploy_nft",
+    "DeployTokenAction": "cdp_agentkit_core.actions.deploy_token",
+    "GetBalanceAction": "cdp_agentkit_core.actions.get_balance",
+    "GetBalanceNftAction": "cdp_agentkit_core.actions.get_balance_nft",
+    "GetPortfolioAction": "cdp_agentkit_core.actions.get_portfolio",
+    "GetTransactionStatusAction": "cdp_agentkit_core.actions.get_transaction_status",
+    "GetWalletDetailsAction": "cdp_agentkit_core.actions.get_wallet_details",
+    "MintNftAction": "cdp_agentkit_core.actions.mint_nft",
+    "PythFetchPriceAction": "cdp_agentkit_core.actions.pyth.fetch_price",
+    "PythFetchPriceFeedIDAction": "cdp_agentkit_core.actions.pyth.fetch_price_feed_id",
+    "RegisterBasenameAction": "cdp_agentkit_core.actions.register_basename",
+    "RequestFaucetFundsAction": "cdp_agentkit_core.actions.request_faucet_funds",
+    "TradeAction": "cdp_agentkit_core.actions.trade",
+    "TransferAction": "cdp_agentkit_core.actions.transfer",
+    "TransferNftAction": "cdp_agentkit_core.actions.transfer_nft",
+    "WowBuyTokenAction": "cdp_agentkit_core.actions.wow.buy_token",
+    "WowCreateTokenAction": "cdp_agentkit_core.actions.wow.create_token",
+    "WowQuoteLadderAction": "cdp_agentkit_core.actions.wow.quote_ladder",
+    "WowSellTokenAction": "cdp_agentkit_core.actions.wow.sell_token",
+    "WrapEthAction": "cdp_agentkit_core.actions.wrap_eth",
+}
+
+_load_lock = threading.Lock()
+_loaded_actions: dict[str, CdpAction] = {}
+
+
+@dataclass(frozen=True)
+class CdpActionSpec:
+    """Manifest entry describing a CDP action without importing its module."""
+
+    name: str
+    description: str
+    args_schema: dict[str, Any] | None
+    module: str
+    class_name: str
+    writes: bool = False
+
+    @property
+    def func(self) -> "LazyCdpActionFunc":
+        """A callable that imports and runs the action on first use."""
+        return LazyCdpActionFunc(self.name)
+
+    @property
+    def afunc(self) -> "LazyCdpActionAsyncFunc":
+        """A coroutine function that imports and runs the action on first use."""
+        return LazyCdpActionAsyncFunc(self.name)
+
+    def load(self) -> CdpAction:
+        """Import the action module and return the action."""
+        return load_cdp_action(self.name)
+
+
+class _LazyCdpActionProxy(ABC):
+    """Base class for proxies that defer importing an action module until the action is invoked."""
+
+    def __init__(self, action_name: str) -> None:
+        self.action_name = action_name
+
+    @abstractmethod
+    def resolve(self) -> Callable[..., Any]:
+        """Load the action and return the function to run."""
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        """Signature of the underlying action function."""
+        return inspect.signature(self.resolve())
+
+    def _load(self, kwargs: dict[str, Any]) -> tuple[CdpAction, dict[str, Any]]:
+        """Load the action and validate keyword arguments against its args schema."""
+        action = load_cdp_action(self.action_name)
+        if action.args_schema is not None:
+            kwargs = action.args_schema(**kwargs).model_dump()
+        return action, kwargs
+
+    def __repr__(self) -> str:
+        """Return a string representation of the proxy."""
+        return f"{type(self).__name__}({self.action_name!r})"
+
+
+class LazyCdpActionFunc(_LazyCdpActionProxy):
+    """Callable proxy for an action function that defers the module import until invoked.
+
+    Keyword arguments are validated against the action's args schema once it is loaded, and
+    ``inspect.signature`` reports the signature of the underlying action function.
+    """
+
+    def resolve(self) -> Callable[..., str]:
+        """Load the action and return its function."""
+        return load_cdp_action(self.action_name).func
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        """Run the action, validating keyword arguments against its args schema."""
+        action, kwargs = self._load(kwargs)
+        return action.func(*args, **kwargs)
+
+
+class LazyCdpActionAsyncFunc(_LazyCdpActionProxy):
+    """Coroutine proxy for an action's async function that defers the module import until invoked.
+
+    Actions without an ``afunc`` run their blocking ``func`` in a worker thread instead.
+    """
+
+    def resolve(self) -> Callable[..., Awaitable[str]] | Callable[..., str]:
+        """Load the action and return its async function, or its function if it has none."""
+        action = load_cdp_action(self.action_name)
+        return action.afunc or action.func
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> str:
+        """Run the action, validating keyword arguments against its args schema."""
+        action, kwargs = self._load(kwargs)
+        if action.afunc is None:
+            return await asyncio.to_thread(action.func, *args, **kwargs)
+        return await action.afunc(*args, **kwargs)
+
+
+@cache
+def get_cdp_action_specs() -> tuple[CdpActionSpec, ...]:
+    """Read the precomputed action manifest.
+
+    Returns:
+        tuple[CdpActionSpec, ...]: The specs of all CDP actions, in registration order.
+
+    """
+    with MANIFEST_PATH.open(encoding="utf-8") as manifest_file:
+        entries = json.load(manifest_file)
+    return tuple(CdpActionSpec(**entry) for entry in entries)
+
+
+def get_cdp_action_spec(name: str) -> CdpActionSpec:
+    """Look up the manifest entry of a CDP action by name.
+
+    Args:
+        name (str): The action name, e.g. `get_balance`.
+
+    Returns:
+        CdpActionSpec: The manifest entry for the action.
+
+    Raises:
+        KeyError: If no action with that name is registered.
+
+    """
+    for spec in get_cdp_action_specs():
+        if spec.name == name:
+            return spec
+    raise KeyError(f"Unknown CDP action: {name}")
+
+
+def load_cdp_action(name: str) -> CdpAction:
+    """Import and instantiate a CDP action by name, caching the instance.
+
+    Args:
+        name (str): The action name, e.g. `get_balance`.
+
+    Returns:
+        CdpAction: The action instance.
+
+    """
+    action = _loaded_actions.get(name)
+    if action is not None:
+        return action
+
+    spec = get_cdp_action_spec(name)
+    with _load_lock:
+        if name not in _loaded_actions:
+            module = importlib.import_module(spec.module)
+            _loaded_actions[name] = getattr(module, spec.class_name)()
+        return _loaded_actions[name]
+
+
+def import_cdp_action_modules() -> None:
+    """Import every registered action module so all CdpAction subclasses are defined."""
+    for module in dict.fromkeys(CDP_ACTION_MODULES.values()):
+        importlib.import_module(module)
+
+
+def build_cdp_action_manifest() -> list[dict[str, Any]]:
+    """Build the manifest entries by importing and instantiating every registered action.
+
+    Returns:
+        list[dict[str, Any]]: The manifest entries, in registration order.
+
+    """
+    entries = []
+    for class_name, module_name in CDP_ACTION_MODULES.items():
+        action = getattr(importlib.import_module(module_name), class_name)()
+        spec = CdpActionSpec(
+            name=action.name,
+            description=action.description,
+            args_schema=action.args_schema.model_json_schema() if action.args_schema else None,
+            module=module_name,
+            class_name=class_name,
+            writes=action.writes,
+        )
+        entries.append(asdict(spec))
+    return entries
+
+
+def write_cdp_action_manifest(path: Path = MANIFEST_PATH) -> None:
+    """Regenerate the action manifest.
+
+    Args:
+        path (Path): Where to write the manifest. Defaults to the packaged `manifest.json`.
+
+    """
+    with path.open("w", encoding="utf-8") as manifest_file:
+        json.dump(build_cdp_action_manifest(), manifest_file, indent=2)
+        manifest_file.write("\n")
@@ -1,9 +1,12 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.transactions import async_wait, wait
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 REQUEST_FAUCET_FUNDS_PROMPT = """
 This tool will request test tokens from the faucet for the default address in the wallet. It takes the wallet and asset ID as input.
@@ -35,10 +38,35 @@ def request_faucet_funds(wallet: Wallet, asset_id: str | None = None) -> str:
     """
     try:
         # Request funds from the faucet.
-        faucet_tx = wallet.faucet(asset_id=asset_id if asset_id else None)
+        faucet_tx = call_upstream(wallet.faucet, asset_id=asset_id if asset_id else None)
 
         # Wait for the faucet transaction to be confirmed.
-        faucet_tx.wait()
+        wait(faucet_tx)
+    except Exception as e:
+        return f"Error requesting faucet funds {e!s}"
+
+    return f"Received {asset_id} from the faucet. Transaction: {faucet_tx.transaction_link}"
+
+
+async def arequest_faucet_funds(wallet: Wallet, asset_id: str | None = None) -> str:
+    """Request test tokens from the faucet for the default address in the wallet.
+
+    Async version of `request_faucet_funds`.
+
+    Args:
+        wallet (Wallet): The wallet to receive tokens
+        asset_id (str | None): The optional asset ID to request from the faucet. Accepts "eth" or "usdc". When omitted, defaults to the network's native asset.
+
+    Returns:
+        str: Confirmation message with transaction details
+
+    """
+    try:
+        faucet_tx = await asyncio.to_thread(
+            call_upstream, wallet.faucet, asset_id=asset_id if asset_id else None
+        )
+
+        await async_wait(faucet_tx)
     except Exception as e:
         return f"Error requesting faucet funds {e!s}"
 
@@ -52,3 +80,4 @@ class RequestFaucetFundsAction(CdpAction):
     description: str = REQUEST_FAUCET_FUNDS_PROMPT
     args_schema: type[BaseModel] | None = RequestFaucetFundsInput
     func: Callable[..., str] = request_faucet_funds
+    afunc: Callable[..., Awaitable[str]] = arequest_faucet_funds
@@ -1,9 +1,16 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 TRADE_PROMPT = """
 This tool will trade a specified amount of a 'from asset' to a 'to asset' for the wallet.
@@ -50,12 +57,53 @@ def trade(wallet: Wallet, amount: str, from_asset_id: str, to_asset_id: str) ->
 
     """
     try:
-        trade_result = wallet.trade(
-            amount=amount, from_asset_id=from_asset_id, to_asset_id=to_asset_id
-        ).wait()
+        trade_result = call_upstream(
+            wallet.trade, amount=amount, from_asset_id=from_asset_id, to_asset_id=to_asset_id
+        )
+        trade_result = wait_or_submit(
+            trade_result, f"trade of {amount} of {from_asset_id} for {to_asset_id}"
+        )
     except Exception as e:
         return f"Error trading assets {e!s}"
 
+    if isinstance(trade_result, PendingTransaction):
+        return trade_result.submitted_message()
+
+    return f"Traded {amount} of {from_asset_id} for {trade_result.to_amount} of {to_asset_id}.\nTransaction hash for the trade: {trade_result.transaction.transaction_hash}\nTransaction link for the trade: {trade_result.transaction.transaction_link}"
+
+
+async def atrade(wallet: Wallet, amount: str, from_asset_id: str, to_asset_id: str) -> str:
+    """Trade a specified amount of a from asset to a to asset for the wallet. Trades are only supported on Mainnets.
+
+    Async version of `trade`.
+
+    Args:
+        wallet (Wallet): The wallet to trade the asset from.
+        amount (str): The amount of the from asset to trade, e.g. `15`, `0.000001`.
+        from_asset_id (str): The from asset ID to trade (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e").
+        to_asset_id (str): The from asset ID to trade (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e").
+
+    Returns:
+        str: A message containing the trade details.
+
+    """
+    try:
+        trade_result = await asyncio.to_thread(
+            call_upstream,
+            wallet.trade,
+            amount=amount,
+            from_asset_id=from_asset_id,
+            to_asset_id=to_asset_id,
+        )
+        trade_result = await await_or_submit(
+            trade_result, f"trade of {amount} of {from_asset_id} for {to_asset_id}"
+        )
+    except Exception as e:
+        return f"Error trading assets {e!s}"
+
+    if isinstance(trade_result, PendingTransaction):
+        return trade_result.submitted_message()
+
     return f"Traded {amount} of {from_asset_id} for {trade_result.to_amount} of {to_asset_id}.\nTransaction hash for the trade: {trade_result.transaction.transaction_hash}\nTransaction link for the trade: {trade_result.transaction.transaction_link}"
 
 
@@ -66,3 +114,5 @@ class TradeAction(CdpAction):
     description: str = TRADE_PROMPT
     args_schema: type[BaseModel] | None = TradeInput
     func: Callable[..., str] = trade
+    afunc: Callable[..., Awaitable[str]] = atrade
+    writes: bool = True
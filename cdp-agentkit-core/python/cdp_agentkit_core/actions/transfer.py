@@ -1,9 +1,16 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 TRANSFER_PROMPT = """
 This tool will transfer an asset from the wallet to another onchain address.
@@ -60,12 +67,61 @@ def transfer(
 
     """
     try:
-        transfer_result = wallet.transfer(
-            amount=amount, asset_id=asset_id, destination=destination, gasless=gasless
-        ).wait()
+        transfer_result = call_upstream(
+            wallet.transfer,
+            amount=amount,
+            asset_id=asset_id,
+            destination=destination,
+            gasless=gasless,
+        )
+        transfer_result = wait_or_submit(
+            transfer_result, f"transfer of {amount} of {asset_id} to {destination}"
+        )
     except Exception as e:
         return f"Error transferring the asset {e!s}"
 
+    if isinstance(transfer_result, PendingTransaction):
+        return transfer_result.submitted_message()
+
+    return f"Transferred {amount} of {asset_id} to {destination}.\nTransaction hash for the transfer: {transfer_result.transaction_hash}\nTransaction link for the transfer: {transfer_result.transaction_link}"
+
+
+async def atransfer(
+    wallet: Wallet, amount: str, asset_id: str, destination: str, gasless: bool = False
+) -> str:
+    """Transfer a specified amount of an asset to a destination onchain. USDC Transfers on Base Sepolia and Mainnet can be gasless. Always use the gasless option when available.
+
+    Async version of `transfer`.
+
+    Args:
+        wallet (Wallet): The wallet to transfer the asset from.
+        amount (str): The amount of the asset to transfer, e.g. `15`, `0.000001`.
+        asset_id (str): The asset ID to transfer (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e").
+        destination (str): The destination to transfer the funds (e.g. `0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027`, `example.eth`, `example.base.eth`).
+        gasless (bool): Whether to send a gasless transfer (Defaults to False.).
+
+    Returns:
+        str: A message containing the transfer details.
+
+    """
+    try:
+        transfer_result = await asyncio.to_thread(
+            call_upstream,
+            wallet.transfer,
+            amount=amount,
+            asset_id=asset_id,
+            destination=destination,
+            gasless=gasless,
+        )
+        transfer_result = await await_or_submit(
+            transfer_result, f"transfer of {amount} of {asset_id} to {destination}"
+        )
+    except Exception as e:
+        return f"Error transferring the asset {e!s}"
+
+    if isinstance(transfer_result, PendingTransaction):
+        return transfer_result.submitted_message()
+
     return f"Transferred {amount} of {asset_id} to {destination}.\nTransaction hash for the transfer: {transfer_result.transaction_hash}\nTransaction link for the transfer: {transfer_result.transaction_link}"
 
 
@@ -76,3 +132,5 @@ class TransferAction(CdpAction):
     description: str = TRANSFER_PROMPT
     args_schema: type[BaseModel] | None = TransferInput
     func: Callable[..., str] = transfer
+    afunc: Callable[..., Awaitable[str]] = atransfer
+    writes: bool = True
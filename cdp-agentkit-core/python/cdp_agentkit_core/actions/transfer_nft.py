@@ -1,9 +1,17 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.preflight import apreflight, erc721_transfer_checks, preflight
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 TRANSFER_NFT_PROMPT = """
 This tool will transfer an NFT (ERC721 token) from the wallet to another onchain address.
@@ -17,6 +25,7 @@ Important notes:
 - Ensure you have ownership of the NFT before attempting transfer
 - Ensure there is sufficient native token balance for gas fees
 - The wallet must either own the NFT or have approval to transfer it
+- Ownership and approval are checked onchain before the transfer is sent
 """
 
 
@@ -57,14 +66,78 @@ def transfer_nft(
     """
     try:
         from_addr = from_address if from_address is not None else wallet.default_address.address_id
-        transfer_result = wallet.invoke_contract(
+        preflight(
+            wallet.network_id,
+            erc721_transfer_checks(
+                contract_address, token_id, from_addr, wallet.default_address.address_id
+            ),
+        )
+        transfer_result = call_upstream(
+            wallet.invoke_contract,
             contract_address=contract_address,
             method="transferFrom",
             args={"from": from_addr, "to": destination, "tokenId": token_id},
-        ).wait()
+        )
+        transfer_result = wait_or_submit(
+            transfer_result,
+            f"transfer of NFT (ID: {token_id}) from contract {contract_address} to {destination}",
+        )
     except Exception as e:
         return f"Error transferring the NFT (contract: {contract_address}, ID: {token_id}) from {from_addr} to {destination}): {e!s}"
 
+    if isinstance(transfer_result, PendingTransaction):
+        return transfer_result.submitted_message()
+
+    return f"Transferred NFT (ID: {token_id}) from contract {contract_address} to {destination}.\nTransaction hash: {transfer_result.transaction_hash}\nTransaction link: {transfer_result.transaction_link}"
+
+
+async def atransfer_nft(
+    wallet: Wallet,
+    contract_address: str,
+    token_id: str,
+    destination: str,
+    from_address: str | None = None,
+) -> str:
+    """Transfer an NFT (ERC721 token) to a destination address.
+
+    Async version of `transfer_nft`.
+
+    Args:
+        wallet (Wallet): The wallet to transfer the NFT from.
+        contract_address (str): The NFT contract address.
+        token_id (str): The ID of the NFT to transfer.
+        destination (str): The destination to transfer the NFT.
+        from_address (str | None): The address to transfer from. Defaults to wallet's default address.
+
+    Returns:
+        str: A message containing the transfer details.
+
+    """
+    try:
+        from_addr = from_address if from_address is not None else wallet.default_address.address_id
+        await apreflight(
+            wallet.network_id,
+            erc721_transfer_checks(
+                contract_address, token_id, from_addr, wallet.default_address.address_id
+            ),
+        )
+        transfer_result = await asyncio.to_thread(
+            call_upstream,
+            wallet.invoke_contract,
+            contract_address=contract_address,
+            method="transferFrom",
+            args={"from": from_addr, "to": destination, "tokenId": token_id},
+        )
+        transfer_result = await await_or_submit(
+            transfer_result,
+            f"transfer of NFT (ID: {token_id}) from contract {contract_address} to {destination}",
+        )
+    except Exception as e:
+        return f"Error transferring the NFT (contract: {contract_address}, ID: {token_id}) from {from_addr} to {destination}): {e!s}"
+
+    if isinstance(transfer_result, PendingTransaction):
+        return transfer_result.submitted_message()
+
     return f"Transferred NFT (ID: {token_id}) from contract {contract_address} to {destination}.\nTransaction hash: {transfer_result.transaction_hash}\nTransaction link: {transfer_result.transaction_link}"
 
 
@@ -75,3 +148,5 @@ class TransferNftAction(CdpAction):
     description: str = TRANSFER_NFT_PROMPT
     args_schema: type[BaseModel] | None = TransferNftInput
     func: Callable[..., str] = transfer_nft
+    afunc: Callable[..., Awaitable[str]] = atransfer_nft
+    writes: bool = True
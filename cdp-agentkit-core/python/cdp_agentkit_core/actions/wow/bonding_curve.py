@@ -0,0 +1,217 @@
+"""Local Zora Wow bonding curve quotes.
+
+A port of the Wow `BondingCurve` contract, which prices tokens on the curve `y = A * e^(B * x)`
+with Solady's `FixedPointMathLib`. The fixed point functions below reproduce Solady's integer
+arithmetic step by step, so quotes match the contract's `getEthBuyQuote` and `getTokenSellQuote`
+to the wei.
+"""
+
+from fractions import Fraction
+
+WAD = 10**18
+
+# The curve parameters, immutable on the deployed BondingCurve contracts.
+BONDING_CURVE_A = 1060848709
+BONDING_CURVE_B = 4379701787
+
+_INT256_MAX = (1 << 255) - 1
+
+
+def _sdiv(a: int, b: int) -> int:
+    """Signed division rounding towards zero, like the EVM `sdiv` and Solidity's `/`."""
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
+
+
+def mul_wad(x: int, y: int) -> int:
+    """Compute floor(x * y / WAD) (FixedPointMathLib.mulWad)."""
+    return x * y // WAD
+
+
+def div_wad(x: int, y: int) -> int:
+    """Compute floor(x * WAD / y) (FixedPointMathLib.divWad)."""
+    return x * WAD // y
+
+
+def full_mul_div(x: int, y: int, d: int) -> int:
+    """Compute floor(x * y / d) with full precision (FixedPointMathLib.fullMulDiv)."""
+    return x * y // d
+
+
+def exp_wad(x: int) -> int:
+    """Compute e^x for a WAD `x` (FixedPointMathLib.expWad).
+
+    Args:
+        x: The exponent, as a WAD.
+
+    Returns:
+        int: e^x, as a WAD.
+
+    Raises:
+        OverflowError: If the result does not fit in an int256.
+
+    """
+    # The result is less than 0.5 wei.
+    if x <= -41446531673892822313:
+        return 0
+    if x >= 135305999368893231589:
+        raise OverflowError("ExpOverflow")
+
+    # Convert to a 2**96 basis, then reduce the range to (-ln 2 / 2, ln 2 / 2) * 2**96 by
+    # factoring out k powers of two.
+    x = _sdiv(x << 78, 5**18)
+    k = (_sdiv(x << 96, 54916777467707473351141471128) + 2**95) >> 96
+    x = x - k * 54916777467707473351141471128
+
+    # (6, 7)-term rational approximation, with p left in a 2**192 basis.
+    y = x + 1346386616545796478920950773328
+    y = ((y * x) >> 96) + 57155421227552351082224309758442
+    p = y + x - 94201549194550492254356042504812
+    p = ((p * y) >> 96) + 28719021644029726153956944680412240
+    p = p * x + (4385272521454847904659076985693276 << 96)
+
+    q = x - 2855989394907223263936484059900
+    q = ((q * x) >> 96) + 50020603652535783019961831881945
+    q = ((q * x) >> 96) - 533845033583426703283633433725380
+    q = ((q * x) >> 96) + 3604857256930695427073651918091429
+    q = ((q * x) >> 96) - 14423608567350463180887372962807573
+    q = ((q * x) >> 96) + 26449188498355588339934803723976023
+
+    r = _sdiv(p, q)
+
+    # Multiply by the scale factor, 2**k and 1e18 / 2**96 at once.
+    return (r * 3822833074963236453042738258902158003155416615667) >> (195 - k)
+
+
+def ln_wad(x: int) -> int:
+    """Compute ln(x) for a WAD `x` (FixedPointMathLib.lnWad).
+
+    Args:
+        x: The argument, as a WAD.
+
+    Returns:
+        int: ln(x), as a WAD.
+
+    Raises:
+        ValueError: If `x` is not positive.
+
+    """
+    if not 0 < x <= _INT256_MAX:
+        raise ValueError("LnWadUndefined")
+
+    # Reduce the range of x to [1, 2) * 2**96, where ln(2**k * x) = k * ln(2) + ln(x).
+    k = x.bit_length() - 1 - 96
+    x = (x << (159 - k)) >> 159
+
+    # (8, 8)-term rational approximation, with p left in a 2**192 basis.
+    p = ((x + 3273285459638523848632254066296) * x) >> 96
+    p = ((p + 24828157081833163892658089445524) * x) >> 96
+    p = ((p + 43456485725739037958740375743393) * x) >> 96
+    p = p - 11111509109440967052023855526967
+    p = ((p * x) >> 96) - 45023709667254063763336534515857
+    p = ((p * x) >> 96) - 14706773417378608786704636184526
+    p = p * x - (795164235651350426258249787498 << 96)
+
+    q = 5573035233440673466300451813936 + x
+    q = 71694874799317883764090561454958 + ((x * q) >> 96)
+    q = 283447036172924575727196451306956 + ((x * q) >> 96)
+    q = 401686690394027663651624208769553 + ((x * q) >> 96)
+    q = 204048457590392012362485061816622 + ((x * q) >> 96)
+    q = 31853899698501571402653359427138 + ((x * q) >> 96)
+    q = 909429971244387300277376558375 + ((x * q) >> 96)
+
+    # Scale, add k * ln(2) and ln(2**96 / 1e18), then convert back to a WAD.
+    p = _sdiv(p, q)
+    p = 1677202110996718588342820967067443963516166 * p
+    p = 16597577552685614221487285958193947469193820559219878177908093499208371 * k + p
+    p = 600920179829731861736702779321621459595472258049074101567377883020018308 + p
+    return p >> 174
+
+
+def _exp_b_x(supply: int) -> int:
+    return exp_wad(mul_wad(BONDING_CURVE_B, supply))
+
+
+def get_spot_price(current_supply: int) -> Fraction:
+    """Compute the marginal price of the curve, dy/dx = A * e^(B * x).
+
+    Args:
+        current_supply: The token's current `totalSupply` (in wei)
+
+    Returns:
+        Fraction: The price of a wei of token (in wei of ETH).
+
+    """
+    return Fraction(BONDING_CURVE_A * _exp_b_x(current_supply), WAD * WAD)
+
+
+def get_eth_buy_quote(current_supply: int, eth_order_size: int) -> int:
+    """Compute the tokens received for an amount of ETH (BondingCurve.getEthBuyQuote).
+
+    Args:
+        current_supply: The token's current `totalSupply` (in wei)
+        eth_order_size: Amount of ETH to buy with (in wei)
+
+    Returns:
+        int: Amount of tokens received (in wei)
+
+    """
+    exp_b_x1 = _exp_b_x(current_supply) + full_mul_div(
+        eth_order_size, BONDING_CURVE_B, BONDING_CURVE_A
+    )
+    return div_wad(ln_wad(exp_b_x1), BONDING_CURVE_B) - current_supply
+
+
+def get_token_sell_quote(current_supply: int, tokens_to_sell: int) -> int:
+    """Compute the ETH received for selling tokens (BondingCurve.getTokenSellQuote).
+
+    Args:
+        current_supply: The token's current `totalSupply` (in wei)
+        tokens_to_sell: Amount of tokens to sell (in wei)
+
+    Returns:
+        int: Amount of ETH received (in wei)
+
+    Raises:
+        ValueError: If more tokens are sold than the current supply.
+
+    """
+    if current_supply < tokens_to_sell:
+        raise ValueError("Insufficient liquidity")
+
+    exp_b_x0 = _exp_b_x(current_supply)
+    exp_b_x1 = _exp_b_x(current_supply - tokens_to_sell)
+    return full_mul_div(exp_b_x0 - exp_b_x1, BONDING_CURVE_A, BONDING_CURVE_B)
+
+
+def get_token_buy_quote(current_supply: int, token_order_size: int) -> int:
+    """Compute the ETH needed to buy an amount of tokens (BondingCurve.getTokenBuyQuote).
+
+    Args:
+        current_supply: The token's current `totalSupply` (in wei)
+        token_order_size: Amount of tokens to buy (in wei)
+
+    Returns:
+        int: Amount of ETH needed (in wei)
+
+    """
+    exp_b_x0 = _exp_b_x(current_supply)
+    exp_b_x1 = _exp_b_x(current_supply + token_order_size)
+    return full_mul_div(exp_b_x1 - exp_b_x0, BONDING_CURVE_A, BONDING_CURVE_B)
+
+
+def get_eth_sell_quote(current_supply: int, eth_order_size: int) -> int:
+    """Compute the tokens to sell to receive an amount of ETH (BondingCurve.getEthSellQuote).
+
+    Args:
+        current_supply: The token's current `totalSupply` (in wei)
+        eth_order_size: Amount of ETH to receive (in wei)
+
+    Returns:
+        int: Amount of tokens to sell (in wei)
+
+    """
+    exp_b_x1 = _exp_b_x(current_supply) - full_mul_div(
+        eth_order_size, BONDING_CURVE_B, BONDING_CURVE_A
+    )
+    return current_supply - div_wad(ln_wad(exp_b_x1), BONDING_CURVE_B)
@@ -1,4 +1,5 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
@@ -7,8 +8,14 @@ from cdp_agentkit_core.actions import CdpAction
 from cdp_agentkit_core.actions.wow.constants import (
     WOW_ABI,
 )
-from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated
-from cdp_agentkit_core.actions.wow.utils import get_buy_quote
+from cdp_agentkit_core.actions.wow.utils import buy_checks, get_buy_outcome, get_quote
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.preflight import apreflight, preflight
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 WOW_BUY_TOKEN_PROMPT = """
 This tool can only be used to buy a Zora Wow ERC20 memecoin with ETH. Do not use this tool for any other purpose, or trading other assets.
@@ -23,6 +30,7 @@ Important notes:
 - Make sure to use the exact amount provided, and if there's any doubt, check by getting more information before continuing with the action.
 - 1 wei = 0.000000000000000001 ETH
 - Minimum purchase amount is 100000000000000 wei (0.0000001 ETH)
+- Once confirmed, the result includes the tokens received and the ETH paid, so they do not need to be looked up
 - Only supported on the following networks:
   - Base Sepolia (ie, 'base-sepolia')
   - Base Mainnet (ie, 'base', 'base-mainnnet')
@@ -55,15 +63,74 @@ def wow_buy_token(wallet: Wallet, contract_address: str, amount_eth_in_wei: str)
         str: A message containing the token purchase details.
 
     """
-    token_quote = get_buy_quote(wallet.network_id, contract_address, amount_eth_in_wei)
+    try:
+        quote = get_quote(wallet.network_id, contract_address, amount_eth_in_wei, "buy")
+        token_quote, has_graduated = quote.amount_out, quote.has_graduated
+
+        # Multiply by 99/100 and floor to get 99% of quote as minimum
+        min_tokens = str(
+            int((token_quote * 99) // 100)
+        )  # Using integer division to floor the result
+        preflight(wallet.network_id, buy_checks(contract_address, amount_eth_in_wei))
+        invocation = call_upstream(
+            wallet.invoke_contract,
+            contract_address=contract_address,
+            method="buy",
+            abi=WOW_ABI,
+            args={
+                "recipient": wallet.default_address.address_id,
+                "refundRecipient": wallet.default_address.address_id,
+                "orderReferrer": "0x0000000000000000000000000000000000000000",
+                "expectedMarketType": (has_graduated and "1") or "0",
+                "minOrderSize": min_tokens,
+                "sqrtPriceLimitX96": "0",
+                "comment": "",
+            },
+            amount=amount_eth_in_wei,
+            asset_id="wei",
+        )
+        invocation = wait_or_submit(
+            invocation,
+            f"purchase of WoW ERC20 memecoin {contract_address} for {amount_eth_in_wei} wei",
+        )
+    except Exception as e:
+        return f"Error buying Zora Wow ERC20 memecoin {e!s}"
+
+    if isinstance(invocation, PendingTransaction):
+        return invocation.submitted_message()
+
+    outcome = get_buy_outcome(invocation, contract_address, wallet.default_address.address_id)
+    return f"Purchased WoW ERC20 memecoin with transaction hash: {invocation.transaction.transaction_hash}{outcome.describe('Tokens received', 'ETH paid')}"
+
+
+async def awow_buy_token(wallet: Wallet, contract_address: str, amount_eth_in_wei: str) -> str:
+    """Buy a Zora Wow ERC20 memecoin with ETH.
+
+    Async version of `wow_buy_token`.
 
-    # Multiply by 99/100 and floor to get 99% of quote as minimum
-    min_tokens = str(int((token_quote * 99) // 100))  # Using integer division to floor the result
+    Args:
+        wallet (Wallet): The wallet to create the token from.
+        contract_address (str): The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_eth_in_wei (str): Amount of ETH to spend (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
 
-    has_graduated = get_has_graduated(wallet.network_id, contract_address)
+    Returns:
+        str: A message containing the token purchase details.
 
+    """
     try:
-        invocation = wallet.invoke_contract(
+        quote = await asyncio.to_thread(
+            get_quote, wallet.network_id, contract_address, amount_eth_in_wei, "buy"
+        )
+        token_quote, has_graduated = quote.amount_out, quote.has_graduated
+
+        # Multiply by 99/100 and floor to get 99% of quote as minimum
+        min_tokens = str(
+            int((token_quote * 99) // 100)
+        )  # Using integer division to floor the result
+        await apreflight(wallet.network_id, buy_checks(contract_address, amount_eth_in_wei))
+        invocation = await asyncio.to_thread(
+            call_upstream,
+            wallet.invoke_contract,
             contract_address=contract_address,
             method="buy",
             abi=WOW_ABI,
@@ -78,11 +145,19 @@ def wow_buy_token(wallet: Wallet, contract_address: str, amount_eth_in_wei: str)
             },
             amount=amount_eth_in_wei,
             asset_id="wei",
-        ).wait()
+        )
+        invocation = await await_or_submit(
+            invocation,
+            f"purchase of WoW ERC20 memecoin {contract_address} for {amount_eth_in_wei} wei",
+        )
     except Exception as e:
         return f"Error buying Zora Wow ERC20 memecoin {e!s}"
 
-    return f"Purchased WoW ERC20 memecoin with transaction hash: {invocation.transaction.transaction_hash}"
+    if isinstance(invocation, PendingTransaction):
+        return invocation.submitted_message()
+
+    outcome = get_buy_outcome(invocation, contract_address, wallet.default_address.address_id)
+    return f"Purchased WoW ERC20 memecoin with transaction hash: {invocation.transaction.transaction_hash}{outcome.describe('Tokens received', 'ETH paid')}"
 
 
 class WowBuyTokenAction(CdpAction):
@@ -92,3 +167,5 @@ class WowBuyTokenAction(CdpAction):
     description: str = WOW_BUY_TOKEN_PROMPT
     args_schema: type[BaseModel] | None = WowBuyTokenInput
     func: Callable[..., str] = wow_buy_token
+    afunc: Callable[..., Awaitable[str]] = awow_buy_token
+    writes: bool = True
@@ -1,3 +1,5 @@
+from cdp_agentkit_core.utils.contract_cache import register_immutable_methods
+
 WOW_FACTORY_ABI = [
     {
         "type": "constructor",
@@ -866,3 +868,6 @@ def get_factory_address(network: str) -> str:
 
 
 GENERIC_TOKEN_METADATA_URI = "ipfs://QmY1GqprFYvojCcUEKgqHeDj9uhZD9jmYGrQTfA9vAE78J"
+
+# A Wow token's pool and metadata are fixed when it is created.
+register_immutable_methods(WOW_ABI, ("poolAddress", "name", "symbol", "decimals"))
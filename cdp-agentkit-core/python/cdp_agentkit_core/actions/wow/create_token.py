@@ -1,4 +1,5 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
@@ -9,6 +10,13 @@ from cdp_agentkit_core.actions.wow.constants import (
     WOW_FACTORY_ABI,
     get_factory_address,
 )
+from cdp_agentkit_core.actions.wow.utils import get_created_token_address
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 WOW_CREATE_TOKEN_PROMPT = """
 This tool can only be used to create a Zora Wow ERC20 memecoin using the WoW factory. Do not use this tool for any other purpose, or creating other types of tokens.
@@ -20,6 +28,7 @@ Inputs:
 
 Important notes:
 - Uses a bonding curve - no upfront liquidity needed
+- Once confirmed, the result includes the address of the created token
 - Only supported on the following networks:
   - Base Sepolia (ie, 'base-sepolia')
   - Base Mainnet (ie, 'base', 'base-mainnnet')
@@ -59,7 +68,54 @@ def wow_create_token(wallet: Wallet, name: str, symbol: str, token_uri: str | No
     factory_address = get_factory_address(wallet.network_id)
 
     try:
-        invocation = wallet.invoke_contract(
+        invocation = call_upstream(
+            wallet.invoke_contract,
+            contract_address=factory_address,
+            method="deploy",
+            abi=WOW_FACTORY_ABI,
+            args={
+                "_tokenCreator": wallet.default_address.address_id,
+                "_platformReferrer": "0x0000000000000000000000000000000000000000",
+                "_tokenURI": token_uri or GENERIC_TOKEN_METADATA_URI,
+                "_name": name,
+                "_symbol": symbol,
+            },
+        )
+        invocation = wait_or_submit(invocation, f"creation of WoW ERC20 memecoin {name} ({symbol})")
+    except Exception as e:
+        return f"Error creating Zora Wow ERC20 memecoin {e!s}"
+
+    if isinstance(invocation, PendingTransaction):
+        return invocation.submitted_message()
+
+    token_address = get_created_token_address(invocation)
+    token_address_line = f"\nToken address: {token_address}" if token_address else ""
+    return f"Created WoW ERC20 memecoin {name} with symbol {symbol} on network {wallet.network_id}.\nTransaction hash for the token creation: {invocation.transaction.transaction_hash}\nTransaction link for the token creation: {invocation.transaction.transaction_link}{token_address_line}"
+
+
+async def awow_create_token(
+    wallet: Wallet, name: str, symbol: str, token_uri: str | None = None
+) -> str:
+    """Create a Zora Wow ERC20 memecoin.
+
+    Async version of `wow_create_token`.
+
+    Args:
+        wallet (Wallet): The wallet to create the token from.
+        name (str): The name of the token to create.
+        symbol (str): The symbol of the token to create.
+        token_uri (str | None): The URI of the token metadata to store on IPFS e.g. ipfs://QmY1GqprFYvojCcUEKgqHeDj9uhZD9jmYGrQTfA9vAE78J.
+
+    Returns:
+        str: A message containing the token creation details.
+
+    """
+    factory_address = get_factory_address(wallet.network_id)
+
+    try:
+        invocation = await asyncio.to_thread(
+            call_upstream,
+            wallet.invoke_contract,
             contract_address=factory_address,
             method="deploy",
             abi=WOW_FACTORY_ABI,
@@ -70,11 +126,19 @@ def wow_create_token(wallet: Wallet, name: str, symbol: str, token_uri: str | No
                 "_name": name,
                 "_symbol": symbol,
             },
-        ).wait()
+        )
+        invocation = await await_or_submit(
+            invocation, f"creation of WoW ERC20 memecoin {name} ({symbol})"
+        )
     except Exception as e:
         return f"Error creating Zora Wow ERC20 memecoin {e!s}"
 
-    return f"Created WoW ERC20 memecoin {name} with symbol {symbol} on network {wallet.network_id}.\nTransaction hash for the token creation: {invocation.transaction.transaction_hash}\nTransaction link for the token creation: {invocation.transaction.transaction_link}"
+    if isinstance(invocation, PendingTransaction):
+        return invocation.submitted_message()
+
+    token_address = get_created_token_address(invocation)
+    token_address_line = f"\nToken address: {token_address}" if token_address else ""
+    return f"Created WoW ERC20 memecoin {name} with symbol {symbol} on network {wallet.network_id}.\nTransaction hash for the token creation: {invocation.transaction.transaction_hash}\nTransaction link for the token creation: {invocation.transaction.transaction_link}{token_address_line}"
 
 
 class WowCreateTokenAction(CdpAction):
@@ -84,3 +148,5 @@ class WowCreateTokenAction(CdpAction):
     description: str = WOW_CREATE_TOKEN_PROMPT
     args_schema: type[BaseModel] | None = WowCreateTokenInput
     func: Callable[..., str] = wow_create_token
+    afunc: Callable[..., Awaitable[str]] = awow_create_token
+    writes: bool = True
@@ -0,0 +1,129 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Literal
+
+from cdp import Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions.cdp_action import CdpAction
+from cdp_agentkit_core.actions.wow.utils import QuoteLadder, get_quote_ladder
+
+WOW_QUOTE_LADDER_PROMPT = """
+This tool quotes buying or selling a Zora Wow ERC20 memecoin for several order sizes at once, and reports the price impact of each size. Use it to find how large an order can be before the price impact becomes unacceptable, instead of requesting one quote per size. It does not trade.
+
+Inputs:
+- WOW token contract address
+- Order sizes (in wei): amounts of ETH to buy with, or of tokens to sell
+- Whether to quote a 'buy' or a 'sell'
+
+Important notes:
+- Each amount is a string and cannot have any decimal points, since the unit of measurement is wei.
+- 1 wei = 0.000000000000000001 ETH
+- Only supported on the following networks:
+  - Base Sepolia (ie, 'base-sepolia')
+  - Base Mainnet (ie, 'base', 'base-mainnnet')
+"""
+
+
+class WowQuoteLadderInput(BaseModel):
+    """Input argument schema for quote ladder action."""
+
+    contract_address: str = Field(
+        ...,
+        description="The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+    )
+
+    amounts_in_wei: list[str] = Field(
+        ...,
+        description="Order sizes to quote (in wei): amounts of ETH to buy with, or of tokens to sell, e.g. `['100000000000000', '1000000000000000']`",
+    )
+
+    quote_type: Literal["buy", "sell"] = Field(
+        ...,
+        description="Whether to quote buying the token with ETH ('buy') or selling it for ETH ('sell')",
+    )
+
+
+def _format_ladder(contract_address: str, quote_type: str, ladder: QuoteLadder) -> str:
+    """Format a quote ladder as a price impact table."""
+    market = "Uniswap" if ladder.has_graduated else "bonding curve"
+    unit_in, unit_out = ("ETH", "tokens") if quote_type == "buy" else ("tokens", "ETH")
+
+    lines = [
+        f"Price impact of {quote_type} orders for {contract_address} ({market}):",
+        f"  amount in ({unit_in}, wei) | amount out ({unit_out}, wei) | price impact",
+    ]
+    for quote in ladder.quotes:
+        if quote.amount_out is None:
+            lines.append(f"  {quote.amount_in} | no quote | n/a")
+        elif quote.price_impact is None:
+            lines.append(f"  {quote.amount_in} | {quote.amount_out} | n/a")
+        else:
+            lines.append(f"  {quote.amount_in} | {quote.amount_out} | {quote.price_impact:.4%}")
+    return "\n".join(lines)
+
+
+def wow_quote_ladder(
+    wallet: Wallet,
+    contract_address: str,
+    amounts_in_wei: list[str],
+    quote_type: Literal["buy", "sell"],
+) -> str:
+    """Quote a Zora Wow ERC20 memecoin buy or sell for several order sizes.
+
+    Args:
+        wallet (Wallet): The wallet whose network to quote on.
+        contract_address (str): The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts_in_wei (list[str]): Amounts of ETH to buy with, or of tokens to sell (in wei)
+        quote_type (Literal["buy", "sell"]): Whether to quote a buy or a sell.
+
+    Returns:
+        str: A table of the amount out and price impact of each order size.
+
+    """
+    try:
+        ladder = get_quote_ladder(wallet.network_id, contract_address, amounts_in_wei, quote_type)
+    except Exception as e:
+        return f"Error quoting Zora Wow ERC20 memecoin {e!s}"
+
+    return _format_ladder(contract_address, quote_type, ladder)
+
+
+async def awow_quote_ladder(
+    wallet: Wallet,
+    contract_address: str,
+    amounts_in_wei: list[str],
+    quote_type: Literal["buy", "sell"],
+) -> str:
+    """Quote a Zora Wow ERC20 memecoin buy or sell for several order sizes.
+
+    Async version of `wow_quote_ladder`.
+
+    Args:
+        wallet (Wallet): The wallet whose network to quote on.
+        contract_address (str): The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts_in_wei (list[str]): Amounts of ETH to buy with, or of tokens to sell (in wei)
+        quote_type (Literal["buy", "sell"]): Whether to quote a buy or a sell.
+
+    Returns:
+        str: A table of the amount out and price impact of each order size.
+
+    """
+    try:
+        ladder = await asyncio.to_thread(
+            get_quote_ladder, wallet.network_id, contract_address, amounts_in_wei, quote_type
+        )
+    except Exception as e:
+        return f"Error quoting Zora Wow ERC20 memecoin {e!s}"
+
+    return _format_ladder(contract_address, quote_type, ladder)
+
+
+class WowQuoteLadderAction(CdpAction):
+    """Zora Wow quote ladder action."""
+
+    name: str = "wow_quote_ladder"
+    description: str = WOW_QUOTE_LADDER_PROMPT
+    args_schema: type[BaseModel] | None = WowQuoteLadderInput
+    func: Callable[..., str] = wow_quote_ladder
+    afunc: Callable[..., Awaitable[str]] = awow_quote_ladder
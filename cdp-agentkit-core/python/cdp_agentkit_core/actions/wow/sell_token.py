@@ -1,4 +1,5 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
@@ -7,8 +8,14 @@ from cdp_agentkit_core.actions.cdp_action import CdpAction
 from cdp_agentkit_core.actions.wow.constants import (
     WOW_ABI,
 )
-from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated
-from cdp_agentkit_core.actions.wow.utils import get_sell_quote
+from cdp_agentkit_core.actions.wow.utils import get_quote, get_sell_outcome, sell_checks
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.preflight import apreflight, preflight
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 WOW_SELL_TOKEN_PROMPT = """
 This tool can only be used to sell a Zora Wow ERC20 memecoin for ETH. Do not use this tool for any other purpose, or trading other assets.
@@ -22,6 +29,7 @@ Important notes:
 - Make sure to use the exact amount provided, and if there's any doubt, check by getting more information before continuing with the action.
 - 1 wei = 0.000000000000000001 ETH
 - Minimum purchase amount is 100000000000000 wei (0.0000001 ETH)
+- Once confirmed, the result includes the tokens sold and the ETH received, so they do not need to be looked up
 - Only supported on the following networks:
   - Base Sepolia (ie, 'base-sepolia')
   - Base Mainnet (ie, 'base', 'base-mainnnet')
@@ -54,14 +62,76 @@ def wow_sell_token(wallet: Wallet, contract_address: str, amount_tokens_in_wei:
         str: A message confirming the sale with the transaction hash
 
     """
-    eth_quote = get_sell_quote(wallet.network_id, contract_address, amount_tokens_in_wei)
-    has_graduated = get_has_graduated(wallet.network_id, contract_address)
+    try:
+        quote = get_quote(wallet.network_id, contract_address, amount_tokens_in_wei, "sell")
+        eth_quote, has_graduated = quote.amount_out, quote.has_graduated
+
+        # Multiply by 98/100 and floor to get 98% of quote as minimum (slippage protection)
+        min_eth = str(int((eth_quote * 98) // 100))
+
+        preflight(
+            wallet.network_id,
+            sell_checks(contract_address, wallet.default_address.address_id, amount_tokens_in_wei),
+        )
+        invocation = call_upstream(
+            wallet.invoke_contract,
+            contract_address=contract_address,
+            method="sell",
+            abi=WOW_ABI,
+            args={
+                "tokensToSell": str(amount_tokens_in_wei),
+                "recipient": wallet.default_address.address_id,
+                "orderReferrer": "0x0000000000000000000000000000000000000000",
+                "comment": "",
+                "expectedMarketType": "1" if has_graduated else "0",
+                "minPayoutSize": min_eth,
+                "sqrtPriceLimitX96": "0",
+            },
+        )
+        invocation = wait_or_submit(
+            invocation,
+            f"sale of {amount_tokens_in_wei} wei of WoW ERC20 memecoin {contract_address}",
+        )
+    except Exception as e:
+        return f"Error selling Zora Wow ERC20 memecoin {e!s}"
 
-    # Multiply by 98/100 and floor to get 98% of quote as minimum (slippage protection)
-    min_eth = str(int((eth_quote * 98) // 100))
+    if isinstance(invocation, PendingTransaction):
+        return invocation.submitted_message()
 
+    outcome = get_sell_outcome(invocation, contract_address, wallet.default_address.address_id)
+    return f"Sold WoW ERC20 memecoin with transaction hash: {invocation.transaction.transaction_hash}{outcome.describe('Tokens sold', 'ETH received')}"
+
+
+async def awow_sell_token(wallet: Wallet, contract_address: str, amount_tokens_in_wei: str) -> str:
+    """Sell WOW tokens for ETH.
+
+    Async version of `wow_sell_token`.
+
+    Args:
+        wallet (Wallet): The wallet to sell the tokens from.
+        contract_address (str): The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_tokens_in_wei (str): Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
+
+    Returns:
+        str: A message confirming the sale with the transaction hash
+
+    """
     try:
-        invocation = wallet.invoke_contract(
+        quote = await asyncio.to_thread(
+            get_quote, wallet.network_id, contract_address, amount_tokens_in_wei, "sell"
+        )
+        eth_quote, has_graduated = quote.amount_out, quote.has_graduated
+
+        # Multiply by 98/100 and floor to get 98% of quote as minimum (slippage protection)
+        min_eth = str(int((eth_quote * 98) // 100))
+
+        await apreflight(
+            wallet.network_id,
+            sell_checks(contract_address, wallet.default_address.address_id, amount_tokens_in_wei),
+        )
+        invocation = await asyncio.to_thread(
+            call_upstream,
+            wallet.invoke_contract,
             contract_address=contract_address,
             method="sell",
             abi=WOW_ABI,
@@ -74,13 +144,19 @@ def wow_sell_token(wallet: Wallet, contract_address: str, amount_tokens_in_wei:
                 "minPayoutSize": min_eth,
                 "sqrtPriceLimitX96": "0",
             },
-        ).wait()
+        )
+        invocation = await await_or_submit(
+            invocation,
+            f"sale of {amount_tokens_in_wei} wei of WoW ERC20 memecoin {contract_address}",
+        )
     except Exception as e:
         return f"Error selling Zora Wow ERC20 memecoin {e!s}"
 
-    return (
-        f"Sold WoW ERC20 memecoin with transaction hash: {invocation.transaction.transaction_hash}"
-    )
+    if isinstance(invocation, PendingTransaction):
+        return invocation.submitted_message()
+
+    outcome = get_sell_outcome(invocation, contract_address, wallet.default_address.address_id)
+    return f"Sold WoW ERC20 memecoin with transaction hash: {invocation.transaction.transaction_hash}{outcome.describe('Tokens sold', 'ETH received')}"
 
 
 class WowSellTokenAction(CdpAction):
@@ -90,3 +166,5 @@ class WowSellTokenAction(CdpAction):
     description: str = WOW_SELL_TOKEN_PROMPT
     args_schema: type[BaseModel] | None = WowSellTokenInput
     func: Callable[..., str] = wow_sell_token
+    afunc: Callable[..., Awaitable[str]] = awow_sell_token
+    writes: bool = True
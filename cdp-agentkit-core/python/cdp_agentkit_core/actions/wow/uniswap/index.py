@@ -1,13 +1,25 @@
 from dataclasses import dataclass
 from decimal import Decimal
+from fractions import Fraction
 from typing import Literal
 
-from cdp import SmartContract
 from web3 import Web3
 from web3.types import Wei
 
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI, addresses
 from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
+from cdp_agentkit_core.actions.wow.uniswap.v3_math import (
+    FEE_DENOMINATOR,
+    MAX_TICK,
+    MIN_TICK,
+    PoolState,
+    simulate_swap,
+)
+from cdp_agentkit_core.utils.contract_cache import cached_read
+from cdp_agentkit_core.utils.multicall import Call, multicall
+
+# Number of tick bitmap words loaded on each side of the current tick for local swap simulation.
+DEFAULT_TICK_WORD_RADIUS = 2
 
 
 @dataclass
@@ -74,6 +86,19 @@ def create_price_info(wei_amount: Wei, eth_price_in_usd: float) -> PriceInfo:
     return PriceInfo(eth=wei_amount, usd=Decimal(str(usd)))
 
 
+def has_graduated_call(token_address: str) -> Call:
+    """Build the multicall read of a Zora Wow token's market type.
+
+    Args:
+        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+
+    Returns:
+        Call: A read of `marketType`, which is 1 once the token has graduated to Uniswap.
+
+    """
+    return Call(token_address, WOW_ABI, "marketType")
+
+
 def get_has_graduated(network_id: str, token_address: str) -> bool:
     """Check if a token has graduated from the Zora Wow protocol.
 
@@ -85,18 +110,141 @@ def get_has_graduated(network_id: str, token_address: str) -> bool:
         bool: True if the token has graduated, False otherwise
 
     """
-    market_type = SmartContract.read(
-        network_id,
-        contract_address=token_address,
-        method="marketType",
-        abi=WOW_ABI,
-    )
+    (market_type,) = multicall(network_id, [has_graduated_call(token_address)])
     return market_type == 1
 
 
+def pool_state_calls(pool_address: str) -> list[Call]:
+    """Build the multicall reads of a uniswap v3 pool's tokens, fee, liquidity and slot0.
+
+    Args:
+        pool_address: Uniswap v3 pool address
+
+    Returns:
+        list[Call]: Reads of `token0`, `token1`, `fee`, `liquidity` and `slot0`, in that order.
+
+    """
+    return [
+        Call(pool_address, UNISWAP_V3_ABI, "token0"),
+        Call(pool_address, UNISWAP_V3_ABI, "token1"),
+        Call(pool_address, UNISWAP_V3_ABI, "fee"),
+        Call(pool_address, UNISWAP_V3_ABI, "liquidity"),
+        Call(pool_address, UNISWAP_V3_ABI, "slot0"),
+    ]
+
+
+def pool_balance_calls(pool_address: str, token0: str, token1: str) -> list[Call]:
+    """Build the multicall reads of a uniswap v3 pool's token balances.
+
+    Args:
+        pool_address: Uniswap v3 pool address
+        token0: The pool's token0 address
+        token1: The pool's token1 address
+
+    Returns:
+        list[Call]: Reads of the pool's token0 and token1 balances, in that order.
+
+    """
+    return [
+        Call(token0, WOW_ABI, "balanceOf", {"account": pool_address}),
+        Call(token1, WOW_ABI, "balanceOf", {"account": pool_address}),
+    ]
+
+
+def exact_input_single_call(
+    network_id: str, token_in: str, token_out: str, amount_in: int | str, fee: int | str
+) -> Call:
+    """Build the multicall read of a Uniswap quoter exact input quote.
+
+    The quote is allowed to revert (e.g. for a pool without liquidity), in which case it is `None`.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_in: Token address to swap from, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        token_out: Token address to swap to, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_in: Amount of tokens to swap (in Wei)
+        fee: Fee for the swap
+
+    Returns:
+        Call: A read of `quoteExactInputSingle` on the network's Uniswap quoter.
+
+    """
+    return Call(
+        addresses[network_id]["UniswapQuoter"],
+        UNISWAP_QUOTER_ABI,
+        "quoteExactInputSingle",
+        {
+            "params": {
+                "tokenIn": str(Web3.to_checksum_address(token_in)),
+                "tokenOut": str(Web3.to_checksum_address(token_out)),
+                "amountIn": amount_in,
+                "fee": fee,
+                "sqrtPriceLimitX96": 0,
+            }
+        },
+        allow_failure=True,
+    )
+
+
+def pool_quote_calls(
+    network_id: str,
+    pool_address: str,
+    token0: str,
+    token1: str,
+    fee: int,
+    amount: int,
+    quote_type: Literal["buy", "sell"],
+) -> list[Call]:
+    """Build the multicall reads needed to quote a swap once the pool's tokens and fee are known.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        pool_address: Uniswap v3 pool address
+        token0: The pool's token0 address
+        token1: The pool's token1 address
+        fee: The pool's fee
+        amount: Amount of tokens to swap (in Wei)
+        quote_type: 'buy' or 'sell'
+
+    Returns:
+        list[Call]: Reads of the pool's token0 and token1 balances and of the quoter, in that order.
+
+    """
+    token_in, token_out = swap_tokens(network_id, token0, token1, quote_type)
+    return [
+        *pool_balance_calls(pool_address, token0, token1),
+        exact_input_single_call(network_id, token_in, token_out, amount, fee),
+    ]
+
+
+def swap_tokens(
+    network_id: str, token0: str, token1: str, quote_type: Literal["buy", "sell"]
+) -> tuple[str, str]:
+    """Order a WETH pool's tokens as (token in, token out) for a buy or a sell.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token0: The pool's token0 address
+        token1: The pool's token1 address
+        quote_type: 'buy' or 'sell'
+
+    Returns:
+        tuple[str, str]: The token swapped from and the token swapped to.
+
+    """
+    is_token0_weth = token0.lower() == addresses[network_id]["WETH"].lower()
+    if (quote_type == "buy") == is_token0_weth:
+        return token0, token1
+    return token1, token0
+
+
 def get_pool_info(network_id: str, pool_address: str) -> PoolInfo:
     """Get pool info for a given uniswap v3 pool address.
 
+    The pool state is read with one multicall, and the pool's token balances with a second one.
+    The pool's tokens and fee never change, so after the first read they come from the contract
+    cache.
+
     Args:
         network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
         pool_address: Uniswap v3 pool address
@@ -106,53 +254,12 @@ def get_pool_info(network_id: str, pool_address: str) -> PoolInfo:
 
     """
     try:
-        # Parallel execution of contract calls
-        token0 = SmartContract.read(
-            network_id,
-            pool_address,
-            "token0",
-            abi=UNISWAP_V3_ABI,
-        )
-        token1 = SmartContract.read(
-            network_id,
-            pool_address,
-            "token1",
-            abi=UNISWAP_V3_ABI,
-        )
-        fee = SmartContract.read(
-            network_id,
-            pool_address,
-            "fee",
-            abi=UNISWAP_V3_ABI,
-        )
-        liquidity = SmartContract.read(
-            network_id,
-            pool_address,
-            "liquidity",
-            abi=UNISWAP_V3_ABI,
-        )
-        slot0 = SmartContract.read(
-            network_id,
-            pool_address,
-            "slot0",
-            abi=UNISWAP_V3_ABI,
-        )
-
-        balance0 = SmartContract.read(
-            network_id,
-            token0,
-            "balanceOf",
-            abi=WOW_ABI,
-            args={"account": pool_address},
+        token0, token1, fee, liquidity, slot0 = multicall(
+            network_id, pool_state_calls(pool_address)
         )
 
-        balance1 = SmartContract.read(
-            network_id,
-            token1,
-            "balanceOf",
-            abi=WOW_ABI,
-            args={"account": pool_address},
-        )
+        # The balances depend on the token addresses, so they need a second round trip.
+        balance0, balance1 = multicall(network_id, pool_balance_calls(pool_address, token0, token1))
 
         return PoolInfo(
             token0=token0,
@@ -161,7 +268,7 @@ def get_pool_info(network_id: str, pool_address: str) -> PoolInfo:
             balance1=balance1,
             fee=fee,
             liquidity=liquidity,
-            sqrt_price_x96=slot0[0],
+            sqrt_price_x96=slot0["sqrtPriceX96"],
         )
     except Exception as error:
         raise Exception(f"Failed to fetch pool information: {error!s}") from error
@@ -184,123 +291,266 @@ def exact_input_single(
 
     """
     try:
-        amount = SmartContract.read(
-            network_id,
-            addresses[network_id]["UniswapQuoter"],
-            "quoteExactInputSingle",
-            abi=UNISWAP_QUOTER_ABI,
-            args={
-                "tokenIn": str(Web3.to_checksum_address(token_in)),
-                "tokenOut": str(Web3.to_checksum_address(token_out)),
-                "fee": fee,
-                "amountIn": amount_in,
-                "sqrtPriceLimitX96": 0,
-            },
+        (quote,) = multicall(
+            network_id, [exact_input_single_call(network_id, token_in, token_out, amount_in, fee)]
         )
-
-        return amount
+        return quote["amountOut"] if quote else 0
     except Exception as error:
         print(f"Quoter error: {error}")
         return 0
 
 
+def build_uniswap_quote(
+    network_id: str,
+    pool_info: PoolInfo | None,
+    amount: int,
+    quote_type: Literal["buy", "sell"],
+    amount_out: int | None,
+) -> Quote:
+    """Assemble a Quote from pool info and a quoter result that have already been read.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        pool_info: The pool info, or None if it could not be read
+        amount: Amount of tokens (in Wei)
+        quote_type: 'buy' or 'sell'
+        amount_out: The quoter's amount out, or None if the quote failed
+
+    Returns:
+        Quote: A Quote object containing the amount in, amount out, balance, fee, and any error messages.
+
+    """
+    if pool_info is None:
+        return Quote(
+            amount_in=amount,
+            amount_out=Wei(0),
+            balance=None,
+            fee=None,
+            error="Failed fetching pool",
+        )
+
+    is_token0_weth = pool_info.token0.lower() == addresses[network_id]["WETH"].lower()
+    balance = Balance(
+        erc20z=Wei(pool_info.balance1 if is_token0_weth else pool_info.balance0),
+        weth=Wei(pool_info.balance0 if is_token0_weth else pool_info.balance1),
+    )
+    # Buying pays WETH in for the ERC20z in the pool; selling pays the ERC20z in for WETH.
+    balance_out = balance.erc20z if quote_type == "buy" else balance.weth
+
+    insufficient_liquidity = (quote_type == "buy" and amount > balance_out) or (
+        quote_type == "sell" and not amount_out
+    )
+    utilization = Wei(amount // balance_out) if quote_type == "buy" and balance_out else Wei(0)
+
+    error = None
+    if insufficient_liquidity:
+        error = "Insufficient liquidity"
+    elif not amount_out and utilization >= Wei(int(0.9 * 1e18)):
+        error = "Price impact too high"
+    elif not amount_out:
+        error = "Failed fetching quote"
+
+    return Quote(
+        amount_in=amount,
+        amount_out=Wei(amount_out) if amount_out else Wei(0),
+        balance=balance,
+        fee=pool_info.fee / 1000000,
+        error=error,
+    )
+
+
 def get_uniswap_quote(
-    network_id: str, token_address: str, amount: int, quote_type: Literal["buy", "sell"]
+    network_id: str,
+    token_address: str,
+    amount: int | str,
+    quote_type: Literal["buy", "sell"],
+    pool_address: str | None = None,
 ) -> Quote:
     """Get Uniswap quote for buying or selling tokens.
 
+    The pool state is read with one multicall, and the pool balances and the quoter with a second.
+
     Args:
         network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
         token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
         amount: Amount of tokens (in Wei)
         quote_type: 'buy' or 'sell'
+        pool_address: The token's uniswap v3 pool address, if already known
 
     Returns:
         Quote: A Quote object containing the amount in, amount out, balance, fee, and any error messages.
 
     """
-    pool = None
-    tokens = None
-    balances = None
-    eth_price_in_usd = None
-    quote_result = None
-    utilization = Wei(0)
-    insufficient_liquidity = False
-
-    pool_address = get_pool_address(token_address)
-    invalid_pool_error = "Invalid pool address" if not pool_address else None
-    print("pool address: " + pool_address)
+    amount = int(amount)
+    pool_address = pool_address or get_pool_address(token_address, network_id)
+    if not pool_address:
+        return Quote(
+            amount_in=amount,
+            amount_out=Wei(0),
+            balance=None,
+            fee=None,
+            error="Invalid pool address",
+        )
 
+    pool_info = None
+    amount_out = None
     try:
-        pool_info = get_pool_info(network_id, pool_address)
-        token0, token1 = pool_info.token0, pool_info.token1
-        balance0, balance1 = pool_info.balance0, pool_info.balance1
-        fee = pool_info.fee
-
-        pool = pool_info
-        tokens = (token0, token1)
-        balances = (balance0, balance1)
-
-        is_token0_weth = token0.lower() == addresses[network_id]["WETH"].lower()
-        token_in = (
-            token0
-            if (quote_type == "buy" and is_token0_weth)
-            or (quote_type == "sell" and not is_token0_weth)
-            else token1
+        token0, token1, fee, liquidity, slot0 = multicall(
+            network_id, pool_state_calls(pool_address)
         )
-
-        token_out, balance_out = (token1, balance1) if token_in == token0 else (token0, balance0)
-        print("123", balance_out, amount)
-        print(type(balance_out), type(amount))
-        insufficient_liquidity = quote_type == "buy" and amount > balance_out
-        utilization = Wei(int(amount / balance_out)) if quote_type == "buy" else Wei(0)
-
-        quote_result = exact_input_single(network_id, token_in, token_out, amount, fee)
-        print("quote_result", quote_result)
+        balance0, balance1, quote = multicall(
+            network_id,
+            pool_quote_calls(network_id, pool_address, token0, token1, fee, amount, quote_type),
+        )
+        pool_info = PoolInfo(
+            token0=token0,
+            balance0=balance0,
+            token1=token1,
+            balance1=balance1,
+            fee=fee,
+            liquidity=liquidity,
+            sqrt_price_x96=slot0["sqrtPriceX96"],
+        )
+        amount_out = quote["amountOut"] if quote else None
     except Exception as error:
         print(f"Error fetching quote: {error}")
 
-    insufficient_liquidity = (
-        quote_type == "sell" and pool and not quote_result
-    ) or insufficient_liquidity
-
-    error_msg = None
-    if not pool or not eth_price_in_usd:
-        error_msg = "Failed fetching pool"
-    elif insufficient_liquidity:
-        error_msg = "Insufficient liquidity"
-    elif not quote_result and utilization >= Wei(int(0.9 * 1e18)):
-        error_msg = "Price impact too high"
-    elif not quote_result:
-        error_msg = "Failed fetching quote"
-
-    print(tokens)
-    balance_result = None
-    if tokens and balances:
-        is_weth_token0 = tokens[0].lower() == addresses[network_id]["WETH"].lower()
-        balance_result = Balance(
-            erc20z=Wei(balances[1]) if is_weth_token0 else Wei(balances[0]),
-            weth=Wei(balances[0]) if is_weth_token0 else Wei(balances[1]),
-        )
-
-    return Quote(
-        amount_in=amount,
-        amount_out=quote_result if quote_result else Wei(0),
-        balance=balance_result,
-        fee=pool.fee / 1000000 if pool else None,
-        error=invalid_pool_error or error_msg,
-    )
+    return build_uniswap_quote(network_id, pool_info, amount, quote_type, amount_out)
 
 
-def get_pool_address(token_address: str) -> str:
+def get_pool_address(token_address: str, network_id: str = "base-sepolia") -> str:
     """Fetch the uniswap v3 pool address for a given token.
 
     Args:
         token_address (str): The address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        network_id (str): Network ID, which is either `base-sepolia` or `base-mainnet`
 
     Returns:
         str: The uniswap v3 pool address associated with the token.
 
     """
-    pool_address = SmartContract.read("base-sepolia", token_address, "poolAddress", abi=WOW_ABI)
+    pool_address = cached_read(network_id, token_address, "poolAddress", abi=WOW_ABI)
     return str(pool_address)
+
+
+def get_pool_state(
+    network_id: str, pool_address: str, word_radius: int = DEFAULT_TICK_WORD_RADIUS
+) -> tuple[str, PoolState]:
+    """Load the state needed to simulate swaps against a uniswap v3 pool locally.
+
+    Reads the pool's price, liquidity, fee and tick spacing, then the tick bitmap words within
+    `word_radius` words of the current tick, then the `liquidityNet` of every initialized tick in
+    those words, with one multicall each.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        pool_address: Uniswap v3 pool address
+        word_radius: Number of tick bitmap words to load on each side of the current tick
+
+    Returns:
+        tuple[str, PoolState]: The pool's token0 address and its state.
+
+    """
+    token0, fee, tick_spacing, liquidity, slot0 = multicall(
+        network_id,
+        [
+            Call(pool_address, UNISWAP_V3_ABI, "token0"),
+            Call(pool_address, UNISWAP_V3_ABI, "fee"),
+            Call(pool_address, UNISWAP_V3_ABI, "tickSpacing"),
+            Call(pool_address, UNISWAP_V3_ABI, "liquidity"),
+            Call(pool_address, UNISWAP_V3_ABI, "slot0"),
+        ],
+    )
+
+    current_word = (slot0["tick"] // tick_spacing) >> 8
+    min_word = max(current_word - word_radius, (MIN_TICK // tick_spacing) >> 8)
+    max_word = min(current_word + word_radius, (MAX_TICK // tick_spacing) >> 8)
+    words = range(min_word, max_word + 1)
+    bitmaps = multicall(
+        network_id,
+        [
+            Call(pool_address, UNISWAP_V3_ABI, "tickBitmap", {"wordPosition": word})
+            for word in words
+        ],
+    )
+
+    initialized_ticks = [
+        ((word << 8) + bit) * tick_spacing
+        for word, bitmap in zip(words, bitmaps, strict=True)
+        for bit in range(256)
+        if bitmap >> bit & 1
+    ]
+    tick_infos = multicall(
+        network_id,
+        [Call(pool_address, UNISWAP_V3_ABI, "ticks", {"tick": tick}) for tick in initialized_ticks],
+    )
+
+    return token0, PoolState(
+        sqrt_price_x96=slot0["sqrtPriceX96"],
+        tick=slot0["tick"],
+        liquidity=liquidity,
+        fee=fee,
+        tick_spacing=tick_spacing,
+        ticks={
+            tick: info["liquidityNet"]
+            for tick, info in zip(initialized_ticks, tick_infos, strict=True)
+        },
+        min_word=min_word,
+        max_word=max_word,
+    )
+
+
+def simulate_uniswap_quote(
+    network_id: str,
+    token0: str,
+    pool_state: PoolState,
+    amount: int | str,
+    quote_type: Literal["buy", "sell"],
+) -> int:
+    """Quote an exact input swap against a WETH pool locally, without calling the quoter.
+
+    The result matches `quoteExactInputSingle` for the same pool state, so a pool loaded once with
+    `get_pool_state` can price any number of trade sizes without further reads.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token0: The pool's token0 address
+        pool_state: The pool state, from `get_pool_state`
+        amount: Amount of tokens to swap in (in Wei)
+        quote_type: 'buy' or 'sell'
+
+    Returns:
+        int: Amount of tokens to receive (in Wei)
+
+    Raises:
+        InsufficientTickDataError: If the swap moves past the tick bitmap words that were loaded.
+
+    """
+    zero_for_one = _is_zero_for_one(network_id, token0, quote_type)
+    return simulate_swap(pool_state, zero_for_one, int(amount)).amount_out
+
+
+def get_uniswap_spot_rate(
+    network_id: str, token0: str, pool_state: PoolState, quote_type: Literal["buy", "sell"]
+) -> Fraction:
+    """Compute the marginal exchange rate of a WETH pool after fees.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token0: The pool's token0 address
+        pool_state: The pool state, from `get_pool_state`
+        quote_type: 'buy' or 'sell'
+
+    Returns:
+        Fraction: Wei of the token swapped to received per wei of the token swapped from.
+
+    """
+    price = Fraction(pool_state.sqrt_price_x96**2, 1 << 192)
+    rate = price if _is_zero_for_one(network_id, token0, quote_type) else 1 / price
+    return rate * Fraction(FEE_DENOMINATOR - pool_state.fee, FEE_DENOMINATOR)
+
+
+def _is_zero_for_one(network_id: str, token0: str, quote_type: Literal["buy", "sell"]) -> bool:
+    # Buying swaps WETH in, so it is a token0 to token1 swap when token0 is WETH.
+    is_token0_weth = token0.lower() == addresses[network_id]["WETH"].lower()
+    return (quote_type == "buy") == is_token0_weth
@@ -0,0 +1,430 @@
+"""Pure-Python Uniswap V3 swap simulation.
+
+A port of the integer math of Uniswap V3 core (`TickMath`, `SqrtPriceMath`, `SwapMath`,
+`TickBitmap` and the `UniswapV3Pool.swap` loop), so swaps can be priced locally from a pool's
+`slot0`, liquidity and initialized ticks with the same rounding as the on-chain quoter.
+"""
+
+from dataclasses import dataclass, field
+
+MIN_TICK = -887272
+MAX_TICK = -MIN_TICK
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+Q96 = 1 << 96
+MAX_UINT160 = (1 << 160) - 1
+MAX_UINT256 = (1 << 256) - 1
+FEE_DENOMINATOR = 1_000_000
+
+# TickMath.getSqrtRatioAtTick multipliers: 2**128 / sqrt(1.0001) ** (2 ** i) for bit i of |tick|.
+_TICK_RATIO_MULTIPLIERS = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+
+class InsufficientTickDataError(Exception):
+    """Raised when a simulated swap moves past the ticks that were loaded for the pool."""
+
+
+def mul_div(a: int, b: int, denominator: int) -> int:
+    """Compute floor(a * b / denominator) with full precision (FullMath.mulDiv)."""
+    return a * b // denominator
+
+
+def mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    """Compute ceil(a * b / denominator) with full precision (FullMath.mulDivRoundingUp)."""
+    return -(-a * b // denominator)
+
+
+def div_rounding_up(a: int, b: int) -> int:
+    """Compute ceil(a / b) (UnsafeMath.divRoundingUp)."""
+    return -(-a // b)
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """Compute sqrt(1.0001 ** tick) as a Q64.96 (TickMath.getSqrtRatioAtTick).
+
+    Args:
+        tick: The tick, between MIN_TICK and MAX_TICK.
+
+    Returns:
+        int: The sqrt price as a Q64.96.
+
+    """
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} out of range")
+
+    ratio = 0xFFFCB933BD6FAD37AA2D162D1A594001 if abs_tick & 0x1 else 1 << 128
+    for bit, multiplier in _TICK_RATIO_MULTIPLIERS:
+        if abs_tick & bit:
+            ratio = (ratio * multiplier) >> 128
+
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+
+    # Round up when going from Q128.128 to Q128.96.
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """Compute the greatest tick whose sqrt ratio is at most `sqrt_price_x96` (TickMath.getTickAtSqrtRatio).
+
+    Args:
+        sqrt_price_x96: The sqrt price as a Q64.96, between MIN_SQRT_RATIO and MAX_SQRT_RATIO.
+
+    Returns:
+        int: The tick.
+
+    """
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError(f"Sqrt price {sqrt_price_x96} out of range")
+
+    low, high = MIN_TICK, MAX_TICK
+    while low < high:
+        mid = (low + high + 1) // 2
+        if get_sqrt_ratio_at_tick(mid) <= sqrt_price_x96:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def get_amount0_delta(sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int, round_up: bool) -> int:
+    """Compute the token0 amount between two prices (SqrtPriceMath.getAmount0Delta)."""
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_ratio_b - sqrt_ratio_a
+    if round_up:
+        return div_rounding_up(
+            mul_div_rounding_up(numerator1, numerator2, sqrt_ratio_b), sqrt_ratio_a
+        )
+    return mul_div(numerator1, numerator2, sqrt_ratio_b) // sqrt_ratio_a
+
+
+def get_amount1_delta(sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int, round_up: bool) -> int:
+    """Compute the token1 amount between two prices (SqrtPriceMath.getAmount1Delta)."""
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+
+    if round_up:
+        return mul_div_rounding_up(liquidity, sqrt_ratio_b - sqrt_ratio_a, Q96)
+    return mul_div(liquidity, sqrt_ratio_b - sqrt_ratio_a, Q96)
+
+
+def _next_sqrt_price_from_amount0_rounding_up(
+    sqrt_price_x96: int, liquidity: int, amount: int, add: bool
+) -> int:
+    if amount == 0:
+        return sqrt_price_x96
+
+    numerator1 = liquidity << 96
+    product = amount * sqrt_price_x96
+    if add:
+        # The contract falls back to a less precise formula when the product overflows uint256.
+        if product <= MAX_UINT256 and numerator1 + product <= MAX_UINT256:
+            return mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 + product)
+        return div_rounding_up(numerator1, numerator1 // sqrt_price_x96 + amount)
+
+    if product > MAX_UINT256 or numerator1 <= product:
+        raise ValueError("Not enough liquidity for the requested output")
+    return mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 - product)
+
+
+def _next_sqrt_price_from_amount1_rounding_down(
+    sqrt_price_x96: int, liquidity: int, amount: int, add: bool
+) -> int:
+    if add:
+        return sqrt_price_x96 + (amount << 96) // liquidity
+
+    quotient = div_rounding_up(amount << 96, liquidity)
+    if sqrt_price_x96 <= quotient:
+        raise ValueError("Not enough liquidity for the requested output")
+    return sqrt_price_x96 - quotient
+
+
+def get_next_sqrt_price_from_input(
+    sqrt_price_x96: int, liquidity: int, amount_in: int, zero_for_one: bool
+) -> int:
+    """Compute the price after adding an input amount (SqrtPriceMath.getNextSqrtPriceFromInput)."""
+    if zero_for_one:
+        return _next_sqrt_price_from_amount0_rounding_up(sqrt_price_x96, liquidity, amount_in, True)
+    return _next_sqrt_price_from_amount1_rounding_down(sqrt_price_x96, liquidity, amount_in, True)
+
+
+def get_next_sqrt_price_from_output(
+    sqrt_price_x96: int, liquidity: int, amount_out: int, zero_for_one: bool
+) -> int:
+    """Compute the price after removing an output amount (SqrtPriceMath.getNextSqrtPriceFromOutput)."""
+    if zero_for_one:
+        return _next_sqrt_price_from_amount1_rounding_down(
+            sqrt_price_x96, liquidity, amount_out, False
+        )
+    return _next_sqrt_price_from_amount0_rounding_up(sqrt_price_x96, liquidity, amount_out, False)
+
+
+def compute_swap_step(
+    sqrt_ratio_current_x96: int,
+    sqrt_ratio_target_x96: int,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int,
+) -> tuple[int, int, int, int]:
+    """Compute a swap within a single tick range (SwapMath.computeSwapStep).
+
+    Args:
+        sqrt_ratio_current_x96: The current sqrt price.
+        sqrt_ratio_target_x96: The sqrt price that cannot be exceeded by this step.
+        liquidity: The usable liquidity.
+        amount_remaining: The amount left to swap in (positive) or out (negative).
+        fee_pips: The fee in hundredths of a bip.
+
+    Returns:
+        tuple[int, int, int, int]: The sqrt price after the step, the amount in (excluding fee),
+        the amount out and the fee amount.
+
+    """
+    zero_for_one = sqrt_ratio_current_x96 >= sqrt_ratio_target_x96
+    exact_in = amount_remaining >= 0
+
+    if exact_in:
+        amount_remaining_less_fee = mul_div(
+            amount_remaining, FEE_DENOMINATOR - fee_pips, FEE_DENOMINATOR
+        )
+        amount_in = (
+            get_amount0_delta(sqrt_ratio_target_x96, sqrt_ratio_current_x96, liquidity, True)
+            if zero_for_one
+            else get_amount1_delta(sqrt_ratio_current_x96, sqrt_ratio_target_x96, liquidity, True)
+        )
+        if amount_remaining_less_fee >= amount_in:
+            sqrt_ratio_next_x96 = sqrt_ratio_target_x96
+        else:
+            sqrt_ratio_next_x96 = get_next_sqrt_price_from_input(
+                sqrt_ratio_current_x96, liquidity, amount_remaining_less_fee, zero_for_one
+            )
+    else:
+        amount_out = (
+            get_amount1_delta(sqrt_ratio_target_x96, sqrt_ratio_current_x96, liquidity, False)
+            if zero_for_one
+            else get_amount0_delta(sqrt_ratio_current_x96, sqrt_ratio_target_x96, liquidity, False)
+        )
+        if -amount_remaining >= amount_out:
+            sqrt_ratio_next_x96 = sqrt_ratio_target_x96
+        else:
+            sqrt_ratio_next_x96 = get_next_sqrt_price_from_output(
+                sqrt_ratio_current_x96, liquidity, -amount_remaining, zero_for_one
+            )
+
+    reached_target = sqrt_ratio_target_x96 == sqrt_ratio_next_x96
+
+    if zero_for_one:
+        if not (reached_target and exact_in):
+            amount_in = get_amount0_delta(
+                sqrt_ratio_next_x96, sqrt_ratio_current_x96, liquidity, True
+            )
+        if not (reached_target and not exact_in):
+            amount_out = get_amount1_delta(
+                sqrt_ratio_next_x96, sqrt_ratio_current_x96, liquidity, False
+            )
+    else:
+        if not (reached_target and exact_in):
+            amount_in = get_amount1_delta(
+                sqrt_ratio_current_x96, sqrt_ratio_next_x96, liquidity, True
+            )
+        if not (reached_target and not exact_in):
+            amount_out = get_amount0_delta(
+                sqrt_ratio_current_x96, sqrt_ratio_next_x96, liquidity, False
+            )
+
+    # Cap the output amount to not exceed the remaining output amount.
+    if not exact_in and amount_out > -amount_remaining:
+        amount_out = -amount_remaining
+
+    if exact_in and sqrt_ratio_next_x96 != sqrt_ratio_target_x96:
+        # The max price was not reached, so the remainder of the input is taken as the fee.
+        fee_amount = amount_remaining - amount_in
+    else:
+        fee_amount = mul_div_rounding_up(amount_in, fee_pips, FEE_DENOMINATOR - fee_pips)
+
+    return sqrt_ratio_next_x96, amount_in, amount_out, fee_amount
+
+
+@dataclass(frozen=True)
+class PoolState:
+    """The state of a Uniswap V3 pool needed to simulate swaps.
+
+    Attributes:
+        sqrt_price_x96: The current sqrt price, from `slot0`.
+        tick: The current tick, from `slot0`.
+        liquidity: The in-range liquidity.
+        fee: The pool fee in hundredths of a bip.
+        tick_spacing: The pool tick spacing.
+        ticks: The `liquidityNet` of every initialized tick in the loaded bitmap words.
+        min_word: The lowest tick bitmap word that was loaded.
+        max_word: The highest tick bitmap word that was loaded.
+
+    """
+
+    sqrt_price_x96: int
+    tick: int
+    liquidity: int
+    fee: int
+    tick_spacing: int
+    ticks: dict[int, int] = field(default_factory=dict)
+    min_word: int = -(1 << 15)
+    max_word: int = (1 << 15) - 1
+
+    def next_initialized_tick_within_one_word(self, tick: int, lte: bool) -> tuple[int, bool]:
+        """Find the next initialized tick in the same bitmap word (TickBitmap.nextInitializedTickWithinOneWord).
+
+        Args:
+            tick: The starting tick.
+            lte: Whether to search to the left (less than or equal to the starting tick).
+
+        Returns:
+            tuple[int, bool]: The next tick (or the word boundary) and whether it is initialized.
+
+        Raises:
+            InsufficientTickDataError: If the word was not loaded.
+
+        """
+        compressed = tick // self.tick_spacing  # Floor division rounds towards negative infinity.
+        if not lte:
+            compressed += 1
+
+        word = compressed >> 8
+        if not self.min_word <= word <= self.max_word:
+            raise InsufficientTickDataError(f"Tick bitmap word {word} was not loaded")
+
+        bit = compressed % 256
+        word_start = compressed - bit
+        initialized = [
+            t // self.tick_spacing
+            for t in self.ticks
+            if word_start <= t // self.tick_spacing < word_start + 256
+        ]
+
+        if lte:
+            candidates = [c for c in initialized if c <= compressed]
+            if candidates:
+                return max(candidates) * self.tick_spacing, True
+            return word_start * self.tick_spacing, False
+
+        candidates = [c for c in initialized if c >= compressed]
+        if candidates:
+            return min(candidates) * self.tick_spacing, True
+        return (word_start + 255) * self.tick_spacing, False
+
+
+@dataclass(frozen=True)
+class SwapResult:
+    """The outcome of a simulated swap."""
+
+    amount_in: int
+    amount_out: int
+    sqrt_price_x96_after: int
+    tick_after: int
+    initialized_ticks_crossed: int
+
+
+def simulate_swap(
+    pool: PoolState,
+    zero_for_one: bool,
+    amount_specified: int,
+    sqrt_price_limit_x96: int | None = None,
+) -> SwapResult:
+    """Simulate a swap against a pool, walking initialized ticks (UniswapV3Pool.swap).
+
+    Args:
+        pool: The pool state.
+        zero_for_one: Whether token0 is swapped for token1.
+        amount_specified: The exact input amount (positive) or exact output amount (negative).
+        sqrt_price_limit_x96: The price limit. Defaults to the quoter's limit of no limit.
+
+    Returns:
+        SwapResult: The amounts in (including fees) and out, and the pool price after the swap.
+
+    Raises:
+        InsufficientTickDataError: If the swap moves past the loaded tick bitmap words.
+
+    """
+    if amount_specified == 0:
+        raise ValueError("amount_specified must not be zero")
+
+    if sqrt_price_limit_x96 is None:
+        sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+
+    exact_input = amount_specified > 0
+    amount_remaining = amount_specified
+    amount_calculated = 0
+    sqrt_price_x96 = pool.sqrt_price_x96
+    tick = pool.tick
+    liquidity = pool.liquidity
+    ticks_crossed = 0
+
+    while amount_remaining != 0 and sqrt_price_x96 != sqrt_price_limit_x96:
+        sqrt_price_start_x96 = sqrt_price_x96
+        tick_next, initialized = pool.next_initialized_tick_within_one_word(tick, zero_for_one)
+        tick_next = min(max(tick_next, MIN_TICK), MAX_TICK)
+        sqrt_price_next_x96 = get_sqrt_ratio_at_tick(tick_next)
+
+        if (zero_for_one and sqrt_price_next_x96 < sqrt_price_limit_x96) or (
+            not zero_for_one and sqrt_price_next_x96 > sqrt_price_limit_x96
+        ):
+            sqrt_price_target_x96 = sqrt_price_limit_x96
+        else:
+            sqrt_price_target_x96 = sqrt_price_next_x96
+
+        sqrt_price_x96, step_in, step_out, step_fee = compute_swap_step(
+            sqrt_price_x96, sqrt_price_target_x96, liquidity, amount_remaining, pool.fee
+        )
+
+        if exact_input:
+            amount_remaining -= step_in + step_fee
+            amount_calculated -= step_out
+        else:
+            amount_remaining += step_out
+            amount_calculated += step_in + step_fee
+
+        if sqrt_price_x96 == sqrt_price_next_x96:
+            if initialized:
+                liquidity_net = pool.ticks[tick_next]
+                liquidity += -liquidity_net if zero_for_one else liquidity_net
+                ticks_crossed += 1
+            tick = tick_next - 1 if zero_for_one else tick_next
+        elif sqrt_price_x96 != sqrt_price_start_x96:
+            tick = get_tick_at_sqrt_ratio(sqrt_price_x96)
+
+    if exact_input:
+        amount_in, amount_out = amount_specified - amount_remaining, -amount_calculated
+    else:
+        amount_in, amount_out = amount_calculated, -(amount_specified - amount_remaining)
+
+    return SwapResult(
+        amount_in=amount_in,
+        amount_out=amount_out,
+        sqrt_price_x96_after=sqrt_price_x96,
+        tick_after=tick,
+        initialized_ticks_crossed=ticks_crossed,
+    )
@@ -1,24 +1,188 @@
-from cdp import SmartContract
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, Literal
 
-from cdp_agentkit_core.actions.wow.constants import WOW_ABI
-from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated, get_uniswap_quote
+from cdp_agentkit_core.actions.wow.bonding_curve import (
+    get_eth_buy_quote,
+    get_spot_price,
+    get_token_sell_quote,
+)
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI, WOW_FACTORY_ABI
+from cdp_agentkit_core.actions.wow.uniswap.index import (
+    PoolInfo,
+    Quote,
+    build_uniswap_quote,
+    get_pool_state,
+    get_uniswap_spot_rate,
+    has_graduated_call,
+    pool_quote_calls,
+    pool_state_calls,
+    simulate_uniswap_quote,
+)
+from cdp_agentkit_core.actions.wow.uniswap.v3_math import InsufficientTickDataError
+from cdp_agentkit_core.utils.multicall import Call, cached_call_result, multicall
+from cdp_agentkit_core.utils.preflight import Check, erc20_balance_check
+from cdp_agentkit_core.utils.receipts import (
+    call_result,
+    eth_sent,
+    internal_eth_received,
+    token_balance_change,
+)
+from cdp_agentkit_core.utils.retry import read_contract
 
 
-def get_current_supply(token_address):
+def get_current_supply(token_address: str, network_id: str = "base-sepolia") -> int:
     """Get the current supply of a token.
 
     Args:
         token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+
+    Returns:
+        int: The token's `totalSupply` (in wei)
+
+    """
+    return int(read_contract(network_id, token_address, "totalSupply", WOW_ABI))
+
+
+@dataclass
+class WowQuote:
+    """Graduation state, pool info and quote for a Zora Wow buy or sell."""
+
+    has_graduated: bool
+    amount_out: int
+    pool_info: PoolInfo | None
+    uniswap_quote: Quote | None
+
+
+def get_bonding_curve_quote(
+    current_supply: int, amount_in_wei: int | str, quote_type: Literal["buy", "sell"]
+) -> int | None:
+    """Quote a Zora Wow bonding curve buy or sell locally.
+
+    Matches the token contract's `getEthBuyQuote` and `getTokenSellQuote` to the wei, without a
+    contract read.
+
+    Args:
+        current_supply: The token's current `totalSupply` (in wei)
+        amount_in_wei: Amount of ETH to buy with, or of tokens to sell (in wei)
+        quote_type: 'buy' or 'sell'
+
+    Returns:
+        int | None: The amount out (in wei), or None where the contract would revert.
+
+    """
+    try:
+        if quote_type == "buy":
+            return get_eth_buy_quote(current_supply, int(amount_in_wei))
+        return get_token_sell_quote(current_supply, int(amount_in_wei))
+    except (ArithmeticError, ValueError):
+        return None
+
+
+def get_quote(
+    network_id: str,
+    token_address: str,
+    amount_in_wei: str,
+    quote_type: Literal["buy", "sell"],
+    current_supply: int | None = None,
+) -> WowQuote:
+    """Quote a Zora Wow buy or sell from the bonding curve, or from Uniswap once graduated.
+
+    Bonding curve quotes are computed locally from the token's `totalSupply`. Every value is read
+    at most once, and independent reads are batched into the same multicall:
+
+    1. market type, total supply (unless `current_supply` is given) and pool address;
+    2. (graduated only) the pool's tokens, fee, liquidity and slot0;
+    3. (graduated only) the pool's balances and the Uniswap quoter.
+
+    The pool address and the pool's tokens and fee never change. Once they are in the contract
+    cache, the reads of steps 2 and 3 join the first batch, so a quote takes a single round trip.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_in_wei: Amount of ETH to buy with, or of tokens to sell (in wei)
+        quote_type: 'buy' or 'sell'
+        current_supply: The token's `totalSupply` (in wei), if already known
+
+    Returns:
+        WowQuote: The graduation state, pool info (if graduated) and the quoted amount out.
+
+    Raises:
+        Exception: If neither the bonding curve nor Uniswap return a quote.
 
     """
-    test = SmartContract.read(
-        "base-sepolia",
-        token_address,
-        "totalSupply",
-        WOW_ABI,
+    amount = int(amount_in_wei)
+    pool_address_call = Call(token_address, WOW_ABI, "poolAddress")
+    supply_calls = [Call(token_address, WOW_ABI, "totalSupply")] if current_supply is None else []
+    calls = [has_graduated_call(token_address), *supply_calls, pool_address_call]
+    token_reads = len(calls)
+
+    pool_address = cached_call_result(network_id, pool_address_call)
+    if pool_address:
+        state_calls = pool_state_calls(pool_address)
+        calls += state_calls
+
+        # token0, token1 and fee are the first three pool state reads.
+        token0, token1, fee = (cached_call_result(network_id, call) for call in state_calls[:3])
+        if token0 and token1 and fee is not None:
+            calls += pool_quote_calls(
+                network_id, pool_address, token0, token1, fee, amount, quote_type
+            )
+
+    results = multicall(network_id, calls)
+    market_type, *supply_results, pool_address = results[:token_reads]
+    state_results = results[token_reads : token_reads + 5]
+    quote_results = results[token_reads + 5 :]
+    if supply_results:
+        (current_supply,) = supply_results
+
+    has_graduated = market_type == 1
+    pool_info = None
+    uniswap_quote = None
+    # The token contract only quotes its bonding curve until the token graduates.
+    bonding_curve_quote = None
+    if not has_graduated:
+        bonding_curve_quote = get_bonding_curve_quote(current_supply, amount, quote_type)
+    else:
+        amount_out = None
+        try:
+            token0, token1, fee, liquidity, slot0 = state_results or multicall(
+                network_id, pool_state_calls(pool_address)
+            )
+            balance0, balance1, quoter_result = quote_results or multicall(
+                network_id,
+                pool_quote_calls(network_id, pool_address, token0, token1, fee, amount, quote_type),
+            )
+            pool_info = PoolInfo(
+                token0=token0,
+                balance0=balance0,
+                token1=token1,
+                balance1=balance1,
+                fee=fee,
+                liquidity=liquidity,
+                sqrt_price_x96=slot0["sqrtPriceX96"],
+            )
+            amount_out = quoter_result["amountOut"] if quoter_result else None
+        except Exception as error:
+            raise Exception(
+                f"Failed to fetch {quote_type} quote for token {token_address}: {error!s}"
+            ) from error
+        uniswap_quote = build_uniswap_quote(network_id, pool_info, amount, quote_type, amount_out)
+
+    token_quote = (uniswap_quote and uniswap_quote.amount_out) or bonding_curve_quote
+    if token_quote is None:
+        raise Exception(f"Failed to fetch {quote_type} quote for token {token_address}")
+
+    return WowQuote(
+        has_graduated=has_graduated,
+        amount_out=token_quote,
+        pool_info=pool_info,
+        uniswap_quote=uniswap_quote,
     )
-    print(test)
-    return test
 
 
 def get_buy_quote(network_id: str, token_address: str, amount_eth_in_wei: str):
@@ -30,18 +194,7 @@ def get_buy_quote(network_id: str, token_address: str, amount_eth_in_wei: str):
         amount_eth_in_wei: Amount of ETH to buy (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
 
     """
-    has_graduated = get_has_graduated(network_id, token_address)
-    token_quote = (
-        has_graduated
-        and (get_uniswap_quote(network_id, token_address, amount_eth_in_wei, "buy")).amount_out
-    ) or SmartContract.read(
-        network_id,
-        token_address,
-        "getEthBuyQuote",
-        abi=WOW_ABI,
-        args={"ethOrderSize": str(amount_eth_in_wei)},
-    )
-    return token_quote
+    return get_quote(network_id, token_address, amount_eth_in_wei, "buy").amount_out
 
 
 def get_sell_quote(network_id: str, token_address: str, amount_tokens_in_wei: str):
@@ -53,15 +206,211 @@ def get_sell_quote(network_id: str, token_address: str, amount_tokens_in_wei: st
         amount_tokens_in_wei (str): Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
 
     """
-    has_graduated = get_has_graduated(network_id, token_address)
-    token_quote = (
-        has_graduated
-        and (get_uniswap_quote(network_id, token_address, amount_tokens_in_wei, "sell")).amount_out
-    ) or SmartContract.read(
+    return get_quote(network_id, token_address, amount_tokens_in_wei, "sell").amount_out
+
+
+@dataclass
+class LadderQuote:
+    """Quote for one order size of a slippage ladder."""
+
+    amount_in: int
+    amount_out: int | None
+    price_impact: Decimal | None
+
+
+@dataclass
+class QuoteLadder:
+    """Quotes for a range of order sizes of a Zora Wow buy or sell."""
+
+    has_graduated: bool
+    quotes: list[LadderQuote]
+
+
+def _ladder_quote(amount_in: int, amount_out: int | None, spot_rate: Fraction) -> LadderQuote:
+    """Build a ladder quote, measuring price impact against the marginal rate before the trade."""
+    price_impact = None
+    if amount_out is not None and amount_in > 0 and spot_rate > 0:
+        impact = 1 - Fraction(amount_out, amount_in) / spot_rate
+        price_impact = Decimal(impact.numerator) / Decimal(impact.denominator)
+    return LadderQuote(amount_in=amount_in, amount_out=amount_out, price_impact=price_impact)
+
+
+def get_quote_ladder(
+    network_id: str,
+    token_address: str,
+    amounts_in_wei: Sequence[int | str],
+    quote_type: Literal["buy", "sell"],
+    current_supply: int | None = None,
+) -> QuoteLadder:
+    """Quote a Zora Wow buy or sell for many order sizes at once.
+
+    The token's state is read once, and every size is then priced locally: on the bonding curve
+    before graduation, and by simulating the Uniswap v3 swap afterwards. Price impact is measured
+    against the marginal rate before the trade, after pool fees, so it is 0 for an infinitely
+    small order.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amounts_in_wei: Amounts of ETH to buy with, or of tokens to sell (in wei)
+        quote_type: 'buy' or 'sell'
+        current_supply: The token's `totalSupply` (in wei), if already known
+
+    Returns:
+        QuoteLadder: The graduation state and a quote per order size, in the order given. Sizes
+        that cannot be quoted have no amount out or price impact.
+
+    """
+    amounts = [int(amount) for amount in amounts_in_wei]
+    supply_calls = [Call(token_address, WOW_ABI, "totalSupply")] if current_supply is None else []
+    market_type, *supply_results, pool_address = multicall(
         network_id,
-        token_address,
-        "getTokenSellQuote",
-        WOW_ABI,
-        args={"tokenOrderSize": str(amount_tokens_in_wei)},
+        [
+            has_graduated_call(token_address),
+            *supply_calls,
+            Call(token_address, WOW_ABI, "poolAddress"),
+        ],
     )
-    return token_quote
+    if current_supply is None:
+        (current_supply,) = supply_results
+
+    if market_type != 1:
+        # Buying is priced in tokens per ETH, the inverse of the curve's price per token.
+        spot_price = get_spot_price(current_supply)
+        spot_rate = 1 / spot_price if quote_type == "buy" else spot_price
+        return QuoteLadder(
+            has_graduated=False,
+            quotes=[
+                _ladder_quote(
+                    amount, get_bonding_curve_quote(current_supply, amount, quote_type), spot_rate
+                )
+                for amount in amounts
+            ],
+        )
+
+    token0, pool_state = get_pool_state(network_id, pool_address)
+    spot_rate = get_uniswap_spot_rate(network_id, token0, pool_state, quote_type)
+
+    quotes = []
+    for amount in amounts:
+        try:
+            amount_out = simulate_uniswap_quote(network_id, token0, pool_state, amount, quote_type)
+        except (InsufficientTickDataError, ValueError):
+            amount_out = None
+        quotes.append(_ladder_quote(amount, amount_out, spot_rate))
+    return QuoteLadder(has_graduated=True, quotes=quotes)
+
+
+def buy_checks(token_address: str, amount_eth_in_wei: str) -> list[Check]:
+    """Create the onchain checks a Zora Wow buy needs to pass before it is sent.
+
+    Args:
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_eth_in_wei: Amount of ETH to buy with (in wei)
+
+    Returns:
+        list[Check]: The minimum order size check.
+
+    """
+    return [
+        Check(
+            calls=(Call(token_address, WOW_ABI, "MIN_ORDER_SIZE"),),
+            passes=lambda min_order_size: int(amount_eth_in_wei) >= min_order_size,
+            reason=lambda min_order_size: (
+                f"The minimum purchase is {min_order_size} wei, more than {amount_eth_in_wei} wei"
+            ),
+        )
+    ]
+
+
+def sell_checks(token_address: str, seller: str, amount_tokens_in_wei: str) -> list[Check]:
+    """Create the onchain checks a Zora Wow sell needs to pass before it is sent.
+
+    Args:
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        seller: The address selling the tokens
+        amount_tokens_in_wei: Amount of tokens to sell (in wei)
+
+    Returns:
+        list[Check]: The token balance check.
+
+    """
+    return [erc20_balance_check(token_address, seller, amount_tokens_in_wei)]
+
+
+@dataclass
+class WowTradeOutcome:
+    """What a confirmed Zora Wow buy or sell exchanged, in wei.
+
+    Either amount is None if the confirmed transaction's content is not available.
+    """
+
+    tokens: int | None
+    eth: int | None
+
+    def describe(self, tokens_label: str, eth_label: str) -> str:
+        """Describe the known amounts, one per line, each line starting with a newline."""
+        lines = ""
+        if self.tokens is not None:
+            lines += f"\n{tokens_label}: {self.tokens} wei"
+        if self.eth is not None:
+            lines += f"\n{eth_label}: {self.eth} wei"
+        return lines
+
+
+def get_buy_outcome(invocation: Any, token_address: str, buyer: str) -> WowTradeOutcome:
+    """Read the tokens received and the ETH paid by a confirmed buy, without a contract read.
+
+    Args:
+        invocation: The confirmed `buy` contract invocation
+        token_address: Address of the token contract
+        buyer: The address that bought and received the tokens, and any ETH refund
+
+    Returns:
+        WowTradeOutcome: The tokens received and the ETH paid net of refunds.
+
+    """
+    tokens = token_balance_change(invocation, token_address, buyer)
+    if not tokens:
+        tokens = call_result(invocation, WOW_ABI, "buy") or tokens
+
+    eth = eth_sent(invocation)
+    refund = internal_eth_received(invocation, buyer)
+    if eth is not None and refund is not None:
+        eth -= refund
+    return WowTradeOutcome(tokens=tokens, eth=eth)
+
+
+def get_sell_outcome(invocation: Any, token_address: str, seller: str) -> WowTradeOutcome:
+    """Read the tokens sold and the ETH received by a confirmed sell, without a contract read.
+
+    Args:
+        invocation: The confirmed `sell` contract invocation
+        token_address: Address of the token contract
+        seller: The address that sold the tokens and received the ETH
+
+    Returns:
+        WowTradeOutcome: The tokens sold and the ETH received.
+
+    """
+    tokens = token_balance_change(invocation, token_address, seller)
+    if tokens is not None:
+        tokens = -tokens
+
+    eth = internal_eth_received(invocation, seller)
+    if not eth:
+        eth = call_result(invocation, WOW_ABI, "sell") or eth
+    return WowTradeOutcome(tokens=tokens, eth=eth)
+
+
+def get_created_token_address(invocation: Any) -> str | None:
+    """Read the address of the token a confirmed factory `deploy` created, without a contract read.
+
+    Args:
+        invocation: The confirmed `deploy` contract invocation
+
+    Returns:
+        str | None: The token address, or None if the transaction content is not available.
+
+    """
+    return call_result(invocation, WOW_FACTORY_ABI, "deploy")
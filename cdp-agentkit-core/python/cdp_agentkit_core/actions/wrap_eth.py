@@ -1,9 +1,16 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    await_or_submit,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.upstream import call_upstream
 
 WETH_ADDRESS = "0x4200000000000000000000000000000000000006"
 
@@ -70,7 +77,8 @@ def wrap_eth(wallet: Wallet, amount_to_wrap: str) -> str:
 
     """
     try:
-        invocation = wallet.invoke_contract(
+        invocation = call_upstream(
+            wallet.invoke_contract,
             contract_address=WETH_ADDRESS,
             method="deposit",
             abi=WETH_ABI,
@@ -78,7 +86,41 @@ def wrap_eth(wallet: Wallet, amount_to_wrap: str) -> str:
             amount=amount_to_wrap,
             asset_id="wei",
         )
-        result = invocation.wait()
+        result = wait_or_submit(invocation, f"wrap of {amount_to_wrap} wei of ETH to WETH")
+        if isinstance(result, PendingTransaction):
+            return result.submitted_message()
+        return f"Wrapped ETH with transaction hash: {result.transaction.transaction_hash}"
+    except Exception as e:
+        return f"Unexpected error wrapping ETH: {e!s}"
+
+
+async def awrap_eth(wallet: Wallet, amount_to_wrap: str) -> str:
+    """Wrap ETH to WETH.
+
+    Async version of `wrap_eth`.
+
+    Args:
+        wallet (Wallet): The wallet to wrap ETH from.
+        amount_to_wrap (str): The amount of ETH to wrap in wei.
+
+    Returns:
+        str: A message containing the wrapped ETH details.
+
+    """
+    try:
+        invocation = await asyncio.to_thread(
+            call_upstream,
+            wallet.invoke_contract,
+            contract_address=WETH_ADDRESS,
+            method="deposit",
+            abi=WETH_ABI,
+            args={},
+            amount=amount_to_wrap,
+            asset_id="wei",
+        )
+        result = await await_or_submit(invocation, f"wrap of {amount_to_wrap} wei of ETH to WETH")
+        if isinstance(result, PendingTransaction):
+            return result.submitted_message()
         return f"Wrapped ETH with transaction hash: {result.transaction.transaction_hash}"
     except Exception as e:
         return f"Unexpected error wrapping ETH: {e!s}"
@@ -91,3 +133,5 @@ class WrapEthAction(CdpAction):
     description: str = WRAP_ETH_PROMPT
     args_schema: type[BaseModel] | None = WrapEthInput
     func: Callable[..., str] = wrap_eth
+    afunc: Callable[..., Awaitable[str]] = awrap_eth
+    writes: bool = True
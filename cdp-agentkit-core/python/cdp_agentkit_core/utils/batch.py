@@ -0,0 +1,205 @@
+"""Pipelined submission of batches of writes from one address.
+
+A batch action submits one write per item back-to-back, without waiting for any of them to land,
+hands them all to the shared confirmation poller, and then waits for them together. The items are
+submitted one after the other, so the CDP API assigns their nonces in order.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from cdp_agentkit_core.utils.confirmation_poller import (
+    COMPLETE,
+    FAILED,
+    PENDING,
+    REPLACED,
+    TIMED_OUT,
+    ConfirmationPoller,
+    PendingTransaction,
+    get_confirmation_poller,
+    is_submit_only,
+)
+from cdp_agentkit_core.utils.deadline import bounded_timeout
+
+T = TypeVar("T")
+
+# How long a batch action waits for its transactions to land before reporting them as pending.
+DEFAULT_BATCH_CONFIRMATION_TIMEOUT_SECONDS = 60.0
+
+ERROR = "error"
+
+
+@dataclass
+class BatchSubmission(Generic[T]):
+    """The outcome of submitting the write of one batch item."""
+
+    item: T
+    transaction: PendingTransaction | None = None
+    error: str | None = None
+
+    @property
+    def status(self) -> str:
+        """The transaction status, or `error` if the write could not be submitted."""
+        return ERROR if self.transaction is None else self.transaction.status
+
+    def result(self) -> str:
+        """Describe the outcome in a single table cell."""
+        transaction = self.transaction
+        if transaction is None:
+            return f"error: {self.error}"
+        if transaction.status == PENDING:
+            return f"pending (transaction ID {transaction.id})"
+
+        result = transaction.status
+        if transaction.error:
+            result += f": {transaction.error}"
+        if transaction.transaction_link:
+            result += f" {transaction.transaction_link}"
+        return result
+
+
+def submit_batch(
+    submit: Callable[[T], Any],
+    items: Iterable[T],
+    describe: Callable[[T], str],
+    poller: ConfirmationPoller | None = None,
+) -> list[BatchSubmission[T]]:
+    """Submit one write per item back-to-back, without waiting for any of them to land.
+
+    Args:
+        submit: Broadcasts the write of an item and returns the broadcast resource.
+        items: The batch items, in submission order.
+        describe: A short description of the write of an item, e.g. `transfer of 1 eth to 0x...`.
+        poller: The confirmation poller to track the writes with. Defaults to the shared one.
+
+    Returns:
+        list[BatchSubmission]: One submission per item, in order. A failed submission is recorded
+        on its item, and the remaining items are still submitted.
+
+    """
+    poller = poller or get_confirmation_poller()
+
+    submissions = []
+    for item in items:
+        try:
+            resource = submit(item)
+        except Exception as e:
+            submissions.append(BatchSubmission(item=item, error=str(e)))
+            continue
+        submissions.append(
+            BatchSubmission(item=item, transaction=poller.track(resource, describe(item)))
+        )
+    return submissions
+
+
+async def asubmit_batch(
+    submit: Callable[[T], Any],
+    items: Iterable[T],
+    describe: Callable[[T], str],
+    poller: ConfirmationPoller | None = None,
+) -> list[BatchSubmission[T]]:
+    """Submit one write per item back-to-back, without waiting for any of them to land.
+
+    Async version of `submit_batch`: each blocking submission runs in a worker thread.
+
+    Args:
+        submit: Broadcasts the write of an item and returns the broadcast resource.
+        items: The batch items, in submission order.
+        describe: A short description of the write of an item, e.g. `transfer of 1 eth to 0x...`.
+        poller: The confirmation poller to track the writes with. Defaults to the shared one.
+
+    Returns:
+        list[BatchSubmission]: One submission per item, in order.
+
+    """
+    poller = poller or get_confirmation_poller()
+
+    submissions = []
+    for item in items:
+        try:
+            resource = await asyncio.to_thread(submit, item)
+        except Exception as e:
+            submissions.append(BatchSubmission(item=item, error=str(e)))
+            continue
+        submissions.append(
+            BatchSubmission(item=item, transaction=poller.track(resource, describe(item)))
+        )
+    return submissions
+
+
+def confirm_batch(
+    submissions: list[BatchSubmission[T]],
+    timeout_seconds: float = DEFAULT_BATCH_CONFIRMATION_TIMEOUT_SECONDS,
+) -> None:
+    """Wait for the transactions of a batch to land together, unless in submit-only mode.
+
+    Args:
+        submissions: The submitted batch.
+        timeout_seconds: The maximum time to wait for the whole batch, bounded by the current
+            deadline. Transactions that have not landed by then are reported as pending.
+
+    """
+    if is_submit_only():
+        return
+
+    wait_until = time.monotonic() + bounded_timeout(timeout_seconds)
+    for submission in submissions:
+        if submission.transaction is not None:
+            submission.transaction.wait(max(0.0, wait_until - time.monotonic()))
+
+
+async def aconfirm_batch(
+    submissions: list[BatchSubmission[T]],
+    timeout_seconds: float = DEFAULT_BATCH_CONFIRMATION_TIMEOUT_SECONDS,
+) -> None:
+    """Wait for the transactions of a batch to land together, unless in submit-only mode.
+
+    Async version of `confirm_batch`: the transactions are awaited on the event loop.
+
+    Args:
+        submissions: The submitted batch.
+        timeout_seconds: The maximum time to wait for the whole batch, bounded by the current
+            deadline.
+
+    """
+    if is_submit_only():
+        return
+
+    wait_until = time.monotonic() + bounded_timeout(timeout_seconds)
+    for submission in submissions:
+        if submission.transaction is not None:
+            await submission.transaction.async_wait(max(0.0, wait_until - time.monotonic()))
+
+
+def format_batch(
+    title: str, columns: list[str], rows: list[tuple[list[str], BatchSubmission]]
+) -> str:
+    """Format the outcome of a batch as a compact table, one row per item.
+
+    Args:
+        title: The first line of the table.
+        columns: The names of the item columns; a `result` column is appended.
+        rows: The item cells and the submission of each row.
+
+    Returns:
+        str: The table, followed by the number of writes per status.
+
+    """
+    lines = [title, "  " + " | ".join([*columns, "result"])]
+    counts: dict[str, int] = {}
+    for cells, submission in rows:
+        lines.append("  " + " | ".join([*cells, submission.result()]))
+        counts[submission.status] = counts.get(submission.status, 0) + 1
+
+    statuses = [COMPLETE, PENDING, FAILED, REPLACED, TIMED_OUT, ERROR]
+    lines.append(
+        ", ".join(
+            f"{counts.get(status, 0)} {status}"
+            for status in statuses
+            if status == COMPLETE or counts.get(status)
+        )
+    )
+    return "\n".join(lines)
@@ -0,0 +1,170 @@
+"""Process-wide CDP API clients, one per API key, over a shared pooled transport.
+
+The CDP SDK keeps a single set of API clients in `Cdp.api_clients`, which every wallet call and
+`SmartContract.read` uses. `Cdp.configure` replaces them, with a new connection pool, every time it
+is called, so each wrapper that configured the SDK threw away the warm connections of the last one.
+
+`configure_cdp` instead builds the API clients of an API key once, and only installs them as the
+SDK's clients when they are not already, so wrappers, actions and contract reads all share one set
+of keep-alive connections. The transport is tuned in one place, with `CdpClientSettings`:
+
+- the connection pool holds as many connections as the adaptive limiter lets calls be in flight
+  (see `cdp_agentkit_core.utils.upstream`), so no connection is opened only to be discarded,
+- every request gets a connect and a read timeout, bounded by the current deadline (see
+  `cdp_agentkit_core.utils.deadline`), instead of waiting indefinitely.
+
+The SDK has one set of active clients, so a process that uses several API keys calls `configure_cdp`
+with the right key before each use of the SDK: switching to clients that are already built only
+swaps them in. `CdpAgentkitWrapper` does this before every action and wallet import.
+"""
+
+import threading
+from dataclasses import dataclass
+
+from cdp import Cdp
+from cdp.api_clients import ApiClients
+from cdp.cdp_api_client import CdpApiClient
+from cdp.client import rest
+
+from cdp_agentkit_core.utils.deadline import bounded_timeout, check_deadline
+from cdp_agentkit_core.utils.upstream import DEFAULT_MAX_LIMIT
+
+DEFAULT_CDP_BASE_PATH = "https://api.cdp.coinbase.com/platform"
+
+
+@dataclass(frozen=True)
+class CdpClientSettings:
+    """How the CDP API clients connect.
+
+    Attributes:
+        pool_maxsize: The number of keep-alive connections kept open to the CDP API.
+        connect_timeout_seconds: The timeout of opening a connection.
+        read_timeout_seconds: The timeout of waiting for a response.
+        max_network_retries: The number of times the SDK retries a request that failed with a 5XX.
+        base_path: The base URL of the CDP API.
+
+    """
+
+    pool_maxsize: int = DEFAULT_MAX_LIMIT
+    connect_timeout_seconds: float = 5.0
+    read_timeout_seconds: float = 30.0
+    max_network_retries: int = 3
+    base_path: str = DEFAULT_CDP_BASE_PATH
+
+
+class PooledCdpApiClient(CdpApiClient):
+    """A CDP API client with a sized connection pool and default request timeouts."""
+
+    def __init__(
+        self,
+        api_key: str,
+        private_key: str,
+        settings: CdpClientSettings,
+        source: str,
+        source_version: str,
+    ) -> None:
+        """Create a client.
+
+        Args:
+            api_key: The API key name.
+            private_key: The private key of the API key.
+            settings: How the client connects.
+            source: The package using the SDK, e.g. `cdp-langchain`.
+            source_version: The version of the package using the SDK.
+
+        """
+        super().__init__(
+            api_key,
+            private_key,
+            settings.base_path,
+            max_network_retries=settings.max_network_retries,
+            source=source,
+            source_version=source_version,
+        )
+        self.settings = settings
+        self.configuration.connection_pool_maxsize = settings.pool_maxsize
+        self.rest_client = rest.RESTClientObject(self.configuration)
+
+    def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> rest.RESTResponse:
+        """Make a request, with the default timeouts if it has none.
+
+        Raises:
+            DeadlineExceededError: If the current deadline has passed.
+
+        """
+        if _request_timeout is None:
+            check_deadline("calling the CDP API")
+            _request_timeout = (
+                bounded_timeout(self.settings.connect_timeout_seconds),
+                bounded_timeout(self.settings.read_timeout_seconds),
+            )
+        return super().call_api(method, url, header_params, body, post_params, _request_timeout)
+
+
+_clients_lock = threading.Lock()
+_clients: dict[tuple[str, str, str], ApiClients] = {}
+_settings = CdpClientSettings()
+
+
+def set_cdp_client_settings(settings: CdpClientSettings) -> None:
+    """Set how the CDP API clients connect.
+
+    Call this when the process starts: it applies to the clients built after it.
+
+    Args:
+        settings: How the clients connect.
+
+    """
+    global _settings
+    with _clients_lock:
+        _settings = settings
+
+
+def configure_cdp(
+    api_key_name: str,
+    private_key: str,
+    source: str,
+    source_version: str,
+) -> ApiClients:
+    """Configure the CDP SDK with the process-wide clients of an API key.
+
+    Takes the place of `Cdp.configure`: the clients of an API key are built on its first use and
+    reused after, and are only installed as the SDK's clients if they are not already. Call it
+    before each use of the SDK when the process uses several API keys, as another key's clients
+    may have been installed since.
+
+    Args:
+        api_key_name: The API key name.
+        private_key: The private key of the API key.
+        source: The package using the SDK, e.g. `cdp-langchain`.
+        source_version: The version of the package using the SDK.
+
+    Returns:
+        ApiClients: The API clients of the key, now used by the SDK.
+
+    """
+    with _clients_lock:
+        key = (api_key_name, private_key, _settings.base_path)
+        clients = _clients.get(key)
+        if clients is None:
+            client = PooledCdpApiClient(
+                api_key_name, private_key, _settings, source, source_version
+            )
+            clients = ApiClients(client)
+            _clients[key] = clients
+
+        if Cdp.api_clients is not clients:
+            Cdp.api_key_name = api_key_name
+            Cdp.private_key = private_key
+            Cdp.base_path = _settings.base_path
+            Cdp.max_network_retries = _settings.max_network_retries
+            Cdp.api_clients = clients
+        return clients
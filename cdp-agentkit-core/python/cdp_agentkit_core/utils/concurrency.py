@@ -0,0 +1,239 @@
+"""Bounded-concurrency fan-out helpers for running blocking CDP calls over many inputs."""
+
+import asyncio
+import contextvars
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class FanOutResult(Generic[T, R]):
+    """The outcome of running a function on a single fan-out item."""
+
+    item: T
+    value: R | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the function returned without raising."""
+        return self.error is None
+
+
+def _call(func: Callable[[T], R], item: T) -> FanOutResult[T, R]:
+    try:
+        return FanOutResult(item=item, value=func(item))
+    except Exception as e:
+        return FanOutResult(item=item, error=e)
+
+
+def map_bounded(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_MAX_WORKERS
+) -> list[FanOutResult[T, R]]:
+    """Run a blocking function over items in a bounded thread pool.
+
+    Args:
+        func: The function to run for each item.
+        items: The items to fan out over.
+        max_workers: The maximum number of calls in flight at once.
+
+    Returns:
+        list[FanOutResult]: One result per item, in input order. Exceptions raised by `func`
+        are captured on the item's result instead of aborting the other calls.
+
+    Raises:
+        ValueError: If `max_workers` is less than 1.
+
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    items = list(items)
+    if len(items) <= 1 or max_workers == 1:
+        return [_call(func, item) for item in items]
+
+    # Each call runs in a copy of the caller's context, so it keeps the deadline and submit-only
+    # mode of the action that fanned out.
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _call, func, item) for item in items
+        ]
+        return [future.result() for future in futures]
+
+
+async def amap_bounded(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_MAX_WORKERS
+) -> list[FanOutResult[T, R]]:
+    """Run a blocking function over items in worker threads, at most `max_workers` at a time.
+
+    Async version of `map_bounded`.
+
+    Args:
+        func: The function to run for each item.
+        items: The items to fan out over.
+        max_workers: The maximum number of calls in flight at once.
+
+    Returns:
+        list[FanOutResult]: One result per item, in input order.
+
+    Raises:
+        ValueError: If `max_workers` is less than 1.
+
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(item: T) -> FanOutResult[T, R]:
+        async with semaphore:
+            return await asyncio.to_thread(_call, func, item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+def _grant_turn(turn: "asyncio.Future[None]") -> None:
+    if not turn.done():
+        turn.set_result(None)
+
+
+class FifoLock:
+    """A lock granted in the order it was requested, from threads and coroutines alike.
+
+    Unlike `threading.Lock`, waiters never overtake each other, so work serialized through the
+    lock runs in submission order. Coroutines wait on a future of their event loop, resolved when
+    their turn comes, so they hold no worker thread that the lock holder may need.
+    """
+
+    def __init__(self) -> None:
+        """Create an unlocked lock."""
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+        # Tickets whose waiters timed out, skipped when their turn comes.
+        self._abandoned: set[int] = set()
+        # The event loop and future of each coroutine waiting for its turn, by ticket.
+        self._async_waiters: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = {}
+
+    @property
+    def waiting(self) -> int:
+        """The number of holders and waiters of the lock."""
+        with self._condition:
+            return self._next_ticket - self._serving - len(self._abandoned)
+
+    def _take_ticket(self) -> int:
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            return ticket
+
+    def _wait_turn(self, ticket: int, timeout: float | None = None) -> bool:
+        with self._condition:
+            if self._condition.wait_for(lambda: self._serving == ticket, timeout):
+                return True
+            self._abandoned.add(ticket)
+            return False
+
+    def _give_up(self, ticket: int) -> bool:
+        """Withdraw a coroutine's ticket, unless its turn has already come.
+
+        Returns:
+            bool: True if the turn had come, and the lock is held.
+
+        """
+        with self._condition:
+            self._async_waiters.pop(ticket, None)
+            if self._serving == ticket:
+                return True
+            self._abandoned.add(ticket)
+            return False
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Block until every earlier request has released the lock, then take it.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if the lock was taken, False if the wait timed out. A timed out request
+            gives up its place in line.
+
+        """
+        return self._wait_turn(self._take_ticket(), timeout)
+
+    async def aacquire(self, timeout: float | None = None) -> bool:
+        """Wait for the lock without blocking the event loop or a worker thread.
+
+        The place in line is taken when this is called, so sync and async callers are served in
+        the order they asked.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if the lock was taken, False if the wait timed out.
+
+        """
+        loop = asyncio.get_running_loop()
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            if self._serving == ticket:
+                return True
+            turn = loop.create_future()
+            self._async_waiters[ticket] = (loop, turn)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(turn), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return self._give_up(ticket)
+        except asyncio.CancelledError:
+            if self._give_up(ticket):
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release the lock to the next caller in line."""
+        with self._condition:
+            self._serving += 1
+            while True:
+                if self._serving in self._abandoned:
+                    self._abandoned.remove(self._serving)
+                    self._serving += 1
+                    continue
+                waiter = self._async_waiters.pop(self._serving, None)
+                if waiter is not None:
+                    loop, turn = waiter
+                    try:
+                        loop.call_soon_threadsafe(_grant_turn, turn)
+                    except RuntimeError:
+                        # The waiter's event loop is closed, so it will never take its turn.
+                        self._serving += 1
+                        continue
+                break
+            self._condition.notify_all()
+
+    def __enter__(self) -> None:
+        """Acquire the lock."""
+        self.acquire()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release the lock."""
+        self.release()
+
+    async def __aenter__(self) -> None:
+        """Acquire the lock without blocking the event loop."""
+        await self.aacquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Release the lock."""
+        self.release()
@@ -0,0 +1,451 @@
+"""Background confirmation of submitted transactions.
+
+Write actions in submit-only mode hand their broadcast resource (a `Transfer`, `Trade`,
+`ContractInvocation` or `SmartContract`) to the process-wide `ConfirmationPoller` instead of
+waiting on it. A single daemon thread reloads every pending resource, across all wallets, once per
+polling interval, resolving each `PendingTransaction` handle as its transaction lands. Reading a
+handle's state never calls the network.
+
+Several writes from one address can be in flight at once. The poller keeps their nonces in a
+`NonceManager` to recover from the two ways such a pipeline breaks: a transaction dropped from the
+mempool is rebroadcast once it has been pending for a while, and a transaction whose nonce was used
+by a different transaction that landed is resolved as replaced instead of waiting for it to time
+out.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, TypeVar
+
+from cdp_agentkit_core.utils.concurrency import map_bounded
+from cdp_agentkit_core.utils.nonce_manager import NonceManager, transaction_nonce
+from cdp_agentkit_core.utils.transactions import async_wait, is_terminal, wait
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+DEFAULT_CONFIRMATION_TIMEOUT_SECONDS = 600.0
+DEFAULT_POLLER_MAX_WORKERS = 8
+
+# How long a transaction may stay pending before its signed payload is broadcast again, in case
+# it was dropped from the mempool, and how many times to do so.
+DEFAULT_REBROADCAST_AFTER_SECONDS = 120.0
+DEFAULT_MAX_REBROADCASTS = 1
+
+# Number of resolved transactions kept for status lookups.
+DEFAULT_MAX_HISTORY = 1000
+
+PENDING = "pending"
+COMPLETE = "complete"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+REPLACED = "replaced"
+
+
+@dataclass
+class PendingTransaction:
+    """Handle to a submitted transaction, resolved by the confirmation poller."""
+
+    id: str
+    description: str
+    resource: Any = field(repr=False)
+    wallet_id: str | None
+    # Times are `time.monotonic()` readings, so changes of the system clock do not affect the
+    # timeouts and rebroadcasts computed from them.
+    submitted_at: float
+    status: str = PENDING
+    transaction_hash: str | None = None
+    transaction_link: str | None = None
+    nonce: int | None = None
+    error: str | None = None
+    resolved_at: float | None = None
+    rebroadcasts: int = 0
+    rebroadcast_at: float | None = None
+    _resolved: threading.Event = field(default_factory=threading.Event, repr=False)
+    # The futures of coroutines waiting for the transaction, with the event loop of each.
+    _async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = field(
+        default_factory=list, repr=False
+    )
+    _waiters_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """Whether the transaction has been resolved."""
+        return self._resolved.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the poller resolves the transaction.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if the transaction was resolved.
+
+        """
+        return self._resolved.wait(timeout)
+
+    async def async_wait(self, timeout: float | None = None) -> bool:
+        """Wait until the poller resolves the transaction, without holding a worker thread.
+
+        Async version of `wait`.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if the transaction was resolved.
+
+        """
+        loop = asyncio.get_running_loop()
+        resolved = loop.create_future()
+        with self._waiters_lock:
+            if self.done:
+                return True
+            waiter = (loop, resolved)
+            self._async_waiters.append(waiter)
+        try:
+            await asyncio.wait_for(resolved, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return self.done
+        finally:
+            with self._waiters_lock:
+                if waiter in self._async_waiters:
+                    self._async_waiters.remove(waiter)
+
+    def _set_resolved(self) -> None:
+        """Wake every thread and coroutine waiting for the transaction."""
+        with self._waiters_lock:
+            self._resolved.set()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, resolved in waiters:
+            # A waiter whose event loop is closed has nothing to wake.
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(_wake, resolved)
+
+    def summary(self) -> str:
+        """Describe the transaction's current state."""
+        lines = [f"Transaction {self.id} ({self.description}): {self.status}"]
+        if self.transaction_hash:
+            lines.append(f"Transaction hash: {self.transaction_hash}")
+        if self.transaction_link:
+            lines.append(f"Transaction link: {self.transaction_link}")
+        if self.nonce is not None:
+            lines.append(f"Nonce: {self.nonce}")
+        if self.error:
+            lines.append(f"Error: {self.error}")
+        return "\n".join(lines)
+
+    def submitted_message(self) -> str:
+        """Describe the transaction as just submitted, for a write action's response."""
+        return (
+            f"Submitted {self.description}. Confirmation is pending; check on it with "
+            f"get_transaction_status using transaction ID {self.id}.\n" + self.summary()
+        )
+
+
+def _wake(resolved: asyncio.Future) -> None:
+    if not resolved.done():
+        resolved.set_result(None)
+
+
+def _transaction_details(resource: Any) -> tuple[str | None, str | None, str | None]:
+    """Read a resource's transaction hash, link and status without calling the network."""
+    transaction = getattr(resource, "transaction", None)
+    source = resource if hasattr(resource, "transaction_hash") else transaction
+    if source is None:
+        return None, None, None
+
+    status = getattr(resource, "status", None)
+    if status is None and transaction is not None:
+        status = transaction.status
+    if isinstance(status, Enum):
+        status = status.value
+
+    return source.transaction_hash, source.transaction_link, status
+
+
+def _is_mined(resource: Any) -> bool:
+    """Check whether a resource's transaction was included in a block, even if it reverted."""
+    transaction = getattr(resource, "transaction", None)
+    return transaction is not None and bool(getattr(transaction, "block_hash", None))
+
+
+class ConfirmationPoller:
+    """Tracks submitted transactions and confirms them from one background thread."""
+
+    def __init__(
+        self,
+        interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        timeout_seconds: float = DEFAULT_CONFIRMATION_TIMEOUT_SECONDS,
+        max_workers: int = DEFAULT_POLLER_MAX_WORKERS,
+        max_history: int = DEFAULT_MAX_HISTORY,
+        rebroadcast_after_seconds: float = DEFAULT_REBROADCAST_AFTER_SECONDS,
+        max_rebroadcasts: int = DEFAULT_MAX_REBROADCASTS,
+    ) -> None:
+        """Create a poller.
+
+        Args:
+            interval_seconds: The interval between polling rounds.
+            timeout_seconds: How long a transaction may stay pending before it is marked timed out.
+            max_workers: The maximum number of concurrent status checks per round.
+            max_history: The number of resolved transactions kept for status lookups.
+            rebroadcast_after_seconds: How long a transaction may stay pending before it is
+                broadcast again.
+            max_rebroadcasts: The maximum number of times a transaction is broadcast again.
+
+        """
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.max_workers = max_workers
+        self.max_history = max_history
+        self.rebroadcast_after_seconds = rebroadcast_after_seconds
+        self.max_rebroadcasts = max_rebroadcasts
+        self.nonces = NonceManager()
+        self._lock = threading.Lock()
+        self._transactions: dict[str, PendingTransaction] = {}
+        self._thread: threading.Thread | None = None
+
+    def track(self, resource: Any, description: str) -> PendingTransaction:
+        """Start tracking a submitted resource until its transaction lands.
+
+        Args:
+            resource: The broadcast `Transfer`, `Trade`, `ContractInvocation` or `SmartContract`.
+            description: A short description of the write, e.g. `transfer of 1 eth to 0x...`.
+
+        Returns:
+            PendingTransaction: The handle, resolved in the background.
+
+        """
+        transaction_hash, transaction_link, _ = _transaction_details(resource)
+        handle = PendingTransaction(
+            id=str(uuid.uuid4()),
+            description=description,
+            resource=resource,
+            wallet_id=getattr(resource, "wallet_id", None),
+            submitted_at=time.monotonic(),
+            transaction_hash=transaction_hash,
+            transaction_link=transaction_link,
+            nonce=transaction_nonce(resource),
+        )
+
+        if not self.nonces.submitted(handle):
+            self._resolve_as(handle, REPLACED, f"Nonce {handle.nonce} was already used")
+
+        with self._lock:
+            self._transactions[handle.id] = handle
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="cdp-confirmation-poller", daemon=True
+                )
+                self._thread.start()
+        return handle
+
+    def get(self, transaction_id: str) -> PendingTransaction | None:
+        """Look up a tracked transaction by ID, without calling the network."""
+        with self._lock:
+            return self._transactions.get(transaction_id)
+
+    def transactions(self, wallet_id: str | None = None) -> list[PendingTransaction]:
+        """List tracked transactions, oldest first, without calling the network.
+
+        Args:
+            wallet_id: Only list the transactions of this wallet, if given.
+
+        Returns:
+            list[PendingTransaction]: The tracked transactions.
+
+        """
+        with self._lock:
+            handles = list(self._transactions.values())
+        return [h for h in handles if wallet_id is None or h.wallet_id == wallet_id]
+
+    def pending(self) -> list[PendingTransaction]:
+        """List the transactions that have not been resolved yet."""
+        with self._lock:
+            return [h for h in self._transactions.values() if not h.done]
+
+    def poll_once(self) -> None:
+        """Check the status of every pending transaction in one batched round."""
+        pending = self.pending()
+        reloads = map_bounded(lambda handle: handle.resource.reload(), pending, self.max_workers)
+
+        now = time.monotonic()
+        for reload in reloads:
+            handle = reload.item
+            if handle.done:
+                # Replaced by a transaction with its nonce that landed earlier in this round.
+                continue
+            if not reload.ok:
+                # A failed status check is retried on the next round.
+                handle.error = str(reload.error)
+            elif is_terminal(handle.resource):
+                self._resolve(handle)
+                continue
+
+            if now - handle.submitted_at > self.timeout_seconds:
+                self.nonces.released(handle)
+                self._resolve_as(handle, TIMED_OUT, handle.error)
+            elif (
+                now - (handle.rebroadcast_at or handle.submitted_at)
+                > self.rebroadcast_after_seconds
+            ):
+                self._rebroadcast(handle, now)
+
+        self._prune()
+
+    def _resolve(self, handle: PendingTransaction) -> None:
+        transaction_hash, transaction_link, status = _transaction_details(handle.resource)
+        handle.transaction_hash = transaction_hash or handle.transaction_hash
+        handle.transaction_link = transaction_link or handle.transaction_link
+        self._resolve_as(handle, FAILED if status == FAILED else COMPLETE)
+
+        if handle.status == COMPLETE or _is_mined(handle.resource):
+            # Reverted transactions use their nonce too.
+            for replaced in self.nonces.landed(handle):
+                self._resolve_as(
+                    replaced,
+                    REPLACED,
+                    f"Nonce {replaced.nonce} was used by transaction {handle.transaction_hash}",
+                )
+        else:
+            self.nonces.released(handle)
+
+    def _resolve_as(
+        self, handle: PendingTransaction, status: str, error: str | None = None
+    ) -> None:
+        handle.status = status
+        handle.error = error
+        handle.resolved_at = time.monotonic()
+        handle._set_resolved()
+
+    def _rebroadcast(self, handle: PendingTransaction, now: float) -> None:
+        """Broadcast a long-pending transaction's signed payload again, in case it was dropped."""
+        broadcast = getattr(handle.resource, "broadcast", None)
+        if broadcast is None or handle.rebroadcasts >= self.max_rebroadcasts:
+            return
+
+        handle.rebroadcasts += 1
+        handle.rebroadcast_at = now
+        try:
+            broadcast()
+        except Exception as e:
+            handle.error = f"Rebroadcast failed: {e!s}"
+
+    def _prune(self) -> None:
+        with self._lock:
+            resolved = [h for h in self._transactions.values() if h.done]
+            for handle in resolved[: max(0, len(resolved) - self.max_history)]:
+                del self._transactions[handle.id]
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval_seconds)
+            try:
+                self.poll_once()
+            except Exception:
+                # Keep polling: the failed round is retried on the next one.
+                logger.exception("Confirmation poller round failed")
+            with self._lock:
+                if all(h.done for h in self._transactions.values()):
+                    # The next track() starts a new thread.
+                    self._thread = None
+                    return
+
+
+_poller_lock = threading.Lock()
+_poller: ConfirmationPoller | None = None
+
+
+def get_confirmation_poller() -> ConfirmationPoller:
+    """Return the process-wide confirmation poller."""
+    global _poller
+    if _poller is None:
+        with _poller_lock:
+            if _poller is None:
+                _poller = ConfirmationPoller()
+    return _poller
+
+
+_submit_only: ContextVar[bool] = ContextVar("cdp_agentkit_submit_only", default=False)
+
+
+@contextmanager
+def submit_only(enabled: bool = True) -> Iterator[None]:
+    """Run write actions in submit-only mode within this context.
+
+    In submit-only mode, write actions return as soon as their transaction is broadcast, with a
+    pending transaction ID, and the confirmation poller confirms it in the background.
+
+    Args:
+        enabled: Whether to enable submit-only mode.
+
+    """
+    token = _submit_only.set(enabled)
+    try:
+        yield
+    finally:
+        _submit_only.reset(token)
+
+
+def is_submit_only() -> bool:
+    """Check whether write actions are running in submit-only mode."""
+    return _submit_only.get()
+
+
+def wait_or_submit(resource: T, description: str) -> T | PendingTransaction:
+    """Wait for a broadcast resource to land, or hand it to the poller in submit-only mode.
+
+    Args:
+        resource: The broadcast `Transfer`, `Trade`, `ContractInvocation` or `SmartContract`.
+        description: A short description of the write, e.g. `transfer of 1 eth to 0x...`.
+
+    Returns:
+        The resource in a terminal state, or its pending transaction handle in submit-only mode or
+        if it has not landed by the current deadline (or within the resource's default timeout).
+
+    """
+    if is_submit_only():
+        return get_confirmation_poller().track(resource, description)
+    try:
+        return wait(resource)
+    except TimeoutError:
+        # Still in flight: the poller confirms it, and get_transaction_status resumes it.
+        return get_confirmation_poller().track(resource, description)
+
+
+async def await_or_submit(resource: T, description: str) -> T | PendingTransaction:
+    """Wait for a broadcast resource to land, or hand it to the poller in submit-only mode.
+
+    Async version of `wait_or_submit`.
+
+    Args:
+        resource: The broadcast `Transfer`, `Trade`, `ContractInvocation` or `SmartContract`.
+        description: A short description of the write, e.g. `transfer of 1 eth to 0x...`.
+
+    Returns:
+        The resource in a terminal state, or its pending transaction handle in submit-only mode or
+        if it has not landed by the current deadline (or within `DEFAULT_TIMEOUT_SECONDS`).
+
+    """
+    if is_submit_only():
+        return get_confirmation_poller().track(resource, description)
+    try:
+        return await async_wait(resource)
+    except TimeoutError:
+        return get_confirmation_poller().track(resource, description)
+    except asyncio.CancelledError:
+        # The transaction was broadcast, so keep confirming it after the caller gives up.
+        get_confirmation_poller().track(resource, description)
+        raise
@@ -0,0 +1,218 @@
+"""Persistent on-disk cache of immutable contract reads.
+
+Some contract values never change once a contract is deployed, such as a Uniswap pool's `token0`,
+`token1` and `fee`, or a Zora Wow token's `poolAddress`, `decimals` and `symbol`. The modules that
+define the ABIs of such contracts register those methods with `register_immutable_methods`; reads
+of them are stored in a SQLite database keyed by (network, address, method, args), shared across
+processes and restarts, so they reach the network only once. A method is only cached for the ABIs
+it is registered with: a `fee` or `name` of another contract may well change.
+
+The database lives at `~/.cache/cdp-agentkit/contract_cache.sqlite3` unless the
+`CDP_AGENTKIT_CONTRACT_CACHE` environment variable points elsewhere. Setting it to an empty string
+disables the cache.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any
+
+from cdp_agentkit_core.utils.retry import read_contract
+
+CONTRACT_CACHE_ENV_VAR = "CDP_AGENTKIT_CONTRACT_CACHE"
+DEFAULT_CONTRACT_CACHE_PATH = Path.home() / ".cache" / "cdp-agentkit" / "contract_cache.sqlite3"
+
+# The methods whose results never change for a given contract and arguments, by the `id` of the
+# ABI they are read with. The ABI is kept alongside so its `id` is never reused.
+_immutable_methods: dict[int, tuple[list[dict], frozenset[str]]] = {}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contract_reads (
+    network_id TEXT NOT NULL,
+    contract_address TEXT NOT NULL,
+    method TEXT NOT NULL,
+    args TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (network_id, contract_address, method, args)
+)
+"""
+
+_MISSING = object()
+
+
+class ContractCache:
+    """SQLite-backed store of immutable contract reads."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (and create if needed) the cache database at `path`."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per operation keeps the cache safe to share between threads and processes.
+        # It runs the operation in a transaction, and is closed after it.
+        with closing(sqlite3.connect(self.path, timeout=30)) as connection, connection:
+            yield connection
+
+    @staticmethod
+    def _key(
+        network_id: str, contract_address: str, method: str, args: dict[str, Any] | None
+    ) -> tuple[str, str, str, str]:
+        return (
+            network_id,
+            contract_address.lower(),
+            method,
+            json.dumps(args or {}, sort_keys=True, separators=(",", ":")),
+        )
+
+    def get(
+        self,
+        network_id: str,
+        contract_address: str,
+        method: str,
+        args: dict[str, Any] | None = None,
+        default: Any = None,
+    ) -> Any:
+        """Look up a cached read.
+
+        Args:
+            network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+            contract_address: The address of the contract.
+            method: The method that was read.
+            args: The method arguments.
+            default: The value to return if the read is not cached.
+
+        Returns:
+            Any: The cached value, or `default`.
+
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM contract_reads WHERE network_id = ? AND contract_address = ?"
+                " AND method = ? AND args = ?",
+                self._key(network_id, contract_address, method, args),
+            ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(
+        self,
+        network_id: str,
+        contract_address: str,
+        method: str,
+        args: dict[str, Any] | None,
+        value: Any,
+    ) -> None:
+        """Store a read.
+
+        Args:
+            network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+            contract_address: The address of the contract.
+            method: The method that was read.
+            args: The method arguments.
+            value: The JSON-serializable value that was read.
+
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO contract_reads VALUES (?, ?, ?, ?, ?)",
+                (*self._key(network_id, contract_address, method, args), json.dumps(value)),
+            )
+
+    def clear(self) -> None:
+        """Remove every cached read."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM contract_reads")
+
+
+_cache_lock = threading.Lock()
+_caches: dict[str, ContractCache] = {}
+
+
+def get_contract_cache() -> ContractCache | None:
+    """Return the process-wide contract cache, or None if it is disabled.
+
+    Returns:
+        ContractCache | None: The cache at the path configured by `CDP_AGENTKIT_CONTRACT_CACHE`.
+
+    """
+    path = os.environ.get(CONTRACT_CACHE_ENV_VAR, str(DEFAULT_CONTRACT_CACHE_PATH))
+    if not path:
+        return None
+
+    cache = _caches.get(path)
+    if cache is None:
+        with _cache_lock:
+            cache = _caches.get(path)
+            if cache is None:
+                cache = _caches[path] = ContractCache(path)
+    return cache
+
+
+def register_immutable_methods(abi: list[dict], methods: Iterable[str]) -> None:
+    """Register the methods of an ABI whose results never change, to cache their reads.
+
+    Args:
+        abi: The ABI of the contracts, e.g. `UNISWAP_V3_ABI`. Reads must use this same object.
+        methods: The names of the methods.
+
+    """
+    _immutable_methods[id(abi)] = (abi, frozenset(methods))
+
+
+def is_immutable(abi: list[dict] | None, method: str) -> bool:
+    """Check whether a contract method's result is cacheable forever.
+
+    Args:
+        abi: The ABI the method is read with.
+        method: The method name.
+
+    Returns:
+        bool: Whether the method is registered as immutable for this ABI.
+
+    """
+    entry = _immutable_methods.get(id(abi))
+    return entry is not None and entry[0] is abi and method in entry[1]
+
+
+def cached_read(
+    network_id: str,
+    contract_address: str,
+    method: str,
+    abi: list[dict] | None = None,
+    args: dict[str, Any] | None = None,
+) -> Any:
+    """Read from a smart contract, serving immutable methods from the contract cache.
+
+    Takes the same arguments as `SmartContract.read`. Reads of methods that are not registered as
+    immutable for `abi` always go to the network.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        contract_address: The address of the contract.
+        method: The method to call on the contract.
+        abi: The ABI of the contract.
+        args: The arguments to pass to the method.
+
+    Returns:
+        Any: The data read from the contract.
+
+    """
+    cache = get_contract_cache() if is_immutable(abi, method) else None
+    if cache is not None:
+        value = cache.get(network_id, contract_address, method, args, default=_MISSING)
+        if value is not _MISSING:
+            return value
+
+    value = read_contract(network_id, contract_address, method, abi=abi, args=args)
+
+    if cache is not None:
+        cache.set(network_id, contract_address, method, args, value)
+    return value
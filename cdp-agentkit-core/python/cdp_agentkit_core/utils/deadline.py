@@ -0,0 +1,88 @@
+"""Deadlines for running actions, propagated through a context variable.
+
+A caller, such as a LangChain tool, runs an action within `deadline(seconds)`. Every blocking step
+of the action bounds its own timeout with `bounded_timeout`: waiting for a transaction to land,
+HTTP requests to third-party APIs, and waiting in a write queue. A write whose transaction has not
+landed by the deadline is handed to the confirmation poller and reported as pending, so the agent
+can resume it with get_transaction_status instead of holding a worker until it lands.
+
+The deadline is a `ContextVar`, so it follows the call into `asyncio.to_thread` workers and tasks
+without changing any action's signature. Nested deadlines can only shorten the enclosing one.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_deadline: ContextVar[float | None] = ContextVar("cdp_agentkit_deadline", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when an action runs out of time before it could start a step."""
+
+
+@contextmanager
+def deadline(timeout_seconds: float | None) -> Iterator[None]:
+    """Run actions within this context with a deadline.
+
+    Args:
+        timeout_seconds: The time the actions may take from now, or None to only keep the
+            enclosing deadline, if any.
+
+    Raises:
+        ValueError: If `timeout_seconds` is negative.
+
+    """
+    if timeout_seconds is None:
+        yield
+        return
+    if timeout_seconds < 0:
+        raise ValueError("timeout_seconds must not be negative")
+
+    at = time.monotonic() + timeout_seconds
+    enclosing = _deadline.get()
+    token = _deadline.set(at if enclosing is None else min(at, enclosing))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_seconds() -> float | None:
+    """Get the time left before the current deadline.
+
+    Returns:
+        float | None: The seconds left, never negative, or None if there is no deadline.
+
+    """
+    at = _deadline.get()
+    return None if at is None else max(0.0, at - time.monotonic())
+
+
+def bounded_timeout(timeout_seconds: float) -> float:
+    """Bound a step's own timeout by the current deadline.
+
+    Args:
+        timeout_seconds: The timeout of the step without a deadline.
+
+    Returns:
+        float: The smaller of the timeout and the time left before the deadline.
+
+    """
+    remaining = remaining_seconds()
+    return timeout_seconds if remaining is None else min(timeout_seconds, remaining)
+
+
+def check_deadline(step: str) -> None:
+    """Check that there is time left to start a step.
+
+    Args:
+        step: What was about to start, for the error message, e.g. `waiting for earlier writes`.
+
+    Raises:
+        DeadlineExceededError: If the current deadline has passed.
+
+    """
+    if remaining_seconds() == 0.0:
+        raise DeadlineExceededError(f"Deadline exceeded before {step}")
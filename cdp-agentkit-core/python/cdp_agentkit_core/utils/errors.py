@@ -0,0 +1,71 @@
+"""Classification of the errors of calls to upstream APIs (the CDP API, Pyth, ...).
+
+An error is transient when the upstream API failed to serve the call rather than rejecting it:
+the call may succeed if it is made again later, and the failure is a sign of load. Retries (see
+`cdp_agentkit_core.utils.retry`) and the load control of `cdp_agentkit_core.utils.upstream` both
+act on transient errors only.
+"""
+
+import sys
+
+import requests
+import urllib3
+
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def status_code(error: BaseException) -> int | None:
+    """Get the HTTP status code of a failed request.
+
+    Args:
+        error: The error raised by the request.
+
+    Returns:
+        int | None: The status code, or None if the request got no response.
+
+    """
+    # An error of the CDP SDK implies the SDK is loaded: checking that first keeps errors of
+    # third-party APIs, such as Pyth, from loading it.
+    if "cdp" in sys.modules:
+        from cdp.client.exceptions import ApiException
+        from cdp.errors import ApiError
+
+        if isinstance(error, ApiError):
+            return error.http_code
+        if isinstance(error, ApiException):
+            return error.status
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_transient(error: BaseException) -> bool:
+    """Check whether a call failed for a reason that may go away on its own.
+
+    Args:
+        error: The error raised by the call.
+
+    Returns:
+        bool: True for rate limits, server errors, connection errors and timeouts; False for
+        errors that retrying cannot fix, such as reverts and invalid arguments.
+
+    """
+    if isinstance(error, DeadlineExceededError):
+        return False
+
+    code = status_code(error)
+    if code is not None:
+        return code in RETRYABLE_STATUS_CODES
+
+    return isinstance(
+        error,
+        requests.ConnectionError
+        | requests.Timeout
+        | urllib3.exceptions.MaxRetryError
+        | urllib3.exceptions.NewConnectionError
+        | urllib3.exceptions.ProtocolError
+        | urllib3.exceptions.TimeoutError
+        | ConnectionError
+        | TimeoutError,
+    )
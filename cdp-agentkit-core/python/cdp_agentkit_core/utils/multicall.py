@@ -0,0 +1,306 @@
+"""Batch contract reads into a single `eth_call` through the Multicall3 contract.
+
+Each read is described by a `Call` using the same arguments as `SmartContract.read` (contract
+address, ABI, method name and a dict of arguments keyed by input name). The calls are ABI-encoded
+locally, executed with one `Multicall3.aggregate3` read, and their return data is decoded into the
+same shapes `SmartContract.read` returns.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from eth_abi import decode, encode
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
+from eth_utils.abi import collapse_if_tuple
+
+from cdp_agentkit_core.utils.contract_cache import get_contract_cache, is_immutable
+from cdp_agentkit_core.utils.retry import read_contract
+
+# Multicall3 is deployed at the same address on every supported network.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+class MulticallError(Exception):
+    """Raised when a batched read fails or its result cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class Call:
+    """A contract read to include in a multicall batch.
+
+    Attributes:
+        address: The address of the contract to read from.
+        abi: The ABI of the contract, or at least of the method being called.
+        method: The name of the view method to call.
+        args: The method arguments keyed by input name, as passed to `SmartContract.read`.
+        allow_failure: Whether a revert of this call should yield `None` instead of failing the batch.
+
+    """
+
+    address: str
+    abi: list[dict]
+    method: str
+    args: dict[str, Any] | None = None
+    allow_failure: bool = False
+
+    @property
+    def function_abi(self) -> dict:
+        """The ABI entry of the called method."""
+        candidates = [
+            entry
+            for entry in self.abi
+            if entry.get("type") == "function" and entry.get("name") == self.method
+        ]
+        arg_names = set(self.args or {})
+        for entry in candidates:
+            if {param["name"] for param in entry.get("inputs", [])} == arg_names:
+                return entry
+        raise MulticallError(f"Method {self.method} with arguments {sorted(arg_names)} not in ABI")
+
+    def encode(self) -> bytes:
+        """ABI-encode the call data (selector followed by the encoded arguments)."""
+        function_abi = self.function_abi
+        inputs = function_abi.get("inputs", [])
+        values = [_to_abi_value(param, (self.args or {})[param["name"]]) for param in inputs]
+        types = [collapse_if_tuple(param) for param in inputs]
+        return function_abi_to_4byte_selector(function_abi) + encode(types, values)
+
+    def decode(self, return_data: bytes) -> Any:
+        """Decode the call's return data like `SmartContract.read` would.
+
+        A single output is returned as is, and multiple outputs as a dict keyed by output name.
+        """
+        outputs = self.function_abi.get("outputs", [])
+        values = decode([collapse_if_tuple(param) for param in outputs], return_data)
+        decoded = [
+            _from_abi_value(param, value) for param, value in zip(outputs, values, strict=True)
+        ]
+
+        if len(outputs) == 1:
+            return decoded[0]
+        if all(param.get("name") for param in outputs):
+            return {param["name"]: value for param, value in zip(outputs, decoded, strict=True)}
+        return decoded
+
+
+def _element_param(param: dict) -> dict:
+    """Return the ABI param describing the elements of an array param."""
+    return {**param, "type": param["type"][: param["type"].rindex("[")]}
+
+
+def _to_abi_value(param: dict, value: Any) -> Any:
+    """Convert a `SmartContract.read` style argument into the value eth_abi expects."""
+    type_ = param["type"]
+    if type_.endswith("]"):
+        return [_to_abi_value(_element_param(param), item) for item in value]
+    if type_ == "tuple":
+        components = param["components"]
+        if isinstance(value, dict):
+            return tuple(_to_abi_value(c, value[c["name"]]) for c in components)
+        return tuple(_to_abi_value(c, item) for c, item in zip(components, value, strict=True))
+    if type_.startswith(("uint", "int")):
+        return int(value)
+    if type_ == "address":
+        return to_checksum_address(value)
+    if type_ == "bool":
+        return value if isinstance(value, bool) else str(value).lower() == "true"
+    if type_.startswith("bytes") and isinstance(value, str):
+        return bytes.fromhex(value.removeprefix("0x"))
+    return value
+
+
+def _from_abi_value(param: dict, value: Any) -> Any:
+    """Convert a value decoded by eth_abi into the shape `SmartContract.read` returns."""
+    type_ = param["type"]
+    if type_.endswith("]"):
+        return [_from_abi_value(_element_param(param), item) for item in value]
+    if type_ == "tuple":
+        return {
+            c["name"]: _from_abi_value(c, item)
+            for c, item in zip(param["components"], value, strict=True)
+        }
+    if type_ == "address":
+        return to_checksum_address(value)
+    if type_.startswith("bytes"):
+        return "0x" + value.hex()
+    return value
+
+
+def _to_bytes(data: Any) -> bytes:
+    if isinstance(data, str):
+        return bytes.fromhex(data.removeprefix("0x"))
+    return bytes(data)
+
+
+def cached_call_result(network_id: str, call: Call) -> Any:
+    """Return the cached result of an immutable call without reading from the network.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        call: The read to look up.
+
+    Returns:
+        Any: The cached result, or None if the call is not immutable or not cached yet.
+
+    """
+    if not is_immutable(call.abi, call.method):
+        return None
+
+    cache = get_contract_cache()
+    return cache.get(network_id, call.address, call.method, call.args) if cache else None
+
+
+@dataclass(frozen=True)
+class CallResult:
+    """The raw outcome of one call of a multicall batch.
+
+    Attributes:
+        success: Whether the call succeeded.
+        return_data: The call's return data, or its revert data if it reverted.
+
+    """
+
+    success: bool
+    return_data: bytes
+
+
+def aggregate(
+    network_id: str, calls: Sequence[Call], multicall_address: str = MULTICALL3_ADDRESS
+) -> list[CallResult]:
+    """Execute calls with one `Multicall3.aggregate3` read, without decoding their results.
+
+    Unlike `multicall`, this never serves results from the contract cache, and keeps the revert
+    data of the calls that reverted.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        calls: The reads to execute. Only calls made with `allow_failure` may revert without
+            failing the whole read.
+        multicall_address: The address of the Multicall3 contract.
+
+    Returns:
+        list[CallResult]: The raw result of each call, in order.
+
+    """
+    results = read_contract(
+        network_id,
+        multicall_address,
+        "aggregate3",
+        abi=MULTICALL3_ABI,
+        args={
+            "calls": [
+                {
+                    "target": call.address,
+                    "allowFailure": call.allow_failure,
+                    "callData": "0x" + call.encode().hex(),
+                }
+                for call in calls
+            ]
+        },
+    )
+    return [
+        CallResult(success=result["success"], return_data=_to_bytes(result["returnData"]))
+        for result in results
+    ]
+
+
+def _aggregate(network_id: str, calls: Sequence[Call], multicall_address: str) -> list[Any]:
+    """Execute calls with one `Multicall3.aggregate3` read and decode their results."""
+    results = aggregate(network_id, calls, multicall_address)
+
+    decoded = []
+    for call, result in zip(calls, results, strict=True):
+        if not result.success:
+            if not call.allow_failure:
+                raise MulticallError(f"Call to {call.method} on {call.address} reverted")
+            decoded.append(None)
+            continue
+
+        try:
+            decoded.append(call.decode(result.return_data))
+        except Exception as error:
+            if not call.allow_failure:
+                raise MulticallError(
+                    f"Failed to decode {call.method} result from {call.address}: {error!s}"
+                ) from error
+            decoded.append(None)
+    return decoded
+
+
+def multicall(
+    network_id: str, calls: Sequence[Call], multicall_address: str = MULTICALL3_ADDRESS
+) -> list[Any]:
+    """Execute several contract reads with a single `eth_call`.
+
+    Reads of immutable methods are served from the contract cache when possible, and only the
+    remaining calls are sent. No read is issued if every call is cached.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        calls: The reads to execute.
+        multicall_address: The address of the Multicall3 contract.
+
+    Returns:
+        list[Any]: The decoded result of each call, in order. Calls made with `allow_failure`
+        that reverted yield `None`.
+
+    Raises:
+        MulticallError: If a call that does not allow failure reverted or could not be decoded.
+
+    """
+    cache = (
+        get_contract_cache() if any(is_immutable(call.abi, call.method) for call in calls) else None
+    )
+
+    decoded: list[Any] = [None] * len(calls)
+    pending = []
+    for index, call in enumerate(calls):
+        if cache is not None and is_immutable(call.abi, call.method):
+            value = cache.get(network_id, call.address, call.method, call.args)
+            if value is not None:
+                decoded[index] = value
+                continue
+        pending.append(index)
+
+    if not pending:
+        return decoded
+
+    results = _aggregate(network_id, [calls[index] for index in pending], multicall_address)
+    for index, value in zip(pending, results, strict=True):
+        decoded[index] = value
+        call = calls[index]
+        if cache is not None and value is not None and is_immutable(call.abi, call.method):
+            cache.set(network_id, call.address, call.method, call.args, value)
+    return decoded
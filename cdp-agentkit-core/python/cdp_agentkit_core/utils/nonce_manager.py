@@ -0,0 +1,194 @@
+"""Per-address nonce bookkeeping for pipelined writes.
+
+The CDP API assigns each transaction's nonce when it creates the unsigned payload, and the wallet
+signs over it, so nonces cannot be chosen locally. What can be done locally is tracking them: when
+several writes from one address are in flight at once (submit-only mode), the `NonceManager` keeps
+the server-assigned nonces of each address in order. Once a transaction lands, another in-flight
+transaction of the same address with the same nonce but a different hash can never land. It was
+replaced, e.g. by a transaction sent from another process or signer.
+
+In-flight transactions with a lower nonce are not replaced: their nonce must already be mined, and
+usually by the very same transaction, which has simply not been observed yet. They are left to be
+resolved by their own status checks.
+"""
+
+import threading
+from typing import Any, Protocol
+
+
+class Tracked(Protocol):
+    """A handle to a submitted resource, such as a `PendingTransaction`."""
+
+    resource: Any
+
+
+def _transaction_hash(handle: Tracked) -> str | None:
+    """Get the hash of a handle's transaction, if known."""
+    for source in (handle, handle.resource):
+        transaction_hash = getattr(source, "transaction_hash", None)
+        if isinstance(transaction_hash, str):
+            return transaction_hash.lower()
+    return None
+
+
+def _is_replacement(landed_hash: str | None, other: Tracked) -> bool:
+    """Check whether a transaction with the nonce of a landed one is a different transaction."""
+    other_hash = _transaction_hash(other)
+    return landed_hash is not None and other_hash is not None and other_hash != landed_hash
+
+
+def transaction_nonce(resource: Any) -> int | None:
+    """Read the nonce the CDP API assigned to a resource's transaction, without calling the network.
+
+    Args:
+        resource: A `Transfer`, `Trade`, `ContractInvocation` or `SmartContract`.
+
+    Returns:
+        int | None: The nonce, or None if the resource has no transaction (e.g. gasless transfers).
+
+    """
+    transaction = getattr(resource, "transaction", None)
+    if transaction is None:
+        return None
+
+    try:
+        nonce = transaction.raw.as_dict()["nonce"]
+    except Exception:
+        return None
+    return nonce if isinstance(nonce, int) else None
+
+
+def transaction_sender(resource: Any) -> tuple[str, str] | None:
+    """Read the network and sending address of a resource, without calling the network.
+
+    Args:
+        resource: A `Transfer`, `Trade`, `ContractInvocation` or `SmartContract`.
+
+    Returns:
+        tuple[str, str] | None: The network ID and the sending address ID, if known.
+
+    """
+    for attribute in ("from_address_id", "address_id", "deployer_address"):
+        address_id = getattr(resource, attribute, None)
+        if isinstance(address_id, str):
+            network_id = getattr(resource, "network_id", None)
+            return (network_id if isinstance(network_id, str) else "", address_id.lower())
+    return None
+
+
+class NonceManager:
+    """Tracks the in-flight nonces of every sending address."""
+
+    def __init__(self) -> None:
+        """Create an empty nonce manager."""
+        self._lock = threading.Lock()
+        self._in_flight: dict[tuple[str, str], dict[int, list[Tracked]]] = {}
+        # The nonce and hash of the latest transaction that landed from each address.
+        self._landed: dict[tuple[str, str], tuple[int, str | None]] = {}
+
+    def submitted(self, handle: Tracked) -> bool:
+        """Record a submitted transaction's nonce.
+
+        Args:
+            handle: The handle of the submitted resource.
+
+        Returns:
+            bool: False if a different transaction of the same address already landed with this
+            nonce, i.e. the submitted transaction can never land.
+
+        """
+        sender = transaction_sender(handle.resource)
+        nonce = transaction_nonce(handle.resource)
+        if sender is None or nonce is None:
+            return True
+
+        with self._lock:
+            landed = self._landed.get(sender)
+            if landed is not None and landed[0] == nonce and _is_replacement(landed[1], handle):
+                return False
+            self._in_flight.setdefault(sender, {}).setdefault(nonce, []).append(handle)
+        return True
+
+    def landed(self, handle: Tracked) -> list[Tracked]:
+        """Record that a transaction landed onchain, i.e. its nonce was used.
+
+        Args:
+            handle: The handle of the landed resource.
+
+        Returns:
+            list[Tracked]: The in-flight transactions of the address that were replaced: the ones
+            with the same nonce and a different hash. Others with the same nonce (the same
+            transaction) or a lower one stay in flight until their own status check.
+
+        """
+        sender = transaction_sender(handle.resource)
+        nonce = transaction_nonce(handle.resource)
+        if sender is None or nonce is None:
+            return []
+
+        landed_hash = _transaction_hash(handle)
+        replaced: list[Tracked] = []
+        with self._lock:
+            if nonce >= self._landed.get(sender, (-1, None))[0]:
+                self._landed[sender] = (nonce, landed_hash)
+            in_flight = self._in_flight.get(sender, {})
+            kept = []
+            for other in in_flight.pop(nonce, []):
+                if other is handle:
+                    continue
+                if _is_replacement(landed_hash, other):
+                    replaced.append(other)
+                else:
+                    kept.append(other)
+            if kept:
+                in_flight[nonce] = kept
+            if not in_flight:
+                self._in_flight.pop(sender, None)
+        return replaced
+
+    def released(self, handle: Tracked) -> None:
+        """Stop tracking a transaction that will not land, e.g. because it failed or timed out.
+
+        Args:
+            handle: The handle of the resource.
+
+        """
+        sender = transaction_sender(handle.resource)
+        nonce = transaction_nonce(handle.resource)
+        if sender is None or nonce is None:
+            return
+
+        with self._lock:
+            in_flight = self._in_flight.get(sender, {})
+            handles = [h for h in in_flight.get(nonce, []) if h is not handle]
+            if handles:
+                in_flight[nonce] = handles
+            else:
+                in_flight.pop(nonce, None)
+            if not in_flight:
+                self._in_flight.pop(sender, None)
+
+    def in_flight(
+        self, address_id: str, network_id: str | None = None
+    ) -> list[tuple[int, Tracked]]:
+        """List the in-flight transactions of an address, lowest nonce first.
+
+        Args:
+            address_id: The sending address.
+            network_id: Only list the transactions on this network, if given.
+
+        Returns:
+            list[tuple[int, Tracked]]: The nonce and handle of each in-flight transaction.
+
+        """
+        with self._lock:
+            return sorted(
+                (
+                    (nonce, handle)
+                    for (network, address), in_flight in self._in_flight.items()
+                    if address == address_id.lower() and network_id in (None, network)
+                    for nonce, handles in in_flight.items()
+                    for handle in handles
+                ),
+                key=lambda entry: entry[0],
+            )
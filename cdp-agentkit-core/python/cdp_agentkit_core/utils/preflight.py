@@ -0,0 +1,351 @@
+"""Pre-flight simulation of contract writes.
+
+`wallet.invoke_contract` only finds out that a write reverts after the CDP API has built, signed
+and broadcast it, and the agent has waited for the failed transaction to land. The reads of the
+CDP API are `eth_call`s without a sender or value, so a write cannot be dry-run as the wallet.
+Instead, each write describes the onchain conditions under which it would revert as view reads
+(`Check`s). They are run together with a single Multicall3 read before the write is sent, and a
+failed check rejects the write with the reason it would revert. The revert data of reads that
+revert themselves is decoded against the ABIs of the contracts.
+
+The simulation only ever rejects writes: if it cannot be run (e.g. the read fails or an argument
+is not an address yet, such as an ENS name), the write goes ahead and the chain decides. NFT mints
+are not simulated: contracts gate their mints with their own views, if any, and need not implement
+ERC-165, so there is no read a mint could be rejected by safely.
+"""
+
+import asyncio
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from eth_abi import decode
+from eth_utils import function_abi_to_4byte_selector
+from eth_utils.abi import collapse_if_tuple
+
+from cdp_agentkit_core.utils.multicall import MULTICALL3_ADDRESS, Call, aggregate
+
+ERROR_SELECTOR = bytes.fromhex("08c379a0")
+PANIC_SELECTOR = bytes.fromhex("4e487b71")
+
+PANIC_REASONS = {
+    0x01: "assertion failed",
+    0x11: "arithmetic overflow or underflow",
+    0x12: "division by zero",
+    0x21: "invalid enum value",
+    0x31: "pop from an empty array",
+    0x32: "array index out of bounds",
+    0x41: "out of memory",
+}
+
+ERC20_ABI = [
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "sender", "type": "address"},
+            {"internalType": "uint256", "name": "balance", "type": "uint256"},
+            {"internalType": "uint256", "name": "needed", "type": "uint256"},
+        ],
+        "name": "ERC20InsufficientBalance",
+        "type": "error",
+    },
+]
+
+ERC721_ABI = [
+    {
+        "inputs": [{"internalType": "uint256", "name": "tokenId", "type": "uint256"}],
+        "name": "ownerOf",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "tokenId", "type": "uint256"}],
+        "name": "getApproved",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "owner", "type": "address"},
+            {"internalType": "address", "name": "operator", "type": "address"},
+        ],
+        "name": "isApprovedForAll",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "tokenId", "type": "uint256"}],
+        "name": "ERC721NonexistentToken",
+        "type": "error",
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "sender", "type": "address"},
+            {"internalType": "uint256", "name": "tokenId", "type": "uint256"},
+            {"internalType": "address", "name": "owner", "type": "address"},
+        ],
+        "name": "ERC721IncorrectOwner",
+        "type": "error",
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "operator", "type": "address"},
+            {"internalType": "uint256", "name": "tokenId", "type": "uint256"},
+        ],
+        "name": "ERC721InsufficientApproval",
+        "type": "error",
+    },
+]
+
+
+class PreflightError(Exception):
+    """Raised when the simulation of a write shows that it would revert."""
+
+
+@dataclass(frozen=True)
+class Check:
+    """A condition a write needs to hold onchain, expressed as view reads.
+
+    Attributes:
+        calls: The reads the condition depends on. They are made with `allow_failure`.
+        passes: Given the decoded result of each call, whether the write would go through.
+        reason: Given the same results, why the write would revert.
+
+    """
+
+    calls: Sequence[Call]
+    passes: Callable[..., bool]
+    reason: Callable[..., str]
+
+
+def decode_revert(data: bytes, *abis: list[dict]) -> str:
+    """Decode the revert data of a call into a readable reason.
+
+    Args:
+        data: The revert data.
+        abis: The ABIs to look up custom errors in, e.g. the ABI of the called contract.
+
+    Returns:
+        str: The `Error(string)` message, the `Panic(uint256)` reason, the custom error with its
+        arguments (e.g. `ERC721NonexistentToken(tokenId=1)`), or the raw data if unknown.
+
+    """
+    if not data:
+        return "execution reverted"
+
+    selector, payload = data[:4], data[4:]
+    try:
+        if selector == ERROR_SELECTOR:
+            return decode(["string"], payload)[0]
+        if selector == PANIC_SELECTOR:
+            code = decode(["uint256"], payload)[0]
+            return f"panic: {PANIC_REASONS.get(code, hex(code))}"
+
+        for entry in (entry for abi in abis for entry in abi):
+            if entry.get("type") != "error" or function_abi_to_4byte_selector(entry) != selector:
+                continue
+            inputs = entry.get("inputs", [])
+            values = decode([collapse_if_tuple(param) for param in inputs], payload)
+            arguments = ", ".join(
+                f"{param['name']}={value}" for param, value in zip(inputs, values, strict=True)
+            )
+            return f"{entry['name']}({arguments})"
+    except Exception:
+        pass
+    return f"execution reverted with data 0x{data.hex()}"
+
+
+def simulate(
+    network_id: str, checks: Sequence[Check], multicall_address: str = MULTICALL3_ADDRESS
+) -> list[str | None]:
+    """Run the reads of every check with a single `eth_call` and evaluate the checks.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        checks: The conditions to evaluate.
+        multicall_address: The address of the Multicall3 contract.
+
+    Returns:
+        list[str | None]: For each check, in order, the reason the write would revert, or None if
+        the check passed. Every check passes if the simulation cannot be run.
+
+    """
+    calls = [
+        Call(call.address, call.abi, call.method, call.args, allow_failure=True)
+        for check in checks
+        for call in check.calls
+    ]
+    if not calls:
+        return [None] * len(checks)
+
+    try:
+        results = aggregate(network_id, calls, multicall_address)
+    except Exception:
+        return [None] * len(checks)
+
+    reasons: list[str | None] = []
+    offset = 0
+    for check in checks:
+        check_results = results[offset : offset + len(check.calls)]
+        offset += len(check.calls)
+        reasons.append(_evaluate(check, check_results))
+    return reasons
+
+
+def _evaluate(check: Check, results: Sequence) -> str | None:
+    """Evaluate a check against the raw results of its reads."""
+    values = []
+    for call, result in zip(check.calls, results, strict=True):
+        if not result.success:
+            return f"{call.method} reverted: {decode_revert(result.return_data, call.abi)}"
+        try:
+            values.append(call.decode(result.return_data))
+        except Exception:
+            return f"{call.address} returned no {call.method} result, it may not be a contract"
+    return None if check.passes(*values) else check.reason(*values)
+
+
+def _rejection(reasons: Sequence[str | None]) -> PreflightError | None:
+    """Build the error rejecting a write from the reasons of its checks, if any failed."""
+    failed = list(dict.fromkeys(reason for reason in reasons if reason is not None))
+    if not failed:
+        return None
+    return PreflightError(f"Simulation shows the call would revert: {'; '.join(failed)}")
+
+
+def preflight_many(
+    network_id: str,
+    writes: Sequence[Sequence[Check]],
+    multicall_address: str = MULTICALL3_ADDRESS,
+) -> list[PreflightError | None]:
+    """Simulate several writes with a single `eth_call`, e.g. the writes of a batch.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        writes: The checks of each write.
+        multicall_address: The address of the Multicall3 contract.
+
+    Returns:
+        list[PreflightError | None]: For each write, in order, the error rejecting it, or None if
+        it passed its checks.
+
+    """
+    checks = [check for write_checks in writes for check in write_checks]
+    reasons = iter(simulate(network_id, checks, multicall_address))
+    return [_rejection([next(reasons) for _ in write_checks]) for write_checks in writes]
+
+
+def preflight(
+    network_id: str, checks: Sequence[Check], multicall_address: str = MULTICALL3_ADDRESS
+) -> None:
+    """Simulate a write by evaluating the checks it needs to pass, before sending it.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        checks: The conditions the write needs to hold onchain.
+        multicall_address: The address of the Multicall3 contract.
+
+    Raises:
+        PreflightError: If any check fails, with the reasons of every failed check.
+
+    """
+    rejection = _rejection(simulate(network_id, checks, multicall_address))
+    if rejection is not None:
+        raise rejection
+
+
+async def apreflight(
+    network_id: str, checks: Sequence[Check], multicall_address: str = MULTICALL3_ADDRESS
+) -> None:
+    """Simulate a write by evaluating the checks it needs to pass, before sending it.
+
+    Async version of `preflight`.
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        checks: The conditions the write needs to hold onchain.
+        multicall_address: The address of the Multicall3 contract.
+
+    Raises:
+        PreflightError: If any check fails.
+
+    """
+    await asyncio.to_thread(preflight, network_id, checks, multicall_address)
+
+
+def _same_address(a: str, b: str) -> bool:
+    return a.lower() == b.lower()
+
+
+def erc20_balance_check(contract_address: str, account: str, amount: int | str) -> Check:
+    """Check that an account holds at least an amount of an ERC-20 token.
+
+    Args:
+        contract_address: The token contract address.
+        account: The address spending the tokens.
+        amount: The amount needed, in the token's smallest unit.
+
+    Returns:
+        Check: The balance check.
+
+    """
+    return Check(
+        calls=(Call(contract_address, ERC20_ABI, "balanceOf", {"account": account}),),
+        passes=lambda balance: balance >= int(amount),
+        reason=lambda balance: (
+            f"{account} holds {balance} of token {contract_address}, less than the {amount} needed"
+        ),
+    )
+
+
+def erc721_transfer_checks(
+    contract_address: str, token_id: str, from_address: str, operator: str
+) -> list[Check]:
+    """Check that an NFT can be transferred with `transferFrom`.
+
+    Args:
+        contract_address: The NFT contract address.
+        token_id: The ID of the NFT.
+        from_address: The address the NFT is transferred from.
+        operator: The address sending the transfer, i.e. the wallet's default address.
+
+    Returns:
+        list[Check]: The ownership check, and the approval check if the operator is not the owner.
+
+    """
+    checks = [
+        Check(
+            calls=(Call(contract_address, ERC721_ABI, "ownerOf", {"tokenId": token_id}),),
+            passes=lambda owner: _same_address(owner, from_address),
+            reason=lambda owner: f"NFT (ID: {token_id}) is owned by {owner}, not {from_address}",
+        )
+    ]
+    if not _same_address(operator, from_address):
+        checks.append(
+            Check(
+                calls=(
+                    Call(contract_address, ERC721_ABI, "getApproved", {"tokenId": token_id}),
+                    Call(
+                        contract_address,
+                        ERC721_ABI,
+                        "isApprovedForAll",
+                        {"owner": from_address, "operator": operator},
+                    ),
+                ),
+                passes=lambda approved, approved_for_all: (
+                    approved_for_all or _same_address(approved, operator)
+                ),
+                reason=lambda *_: (
+                    f"{operator} is not approved to transfer NFT (ID: {token_id}) from {from_address}"
+                ),
+            )
+        )
+    return checks
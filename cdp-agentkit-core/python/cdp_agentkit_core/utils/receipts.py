@@ -0,0 +1,219 @@
+"""Outcomes of confirmed writes, read from the transaction the CDP API already returned.
+
+Once a write is confirmed, the CDP API fills in the content of its transaction: the token
+transfers decoded from its `Transfer` logs and its flattened call traces. The CDP API does not
+expose the other receipt logs (such as `WowTokenBuy`), but their figures can be read from this
+content without any further call: tokens received from the token transfers, ETH refunded or paid
+out from the internal calls, and values such as a created token address from the return data of
+the top-level call.
+
+Every helper returns None (or nothing) when the content is not available, e.g. for a write that
+was only submitted, so actions can fall back to reporting the transaction hash alone.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from cdp.client.models.ethereum_token_transfer import EthereumTokenTransfer
+from cdp.client.models.ethereum_transaction import EthereumTransaction
+from cdp.client.models.ethereum_transaction_flattened_trace import (
+    EthereumTransactionFlattenedTrace,
+)
+
+from cdp_agentkit_core.utils.multicall import Call
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def _to_int(value: str | None) -> int:
+    if not value:
+        return 0
+    return int(value, 16) if value.startswith("0x") else int(value)
+
+
+def _same_address(a: str | None, b: str | None) -> bool:
+    return a is not None and b is not None and a.lower() == b.lower()
+
+
+def confirmed_transaction(resource: Any) -> EthereumTransaction | None:
+    """Get the onchain content of a resource's confirmed transaction.
+
+    Args:
+        resource: A confirmed `ContractInvocation`, `Transfer` or `Trade`.
+
+    Returns:
+        EthereumTransaction | None: The transaction content, or None if the CDP API has not
+        returned it.
+
+    """
+    transaction = getattr(resource, "transaction", None)
+    content = getattr(transaction, "content", None)
+    if isinstance(content, EthereumTransaction):
+        return content
+    content = getattr(content, "actual_instance", None)
+    return content if isinstance(content, EthereumTransaction) else None
+
+
+def token_transfers(resource: Any, contract_address: str) -> list[EthereumTokenTransfer] | None:
+    """List the transfers of a token made by a confirmed transaction.
+
+    Args:
+        resource: A confirmed `ContractInvocation`, `Transfer` or `Trade`.
+        contract_address: The token contract address.
+
+    Returns:
+        list[EthereumTokenTransfer] | None: The transfers in log order, or None if the
+        transaction content is not available.
+
+    """
+    content = confirmed_transaction(resource)
+    if content is None or content.token_transfers is None:
+        return None
+    return sorted(
+        (
+            transfer
+            for transfer in content.token_transfers
+            if _same_address(transfer.contract_address, contract_address)
+        ),
+        key=lambda transfer: transfer.log_index,
+    )
+
+
+def token_balance_change(resource: Any, contract_address: str, address: str) -> int | None:
+    """Compute how much of a fungible token an address gained (or lost, if negative).
+
+    Args:
+        resource: A confirmed `ContractInvocation`, `Transfer` or `Trade`.
+        contract_address: The token contract address.
+        address: The address whose balance changed.
+
+    Returns:
+        int | None: The net amount received, in the token's smallest unit, or None if the
+        transaction content is not available.
+
+    """
+    transfers = token_transfers(resource, contract_address)
+    if transfers is None:
+        return None
+
+    change = 0
+    for transfer in transfers:
+        if _same_address(transfer.to_address, address):
+            change += _to_int(transfer.value)
+        if _same_address(transfer.from_address, address):
+            change -= _to_int(transfer.value)
+    return change
+
+
+def minted_token_ids(resource: Any, contract_address: str, destination: str) -> list[str] | None:
+    """List the IDs of the NFTs a confirmed transaction minted to an address.
+
+    Args:
+        resource: A confirmed `ContractInvocation`.
+        contract_address: The NFT contract address.
+        destination: The address the NFTs were minted to.
+
+    Returns:
+        list[str] | None: The token IDs in mint order, or None if the transaction content is not
+        available.
+
+    """
+    transfers = token_transfers(resource, contract_address)
+    if transfers is None:
+        return None
+    return [
+        transfer.token_id
+        for transfer in transfers
+        if transfer.token_id is not None
+        and _same_address(transfer.from_address, ZERO_ADDRESS)
+        and _same_address(transfer.to_address, destination)
+    ]
+
+
+def _traces(resource: Any) -> list[EthereumTransactionFlattenedTrace] | None:
+    content = confirmed_transaction(resource)
+    return None if content is None else content.flattened_traces
+
+
+def _succeeded(
+    traces: Iterable[EthereumTransactionFlattenedTrace],
+) -> Iterable[EthereumTransactionFlattenedTrace]:
+    return (trace for trace in traces if not trace.error and trace.status != 0)
+
+
+def internal_eth_received(resource: Any, address: str) -> int | None:
+    """Compute how much ETH a confirmed transaction's internal calls sent to an address.
+
+    This is e.g. the refund of a purchase, or the payout of a sale.
+
+    Args:
+        resource: A confirmed `ContractInvocation`.
+        address: The receiving address.
+
+    Returns:
+        int | None: The ETH received (in wei), or None if the traces are not available.
+
+    """
+    traces = _traces(resource)
+    if traces is None:
+        return None
+    return sum(
+        _to_int(trace.value)
+        for trace in _succeeded(traces)
+        if trace.trace_address and _same_address(trace.to, address)
+    )
+
+
+def eth_sent(resource: Any) -> int | None:
+    """Get the ETH value a confirmed transaction sent with its top-level call.
+
+    Args:
+        resource: A confirmed `ContractInvocation`.
+
+    Returns:
+        int | None: The value (in wei), or None if the transaction content is not available.
+
+    """
+    content = confirmed_transaction(resource)
+    return None if content is None else _to_int(content.value)
+
+
+def call_result(
+    resource: Any, abi: list[dict], method: str, args: dict[str, Any] | None = None
+) -> Any:
+    """Decode the return value of a confirmed transaction's top-level call.
+
+    Args:
+        resource: A confirmed `ContractInvocation`.
+        abi: The ABI of the called contract.
+        method: The called method.
+        args: The arguments of the call, only needed to tell overloaded methods apart.
+
+    Returns:
+        Any: The decoded return value, as `SmartContract.read` would return it, or None if the
+        traces are not available or cannot be decoded.
+
+    """
+    traces = _traces(resource)
+    if not traces:
+        return None
+
+    top_level = next((trace for trace in traces if not trace.trace_address), None)
+    if top_level is None or top_level.error or not top_level.output:
+        return None
+
+    if args is None:
+        entries = [
+            entry
+            for entry in abi
+            if entry.get("type") == "function" and entry.get("name") == method
+        ]
+        if len(entries) != 1:
+            return None
+        args = {param["name"]: None for param in entries[0].get("inputs", [])}
+
+    try:
+        call = Call(top_level.to or "", abi, method, args)
+        return call.decode(bytes.fromhex(top_level.output.removeprefix("0x")))
+    except Exception:
+        return None
@@ -0,0 +1,187 @@
+"""Retries of idempotent reads that failed for transient reasons.
+
+Actions turn any exception into an error string for the agent, so without retries every dropped
+connection or rate limit costs the agent a full round-trip to try again. Reads that cannot change
+state (contract reads and third-party HTTP APIs such as Pyth) are instead retried here with
+exponential backoff and full jitter, as long as their error is transient:
+
+- HTTP 408, 425, 429 and 5XX responses, from the CDP API or any `requests` call,
+- connection errors and timeouts.
+
+Anything else, such as a contract read that reverts or a 4XX for a bad argument, is raised at once.
+Retries never outlast the current deadline (see `cdp_agentkit_core.utils.deadline`). Writes are
+never retried: a write that failed may still have been broadcast.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from cdp_agentkit_core.utils.deadline import remaining_seconds
+from cdp_agentkit_core.utils.errors import is_transient
+from cdp_agentkit_core.utils.upstream import call_upstream
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How many times, and how far apart, to try a read.
+
+    Attributes:
+        max_attempts: The maximum number of attempts, including the first one.
+        base_delay_seconds: The upper bound of the delay before the first retry. It doubles with
+            every retry, and the actual delay is drawn uniformly below it.
+        max_delay_seconds: The cap of the delay before any retry.
+
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.25
+    max_delay_seconds: float = 4.0
+
+    def delay(self, retry: int, error: BaseException | None = None) -> float:
+        """Compute the delay before a retry.
+
+        Args:
+            retry: The number of retries made so far.
+            error: The error of the last attempt. A `Retry-After` it carries sets the minimum delay.
+
+        Returns:
+            float: The delay in seconds.
+
+        """
+        backoff = min(self.max_delay_seconds, self.base_delay_seconds * 2**retry)
+        delay = random.uniform(0, backoff)
+        retry_after = _retry_after(error) if error is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay_seconds))
+        return delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """Read the `Retry-After` header of a rate limited response, in seconds."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or getattr(error, "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _next_delay(policy: RetryPolicy, attempt: int, error: Exception) -> float | None:
+    """Get the delay before retrying a failed attempt, or None if it should not be retried."""
+    if attempt + 1 >= policy.max_attempts or not is_transient(error):
+        return None
+    delay = policy.delay(attempt, error)
+    remaining = remaining_seconds()
+    if remaining is not None and delay >= remaining:
+        return None
+    return delay
+
+
+def retry_call(
+    func: Callable[..., R],
+    *args: Any,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    **kwargs: Any,
+) -> R:
+    """Call an idempotent function, retrying it while it fails for transient reasons.
+
+    Args:
+        func: The function to call. It must be safe to call more than once.
+        args: The positional arguments of the call.
+        policy: How many times, and how far apart, to try.
+        kwargs: The keyword arguments of the call.
+
+    Returns:
+        The result of the first successful attempt.
+
+    Raises:
+        Exception: The error of the last attempt, if none succeeded.
+
+    """
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            delay = _next_delay(policy, attempt, e)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+async def aretry_call(
+    func: Callable[..., R],
+    *args: Any,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    **kwargs: Any,
+) -> R:
+    """Call a blocking, idempotent function in a worker thread, retrying transient failures.
+
+    Async version of `retry_call`. The event loop is free between attempts.
+
+    Args:
+        func: The blocking function to call. It must be safe to call more than once.
+        args: The positional arguments of the call.
+        policy: How many times, and how far apart, to try.
+        kwargs: The keyword arguments of the call.
+
+    Returns:
+        The result of the first successful attempt.
+
+    Raises:
+        Exception: The error of the last attempt, if none succeeded.
+
+    """
+    attempt = 0
+    while True:
+        try:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        except Exception as e:
+            delay = _next_delay(policy, attempt, e)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def read_contract(
+    network_id: str,
+    contract_address: str,
+    method: str,
+    abi: list[dict] | None = None,
+    args: dict[str, Any] | None = None,
+) -> Any:
+    """Read from a smart contract under load control, retrying transient failures.
+
+    Takes the same arguments as `SmartContract.read`. Every contract read of the actions goes
+    through here, over the shared connections of the SDK's clients (see `configure_cdp`).
+
+    Args:
+        network_id: Network ID, such as `base-sepolia` or `base-mainnet`
+        contract_address: The address of the contract.
+        method: The method to call on the contract.
+        abi: The ABI of the contract.
+        args: The arguments to pass to the method.
+
+    Returns:
+        Any: The data read from the contract.
+
+    """
+    # Imported here so reads of third-party APIs, such as Pyth, do not load the CDP SDK.
+    from cdp import SmartContract
+
+    return retry_call(
+        call_upstream, SmartContract.read, network_id, contract_address, method, abi=abi, args=args
+    )
@@ -0,0 +1,90 @@
+"""Helpers for waiting on CDP onchain resources (transfers, trades, contract invocations, ...)."""
+
+import asyncio
+import time
+from typing import Any, TypeVar
+
+from cdp_agentkit_core.utils.deadline import remaining_seconds
+
+T = TypeVar("T")
+
+DEFAULT_INTERVAL_SECONDS = 0.2
+DEFAULT_TIMEOUT_SECONDS = 20.0
+
+
+def is_terminal(resource: Any) -> bool:
+    """Check whether a CDP resource has reached a terminal (complete or failed) state.
+
+    Args:
+        resource: A `Transfer`, `Trade`, `ContractInvocation`, `SmartContract` or `FaucetTransaction`.
+
+    Returns:
+        bool: True if the resource's transaction is complete or failed.
+
+    """
+    if hasattr(resource, "terminal_state"):
+        # Transfers delegate to either a transaction or a sponsored send.
+        return bool(resource.terminal_state)
+
+    transaction = resource.transaction
+    return transaction is None or bool(transaction.terminal_state)
+
+
+def wait(resource: T) -> T:
+    """Block until a CDP resource reaches a terminal state, or until the current deadline.
+
+    Without a deadline, this is the resource's own `.wait()` with its default timeout.
+
+    Args:
+        resource: The CDP resource to wait for.
+
+    Returns:
+        The resource in a terminal state.
+
+    Raises:
+        TimeoutError: If the resource has not reached a terminal state in time.
+
+    """
+    remaining = remaining_seconds()
+    if remaining is None:
+        return resource.wait()  # type: ignore[attr-defined]
+    return resource.wait(timeout_seconds=remaining)  # type: ignore[attr-defined]
+
+
+async def async_wait(
+    resource: T,
+    interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+    timeout_seconds: float | None = None,
+) -> T:
+    """Wait for a CDP resource to reach a terminal state without blocking the event loop.
+
+    This is the coroutine counterpart of the resources' blocking `.wait()`: only the `reload()`
+    HTTP calls run in a worker thread, so no thread is held while the transaction is pending.
+
+    Args:
+        resource: The CDP resource to wait for.
+        interval_seconds: The interval at which to poll the server.
+        timeout_seconds: The maximum time to wait before timing out. Defaults to the time left
+            before the current deadline, or `DEFAULT_TIMEOUT_SECONDS` without one.
+
+    Returns:
+        The resource in a terminal state.
+
+    Raises:
+        TimeoutError: If the resource takes longer than the given timeout.
+
+    """
+    if timeout_seconds is None:
+        remaining = remaining_seconds()
+        timeout_seconds = DEFAULT_TIMEOUT_SECONDS if remaining is None else remaining
+
+    start_time = time.monotonic()
+    while not is_terminal(resource):
+        await asyncio.to_thread(resource.reload)  # type: ignore[attr-defined]
+
+        if time.monotonic() - start_time > timeout_seconds:
+            raise TimeoutError(f"Timed out waiting for {type(resource).__name__} to land onchain")
+
+        await asyncio.sleep(interval_seconds)
+
+    return resource
@@ -0,0 +1,394 @@
+"""Load control of the calls the actions make to upstream APIs.
+
+When the CDP API slows down under load, agents that keep sending as many concurrent requests make
+it slower still. Every wallet and contract call of the actions therefore goes through the
+process-wide `Upstream` of its API (see `call_upstream`), which combines:
+
+- an `AdaptiveLimiter`, which caps the calls in flight with AIMD: the limit grows by one call per
+  window of successful calls, and halves when a call fails with a transient error (see
+  `cdp_agentkit_core.utils.errors`) or takes longer than the latency target. Calls over the limit
+  wait for a slot, up to the current deadline.
+- a `CircuitBreaker`, which opens after a run of consecutive transient failures and then rejects
+  calls at once with `CircuitOpenError`, without calling the API, until a probe call succeeds.
+
+Errors that are not transient, such as reverts, mean the API is healthy and count as successes.
+The state of every upstream is exposed as `UpstreamMetrics` by `upstream_metrics()`.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, remaining_seconds
+from cdp_agentkit_core.utils.errors import is_transient
+
+R = TypeVar("R")
+
+CDP_UPSTREAM = "cdp"
+
+DEFAULT_INITIAL_LIMIT = 8
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 64
+DEFAULT_BACKOFF_RATIO = 0.5
+DEFAULT_LATENCY_TARGET_SECONDS = 5.0
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT_SECONDS = 30.0
+
+# Number of recent call latencies kept for the latency percentiles.
+LATENCY_WINDOW = 256
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream API whose circuit breaker is open."""
+
+
+class AdaptiveLimiter:
+    """A concurrency limit that adapts to the health of an upstream API (AIMD)."""
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+        latency_target_seconds: float | None = DEFAULT_LATENCY_TARGET_SECONDS,
+    ) -> None:
+        """Create a limiter.
+
+        Args:
+            initial_limit: The number of calls allowed in flight at first.
+            min_limit: The lowest the limit can drop to.
+            max_limit: The highest the limit can grow to.
+            backoff_ratio: The factor the limit is multiplied by when the API is overloaded.
+            latency_target_seconds: Calls slower than this count as a sign of overload, or None
+                to only back off on transient errors.
+
+        Raises:
+            ValueError: If the limits or the backoff ratio are out of range.
+
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_target_seconds = latency_target_seconds
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiting = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The number of calls currently allowed in flight."""
+        with self._condition:
+            return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls in flight."""
+        with self._condition:
+            return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """The number of calls waiting for a slot."""
+        with self._condition:
+            return self._waiting
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Block until a call is allowed in flight, then take its slot.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if the slot was taken, False if the wait timed out.
+
+        """
+        with self._condition:
+            self._waiting += 1
+            try:
+                if not self._condition.wait_for(
+                    lambda: self._in_flight < int(self._limit), timeout
+                ):
+                    return False
+            finally:
+                self._waiting -= 1
+            self._in_flight += 1
+            return True
+
+    def release(self, latency_seconds: float, overloaded: bool = False) -> None:
+        """Free a call's slot and adapt the limit to how the call went.
+
+        Args:
+            latency_seconds: How long the call took.
+            overloaded: Whether the call failed with a transient error.
+
+        """
+        slow = (
+            self.latency_target_seconds is not None
+            and latency_seconds > self.latency_target_seconds
+        )
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded or slow:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+class CircuitBreaker:
+    """Stops calls to an upstream API that keeps failing, and lets a probe through to recover."""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = DEFAULT_RESET_TIMEOUT_SECONDS,
+    ) -> None:
+        """Create a closed circuit breaker.
+
+        Args:
+            failure_threshold: The number of consecutive transient failures that open the circuit.
+            reset_timeout_seconds: How long the circuit stays open before a probe call is allowed.
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """The state of the circuit: `closed`, `open` or `half_open`."""
+        with self._lock:
+            return self._state()
+
+    @property
+    def consecutive_failures(self) -> int:
+        """The number of transient failures since the last success."""
+        with self._lock:
+            return self._consecutive_failures
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout_seconds:
+            return OPEN
+        return HALF_OPEN
+
+    def retry_in(self) -> float:
+        """Get the time until a probe call is allowed, in seconds, or 0 if calls are allowed."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout_seconds - time.monotonic())
+
+    def allow(self) -> bool:
+        """Check whether a call may go through, reserving the probe call of a half-open circuit.
+
+        Returns:
+            bool: True if the call may go through. It must then be reported with
+            `record_success`, `record_failure` or `cancel`.
+
+        """
+        with self._lock:
+            state = self._state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Report a call that the API served, closing the circuit."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Report a call that failed with a transient error, opening the circuit if need be."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._probing or self._consecutive_failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def cancel(self) -> None:
+        """Report an allowed call that was not made after all, freeing the probe call."""
+        with self._lock:
+            self._probing = False
+
+
+@dataclass(frozen=True)
+class UpstreamMetrics:
+    """A snapshot of the load control state of an upstream API."""
+
+    name: str
+    limit: int
+    in_flight: int
+    waiting: int
+    circuit_state: str
+    consecutive_failures: int
+    calls: int
+    failures: int
+    rejected: int
+    latency_p50_seconds: float | None
+    latency_p99_seconds: float | None
+
+
+def _percentile(values: list[float], percentile: float) -> float | None:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+class Upstream:
+    """The adaptive limiter and circuit breaker of an upstream API, with their metrics."""
+
+    def __init__(
+        self,
+        name: str,
+        limiter: AdaptiveLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Create the load control of an upstream API.
+
+        Args:
+            name: The name of the API, e.g. `cdp`.
+            limiter: The concurrency limiter, or None for the default one.
+            breaker: The circuit breaker, or None for the default one.
+
+        """
+        self.name = name
+        self.limiter = limiter or AdaptiveLimiter()
+        self.breaker = breaker or CircuitBreaker()
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._failures = 0
+        self._rejected = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def call(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Call the API under load control.
+
+        Args:
+            func: The blocking function that calls the API.
+            args: The positional arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            The result of the call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, without calling the API.
+            DeadlineExceededError: If the deadline passes while waiting for a slot.
+
+        """
+        if not self.breaker.allow():
+            with self._lock:
+                self._rejected += 1
+            raise CircuitOpenError(
+                f"The {self.name} API is failing; calls are paused for "
+                f"{self.breaker.retry_in():.0f} more seconds"
+            )
+
+        if not self.limiter.acquire(remaining_seconds()):
+            self.breaker.cancel()
+            with self._lock:
+                self._rejected += 1
+            raise DeadlineExceededError(
+                f"Deadline exceeded while waiting to call the {self.name} API"
+            )
+
+        start = time.monotonic()
+        overloaded = False
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            overloaded = is_transient(e)
+            raise
+        finally:
+            latency = time.monotonic() - start
+            self.limiter.release(latency, overloaded)
+            if overloaded:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            with self._lock:
+                self._calls += 1
+                self._failures += overloaded
+                self._latencies.append(latency)
+
+    def metrics(self) -> UpstreamMetrics:
+        """Take a snapshot of the state of the limiter and circuit breaker."""
+        with self._lock:
+            latencies = list(self._latencies)
+            calls, failures, rejected = self._calls, self._failures, self._rejected
+        return UpstreamMetrics(
+            name=self.name,
+            limit=self.limiter.limit,
+            in_flight=self.limiter.in_flight,
+            waiting=self.limiter.waiting,
+            circuit_state=self.breaker.state,
+            consecutive_failures=self.breaker.consecutive_failures,
+            calls=calls,
+            failures=failures,
+            rejected=rejected,
+            latency_p50_seconds=_percentile(latencies, 0.5),
+            latency_p99_seconds=_percentile(latencies, 0.99),
+        )
+
+
+_upstreams_lock = threading.Lock()
+_upstreams: dict[str, Upstream] = {}
+
+
+def get_upstream(name: str = CDP_UPSTREAM) -> Upstream:
+    """Return the process-wide load control of an upstream API, creating it on first use."""
+    with _upstreams_lock:
+        if name not in _upstreams:
+            _upstreams[name] = Upstream(name)
+        return _upstreams[name]
+
+
+def call_upstream(func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """Call the CDP API under the process-wide load control.
+
+    Wrap every blocking wallet or contract call of the actions in this, e.g.
+    `call_upstream(wallet.transfer, amount=..., asset_id=..., destination=...)`.
+
+    Args:
+        func: The blocking function that calls the CDP API.
+        args: The positional arguments of the call.
+        kwargs: The keyword arguments of the call.
+
+    Returns:
+        The result of the call.
+
+    """
+    return get_upstream(CDP_UPSTREAM).call(func, *args, **kwargs)
+
+
+def upstream_metrics() -> dict[str, UpstreamMetrics]:
+    """Take a snapshot of the load control state of every upstream API, by name."""
+    with _upstreams_lock:
+        upstreams = list(_upstreams.values())
+    return {upstream.name: upstream.metrics() for upstream in upstreams}
@@ -1,12 +1,15 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
 from cdp_agentkit_core.actions.pyth.fetch_price import (
     PythFetchPriceInput,
+    apyth_fetch_price,
     pyth_fetch_price,
 )
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, deadline
 
 MOCK_PRICE_FEED_ID = "valid-price-feed-id"
 
@@ -59,3 +62,59 @@ def test_pyth_fetch_price_http_error():
 
         with pytest.raises(requests.exceptions.HTTPError):
             pyth_fetch_price(MOCK_PRICE_FEED_ID)
+
+
+def test_apyth_fetch_price_success():
+    """Test successful async pyth fetch price with valid parameters."""
+    mock_response = {
+        "parsed": [
+            {
+                "price": {
+                    "price": "4212345",
+                    "expo": -2,
+                    "conf": "1234",
+                },
+                "id": "test_feed_id",
+            }
+        ]
+    }
+
+    with patch("requests.get") as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+        mock_get.return_value.raise_for_status.return_value = None
+
+        result = asyncio.run(apyth_fetch_price(MOCK_PRICE_FEED_ID))
+
+        assert result == "42123.45"
+
+
+def test_pyth_fetch_price_within_deadline():
+    """Test that the request timeout is bounded by the deadline, and skipped once it passed."""
+    with patch("requests.get") as mock_get:
+        mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError()
+
+        with deadline(2), pytest.raises(requests.exceptions.HTTPError):
+            pyth_fetch_price(MOCK_PRICE_FEED_ID)
+
+        assert 0 < mock_get.call_args.kwargs["timeout"] <= 2
+
+        with deadline(0), pytest.raises(DeadlineExceededError):
+            pyth_fetch_price(MOCK_PRICE_FEED_ID)
+
+        mock_get.assert_called_once()
+
+
+def test_pyth_fetch_price_retries_server_errors():
+    """Test that transient Pyth errors are retried before the price is returned."""
+    error = requests.exceptions.HTTPError("503 Server Error", response=Mock(status_code=503))
+    failed = Mock(**{"raise_for_status.side_effect": error})
+    succeeded = Mock(**{"json.return_value": {"parsed": []}})
+
+    with (
+        patch("requests.get", side_effect=[failed, succeeded]) as mock_get,
+        patch("cdp_agentkit_core.utils.retry.time.sleep"),
+        pytest.raises(ValueError, match="No price data found"),
+    ):
+        pyth_fetch_price(MOCK_PRICE_FEED_ID)
+
+    assert mock_get.call_count == 2
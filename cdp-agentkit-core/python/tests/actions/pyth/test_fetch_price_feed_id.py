@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 import requests
 
+from cdp_agentkit_core.actions.pyth.constants import PYTH_HTTP_TIMEOUT_SECONDS
 from cdp_agentkit_core.actions.pyth.fetch_price_feed_id import (
     PythFetchPriceFeedIDInput,
     pyth_fetch_price_feed_id,
@@ -46,7 +47,8 @@ def test_pyth_fetch_price_feed_id_success():
 
         assert result == "0ff1e87c65eb6e6f7768e66543859b7f3076ba8a3529636f6b2664f367c3344a"
         mock_get.assert_called_once_with(
-            "https://hermes.pyth.network/v2/price_feeds?query=BTC&asset_type=crypto"
+            "https://hermes.pyth.network/v2/price_feeds?query=BTC&asset_type=crypto",
+            timeout=PYTH_HTTP_TIMEOUT_SECONDS,
         )
 
 
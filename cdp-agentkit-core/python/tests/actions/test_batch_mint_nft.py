@@ -0,0 +1,145 @@
+import asyncio
+from unittest.mock import call, patch
+
+import pytest
+
+from cdp_agentkit_core.actions.batch_mint_nft import (
+    BatchMintNftInput,
+    abatch_mint_nft,
+    batch_mint_nft,
+)
+from cdp_agentkit_core.utils.confirmation_poller import ConfirmationPoller
+
+MOCK_CONTRACT_ADDRESS = "0xvalidContractAddress"
+MOCK_DESTINATION_A = "0xDestinationA"
+MOCK_DESTINATION_B = "0xDestinationB"
+MOCK_LINK = "https://basescan.org/tx/0xvalidTransactionHash"
+
+
+@pytest.fixture(autouse=True)
+def poller(monkeypatch):
+    """Confirm the batch with a poller that checks the transactions right away."""
+    poller = ConfirmationPoller(interval_seconds=0)
+    monkeypatch.setattr("cdp_agentkit_core.utils.batch.get_confirmation_poller", lambda: poller)
+    return poller
+
+
+def _invocation(contract_invocation_factory):
+    invocation = contract_invocation_factory()
+    invocation.transaction_hash = "0xvalidTransactionHash"
+    invocation.transaction_link = MOCK_LINK
+    invocation.status = "complete"
+    return invocation
+
+
+def test_batch_mint_nft_input_model_valid():
+    """Test that BatchMintNftInput accepts valid parameters and defaults the quantity to 1."""
+    input_model = BatchMintNftInput(
+        contract_address=MOCK_CONTRACT_ADDRESS,
+        recipients=[
+            {"destination": MOCK_DESTINATION_A},
+            {"destination": MOCK_DESTINATION_B, "quantity": "5"},
+        ],
+    )
+
+    assert input_model.recipients[0].quantity == "1"
+    assert input_model.recipients[1].quantity == "5"
+
+
+def test_batch_mint_nft_input_model_requires_recipients():
+    """Test that BatchMintNftInput rejects an empty recipient list."""
+    with pytest.raises(ValueError):
+        BatchMintNftInput(contract_address=MOCK_CONTRACT_ADDRESS, recipients=[])
+
+
+def test_batch_mint_nft_success(wallet_factory, contract_invocation_factory):
+    """Test that one mint per destination is submitted, using the contract's quantity argument."""
+    mock_wallet = wallet_factory()
+    invocations = [_invocation(contract_invocation_factory) for _ in range(2)]
+    recipients = [
+        {"destination": MOCK_DESTINATION_A, "quantity": "2"},
+        {"destination": MOCK_DESTINATION_B, "quantity": "1"},
+        {"destination": MOCK_DESTINATION_A, "quantity": "3"},
+    ]
+
+    with patch.object(mock_wallet, "invoke_contract", side_effect=invocations) as mock_invoke:
+        action_response = batch_mint_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, recipients)
+
+    assert mock_invoke.call_args_list == [
+        call(
+            contract_address=MOCK_CONTRACT_ADDRESS,
+            method="mint",
+            args={"to": MOCK_DESTINATION_A, "quantity": "5"},
+        ),
+        call(
+            contract_address=MOCK_CONTRACT_ADDRESS,
+            method="mint",
+            args={"to": MOCK_DESTINATION_B, "quantity": "1"},
+        ),
+    ]
+    for invocation in invocations:
+        invocation.wait.assert_not_called()
+    assert action_response == "\n".join(
+        [
+            f"Batch mint of 6 NFTs from contract {MOCK_CONTRACT_ADDRESS} to 2 addresses on network {mock_wallet.network_id}:",
+            "  destination | quantity | result",
+            f"  {MOCK_DESTINATION_A} | 5 | complete {MOCK_LINK}",
+            f"  {MOCK_DESTINATION_B} | 1 | complete {MOCK_LINK}",
+            "2 complete",
+        ]
+    )
+
+
+def test_batch_mint_nft_invalid_quantity(wallet_factory):
+    """Test that nothing is minted when a quantity is not a positive integer."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(mock_wallet, "invoke_contract") as mock_invoke:
+        action_response = batch_mint_nft(
+            mock_wallet,
+            MOCK_CONTRACT_ADDRESS,
+            [{"destination": MOCK_DESTINATION_A, "quantity": "0"}],
+        )
+
+    mock_invoke.assert_not_called()
+    assert action_response == f"Error minting NFTs Invalid quantity 0 for {MOCK_DESTINATION_A}"
+
+
+def test_batch_mint_nft_api_error(wallet_factory, contract_invocation_factory):
+    """Test that a failed mint is reported and the other mints are still submitted."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(
+        mock_wallet,
+        "invoke_contract",
+        side_effect=[Exception("API error"), _invocation(contract_invocation_factory)],
+    ):
+        action_response = batch_mint_nft(
+            mock_wallet,
+            MOCK_CONTRACT_ADDRESS,
+            [{"destination": MOCK_DESTINATION_A}, {"destination": MOCK_DESTINATION_B}],
+        )
+
+    assert action_response.splitlines()[2:] == [
+        f"  {MOCK_DESTINATION_A} | 1 | error: API error",
+        f"  {MOCK_DESTINATION_B} | 1 | complete {MOCK_LINK}",
+        "1 complete, 1 error",
+    ]
+
+
+def test_batch_mint_nft_async(wallet_factory, contract_invocation_factory):
+    """Test that the async batch mint reports the same table."""
+    mock_wallet = wallet_factory()
+    recipients = [{"destination": MOCK_DESTINATION_A}, {"destination": MOCK_DESTINATION_B}]
+
+    with patch.object(
+        mock_wallet,
+        "invoke_contract",
+        side_effect=[_invocation(contract_invocation_factory) for _ in range(4)],
+    ):
+        sync_response = batch_mint_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, recipients)
+        async_response = asyncio.run(
+            abatch_mint_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, recipients)
+        )
+
+    assert async_response == sync_response
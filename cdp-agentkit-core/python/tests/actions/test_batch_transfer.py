@@ -0,0 +1,152 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import call, patch
+
+import pytest
+
+from cdp_agentkit_core.actions.batch_transfer import (
+    BatchTransferInput,
+    abatch_transfer,
+    batch_transfer,
+)
+from cdp_agentkit_core.utils.confirmation_poller import ConfirmationPoller, submit_only
+
+MOCK_ASSET_ID = "usdc"
+MOCK_RECIPIENTS = [
+    {"destination": "example.eth", "amount": "1.5"},
+    {"destination": "0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027", "amount": "2"},
+]
+MOCK_LINK = "https://basescan.org/tx/0xvalidTransactionHash"
+
+
+@pytest.fixture(autouse=True)
+def poller(monkeypatch):
+    """Confirm the batch with a poller that checks the transactions right away."""
+    poller = ConfirmationPoller(interval_seconds=0)
+    monkeypatch.setattr("cdp_agentkit_core.utils.batch.get_confirmation_poller", lambda: poller)
+    return poller
+
+
+def test_batch_transfer_input_model_valid():
+    """Test that BatchTransferInput accepts valid parameters."""
+    input_model = BatchTransferInput(
+        asset_id=MOCK_ASSET_ID, recipients=MOCK_RECIPIENTS, gasless=True
+    )
+
+    assert input_model.recipients[0].destination == "example.eth"
+    assert input_model.recipients[1].amount == "2"
+    assert input_model.gasless is True
+
+
+def test_batch_transfer_input_model_requires_recipients():
+    """Test that BatchTransferInput rejects an empty recipient list."""
+    with pytest.raises(ValueError):
+        BatchTransferInput(asset_id=MOCK_ASSET_ID, recipients=[])
+
+
+def test_batch_transfer_success(wallet_factory, transfer_factory):
+    """Test that every transfer is submitted before the batch is confirmed together."""
+    mock_wallet = wallet_factory()
+    mock_wallet.balance.return_value = Decimal("10")
+    transfers = [transfer_factory(), transfer_factory()]
+
+    with patch.object(mock_wallet, "transfer", side_effect=transfers) as mock_transfer:
+        action_response = batch_transfer(mock_wallet, MOCK_ASSET_ID, MOCK_RECIPIENTS, True)
+
+    mock_wallet.balance.assert_called_once_with(MOCK_ASSET_ID)
+    assert mock_transfer.call_args_list == [
+        call(amount=r["amount"], asset_id=MOCK_ASSET_ID, destination=r["destination"], gasless=True)
+        for r in MOCK_RECIPIENTS
+    ]
+    for transfer in transfers:
+        transfer.wait.assert_not_called()
+    assert action_response == "\n".join(
+        [
+            "Batch transfer of 3.5 of usdc to 2 recipients:",
+            "  destination | amount | result",
+            f"  example.eth | 1.5 | complete {MOCK_LINK}",
+            f"  0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027 | 2 | complete {MOCK_LINK}",
+            "2 complete",
+        ]
+    )
+
+
+def test_batch_transfer_insufficient_balance(wallet_factory):
+    """Test that nothing is sent when the batch total exceeds the balance."""
+    mock_wallet = wallet_factory()
+    mock_wallet.balance.return_value = Decimal("3")
+
+    with patch.object(mock_wallet, "transfer") as mock_transfer:
+        action_response = batch_transfer(mock_wallet, MOCK_ASSET_ID, MOCK_RECIPIENTS)
+
+    mock_transfer.assert_not_called()
+    assert action_response == (
+        "Error transferring the assets Insufficient balance: the batch sends 3.5 of usdc, "
+        "but the wallet holds 3"
+    )
+
+
+def test_batch_transfer_invalid_amount(wallet_factory):
+    """Test that nothing is sent when an amount is not a positive number."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(mock_wallet, "transfer") as mock_transfer:
+        action_response = batch_transfer(
+            mock_wallet, MOCK_ASSET_ID, [{"destination": "example.eth", "amount": "-1"}]
+        )
+
+    mock_transfer.assert_not_called()
+    assert action_response == "Error transferring the assets Invalid amount -1 for example.eth"
+
+
+def test_batch_transfer_partial_failure(wallet_factory, transfer_factory):
+    """Test that a failed submission is reported and the other transfers are still sent."""
+    mock_wallet = wallet_factory()
+    mock_wallet.balance.return_value = Decimal("10")
+    failed = transfer_factory()
+    failed.status = "failed"
+
+    with patch.object(
+        mock_wallet, "transfer", side_effect=[Exception("API error"), failed]
+    ) as mock_transfer:
+        action_response = batch_transfer(mock_wallet, MOCK_ASSET_ID, MOCK_RECIPIENTS)
+
+    assert mock_transfer.call_count == 2
+    assert action_response.splitlines()[2:] == [
+        "  example.eth | 1.5 | error: API error",
+        f"  0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027 | 2 | failed {MOCK_LINK}",
+        "0 complete, 1 failed, 1 error",
+    ]
+
+
+def test_batch_transfer_submit_only(wallet_factory, transfer_factory, poller):
+    """Test that the batch returns pending transaction IDs in submit-only mode."""
+    mock_wallet = wallet_factory()
+    mock_wallet.balance.return_value = Decimal("10")
+    poller.interval_seconds = 3600
+
+    with (
+        patch.object(mock_wallet, "transfer", side_effect=[transfer_factory(), transfer_factory()]),
+        submit_only(),
+    ):
+        action_response = batch_transfer(mock_wallet, MOCK_ASSET_ID, MOCK_RECIPIENTS)
+
+    pending = poller.transactions()
+    assert [transaction.description for transaction in pending] == [
+        "transfer of 1.5 of usdc to example.eth",
+        "transfer of 2 of usdc to 0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027",
+    ]
+    assert f"  example.eth | 1.5 | pending (transaction ID {pending[0].id})" in action_response
+    assert action_response.endswith("0 complete, 2 pending")
+
+
+def test_batch_transfer_async(wallet_factory, transfer_factory):
+    """Test that the async batch transfer reports the same table."""
+    mock_wallet = wallet_factory()
+    mock_wallet.balance.return_value = Decimal("10")
+
+    with patch.object(mock_wallet, "transfer", side_effect=[transfer_factory() for _ in range(4)]):
+        sync_response = batch_transfer(mock_wallet, MOCK_ASSET_ID, MOCK_RECIPIENTS)
+        async_response = asyncio.run(abatch_transfer(mock_wallet, MOCK_ASSET_ID, MOCK_RECIPIENTS))
+
+    assert async_response == sync_response
@@ -0,0 +1,161 @@
+import asyncio
+from unittest.mock import call, patch
+
+import pytest
+from eth_abi import encode
+
+from cdp_agentkit_core.actions.batch_transfer_nft import (
+    BatchTransferNftInput,
+    abatch_transfer_nft,
+    batch_transfer_nft,
+)
+from cdp_agentkit_core.utils.confirmation_poller import ConfirmationPoller
+from cdp_agentkit_core.utils.multicall import CallResult
+
+MOCK_CONTRACT_ADDRESS = "0x123456789abcdef"
+MOCK_FROM_ADDRESS = "0xFromAddress"
+MOCK_OWNER = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+MOCK_TRANSFERS = [
+    {"token_id": "1", "destination": "example.eth"},
+    {"token_id": "2", "destination": "0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027"},
+]
+MOCK_LINK = "https://basescan.org/tx/0xvalidTransactionHash"
+
+
+@pytest.fixture(autouse=True)
+def poller(monkeypatch):
+    """Confirm the batch with a poller that checks the transactions right away."""
+    poller = ConfirmationPoller(interval_seconds=0)
+    monkeypatch.setattr("cdp_agentkit_core.utils.batch.get_confirmation_poller", lambda: poller)
+    return poller
+
+
+def _invocation(contract_invocation_factory):
+    invocation = contract_invocation_factory()
+    invocation.transaction_hash = "0xvalidTransactionHash"
+    invocation.transaction_link = MOCK_LINK
+    invocation.status = "complete"
+    return invocation
+
+
+def test_batch_transfer_nft_input_model_valid():
+    """Test that BatchTransferNftInput accepts valid parameters."""
+    input_model = BatchTransferNftInput(
+        contract_address=MOCK_CONTRACT_ADDRESS, transfers=MOCK_TRANSFERS
+    )
+
+    assert input_model.transfers[1].token_id == "2"
+    assert input_model.from_address is None
+
+
+def test_batch_transfer_nft_input_model_requires_transfers():
+    """Test that BatchTransferNftInput rejects an empty transfer list."""
+    with pytest.raises(ValueError):
+        BatchTransferNftInput(contract_address=MOCK_CONTRACT_ADDRESS, transfers=[])
+
+
+def test_batch_transfer_nft_success(wallet_factory, contract_invocation_factory):
+    """Test that one transfer per NFT is submitted before the batch is confirmed together."""
+    mock_wallet = wallet_factory()
+    invocations = [_invocation(contract_invocation_factory) for _ in range(2)]
+
+    with patch.object(mock_wallet, "invoke_contract", side_effect=invocations) as mock_invoke:
+        action_response = batch_transfer_nft(
+            mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_TRANSFERS, MOCK_FROM_ADDRESS
+        )
+
+    assert mock_invoke.call_args_list == [
+        call(
+            contract_address=MOCK_CONTRACT_ADDRESS,
+            method="transferFrom",
+            args={"from": MOCK_FROM_ADDRESS, "to": t["destination"], "tokenId": t["token_id"]},
+        )
+        for t in MOCK_TRANSFERS
+    ]
+    assert action_response == "\n".join(
+        [
+            f"Batch transfer of 2 NFTs from contract {MOCK_CONTRACT_ADDRESS} from {MOCK_FROM_ADDRESS}:",
+            "  token ID | destination | result",
+            f"  1 | example.eth | complete {MOCK_LINK}",
+            f"  2 | 0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027 | complete {MOCK_LINK}",
+            "2 complete",
+        ]
+    )
+
+
+def test_batch_transfer_nft_default_from_address(wallet_factory, contract_invocation_factory):
+    """Test that the NFTs are transferred from the wallet's default address by default."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(
+        mock_wallet, "invoke_contract", return_value=_invocation(contract_invocation_factory)
+    ) as mock_invoke:
+        batch_transfer_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_TRANSFERS[:1])
+
+    assert mock_invoke.call_args.kwargs["args"]["from"] == mock_wallet.default_address.address_id
+
+
+def test_batch_transfer_nft_duplicate_token(wallet_factory):
+    """Test that nothing is sent when an NFT is listed more than once."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(mock_wallet, "invoke_contract") as mock_invoke:
+        action_response = batch_transfer_nft(
+            mock_wallet, MOCK_CONTRACT_ADDRESS, [MOCK_TRANSFERS[0], MOCK_TRANSFERS[0]]
+        )
+
+    mock_invoke.assert_not_called()
+    assert action_response == (
+        f"Error transferring the NFTs (contract: {MOCK_CONTRACT_ADDRESS}): "
+        "NFT (ID: 1) is transferred more than once"
+    )
+
+
+def test_batch_transfer_nft_async(wallet_factory, contract_invocation_factory):
+    """Test that the async batch transfer reports the same table."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(
+        mock_wallet,
+        "invoke_contract",
+        side_effect=[_invocation(contract_invocation_factory) for _ in range(4)],
+    ):
+        sync_response = batch_transfer_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_TRANSFERS)
+        async_response = asyncio.run(
+            abatch_transfer_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_TRANSFERS)
+        )
+
+    assert async_response == sync_response
+
+
+def test_batch_transfer_nft_skips_transfers_rejected_by_simulation(
+    wallet_factory, contract_invocation_factory
+):
+    """Test that NFTs the wallet cannot transfer are simulated in one read and not sent."""
+    mock_wallet = wallet_factory()
+    mock_wallet.default_address.address_id = MOCK_OWNER
+    owned = CallResult(success=True, return_data=encode(["address"], [MOCK_OWNER]))
+    missing = CallResult(
+        success=False, return_data=bytes.fromhex("7e273289") + encode(["uint256"], [2])
+    )
+
+    with (
+        patch(
+            "cdp_agentkit_core.utils.preflight.aggregate", return_value=[owned, missing]
+        ) as mock_aggregate,
+        patch.object(
+            mock_wallet, "invoke_contract", return_value=_invocation(contract_invocation_factory)
+        ) as mock_invoke,
+    ):
+        action_response = batch_transfer_nft(
+            mock_wallet, "0x036CbD53842c5426634e7929541eC2318f3dCF7e", MOCK_TRANSFERS
+        )
+
+    mock_aggregate.assert_called_once()
+    assert mock_invoke.call_count == 1
+    assert mock_invoke.call_args.kwargs["args"]["tokenId"] == "1"
+    assert (
+        "  2 | 0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027 | error: Simulation shows the call "
+        "would revert: ownerOf reverted: ERC721NonexistentToken(tokenId=2)"
+    ) in action_response
+    assert action_response.endswith("1 complete, 1 error")
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+from decimal import Decimal
+from unittest.mock import Mock, PropertyMock
+
+import pytest
+from cdp import Address
+
+from cdp_agentkit_core.actions.get_balance import (
+    GetBalanceInput,
+    aget_balance,
+    get_balance,
+)
+
+MOCK_ASSET_ID = "eth"
+
+
+def _mock_address(address_id, balance=None, error=None, delay=0.0):
+    address = Mock(spec=Address)
+    address.address_id = address_id
+
+    def get_address_balance(asset_id):
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return balance
+
+    address.balance.side_effect = get_address_balance
+    return address
+
+
+def test_get_balance_input_model_valid():
+    """Test that GetBalanceInput accepts valid parameters."""
+    input_model = GetBalanceInput(asset_id=MOCK_ASSET_ID)
+
+    assert input_model.asset_id == MOCK_ASSET_ID
+
+
+def test_get_balance_input_model_missing_params():
+    """Test that GetBalanceInput raises error when params are missing."""
+    with pytest.raises(ValueError):
+        GetBalanceInput()
+
+
+def test_get_balance_success(wallet_factory):
+    """Test successful get balance with results in wallet address order."""
+    mock_wallet = wallet_factory()
+    # The first address is the slowest, so it completes last.
+    mock_wallet.addresses = [
+        _mock_address("0xfirst", Decimal("1.5"), delay=0.05),
+        _mock_address("0xsecond", Decimal("2")),
+        _mock_address("0xthird", Decimal("0")),
+    ]
+
+    action_response = get_balance(mock_wallet, MOCK_ASSET_ID)
+
+    expected_response = (
+        f"Balances for wallet {mock_wallet.id}:\n  0xfirst: 1.5\n  0xsecond: 2\n  0xthird: 0"
+    )
+    assert action_response == expected_response
+    for address in mock_wallet.addresses:
+        address.balance.assert_called_once_with(MOCK_ASSET_ID)
+
+
+def test_get_balance_partial_failure(wallet_factory):
+    """Test that a failing address is reported without aborting the other addresses."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [
+        _mock_address("0xfirst", Decimal("1")),
+        _mock_address("0xsecond", error=Exception("API error")),
+        _mock_address("0xthird", Decimal("3")),
+    ]
+
+    action_response = get_balance(mock_wallet, MOCK_ASSET_ID)
+
+    expected_response = f"Balances for wallet {mock_wallet.id}:\n  0xfirst: 1\n  0xsecond: Error getting balance API error\n  0xthird: 3"
+    assert action_response == expected_response
+
+
+def test_get_balance_respects_max_workers(wallet_factory):
+    """Test that no more than max_workers balance requests are in flight at once."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def get_address_balance(asset_id):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return Decimal("1")
+
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = []
+    for i in range(6):
+        address = Mock(spec=Address)
+        address.address_id = f"0x{i}"
+        address.balance.side_effect = get_address_balance
+        mock_wallet.addresses.append(address)
+
+    get_balance(mock_wallet, MOCK_ASSET_ID, max_workers=2)
+
+    assert peak == 2
+
+
+def test_get_balance_addresses_error(wallet_factory):
+    """Test get balance when the wallet addresses cannot be listed."""
+    mock_wallet = wallet_factory()
+    type(mock_wallet).addresses = PropertyMock(side_effect=Exception("API error"))
+
+    action_response = get_balance(mock_wallet, MOCK_ASSET_ID)
+
+    assert action_response == "Error getting balance for all addresses in the wallet API error"
+
+
+def test_aget_balance_partial_failure(wallet_factory):
+    """Test that the async get balance keeps address order and reports partial failures."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [
+        _mock_address("0xfirst", Decimal("1"), delay=0.05),
+        _mock_address("0xsecond", error=Exception("API error")),
+    ]
+
+    action_response = asyncio.run(aget_balance(mock_wallet, MOCK_ASSET_ID, max_workers=2))
+
+    expected_response = f"Balances for wallet {mock_wallet.id}:\n  0xfirst: 1\n  0xsecond: Error getting balance API error"
+    assert action_response == expected_response
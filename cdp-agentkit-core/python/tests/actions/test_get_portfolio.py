@@ -0,0 +1,121 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from cdp import Address
+
+from cdp_agentkit_core.actions.get_portfolio import (
+    GetPortfolioInput,
+    aget_portfolio,
+    get_portfolio,
+)
+
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+
+def _mock_address(address_id, balances=None, balances_error=None, balance=Decimal("0")):
+    address = Mock(spec=Address)
+    address.address_id = address_id
+    if balances_error is not None:
+        address.balances.side_effect = balances_error
+    else:
+        address.balances.return_value = balances or {}
+    address.balance.return_value = balance
+    return address
+
+
+def test_get_portfolio_input_model_valid():
+    """Test that GetPortfolioInput accepts an explicit asset list."""
+    input_model = GetPortfolioInput(asset_ids=["eth", "usdc"])
+
+    assert input_model.asset_ids == ["eth", "usdc"]
+
+
+def test_get_portfolio_input_model_missing_optional():
+    """Test that GetPortfolioInput works without an asset list."""
+    input_model = GetPortfolioInput()
+
+    assert input_model.asset_ids is None
+
+
+def test_get_portfolio_all_assets(wallet_factory):
+    """Test that every asset is reported with one batched listing per address."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [
+        _mock_address("0xfirst", {"eth": Decimal("1.5"), "usdc": Decimal("10")}),
+        _mock_address("0xsecond", {}),
+    ]
+
+    action_response = get_portfolio(mock_wallet)
+
+    expected_response = (
+        f"Portfolio for wallet {mock_wallet.id}:\n"
+        "  0xfirst:\n    eth: 1.5\n    usdc: 10\n"
+        "  0xsecond:\n    No balances"
+    )
+    assert action_response == expected_response
+    for address in mock_wallet.addresses:
+        address.balances.assert_called_once_with()
+        address.balance.assert_not_called()
+
+
+def test_get_portfolio_explicit_assets(wallet_factory):
+    """Test that listed assets come from the batched listing and the rest are read individually."""
+    mock_wallet = wallet_factory()
+    address = _mock_address("0xfirst", {"eth": Decimal("1"), "usdc": Decimal("2")}, balance=5)
+    mock_wallet.addresses = [address]
+
+    action_response = get_portfolio(mock_wallet, ["ETH", MOCK_TOKEN_ADDRESS])
+
+    expected_response = (
+        f"Portfolio for wallet {mock_wallet.id}:\n"
+        f"  0xfirst:\n    ETH: 1\n    {MOCK_TOKEN_ADDRESS}: 5"
+    )
+    assert action_response == expected_response
+    address.balance.assert_called_once_with(MOCK_TOKEN_ADDRESS)
+
+
+def test_get_portfolio_partial_failure(wallet_factory):
+    """Test that a failing address is reported without aborting the other addresses."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [
+        _mock_address("0xfirst", balances_error=Exception("API error")),
+        _mock_address("0xsecond", {"eth": Decimal("3")}),
+    ]
+
+    action_response = get_portfolio(mock_wallet)
+
+    expected_response = (
+        f"Portfolio for wallet {mock_wallet.id}:\n"
+        "  0xfirst:\n    Error getting balances API error\n"
+        "  0xsecond:\n    eth: 3"
+    )
+    assert action_response == expected_response
+
+
+def test_get_portfolio_explicit_assets_fallback_error(wallet_factory):
+    """Test that a failed individual read is reported next to its asset."""
+    mock_wallet = wallet_factory()
+    address = _mock_address("0xfirst", balances_error=Exception("API error"))
+    address.balance.side_effect = [Decimal("1"), Exception("Read error")]
+    mock_wallet.addresses = [address]
+
+    action_response = get_portfolio(mock_wallet, ["eth", "usdc"], max_workers=1)
+
+    expected_response = (
+        f"Portfolio for wallet {mock_wallet.id}:\n"
+        "  0xfirst:\n    eth: 1\n    usdc: Error getting balance Read error"
+    )
+    assert action_response == expected_response
+
+
+@pytest.mark.parametrize("asset_ids", [None, ["eth"]])
+def test_aget_portfolio_success(wallet_factory, asset_ids):
+    """Test that the async get portfolio matches the sync result."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [_mock_address("0xfirst", {"eth": Decimal("1")})]
+
+    action_response = asyncio.run(aget_portfolio(mock_wallet, asset_ids))
+
+    assert action_response == f"Portfolio for wallet {mock_wallet.id}:\n  0xfirst:\n    eth: 1"
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import Mock
+
+from cdp import ContractInvocation
+
+from cdp_agentkit_core.actions.get_transaction_status import (
+    GetTransactionStatusInput,
+    aget_transaction_status,
+    get_transaction_status,
+)
+from cdp_agentkit_core.utils.confirmation_poller import ConfirmationPoller
+
+MOCK_TRANSACTION_ID = "0b6e1c0e-3c9e-4b8a-9d55-2d6cf3f5f0a1"
+MOCK_TRANSACTION_HASH = "0xvalidTransactionHash"
+
+
+def _track(poller, wallet_id, description):
+    invocation = Mock(spec=ContractInvocation)
+    invocation.wallet_id = wallet_id
+    invocation.transaction_hash = MOCK_TRANSACTION_HASH
+    invocation.transaction_link = f"https://sepolia.basescan.org/tx/{MOCK_TRANSACTION_HASH}"
+    return poller.track(invocation, description)
+
+
+def _poller(monkeypatch):
+    poller = ConfirmationPoller(interval_seconds=3600)
+    monkeypatch.setattr(
+        "cdp_agentkit_core.actions.get_transaction_status.get_confirmation_poller",
+        lambda: poller,
+    )
+    return poller
+
+
+def test_get_transaction_status_input_model_valid():
+    """Test that GetTransactionStatusInput accepts an optional transaction ID."""
+    assert GetTransactionStatusInput().transaction_id is None
+    assert (
+        GetTransactionStatusInput(transaction_id=MOCK_TRANSACTION_ID).transaction_id
+        == MOCK_TRANSACTION_ID
+    )
+
+
+def test_get_transaction_status_by_id(wallet_factory, monkeypatch):
+    """Test getting the status of one submitted transaction."""
+    mock_wallet = wallet_factory()
+    pending = _track(_poller(monkeypatch), mock_wallet.id, "wrap of 1 wei of ETH to WETH")
+
+    action_response = get_transaction_status(mock_wallet, pending.id)
+
+    assert action_response == pending.summary()
+    assert f"Transaction {pending.id} (wrap of 1 wei of ETH to WETH): pending" in action_response
+    assert f"Transaction hash: {MOCK_TRANSACTION_HASH}" in action_response
+
+
+def test_get_transaction_status_unknown_id(wallet_factory, monkeypatch):
+    """Test getting the status of a transaction that was never submitted."""
+    _poller(monkeypatch)
+
+    action_response = get_transaction_status(wallet_factory(), MOCK_TRANSACTION_ID)
+
+    assert action_response == f"No submitted transaction found with ID {MOCK_TRANSACTION_ID}"
+
+
+def test_get_transaction_status_of_other_wallet(wallet_factory, monkeypatch):
+    """Test that a transaction of another wallet is not reported, even by its ID."""
+    pending = _track(_poller(monkeypatch), "other-wallet", "other")
+
+    action_response = get_transaction_status(wallet_factory(), pending.id)
+
+    assert action_response == f"No submitted transaction found with ID {pending.id}"
+
+
+def test_get_transaction_status_for_wallet(wallet_factory, monkeypatch):
+    """Test that every submitted transaction of the wallet, and only those, are reported."""
+    mock_wallet = wallet_factory()
+    poller = _poller(monkeypatch)
+    first = _track(poller, mock_wallet.id, "first")
+    second = _track(poller, mock_wallet.id, "second")
+    _track(poller, "other-wallet", "other")
+
+    action_response = get_transaction_status(mock_wallet)
+
+    assert action_response == f"{first.summary()}\n\n{second.summary()}"
+
+
+def test_get_transaction_status_none_submitted(wallet_factory, monkeypatch):
+    """Test getting the status when the wallet has not submitted any transactions."""
+    mock_wallet = wallet_factory()
+    _poller(monkeypatch)
+
+    action_response = get_transaction_status(mock_wallet)
+
+    assert action_response == f"No submitted transactions for wallet {mock_wallet.id}"
+
+
+def test_get_transaction_status_async(wallet_factory, monkeypatch):
+    """Test that the async version reports the same status."""
+    mock_wallet = wallet_factory()
+    pending = _track(_poller(monkeypatch), mock_wallet.id, "write")
+
+    action_response = asyncio.run(aget_transaction_status(mock_wallet, pending.id))
+
+    assert action_response == pending.summary()
@@ -1,6 +1,10 @@
 from unittest.mock import patch
 
 import pytest
+from cdp.client.models.ethereum_token_transfer import EthereumTokenTransfer
+from cdp.client.models.ethereum_transaction import EthereumTransaction
+from cdp.client.models.token_transfer_type import TokenTransferType
+from cdp.client.models.transaction_content import TransactionContent
 
 from cdp_agentkit_core.actions.mint_nft import (
     MintNftInput,
@@ -53,6 +57,27 @@ def test_mint_nft_success(wallet_factory, contract_invocation_factory):
         mock_contract_invocation_wait.assert_called_once_with()
 
 
+def test_mint_nft_without_erc165(wallet_factory, contract_invocation_factory):
+    """Test that contracts without ERC-165 support are minted from, not rejected."""
+    mock_wallet = wallet_factory()
+    mock_contract_invocation = contract_invocation_factory()
+
+    with (
+        patch(
+            "cdp_agentkit_core.utils.preflight.aggregate", side_effect=Exception("reverted")
+        ) as mock_aggregate,
+        patch.object(
+            mock_wallet, "invoke_contract", return_value=mock_contract_invocation
+        ) as mock_invoke_contract,
+        patch.object(mock_contract_invocation, "wait", return_value=mock_contract_invocation),
+    ):
+        action_response = mint_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION)
+
+        assert action_response.startswith(f"Minted NFT from contract {MOCK_CONTRACT_ADDRESS}")
+        mock_invoke_contract.assert_called_once()
+        mock_aggregate.assert_not_called()
+
+
 def test_trade_api_error(wallet_factory):
     """Test mint NFT when API error occurs."""
     mock_wallet = wallet_factory()
@@ -70,3 +95,33 @@ def test_trade_api_error(wallet_factory):
             method="mint",
             args={"to": MOCK_DESTINATION, "quantity": "1"},
         )
+
+
+def test_mint_nft_reports_token_ids(wallet_factory, contract_invocation_factory):
+    """Test that the minted token IDs are read from the confirmed transaction."""
+    mock_wallet = wallet_factory()
+    mock_contract_invocation = contract_invocation_factory()
+    mock_contract_invocation.transaction.content = TransactionContent(
+        actual_instance=EthereumTransaction(
+            **{"from": MOCK_DESTINATION},
+            to=MOCK_CONTRACT_ADDRESS,
+            token_transfers=[
+                EthereumTokenTransfer(
+                    contract_address=MOCK_CONTRACT_ADDRESS,
+                    from_address="0x0000000000000000000000000000000000000000",
+                    to_address=MOCK_DESTINATION,
+                    token_id="42",
+                    log_index=0,
+                    token_transfer_type=TokenTransferType.ERC721,
+                )
+            ],
+        )
+    )
+
+    with (
+        patch.object(mock_wallet, "invoke_contract", return_value=mock_contract_invocation),
+        patch.object(mock_contract_invocation, "wait", return_value=mock_contract_invocation),
+    ):
+        action_response = mint_nft(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION)
+
+    assert action_response.endswith("\nMinted token IDs: 42")
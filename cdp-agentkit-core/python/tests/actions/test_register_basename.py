@@ -1,11 +1,13 @@
 from unittest.mock import patch
 
 import pytest
+from eth_abi import encode
 
 from cdp_agentkit_core.actions.register_basename import (
     RegisterBasenameInput,
     register_basename,
 )
+from cdp_agentkit_core.utils.multicall import CallResult
 
 MOCK_NETWORK_ID = "base-mainnet"
 MOCK_BASENAME = "example.base.eth"
@@ -107,3 +109,55 @@ def test_register_basename_testnet_suffix(wallet_factory):
 
         mock_invoke.assert_called_once()
         mock_wait.assert_called_once()
+
+
+def test_register_basename_rejected_by_simulation(wallet_factory):
+    """Test that a Basename that is not available is rejected before the registration is sent."""
+    mock_wallet = wallet_factory(network_id=MOCK_NETWORK_ID)
+    mock_wallet.default_address.address_id = MOCK_ADDRESS
+
+    with (
+        patch(
+            "cdp_agentkit_core.utils.preflight.aggregate",
+            return_value=[
+                CallResult(success=True, return_data=encode(["bool"], [False])),
+                CallResult(success=True, return_data=encode(["uint256"], [10**15])),
+            ],
+        ) as mock_aggregate,
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        action_response = register_basename(mock_wallet, MOCK_BASENAME, MOCK_AMOUNT)
+
+    assert action_response == (
+        "Error registering basename: Simulation shows the call would revert: "
+        "Basename example is not available"
+    )
+    assert [call.method for call in mock_aggregate.call_args.args[1]] == [
+        "available",
+        "registerPrice",
+    ]
+    mock_invoke.assert_not_called()
+
+
+def test_register_basename_checks_price(wallet_factory):
+    """Test that a registration paying less than the registration price is rejected."""
+    mock_wallet = wallet_factory(network_id=MOCK_NETWORK_ID)
+    mock_wallet.default_address.address_id = MOCK_ADDRESS
+
+    with (
+        patch(
+            "cdp_agentkit_core.utils.preflight.aggregate",
+            return_value=[
+                CallResult(success=True, return_data=encode(["bool"], [True])),
+                CallResult(success=True, return_data=encode(["uint256"], [3 * 10**15])),
+            ],
+        ),
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        action_response = register_basename(mock_wallet, MOCK_BASENAME, MOCK_AMOUNT)
+
+    assert action_response == (
+        "Error registering basename: Simulation shows the call would revert: "
+        "Registering example costs 0.003 ETH, more than the 0.002 ETH paid"
+    )
+    mock_invoke.assert_not_called()
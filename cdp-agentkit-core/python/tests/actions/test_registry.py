@@ -0,0 +1,116 @@
+import asyncio
+import inspect
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions import CDP_ACTIONS, CdpAction
+from cdp_agentkit_core.actions.registry import (
+    CdpActionSpec,
+    LazyCdpActionAsyncFunc,
+    LazyCdpActionFunc,
+    _loaded_actions,
+    build_cdp_action_manifest,
+    get_cdp_action_spec,
+    get_cdp_action_specs,
+    load_cdp_action,
+)
+
+
+def test_manifest_matches_actions():
+    """Test that the packaged manifest is in sync with the action modules (run `make manifest`)."""
+    manifest = [CdpActionSpec(**entry) for entry in build_cdp_action_manifest()]
+
+    assert list(get_cdp_action_specs()) == manifest
+
+
+def test_manifest_covers_cdp_actions():
+    """Test that the manifest lists every action in CDP_ACTIONS."""
+    assert {spec.name for spec in get_cdp_action_specs()} == {action.name for action in CDP_ACTIONS}
+
+
+def test_manifest_does_not_import_action_modules():
+    """Test that reading the manifest does not import cdp, web3 or any action module."""
+    code = (
+        "import sys\n"
+        "from cdp_agentkit_core.actions import get_cdp_action_specs\n"
+        "get_cdp_action_specs()\n"
+        "loaded = [m for m in ('cdp', 'web3', 'cdp_agentkit_core.actions.wow.constants') if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_loading_pyth_action_does_not_import_cdp():
+    """Test that loading and failing a Pyth action does not import the CDP SDK."""
+    code = (
+        "import sys\n"
+        "from cdp_agentkit_core.actions import load_cdp_action\n"
+        "from cdp_agentkit_core.utils.errors import is_transient\n"
+        "load_cdp_action('pyth_fetch_price_feed_id')\n"
+        "load_cdp_action('pyth_fetch_price')\n"
+        "is_transient(ValueError())\n"
+        "assert 'cdp' not in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_get_cdp_action_spec_unknown():
+    """Test that looking up an unregistered action raises KeyError."""
+    with pytest.raises(KeyError):
+        get_cdp_action_spec("not_an_action")
+
+
+def test_load_cdp_action_is_cached():
+    """Test that loading an action twice returns the same instance."""
+    action = load_cdp_action("transfer")
+
+    assert action.name == "transfer"
+    assert load_cdp_action("transfer") is action
+
+
+def test_lazy_func_signature():
+    """Test that the lazy proxy reports the signature of the underlying function."""
+    func = get_cdp_action_spec("get_balance").func
+
+    assert isinstance(func, LazyCdpActionFunc)
+    assert inspect.signature(func) == inspect.signature(load_cdp_action("get_balance").func)
+
+
+def test_lazy_func_validates_input():
+    """Test that the lazy proxy validates keyword arguments with the action's args schema."""
+    func = LazyCdpActionFunc("pyth_fetch_price_feed_id")
+
+    with pytest.raises(ValueError):
+        func(invalid_param="BTC")
+
+
+def test_every_action_has_afunc():
+    """Test that every registered action provides a native async implementation."""
+    assert all(action.afunc is not None for action in CDP_ACTIONS)
+
+
+def test_lazy_async_func_runs_afunc():
+    """Test that the lazy async proxy awaits the action's afunc."""
+    mock_response = {"parsed": [{"price": {"price": "4212345", "expo": -2}}]}
+
+    with patch("requests.get") as mock_get:
+        mock_get.return_value.json.return_value = mock_response
+
+        result = asyncio.run(LazyCdpActionAsyncFunc("pyth_fetch_price")(price_feed_id="feed-id"))
+
+    assert result == "42123.45"
+
+
+def test_lazy_async_func_falls_back_to_func(monkeypatch):
+    """Test that the lazy async proxy runs func in a thread when the action has no afunc."""
+    sync_only_action = CdpAction(
+        name="sync_only", description="Sync only test action", func=lambda: "sync result"
+    )
+    monkeypatch.setitem(_loaded_actions, "sync_only", sync_only_action)
+
+    assert asyncio.run(LazyCdpActionAsyncFunc("sync_only")()) == "sync result"
@@ -1,11 +1,14 @@
+import asyncio
 from unittest.mock import patch
 
 import pytest
 
 from cdp_agentkit_core.actions.transfer import (
     TransferInput,
+    atransfer,
     transfer,
 )
+from cdp_agentkit_core.utils.confirmation_poller import get_confirmation_poller, submit_only
 
 MOCK_AMOUNT = "0.01"
 MOCK_ASSET_ID = "usdc"
@@ -60,6 +63,30 @@ def test_transfer_success(wallet_factory, transfer_factory):
         mock_transfer_wait.assert_called_once_with()
 
 
+def test_transfer_submit_only(wallet_factory, transfer_factory):
+    """Test that a transfer in submit-only mode returns a pending transaction without waiting."""
+    mock_wallet = wallet_factory()
+    mock_transfer_instance = transfer_factory()
+
+    with (
+        patch.object(mock_wallet, "transfer", return_value=mock_transfer_instance),
+        patch.object(mock_transfer_instance, "wait") as mock_transfer_wait,
+        submit_only(),
+    ):
+        action_response = transfer(
+            mock_wallet, MOCK_AMOUNT, MOCK_ASSET_ID, MOCK_DESTINATION, MOCK_GASLESS
+        )
+
+    mock_transfer_wait.assert_not_called()
+    assert action_response.startswith(
+        f"Submitted transfer of {MOCK_AMOUNT} of {MOCK_ASSET_ID} to {MOCK_DESTINATION}."
+    )
+    transaction_id = action_response.split("transaction ID ")[1].split(".\n")[0]
+    pending = get_confirmation_poller().get(transaction_id)
+    assert pending.resource is mock_transfer_instance
+    assert pending.transaction_hash == mock_transfer_instance.transaction_hash
+
+
 def test_transfer_api_error(wallet_factory):
     """Test transfer when API error occurs."""
     mock_wallet = wallet_factory()
@@ -78,3 +105,39 @@ def test_transfer_api_error(wallet_factory):
             destination=MOCK_DESTINATION,
             gasless=MOCK_GASLESS,
         )
+
+
+def test_atransfer_success(wallet_factory, transfer_factory):
+    """Test successful async transfer with valid parameters."""
+    mock_wallet = wallet_factory()
+    mock_transfer_instance = transfer_factory()
+
+    with (
+        patch.object(mock_wallet, "transfer", return_value=mock_transfer_instance) as mock_transfer,
+        patch.object(mock_transfer_instance, "wait") as mock_transfer_wait,
+    ):
+        action_response = asyncio.run(
+            atransfer(mock_wallet, MOCK_AMOUNT, MOCK_ASSET_ID, MOCK_DESTINATION, MOCK_GASLESS)
+        )
+
+        expected_response = f"Transferred {MOCK_AMOUNT} of {MOCK_ASSET_ID} to {MOCK_DESTINATION}.\nTransaction hash for the transfer: {mock_transfer_instance.transaction_hash}\nTransaction link for the transfer: {mock_transfer_instance.transaction_link}"
+        assert action_response == expected_response
+        mock_transfer.assert_called_once_with(
+            amount=MOCK_AMOUNT,
+            asset_id=MOCK_ASSET_ID,
+            destination=MOCK_DESTINATION,
+            gasless=MOCK_GASLESS,
+        )
+        mock_transfer_wait.assert_not_called()
+
+
+def test_atransfer_api_error(wallet_factory):
+    """Test async transfer when API error occurs."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(mock_wallet, "transfer", side_effect=Exception("API error")):
+        action_response = asyncio.run(
+            atransfer(mock_wallet, MOCK_AMOUNT, MOCK_ASSET_ID, MOCK_DESTINATION, MOCK_GASLESS)
+        )
+
+        assert action_response == "Error transferring the asset API error"
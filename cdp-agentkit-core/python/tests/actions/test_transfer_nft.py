@@ -1,11 +1,13 @@
 from unittest.mock import patch
 
 import pytest
+from eth_abi import encode
 
 from cdp_agentkit_core.actions.transfer_nft import (
     TransferNftInput,
     transfer_nft,
 )
+from cdp_agentkit_core.utils.multicall import CallResult
 
 MOCK_CONTRACT_ADDRESS = "0xvalidContractAddress"
 MOCK_DESTINATION = "0xvalidAddress"
@@ -93,3 +95,27 @@ def test_transfer_nft_api_error(wallet_factory):
                 "tokenId": MOCK_TOKEN_ID,
             },
         )
+
+
+def test_transfer_nft_rejected_by_simulation(wallet_factory):
+    """Test that a transfer of an NFT the wallet does not own is rejected before it is sent."""
+    mock_wallet = wallet_factory()
+    mock_wallet.default_address.address_id = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+    contract_address = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+    owner = "0x4200000000000000000000000000000000000006"
+
+    with (
+        patch(
+            "cdp_agentkit_core.utils.preflight.aggregate",
+            return_value=[CallResult(success=True, return_data=encode(["address"], [owner]))],
+        ),
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke_contract,
+    ):
+        action_response = transfer_nft(
+            mock_wallet, contract_address, MOCK_TOKEN_ID, MOCK_DESTINATION
+        )
+
+    assert action_response.endswith(
+        f"Simulation shows the call would revert: NFT (ID: {MOCK_TOKEN_ID}) is owned by {owner}, not {mock_wallet.default_address.address_id}"
+    )
+    mock_invoke_contract.assert_not_called()
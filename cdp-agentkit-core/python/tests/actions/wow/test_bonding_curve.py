@@ -0,0 +1,79 @@
+import pytest
+
+from cdp_agentkit_core.actions.wow.bonding_curve import (
+    exp_wad,
+    get_eth_buy_quote,
+    get_eth_sell_quote,
+    get_token_buy_quote,
+    get_token_sell_quote,
+    ln_wad,
+)
+
+SUPPLY = 500_000_000 * 10**18
+
+
+@pytest.mark.parametrize(
+    ("x", "expected"),
+    [
+        (-42139678854452767551, 0),
+        (-3 * 10**18, 49787068367863942),
+        (-(10**18), 367879441171442321),
+        (0, 10**18),
+        (10**18, 2718281828459045235),
+        (3 * 10**18, 20085536923187667741),
+        (
+            135305999368893231588,
+            57896044618658097650144101621524338577433870140581303254786265309376407432913,
+        ),
+    ],
+)
+def test_exp_wad(x, expected):
+    """Test expWad against the Solady reference values."""
+    assert exp_wad(x) == expected
+
+
+def test_exp_wad_overflow():
+    """Test that expWad overflows where Solady reverts."""
+    with pytest.raises(OverflowError):
+        exp_wad(135305999368893231589)
+
+
+@pytest.mark.parametrize(
+    ("x", "expected"),
+    [
+        (10**18, 0),
+        (2718281828459045235, 999999999999999999),
+        (11723640096265400935, 2461607324344817918),
+        (1, -41446531673892822313),
+        (42, -37708862055609454007),
+        (10**4, -32236191301916639577),
+        (10**9, -20723265836946411157),
+        (2**255 - 1, 135305999368893231589),
+    ],
+)
+def test_ln_wad(x, expected):
+    """Test lnWad against the Solady reference values."""
+    assert ln_wad(x) == expected
+
+
+def test_ln_wad_undefined():
+    """Test that lnWad is undefined where Solady reverts."""
+    with pytest.raises(ValueError):
+        ln_wad(0)
+
+
+def test_buy_and_sell_quotes_are_consistent():
+    """Test that each quote rounds in the curve's favour against its inverse."""
+    eth_in = 10**16
+    tokens_out = get_eth_buy_quote(SUPPLY, eth_in)
+
+    assert tokens_out > 0
+    assert get_token_buy_quote(SUPPLY, tokens_out) <= eth_in
+    assert get_token_sell_quote(SUPPLY + tokens_out, tokens_out) <= eth_in
+    assert get_eth_sell_quote(SUPPLY + tokens_out, eth_in) >= tokens_out - 1
+
+
+def test_token_sell_quote_insufficient_liquidity():
+    """Test that selling more than the current supply fails like the contract does."""
+    with pytest.raises(ValueError, match="Insufficient liquidity"):
+        get_token_sell_quote(100, 101)
@@ -1,12 +1,24 @@
+import asyncio
 from unittest.mock import patch
 
 import pytest
+from cdp.client.models.ethereum_token_transfer import EthereumTokenTransfer
+from cdp.client.models.ethereum_transaction import EthereumTransaction
+from cdp.client.models.ethereum_transaction_flattened_trace import (
+    EthereumTransactionFlattenedTrace,
+)
+from cdp.client.models.token_transfer_type import TokenTransferType
+from cdp.client.models.transaction_content import TransactionContent
+from eth_abi import encode
 
 from cdp_agentkit_core.actions.wow.buy_token import (
     WowBuyTokenInput,
+    awow_buy_token,
     wow_buy_token,
 )
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.utils import WowQuote
+from cdp_agentkit_core.utils.multicall import CallResult
 
 MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
 MOCK_AMOUNT_ETH = "100000000000000"
@@ -15,6 +27,12 @@ MOCK_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_TOKEN_QUOTE = 1000000
 
 
+def _mock_quote(has_graduated):
+    return WowQuote(
+        has_graduated=has_graduated, amount_out=MOCK_TOKEN_QUOTE, pool_info=None, uniswap_quote=None
+    )
+
+
 def test_buy_token_input_model_valid():
     """Test that WowBuyTokenInput accepts valid parameters."""
     input_model = WowBuyTokenInput(
@@ -41,9 +59,9 @@ def test_buy_token_success(wallet_factory, contract_invocation_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
+            "cdp_agentkit_core.actions.wow.buy_token.get_quote",
+            return_value=_mock_quote(has_graduated=False),
         ),
-        patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=False),
         patch.object(
             mock_wallet, "invoke_contract", return_value=mock_contract_instance
         ) as mock_invoke,
@@ -91,9 +109,9 @@ def test_buy_token_graduated_pool(wallet_factory, contract_invocation_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
+            "cdp_agentkit_core.actions.wow.buy_token.get_quote",
+            return_value=_mock_quote(has_graduated=True),
         ),
-        patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=True),
         patch.object(
             mock_wallet, "invoke_contract", return_value=mock_contract_instance
         ) as mock_invoke,
@@ -117,9 +135,9 @@ def test_buy_token_api_error(wallet_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
+            "cdp_agentkit_core.actions.wow.buy_token.get_quote",
+            return_value=_mock_quote(has_graduated=False),
         ),
-        patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=False),
         patch.object(
             mock_wallet, "invoke_contract", side_effect=Exception("API error")
         ) as mock_invoke,
@@ -134,3 +152,133 @@ def test_buy_token_api_error(wallet_factory):
 
         assert action_response == expected_response
         mock_invoke.assert_called_once()
+
+
+def test_buy_token_quote_error(wallet_factory):
+    """Test that a failed quote is returned as an error, synchronously and asynchronously."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.buy_token.get_quote",
+            side_effect=Exception("Failed to fetch buy quote"),
+        ),
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        expected_response = "Error buying Zora Wow ERC20 memecoin Failed to fetch buy quote"
+
+        action_response = wow_buy_token(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNT_ETH)
+        async_response = asyncio.run(
+            awow_buy_token(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNT_ETH)
+        )
+
+        assert action_response == expected_response
+        assert async_response == expected_response
+        mock_invoke.assert_not_called()
+
+
+def test_abuy_token_graduated_pool(wallet_factory, contract_invocation_factory):
+    """Test async token purchase with graduated pool."""
+    mock_wallet = wallet_factory()
+    mock_contract_instance = contract_invocation_factory()
+    mock_wallet.default_address.address_id = MOCK_WALLET_ADDRESS
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.buy_token.get_quote",
+            return_value=_mock_quote(has_graduated=True),
+        ),
+        patch.object(
+            mock_wallet, "invoke_contract", return_value=mock_contract_instance
+        ) as mock_invoke,
+    ):
+        action_response = asyncio.run(
+            awow_buy_token(
+                mock_wallet,
+                MOCK_CONTRACT_ADDRESS,
+                MOCK_AMOUNT_ETH,
+            )
+        )
+
+        expected_response = f"Purchased WoW ERC20 memecoin with transaction hash: {mock_contract_instance.transaction.transaction_hash}"
+        assert action_response == expected_response
+        assert mock_invoke.call_args[1]["args"]["expectedMarketType"] == "1"
+        assert mock_invoke.call_args[1]["args"]["minOrderSize"] == str(
+            int((MOCK_TOKEN_QUOTE * 99) // 100)
+        )
+
+
+def test_buy_token_rejected_by_simulation(wallet_factory):
+    """Test that a purchase below the token's minimum order size is rejected before it is sent."""
+    mock_wallet = wallet_factory()
+    mock_wallet.default_address.address_id = MOCK_WALLET_ADDRESS
+    mock_wallet.network_id = MOCK_NETWORK_ID
+    min_order_size = int(MOCK_AMOUNT_ETH) + 1
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.buy_token.get_quote",
+            return_value=_mock_quote(has_graduated=False),
+        ),
+        patch(
+            "cdp_agentkit_core.utils.preflight.aggregate",
+            return_value=[
+                CallResult(success=True, return_data=encode(["uint256"], [min_order_size]))
+            ],
+        ),
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        action_response = wow_buy_token(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNT_ETH)
+
+    assert action_response == (
+        "Error buying Zora Wow ERC20 memecoin Simulation shows the call would revert: "
+        f"The minimum purchase is {min_order_size} wei, more than {MOCK_AMOUNT_ETH} wei"
+    )
+    mock_invoke.assert_not_called()
+
+
+def test_buy_token_reports_outcome(wallet_factory, contract_invocation_factory):
+    """Test that the tokens received and ETH paid are read from the confirmed transaction."""
+    mock_wallet = wallet_factory()
+    mock_contract_instance = contract_invocation_factory()
+    mock_wallet.default_address.address_id = MOCK_WALLET_ADDRESS
+    mock_wallet.network_id = MOCK_NETWORK_ID
+    mock_contract_instance.transaction.content = TransactionContent(
+        actual_instance=EthereumTransaction(
+            **{"from": MOCK_WALLET_ADDRESS},
+            to=MOCK_CONTRACT_ADDRESS,
+            value=MOCK_AMOUNT_ETH,
+            token_transfers=[
+                EthereumTokenTransfer(
+                    contract_address=MOCK_CONTRACT_ADDRESS,
+                    from_address=MOCK_CONTRACT_ADDRESS,
+                    to_address=MOCK_WALLET_ADDRESS,
+                    value="990000",
+                    log_index=0,
+                    token_transfer_type=TokenTransferType.ERC20,
+                )
+            ],
+            flattened_traces=[
+                EthereumTransactionFlattenedTrace(
+                    trace_address=[0], to=MOCK_WALLET_ADDRESS, value="1000"
+                )
+            ],
+        )
+    )
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.buy_token.get_quote",
+            return_value=_mock_quote(has_graduated=False),
+        ),
+        patch.object(mock_wallet, "invoke_contract", return_value=mock_contract_instance),
+        patch.object(mock_contract_instance, "wait", return_value=mock_contract_instance),
+    ):
+        action_response = wow_buy_token(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNT_ETH)
+
+    assert action_response == (
+        f"Purchased WoW ERC20 memecoin with transaction hash: {mock_contract_instance.transaction.transaction_hash}"
+        f"\nTokens received: 990000 wei\nETH paid: {int(MOCK_AMOUNT_ETH) - 1000} wei"
+    )
@@ -1,6 +1,12 @@
 from unittest.mock import patch
 
 import pytest
+from cdp.client.models.ethereum_transaction import EthereumTransaction
+from cdp.client.models.ethereum_transaction_flattened_trace import (
+    EthereumTransactionFlattenedTrace,
+)
+from cdp.client.models.transaction_content import TransactionContent
+from eth_abi import encode
 
 from cdp_agentkit_core.actions.wow.constants import (
     GENERIC_TOKEN_METADATA_URI,
@@ -148,3 +154,33 @@ def test_create_token_with_custom_token_uri_success(wallet_factory, contract_inv
             },
         )
         mock_contract_wait.assert_called_once_with()
+
+
+def test_create_token_reports_token_address(wallet_factory, contract_invocation_factory):
+    """Test that the created token address is decoded from the confirmed transaction."""
+    mock_wallet = wallet_factory()
+    mock_contract_instance = contract_invocation_factory()
+    mock_wallet.default_address.address_id = MOCK_WALLET_ADDRESS
+    mock_wallet.network_id = MOCK_NETWORK_ID
+    token_address = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+    mock_contract_instance.transaction.content = TransactionContent(
+        actual_instance=EthereumTransaction(
+            **{"from": MOCK_WALLET_ADDRESS},
+            to=get_factory_address(MOCK_NETWORK_ID),
+            flattened_traces=[
+                EthereumTransactionFlattenedTrace(
+                    trace_address=[],
+                    to=get_factory_address(MOCK_NETWORK_ID),
+                    output="0x" + encode(["address"], [token_address]).hex(),
+                )
+            ],
+        )
+    )
+
+    with (
+        patch.object(mock_wallet, "invoke_contract", return_value=mock_contract_instance),
+        patch.object(mock_contract_instance, "wait", return_value=mock_contract_instance),
+    ):
+        action_response = wow_create_token(mock_wallet, MOCK_NAME, MOCK_SYMBOL)
+
+    assert action_response.endswith(f"\nToken address: {token_address}")
@@ -0,0 +1,97 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.wow.quote_ladder import (
+    WowQuoteLadderInput,
+    awow_quote_ladder,
+    wow_quote_ladder,
+)
+from cdp_agentkit_core.actions.wow.utils import LadderQuote, QuoteLadder
+
+MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_AMOUNTS = ["100000000000000", "1000000000000000", "10000000000000000"]
+
+MOCK_LADDER = QuoteLadder(
+    has_graduated=False,
+    quotes=[
+        LadderQuote(amount_in=100000000000000, amount_out=1000, price_impact=Decimal("0.0001")),
+        LadderQuote(amount_in=1000000000000000, amount_out=9900, price_impact=Decimal("0.01")),
+        LadderQuote(amount_in=10000000000000000, amount_out=None, price_impact=None),
+    ],
+)
+
+
+def test_quote_ladder_input_model_valid():
+    """Test that WowQuoteLadderInput accepts valid parameters."""
+    input_model = WowQuoteLadderInput(
+        contract_address=MOCK_CONTRACT_ADDRESS, amounts_in_wei=MOCK_AMOUNTS, quote_type="buy"
+    )
+
+    assert input_model.amounts_in_wei == MOCK_AMOUNTS
+    assert input_model.quote_type == "buy"
+
+
+def test_quote_ladder_input_model_invalid_quote_type():
+    """Test that WowQuoteLadderInput rejects unknown quote types."""
+    with pytest.raises(ValueError):
+        WowQuoteLadderInput(
+            contract_address=MOCK_CONTRACT_ADDRESS, amounts_in_wei=MOCK_AMOUNTS, quote_type="swap"
+        )
+
+
+def test_quote_ladder_success(wallet_factory):
+    """Test that the quote ladder is reported as a price impact table."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with patch(
+        "cdp_agentkit_core.actions.wow.quote_ladder.get_quote_ladder", return_value=MOCK_LADDER
+    ) as mock_get_quote_ladder:
+        action_response = wow_quote_ladder(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "buy")
+
+    mock_get_quote_ladder.assert_called_once_with(
+        MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "buy"
+    )
+    assert action_response == "\n".join(
+        [
+            f"Price impact of buy orders for {MOCK_CONTRACT_ADDRESS} (bonding curve):",
+            "  amount in (ETH, wei) | amount out (tokens, wei) | price impact",
+            "  100000000000000 | 1000 | 0.0100%",
+            "  1000000000000000 | 9900 | 1.0000%",
+            "  10000000000000000 | no quote | n/a",
+        ]
+    )
+
+
+def test_quote_ladder_error(wallet_factory):
+    """Test that quote ladder failures are reported."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with patch(
+        "cdp_agentkit_core.actions.wow.quote_ladder.get_quote_ladder",
+        side_effect=Exception("API error"),
+    ):
+        action_response = wow_quote_ladder(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "sell")
+
+    assert action_response == "Error quoting Zora Wow ERC20 memecoin API error"
+
+
+def test_quote_ladder_async(wallet_factory):
+    """Test that the async quote ladder reports the same table."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with patch(
+        "cdp_agentkit_core.actions.wow.quote_ladder.get_quote_ladder", return_value=MOCK_LADDER
+    ):
+        sync_response = wow_quote_ladder(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "buy")
+        async_response = asyncio.run(
+            awow_quote_ladder(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNTS, "buy")
+        )
+
+    assert async_response == sync_response
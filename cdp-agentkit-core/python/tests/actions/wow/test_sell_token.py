@@ -1,12 +1,15 @@
 from unittest.mock import patch
 
 import pytest
+from eth_abi import encode
 
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI
 from cdp_agentkit_core.actions.wow.sell_token import (
     WowSellTokenInput,
     wow_sell_token,
 )
+from cdp_agentkit_core.actions.wow.utils import WowQuote
+from cdp_agentkit_core.utils.multicall import CallResult
 
 MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
 MOCK_AMOUNT_TOKENS = "100000000000000"
@@ -15,6 +18,12 @@ MOCK_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_ETH_QUOTE = 1000000
 
 
+def _mock_quote(has_graduated):
+    return WowQuote(
+        has_graduated=has_graduated, amount_out=MOCK_ETH_QUOTE, pool_info=None, uniswap_quote=None
+    )
+
+
 def test_sell_token_input_model_valid():
     """Test that WowSellTokenInput accepts valid parameters."""
     input_model = WowSellTokenInput(
@@ -41,12 +50,8 @@ def test_sell_token_success(wallet_factory, contract_invocation_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
-            return_value=False,
+            "cdp_agentkit_core.actions.wow.sell_token.get_quote",
+            return_value=_mock_quote(has_graduated=False),
         ),
         patch.object(
             mock_wallet, "invoke_contract", return_value=mock_contract_instance
@@ -93,12 +98,8 @@ def test_sell_token_graduated_pool(wallet_factory, contract_invocation_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
-            return_value=True,
+            "cdp_agentkit_core.actions.wow.sell_token.get_quote",
+            return_value=_mock_quote(has_graduated=True),
         ),
         patch.object(
             mock_wallet, "invoke_contract", return_value=mock_contract_instance
@@ -123,12 +124,8 @@ def test_sell_token_api_error(wallet_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
-            return_value=False,
+            "cdp_agentkit_core.actions.wow.sell_token.get_quote",
+            return_value=_mock_quote(has_graduated=False),
         ),
         patch.object(
             mock_wallet, "invoke_contract", side_effect=Exception("API error")
@@ -144,3 +141,49 @@ def test_sell_token_api_error(wallet_factory):
 
         assert action_response == expected_response
         mock_invoke.assert_called_once()
+
+
+def test_sell_token_quote_error(wallet_factory):
+    """Test that a failed quote is returned as an error."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.sell_token.get_quote",
+            side_effect=Exception("Failed to fetch sell quote"),
+        ),
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        action_response = wow_sell_token(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNT_TOKENS)
+
+        assert action_response == "Error selling Zora Wow ERC20 memecoin Failed to fetch sell quote"
+        mock_invoke.assert_not_called()
+
+
+def test_sell_token_rejected_by_simulation(wallet_factory):
+    """Test that a sale of more tokens than the wallet holds is rejected before it is sent."""
+    mock_wallet = wallet_factory()
+    mock_wallet.default_address.address_id = MOCK_WALLET_ADDRESS
+    mock_wallet.network_id = MOCK_NETWORK_ID
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.sell_token.get_quote",
+            return_value=_mock_quote(has_graduated=False),
+        ),
+        patch(
+            "cdp_agentkit_core.utils.preflight.aggregate",
+            return_value=[CallResult(success=True, return_data=encode(["uint256"], [1]))],
+        ) as mock_aggregate,
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        action_response = wow_sell_token(mock_wallet, MOCK_CONTRACT_ADDRESS, MOCK_AMOUNT_TOKENS)
+
+    assert action_response == (
+        "Error selling Zora Wow ERC20 memecoin Simulation shows the call would revert: "
+        f"{MOCK_WALLET_ADDRESS} holds 1 of token {MOCK_CONTRACT_ADDRESS}, "
+        f"less than the {MOCK_AMOUNT_TOKENS} needed"
+    )
+    assert mock_aggregate.call_args.args[1][0].args == {"account": MOCK_WALLET_ADDRESS}
+    mock_invoke.assert_not_called()
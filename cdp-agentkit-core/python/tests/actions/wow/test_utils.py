@@ -0,0 +1,297 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.wow.bonding_curve import get_eth_buy_quote, get_token_sell_quote
+from cdp_agentkit_core.actions.wow.uniswap.index import (
+    Balance,
+    PoolInfo,
+    Quote,
+    build_uniswap_quote,
+    get_has_graduated,
+    get_pool_info,
+    get_uniswap_quote,
+)
+from cdp_agentkit_core.actions.wow.uniswap.v3_math import Q96, PoolState, simulate_swap
+from cdp_agentkit_core.actions.wow.utils import (
+    WowQuote,
+    get_quote,
+    get_quote_ladder,
+    get_sell_quote,
+)
+from cdp_agentkit_core.utils.contract_cache import get_contract_cache
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_WETH_ADDRESS = "0x4200000000000000000000000000000000000006"
+MOCK_POOL_ADDRESS = "0x1111111111111111111111111111111111111111"
+MOCK_SUPPLY = 500_000_000 * 10**18
+
+
+def test_get_has_graduated():
+    """Test that get_has_graduated reads the market type."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall", return_value=[1]
+    ) as mock_multicall:
+        assert get_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS)
+
+    (call,) = mock_multicall.call_args.args[1]
+    assert call.method == "marketType"
+
+
+def test_get_pool_info_batches_reads():
+    """Test that get_pool_info reads the pool with two multicalls instead of seven reads."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        side_effect=[
+            [MOCK_WETH_ADDRESS, MOCK_TOKEN_ADDRESS, 10000, 500, {"sqrtPriceX96": 123}],
+            [1000, 2000],
+        ],
+    ) as mock_multicall:
+        pool_info = get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS)
+
+    assert mock_multicall.call_count == 2
+    assert [call.method for call in mock_multicall.call_args_list[0].args[1]] == [
+        "token0",
+        "token1",
+        "fee",
+        "liquidity",
+        "slot0",
+    ]
+    assert pool_info.token0 == MOCK_WETH_ADDRESS
+    assert pool_info.balance0 == 1000
+    assert pool_info.balance1 == 2000
+    assert pool_info.fee == 10000
+    assert pool_info.liquidity == 500
+    assert pool_info.sqrt_price_x96 == 123
+
+
+def test_get_pool_info_error():
+    """Test that get_pool_info wraps read failures."""
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+            side_effect=Exception("API error"),
+        ),
+        pytest.raises(Exception, match="Failed to fetch pool information: API error"),
+    ):
+        get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS)
+
+
+def _pool_state():
+    return [MOCK_WETH_ADDRESS, MOCK_TOKEN_ADDRESS, 10000, 500, {"sqrtPriceX96": 123}]
+
+
+def test_get_quote_bonding_curve():
+    """Test that an ungraduated token is quoted locally from a single multicall of its supply."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.utils.multicall",
+        return_value=[0, MOCK_SUPPLY, MOCK_POOL_ADDRESS],
+    ) as mock_multicall:
+        quote = get_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "100", "buy")
+
+    assert quote == WowQuote(
+        has_graduated=False,
+        amount_out=get_eth_buy_quote(MOCK_SUPPLY, 100),
+        pool_info=None,
+        uniswap_quote=None,
+    )
+    mock_multicall.assert_called_once()
+    assert [call.method for call in mock_multicall.call_args.args[1]] == [
+        "marketType",
+        "totalSupply",
+        "poolAddress",
+    ]
+
+
+def test_get_quote_bonding_curve_known_supply():
+    """Test that a known supply is not read again."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.utils.multicall",
+        return_value=[0, MOCK_POOL_ADDRESS],
+    ) as mock_multicall:
+        quote = get_quote(
+            MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "100", "sell", current_supply=MOCK_SUPPLY
+        )
+
+    assert quote.amount_out == get_token_sell_quote(MOCK_SUPPLY, 100)
+    assert [call.method for call in mock_multicall.call_args.args[1]] == [
+        "marketType",
+        "poolAddress",
+    ]
+
+
+def test_get_quote_bonding_curve_sell_exceeds_supply():
+    """Test that selling more than the supply fails like the contract does."""
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.utils.multicall",
+            return_value=[0, 100, MOCK_POOL_ADDRESS],
+        ),
+        pytest.raises(Exception, match="Failed to fetch sell quote"),
+    ):
+        get_sell_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "101")
+
+
+def test_get_quote_graduated_cold():
+    """Test that a graduated token is quoted in three batched reads when nothing is cached."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.utils.multicall",
+        side_effect=[
+            [1, MOCK_SUPPLY, MOCK_POOL_ADDRESS],
+            _pool_state(),
+            [5000, 7000, {"amountOut": 42}],
+        ],
+    ) as mock_multicall:
+        quote = get_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "100", "sell")
+
+    assert mock_multicall.call_count == 3
+    assert [call.method for call in mock_multicall.call_args.args[1]] == [
+        "balanceOf",
+        "balanceOf",
+        "quoteExactInputSingle",
+    ]
+    assert quote.has_graduated
+    assert quote.amount_out == 42
+    assert quote.pool_info.balance0 == 5000
+    assert quote.uniswap_quote.balance.weth == 5000
+    assert quote.uniswap_quote.error is None
+
+
+def test_get_quote_graduated_warm():
+    """Test that a graduated token is quoted in one batched read once the pool facts are cached."""
+    cache = get_contract_cache()
+    cache.set(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "poolAddress", None, MOCK_POOL_ADDRESS)
+    cache.set(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "token0", None, MOCK_WETH_ADDRESS)
+    cache.set(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "token1", None, MOCK_TOKEN_ADDRESS)
+    cache.set(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "fee", None, 10000)
+
+    with patch(
+        "cdp_agentkit_core.actions.wow.utils.multicall",
+        return_value=[
+            1,
+            MOCK_SUPPLY,
+            MOCK_POOL_ADDRESS,
+            *_pool_state(),
+            5000,
+            7000,
+            {"amountOut": 42},
+        ],
+    ) as mock_multicall:
+        quote = get_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "100", "buy")
+
+    mock_multicall.assert_called_once()
+    quoter_call = mock_multicall.call_args.args[1][-1]
+    assert quoter_call.args["params"]["tokenIn"] == MOCK_WETH_ADDRESS
+    assert quote.amount_out == 42
+    assert quote.pool_info.fee == 10000
+
+
+def test_get_sell_quote_failure():
+    """Test that a graduated token's failed Uniswap quote is not replaced by a bonding curve one."""
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.utils.multicall",
+            side_effect=[
+                [1, MOCK_SUPPLY, MOCK_POOL_ADDRESS],
+                _pool_state(),
+                [5000, 7000, None],
+            ],
+        ),
+        pytest.raises(Exception, match="Failed to fetch sell quote"),
+    ):
+        get_sell_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "100")
+
+
+def test_get_uniswap_quote():
+    """Test that get_uniswap_quote reads the pool state, then the balances and quoter together."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        side_effect=[_pool_state(), [5000, 7000, {"amountOut": 42}]],
+    ) as mock_multicall:
+        quote = get_uniswap_quote(
+            MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "100", "buy", pool_address=MOCK_POOL_ADDRESS
+        )
+
+    assert mock_multicall.call_count == 2
+    assert quote == Quote(
+        amount_in=100,
+        amount_out=42,
+        balance=Balance(erc20z=7000, weth=5000),
+        fee=0.01,
+        error=None,
+    )
+
+
+def test_build_uniswap_quote_insufficient_liquidity():
+    """Test that buying more than the pool holds is reported as insufficient liquidity."""
+    pool_info = PoolInfo(
+        token0=MOCK_WETH_ADDRESS,
+        balance0=5000,
+        token1=MOCK_TOKEN_ADDRESS,
+        balance1=10,
+        fee=10000,
+        liquidity=500,
+        sqrt_price_x96=123,
+    )
+
+    quote = build_uniswap_quote(MOCK_NETWORK_ID, pool_info, 100, "buy", None)
+
+    assert quote.error == "Insufficient liquidity"
+    assert quote.amount_out == 0
+
+
+def test_get_quote_ladder_bonding_curve():
+    """Test that a ladder of bonding curve sizes is priced locally after a single multicall."""
+    amounts = [10**14, 10**16, 10**18]
+
+    with patch(
+        "cdp_agentkit_core.actions.wow.utils.multicall",
+        return_value=[0, MOCK_SUPPLY, MOCK_POOL_ADDRESS],
+    ) as mock_multicall:
+        ladder = get_quote_ladder(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, amounts, "buy")
+
+    mock_multicall.assert_called_once()
+    assert not ladder.has_graduated
+    assert [quote.amount_out for quote in ladder.quotes] == [
+        get_eth_buy_quote(MOCK_SUPPLY, amount) for amount in amounts
+    ]
+    impacts = [quote.price_impact for quote in ladder.quotes]
+    assert 0 <= impacts[0] < impacts[1] < impacts[2]
+
+
+def test_get_quote_ladder_graduated():
+    """Test that a ladder of graduated sizes is priced by simulating the Uniswap swap."""
+    pool_state = PoolState(
+        sqrt_price_x96=Q96,
+        tick=0,
+        liquidity=10**18,
+        fee=10000,
+        tick_spacing=200,
+        ticks={-1000: 10**18, 1000: -(10**18)},
+        min_word=-1,
+        max_word=0,
+    )
+    amounts = [10**15, 10**16, 10**20]
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.utils.multicall",
+            return_value=[1, MOCK_SUPPLY, MOCK_POOL_ADDRESS],
+        ),
+        patch(
+            "cdp_agentkit_core.actions.wow.utils.get_pool_state",
+            return_value=(MOCK_WETH_ADDRESS, pool_state),
+        ) as mock_get_pool_state,
+    ):
+        ladder = get_quote_ladder(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, amounts, "buy")
+
+    mock_get_pool_state.assert_called_once_with(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS)
+    assert ladder.has_graduated
+    small, medium, too_large = ladder.quotes
+    assert small.amount_out == simulate_swap(pool_state, True, 10**15).amount_out
+    assert medium.amount_out == simulate_swap(pool_state, True, 10**16).amount_out
+    assert 0 <= small.price_impact < medium.price_impact
+    # The largest order runs past the loaded ticks, so it is not quoted.
+    assert too_large.amount_out is None
+    assert too_large.price_impact is None
@@ -0,0 +1,207 @@
+from dataclasses import replace
+from math import isqrt
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.uniswap.index import get_pool_state, simulate_uniswap_quote
+from cdp_agentkit_core.actions.wow.uniswap.v3_math import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    InsufficientTickDataError,
+    PoolState,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+    simulate_swap,
+)
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x1111111111111111111111111111111111111111"
+WETH_ADDRESS = addresses[MOCK_NETWORK_ID]["WETH"]
+
+
+def encode_price_sqrt(reserve1: int, reserve0: int) -> int:
+    """Encode a price as a Q64.96 sqrt price, like the v3-core test utilities."""
+    return isqrt((reserve1 << 192) // reserve0)
+
+
+def _two_position_pool() -> PoolState:
+    """Build a pool with a wide [-600, 600] position and a narrow [-120, 120] position."""
+    return PoolState(
+        sqrt_price_x96=Q96,
+        tick=0,
+        liquidity=3 * 10**18 // 2,
+        fee=3000,
+        tick_spacing=60,
+        ticks={-600: 10**18, -120: 10**18 // 2, 120: -(10**18) // 2, 600: -(10**18)},
+        min_word=-1,
+        max_word=0,
+    )
+
+
+def test_sqrt_ratio_at_tick_bounds():
+    """Test the v3-core TickMath reference values."""
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(0) == Q96
+
+    with pytest.raises(ValueError):
+        get_sqrt_ratio_at_tick(MAX_TICK + 1)
+
+
+def test_tick_at_sqrt_ratio():
+    """Test that getTickAtSqrtRatio inverts getSqrtRatioAtTick, including at the bounds."""
+    assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+    assert get_tick_at_sqrt_ratio(MAX_SQRT_RATIO - 1) == MAX_TICK - 1
+
+    for tick in (-200_000, -60, -1, 0, 1, 60, 200_000):
+        sqrt_ratio = get_sqrt_ratio_at_tick(tick)
+        assert get_tick_at_sqrt_ratio(sqrt_ratio) == tick
+        assert get_tick_at_sqrt_ratio(sqrt_ratio - 1) == tick - 1
+
+
+@pytest.mark.parametrize(
+    ("price", "target", "liquidity", "amount", "fee", "expected"),
+    [
+        # Exact amount in that gets capped at the price target.
+        (
+            encode_price_sqrt(1, 1),
+            encode_price_sqrt(101, 100),
+            2 * 10**18,
+            10**18,
+            600,
+            (encode_price_sqrt(101, 100), 9975124224178055, 9925619580021728, 5988667735148),
+        ),
+        # Exact amount in that is fully spent before reaching the price target.
+        (
+            encode_price_sqrt(1, 1),
+            encode_price_sqrt(1000, 100),
+            2 * 10**18,
+            10**18,
+            600,
+            (
+                118818475322642227089037862318,
+                999400000000000000,
+                666399946655997866,
+                600000000000000,
+            ),
+        ),
+        # Exact amount out of one wei.
+        (
+            417332158212080721273783715441582,
+            1452870262520218020823638996,
+            159344665391607089467575320103,
+            -1,
+            1,
+            (417332158212080721273783715441581, 1, 1, 1),
+        ),
+        # Entire input amount taken as fee.
+        (
+            2413,
+            79887613182836312,
+            1985041575832132834610021537970,
+            10,
+            1872,
+            (2413, 0, 0, 10),
+        ),
+        # Input amount large enough to take the price to its lowest value.
+        (
+            2,
+            1,
+            1,
+            3915081100057732413702495386755767,
+            1,
+            (1, 39614081257132168796771975168, 0, 39614120871253040049813),
+        ),
+    ],
+)
+def test_compute_swap_step(price, target, liquidity, amount, fee, expected):
+    """Test SwapMath.computeSwapStep against the v3-core reference vectors."""
+    assert compute_swap_step(price, target, liquidity, amount, fee) == expected
+
+
+def test_simulate_swap_single_range_matches_closed_form():
+    """Test that a swap within one tick range matches the constant product formula."""
+    pool = _two_position_pool()
+    amount_in = 10**15
+
+    result = simulate_swap(pool, zero_for_one=True, amount_specified=amount_in)
+
+    amount_less_fee = amount_in * (10**6 - pool.fee) // 10**6
+    numerator = pool.liquidity << 96
+    sqrt_price_next = -(-numerator * pool.sqrt_price_x96 // (numerator + amount_less_fee * Q96))
+    assert result.amount_in == amount_in
+    assert result.amount_out == pool.liquidity * (Q96 - sqrt_price_next) // Q96
+    assert result.sqrt_price_x96_after == sqrt_price_next
+    assert result.initialized_ticks_crossed == 0
+
+
+def test_simulate_swap_crosses_initialized_ticks():
+    """Test that a swap walking through an initialized tick matches the swap steps taken by hand."""
+    pool = _two_position_pool()
+    amount_in = 2 * 10**16
+
+    result = simulate_swap(pool, zero_for_one=True, amount_specified=amount_in)
+
+    sqrt_price, in1, out1, fee1 = compute_swap_step(
+        Q96, get_sqrt_ratio_at_tick(-120), pool.liquidity, amount_in, pool.fee
+    )
+    assert sqrt_price == get_sqrt_ratio_at_tick(-120)
+    sqrt_price, in2, out2, fee2 = compute_swap_step(
+        sqrt_price, get_sqrt_ratio_at_tick(-600), 10**18, amount_in - in1 - fee1, pool.fee
+    )
+    assert in1 + fee1 + in2 + fee2 == amount_in
+    assert result.amount_in == amount_in
+    assert result.amount_out == out1 + out2
+    assert result.sqrt_price_x96_after == sqrt_price
+    assert result.tick_after == get_tick_at_sqrt_ratio(sqrt_price)
+    assert result.initialized_ticks_crossed == 1
+
+
+def test_simulate_swap_exact_output_round_trip():
+    """Test that buying back an exact input swap's output costs no more than its input."""
+    pool = _two_position_pool()
+    exact_in = simulate_swap(pool, zero_for_one=False, amount_specified=2 * 10**16)
+
+    exact_out = simulate_swap(pool, zero_for_one=False, amount_specified=-exact_in.amount_out)
+
+    assert exact_out.amount_out == exact_in.amount_out
+    assert exact_out.amount_in <= exact_in.amount_in
+    assert exact_in.initialized_ticks_crossed == exact_out.initialized_ticks_crossed == 1
+
+
+def test_simulate_swap_outside_loaded_words():
+    """Test that a swap running past the loaded tick bitmap words refuses to guess."""
+    with pytest.raises(InsufficientTickDataError):
+        simulate_swap(_two_position_pool(), zero_for_one=True, amount_specified=10**20)
+
+
+def test_get_pool_state_and_simulate_uniswap_quote():
+    """Test that the pool state is loaded in three multicalls and then priced locally."""
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.multicall",
+        side_effect=[
+            [WETH_ADDRESS, 3000, 60, 3 * 10**18 // 2, {"sqrtPriceX96": Q96, "tick": 0}],
+            [(1 << 246) | (1 << 254), (1 << 2) | (1 << 10), 0],
+            [{"liquidityNet": net} for net in (10**18, 10**18 // 2, -(10**18) // 2, -(10**18))],
+        ],
+    ) as mock_multicall:
+        token0, pool_state = get_pool_state(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, word_radius=1)
+
+    assert mock_multicall.call_count == 3
+    assert [call.args for call in mock_multicall.call_args_list[1].args[1]] == [
+        {"wordPosition": -1},
+        {"wordPosition": 0},
+        {"wordPosition": 1},
+    ]
+    assert token0 == WETH_ADDRESS
+    assert pool_state == replace(_two_position_pool(), max_word=1)
+
+    amount_out = simulate_uniswap_quote(MOCK_NETWORK_ID, token0, pool_state, "100000", "buy")
+    assert amount_out == simulate_swap(pool_state, True, 100000).amount_out
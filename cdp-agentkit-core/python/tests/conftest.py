@@ -1,7 +1,19 @@
 import os
 
+import pytest
+
+from cdp_agentkit_core.utils.contract_cache import CONTRACT_CACHE_ENV_VAR
+
 factory_modules = [
     f[:-3] for f in os.listdir("./tests/factories") if f.endswith(".py") and f != "__init__.py"
 ]
 
 pytest_plugins = [f"tests.factories.{module_name}" for module_name in factory_modules]
+
+
+@pytest.fixture(autouse=True)
+def contract_cache_path(tmp_path, monkeypatch):
+    """Keep the contract cache of each test in its own temporary database."""
+    path = tmp_path / "contract_cache.sqlite3"
+    monkeypatch.setenv(CONTRACT_CACHE_ENV_VAR, str(path))
+    return path
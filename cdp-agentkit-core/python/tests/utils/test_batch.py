@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from cdp import ContractInvocation
+
+from cdp_agentkit_core.utils.batch import (
+    aconfirm_batch,
+    asubmit_batch,
+    confirm_batch,
+    format_batch,
+    submit_batch,
+)
+from cdp_agentkit_core.utils.confirmation_poller import ConfirmationPoller
+from cdp_agentkit_core.utils.deadline import deadline
+
+
+def _invocation(terminal):
+    invocation = Mock(spec=ContractInvocation)
+    invocation.status = "complete"
+    invocation.transaction_hash = "0xvalidTransactionHash"
+    invocation.transaction_link = None
+    invocation.transaction.terminal_state = terminal
+    return invocation
+
+
+def test_submit_batch_submits_in_order_and_records_failures():
+    """Test that items are submitted in order, with failed submissions recorded on their item."""
+    poller = ConfirmationPoller(interval_seconds=3600)
+    submitted = []
+
+    def submit(item):
+        submitted.append(item)
+        if item == "b":
+            raise Exception("API error")
+        return _invocation(terminal=False)
+
+    submissions = submit_batch(submit, ["a", "b", "c"], lambda item: f"write {item}", poller)
+
+    assert submitted == ["a", "b", "c"]
+    assert [submission.status for submission in submissions] == ["pending", "error", "pending"]
+    assert submissions[1].error == "API error"
+    assert submissions[2].transaction.description == "write c"
+
+
+def test_confirm_batch_waits_for_every_transaction():
+    """Test that the batch is confirmed together by the poller."""
+    poller = ConfirmationPoller(interval_seconds=0)
+    submissions = submit_batch(
+        lambda item: _invocation(terminal=True), range(3), lambda item: "write", poller
+    )
+
+    confirm_batch(submissions, timeout_seconds=5)
+
+    assert [submission.status for submission in submissions] == ["complete"] * 3
+
+
+def test_confirm_batch_times_out_as_pending():
+    """Test that transactions that have not landed by the timeout are left pending."""
+    poller = ConfirmationPoller(interval_seconds=3600)
+    submissions = submit_batch(
+        lambda item: _invocation(terminal=False), range(2), lambda item: "write", poller
+    )
+
+    confirm_batch(submissions, timeout_seconds=0)
+
+    assert [submission.status for submission in submissions] == ["pending"] * 2
+    assert submissions[0].result() == (f"pending (transaction ID {submissions[0].transaction.id})")
+
+
+def test_confirm_batch_within_deadline():
+    """Test that a batch stops waiting at the deadline, synchronously and asynchronously."""
+    poller = ConfirmationPoller(interval_seconds=3600)
+    submissions = submit_batch(
+        lambda item: _invocation(terminal=False), range(2), lambda item: "write", poller
+    )
+
+    with deadline(0.05):
+        start = time.monotonic()
+        confirm_batch(submissions, timeout_seconds=60)
+        asyncio.run(aconfirm_batch(submissions, timeout_seconds=60))
+
+    assert time.monotonic() - start < 5
+    assert [submission.status for submission in submissions] == ["pending"] * 2
+
+
+def test_aconfirm_batch_wakes_when_resolved():
+    """Test that an awaited transaction wakes its coroutine once the poller resolves it."""
+    poller = ConfirmationPoller(interval_seconds=3600)
+    submissions = submit_batch(
+        lambda item: _invocation(terminal=True), range(1), lambda item: "write", poller
+    )
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, lambda: threading.Thread(target=poller.poll_once).start())
+        await aconfirm_batch(submissions, timeout_seconds=5)
+
+    asyncio.run(run())
+
+    assert submissions[0].status == "complete"
+
+
+def test_async_batch():
+    """Test submitting and confirming a batch without blocking the event loop."""
+    poller = ConfirmationPoller(interval_seconds=0)
+
+    async def run():
+        submissions = await asubmit_batch(
+            lambda item: _invocation(terminal=True), range(2), lambda item: "write", poller
+        )
+        await aconfirm_batch(submissions, timeout_seconds=5)
+        return submissions
+
+    submissions = asyncio.run(run())
+
+    assert [submission.status for submission in submissions] == ["complete"] * 2
+
+
+def test_format_batch():
+    """Test that the batch table has one row per item and a status count."""
+    poller = ConfirmationPoller(interval_seconds=3600)
+    submissions = submit_batch(
+        lambda item: _invocation(terminal=False), ["a"], lambda item: "write", poller
+    )
+    submissions += submit_batch(_raise, ["b"], lambda item: "write", poller)
+
+    table = format_batch(
+        "Batch:", ["item"], [([submission.item], submission) for submission in submissions]
+    )
+
+    assert table.splitlines() == [
+        "Batch:",
+        "  item | result",
+        f"  a | pending (transaction ID {submissions[0].transaction.id})",
+        "  b | error: API error",
+        "0 complete, 1 pending, 1 error",
+    ]
+
+
+def _raise(item):
+    raise Exception("API error")
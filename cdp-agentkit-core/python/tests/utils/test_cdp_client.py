@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import pytest
+from cdp import Cdp
+from cdp.cdp_api_client import CdpApiClient
+
+from cdp_agentkit_core.utils import cdp_client
+from cdp_agentkit_core.utils.cdp_client import (
+    CdpClientSettings,
+    configure_cdp,
+    set_cdp_client_settings,
+)
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, deadline
+
+MOCK_API_KEY_NAME = "test-api-key-name"
+MOCK_PRIVATE_KEY = "test-private-key"
+
+
+@pytest.fixture(autouse=True)
+def clean_clients():
+    """Fixture that restores the SDK's clients and the registry after each test."""
+    api_clients = Cdp.api_clients
+    settings = cdp_client._settings
+    yield
+    cdp_client._clients.clear()
+    cdp_client._settings = settings
+    Cdp.api_clients = api_clients
+
+
+def _configure(api_key_name=MOCK_API_KEY_NAME):
+    return configure_cdp(api_key_name, MOCK_PRIVATE_KEY, "test-source", "0.0.1")
+
+
+def test_configure_cdp_reuses_clients_of_api_key():
+    """Test that the clients of an API key are built once and installed as the SDK's clients."""
+    clients = _configure()
+
+    assert Cdp.api_clients is clients
+    assert Cdp.api_key_name == MOCK_API_KEY_NAME
+    assert _configure() is clients
+
+    other = _configure("other-api-key-name")
+
+    assert other is not clients
+    assert Cdp.api_clients is other
+    assert _configure() is clients
+    assert Cdp.api_clients is clients
+
+
+def test_settings_tune_pool_and_timeouts():
+    """Test that the settings size the connection pool and set the default request timeouts."""
+    set_cdp_client_settings(
+        CdpClientSettings(pool_maxsize=16, connect_timeout_seconds=2, read_timeout_seconds=20)
+    )
+    client = _configure()._cdp_client
+
+    assert client.configuration.connection_pool_maxsize == 16
+    assert client.rest_client.pool_manager.connection_pool_kw["maxsize"] == 16
+
+    with patch.object(CdpApiClient, "call_api", return_value="response") as mock_call_api:
+        assert client.call_api("GET", "https://example.com") == "response"
+        assert client.call_api("GET", "https://example.com", _request_timeout=1) == "response"
+
+    assert mock_call_api.call_args_list[0].args[-1] == (2, 20)
+    assert mock_call_api.call_args_list[1].args[-1] == 1
+
+
+def test_request_timeouts_bounded_by_deadline():
+    """Test that the default request timeouts never outlast the current deadline."""
+    client = _configure()._cdp_client
+
+    with patch.object(CdpApiClient, "call_api", return_value="response") as mock_call_api:
+        with deadline(1):
+            client.call_api("GET", "https://example.com")
+        with deadline(0), pytest.raises(DeadlineExceededError):
+            client.call_api("GET", "https://example.com")
+
+    connect_timeout, read_timeout = mock_call_api.call_args.args[-1]
+    assert 0 < connect_timeout <= 1
+    assert 0 < read_timeout <= 1
+    mock_call_api.assert_called_once()
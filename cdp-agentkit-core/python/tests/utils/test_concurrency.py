@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cdp_agentkit_core.utils.concurrency import FifoLock, amap_bounded, map_bounded
+from cdp_agentkit_core.utils.deadline import deadline, remaining_seconds
+
+
+def _invert(value):
+    return 1 / value
+
+
+def test_map_bounded_preserves_order_and_captures_errors():
+    """Test that map_bounded returns one result per item, in order, with errors captured."""
+    results = map_bounded(_invert, [1, 0, 4], max_workers=3)
+
+    assert [result.item for result in results] == [1, 0, 4]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].value == 1
+    assert isinstance(results[1].error, ZeroDivisionError)
+    assert results[2].value == 0.25
+
+
+def test_map_bounded_invalid_max_workers():
+    """Test that map_bounded rejects a worker limit below 1."""
+    with pytest.raises(ValueError):
+        map_bounded(_invert, [1], max_workers=0)
+
+
+def test_amap_bounded_preserves_order_and_captures_errors():
+    """Test that amap_bounded returns one result per item, in order, with errors captured."""
+    results = asyncio.run(amap_bounded(_invert, [2, 0], max_workers=1))
+
+    assert [result.value for result in results] == [0.5, None]
+    assert isinstance(results[1].error, ZeroDivisionError)
+
+
+def test_fifo_lock_serves_in_request_order():
+    """Test that FifoLock grants the lock in the order it was requested."""
+    lock = FifoLock()
+    order = []
+
+    lock.acquire()
+    threads = []
+    for index in range(5):
+        thread = threading.Thread(target=lambda i=index: _hold(lock, order, i))
+        thread.start()
+        threads.append(thread)
+        while lock.waiting != index + 2:
+            time.sleep(0.001)
+    lock.release()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == [0, 1, 2, 3, 4]
+    assert lock.waiting == 0
+
+
+def _hold(lock, order, index):
+    with lock:
+        order.append(index)
+
+
+def test_fifo_lock_async_waits_without_blocking_the_loop():
+    """Test that coroutines wait for FifoLock in line while the event loop keeps running."""
+    lock = FifoLock()
+    order = []
+
+    async def hold(index):
+        async with lock:
+            order.append(index)
+            await asyncio.sleep(0)
+
+    async def run():
+        lock.acquire()
+        tasks = [asyncio.create_task(hold(index)) for index in range(3)]
+        await asyncio.sleep(0.01)
+        assert order == []
+        lock.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == [0, 1, 2]
+
+
+def test_fifo_lock_cancelled_waiter_gives_up_its_turn():
+    """Test that a cancelled async waiter does not keep the lock once its turn comes."""
+    lock = FifoLock()
+
+    async def run():
+        lock.acquire()
+        waiter = asyncio.create_task(lock.aacquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        lock.release()
+        await asyncio.wait_for(lock.aacquire(), timeout=5)
+        lock.release()
+
+    asyncio.run(run())
+
+    assert lock.waiting == 0
+
+
+def test_fifo_lock_timed_out_waiter_gives_up_its_place():
+    """Test that a waiter that times out is skipped instead of holding up the line."""
+    lock = FifoLock()
+    lock.acquire()
+
+    assert not lock.acquire(timeout=0.01)
+    assert not asyncio.run(lock.aacquire(timeout=0.01))
+    assert lock.waiting == 1
+
+    lock.release()
+
+    assert lock.acquire(timeout=5)
+    lock.release()
+    assert lock.waiting == 0
+
+
+def test_fifo_lock_async_waiters_hold_no_worker_thread():
+    """Test that async waiters leave the executor's threads to the lock holder."""
+    lock = FifoLock()
+    order = []
+
+    async def write(index):
+        async with lock:
+            await asyncio.to_thread(time.sleep, 0.01)
+            order.append(index)
+
+    async def run():
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+        await asyncio.wait_for(asyncio.gather(*(write(index) for index in range(4))), timeout=5)
+
+    asyncio.run(run())
+
+    assert order == [0, 1, 2, 3]
+    assert lock.waiting == 0
+
+
+def test_map_bounded_keeps_caller_context():
+    """Test that fanned out calls see the caller's deadline."""
+    with deadline(30):
+        results = map_bounded(lambda item: remaining_seconds(), range(3), max_workers=3)
+
+    assert all(0 < result.value <= 30 for result in results)
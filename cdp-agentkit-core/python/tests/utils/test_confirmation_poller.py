@@ -0,0 +1,336 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from cdp import ContractInvocation, Transaction
+
+from cdp_agentkit_core.utils.confirmation_poller import (
+    COMPLETE,
+    FAILED,
+    PENDING,
+    REPLACED,
+    TIMED_OUT,
+    ConfirmationPoller,
+    PendingTransaction,
+    await_or_submit,
+    get_confirmation_poller,
+    is_submit_only,
+    submit_only,
+    wait_or_submit,
+)
+from cdp_agentkit_core.utils.deadline import deadline
+
+MOCK_WALLET_ID = "test-wallet-id"
+MOCK_TRANSACTION_HASH = "0xvalidTransactionHash"
+MOCK_ADDRESS_ID = "0x0000000000000000000000000000000000000001"
+
+
+def _invocation(wallet_id=MOCK_WALLET_ID, nonce=None, transaction_hash=MOCK_TRANSACTION_HASH):
+    invocation = Mock(spec=ContractInvocation)
+    invocation.wallet_id = wallet_id
+    invocation.address_id = MOCK_ADDRESS_ID
+    invocation.network_id = "base-sepolia"
+    invocation.transaction_hash = transaction_hash
+    invocation.transaction_link = f"https://sepolia.basescan.org/tx/{transaction_hash}"
+    invocation.status = "broadcast"
+    invocation.transaction = Mock(spec=Transaction)
+    invocation.transaction.terminal_state = False
+    invocation.transaction.block_hash = None
+    invocation.transaction.raw.as_dict.return_value = {"nonce": nonce}
+    return invocation
+
+
+def _land(invocation, status):
+    def reload():
+        invocation.status = status
+        invocation.transaction.terminal_state = True
+
+    invocation.reload.side_effect = reload
+
+
+def _idle_poller(**kwargs):
+    """Build a poller whose background thread never gets to poll, so tests drive it directly."""
+    return ConfirmationPoller(interval_seconds=3600, **kwargs)
+
+
+def test_track_returns_pending_handle():
+    """Test that tracking a resource returns a pending handle without calling the network."""
+    poller = _idle_poller()
+    invocation = _invocation()
+
+    handle = poller.track(invocation, "wrap of 1 wei of ETH to WETH")
+
+    assert handle.status == PENDING
+    assert not handle.done
+    assert handle.wallet_id == MOCK_WALLET_ID
+    assert handle.transaction_hash == MOCK_TRANSACTION_HASH
+    assert poller.get(handle.id) is handle
+    invocation.reload.assert_not_called()
+
+
+def test_poll_once_resolves_every_pending_transaction():
+    """Test that one polling round checks all pending transactions across wallets."""
+    poller = _idle_poller()
+    complete, failed, pending = _invocation("wallet-a"), _invocation("wallet-b"), _invocation()
+    _land(complete, "complete")
+    _land(failed, "failed")
+    handles = [poller.track(invocation, "write") for invocation in (complete, failed, pending)]
+
+    poller.poll_once()
+
+    assert [handle.status for handle in handles] == [COMPLETE, FAILED, PENDING]
+    assert handles[0].done and handles[1].done and not handles[2].done
+    for invocation in (complete, failed, pending):
+        invocation.reload.assert_called_once_with()
+    assert poller.pending() == [handles[2]]
+
+
+def test_poll_once_retries_failed_status_checks():
+    """Test that a failed status check keeps the transaction pending and records the error."""
+    poller = _idle_poller()
+    invocation = _invocation()
+    invocation.reload.side_effect = Exception("API error")
+    handle = poller.track(invocation, "write")
+
+    poller.poll_once()
+
+    assert handle.status == PENDING
+    assert handle.error == "API error"
+
+    _land(invocation, "complete")
+    poller.poll_once()
+
+    assert handle.status == COMPLETE
+    assert handle.error is None
+
+
+def test_poll_once_times_out():
+    """Test that a transaction pending for longer than the timeout is marked timed out."""
+    poller = _idle_poller(timeout_seconds=0)
+    handle = poller.track(_invocation(), "write")
+    handle.submitted_at -= 1
+
+    poller.poll_once()
+
+    assert handle.status == TIMED_OUT
+    assert handle.done
+
+
+def test_poll_once_resolves_replaced_transactions():
+    """Test that pipelined transactions whose nonce was used by a landed one are replaced."""
+    poller = _idle_poller()
+    replaced = _invocation(nonce=3, transaction_hash="0xreplacedTransactionHash")
+    landed, queued = _invocation(nonce=3), _invocation(nonce=4)
+    _land(landed, "complete")
+    handles = [poller.track(invocation, "write") for invocation in (replaced, landed, queued)]
+
+    poller.poll_once()
+
+    assert [handle.status for handle in handles] == [REPLACED, COMPLETE, PENDING]
+    assert handles[0].nonce == 3
+    assert handles[0].error == f"Nonce 3 was used by transaction {MOCK_TRANSACTION_HASH}"
+    assert poller.nonces.in_flight(MOCK_ADDRESS_ID) == [(4, handles[2])]
+
+    # A different transaction submitted with a nonce that already landed can never land either.
+    late = poller.track(_invocation(nonce=3, transaction_hash="0xlateTransactionHash"), "write")
+    assert late.status == REPLACED
+
+
+def test_poll_once_keeps_lower_nonces_pending():
+    """Test that a higher nonce landing does not resolve lower ones, which are polled again."""
+    poller = _idle_poller()
+    lower = _invocation(nonce=3, transaction_hash="0xlowerTransactionHash")
+    higher = _invocation(nonce=4)
+    _land(higher, "complete")
+    handles = [poller.track(invocation, "write") for invocation in (lower, higher)]
+
+    poller.poll_once()
+
+    assert [handle.status for handle in handles] == [PENDING, COMPLETE]
+
+    _land(lower, "complete")
+    poller.poll_once()
+
+    assert handles[0].status == COMPLETE
+
+
+def test_poll_once_frees_nonces_of_unmined_failures():
+    """Test that a transaction that failed without being mined does not replace others."""
+    poller = _idle_poller()
+    failed, retried = _invocation(nonce=3), _invocation(nonce=3)
+    _land(failed, "failed")
+    handles = [poller.track(invocation, "write") for invocation in (failed, retried)]
+
+    poller.poll_once()
+
+    assert [handle.status for handle in handles] == [FAILED, PENDING]
+
+
+def test_poll_once_rebroadcasts_long_pending_transactions():
+    """Test that a transaction pending for a while is broadcast again, once."""
+    poller = _idle_poller(rebroadcast_after_seconds=0)
+    invocation = _invocation(nonce=3)
+    invocation.broadcast.side_effect = [invocation, Exception("already known")]
+    handle = poller.track(invocation, "write")
+    handle.submitted_at -= 1
+
+    poller.poll_once()
+    handle.rebroadcast_at -= 1
+    poller.poll_once()
+
+    invocation.broadcast.assert_called_once_with()
+    assert handle.rebroadcasts == 1
+    assert handle.status == PENDING
+
+
+def test_poll_once_records_failed_rebroadcasts():
+    """Test that a failed rebroadcast is recorded and the transaction stays pending."""
+    poller = _idle_poller(rebroadcast_after_seconds=0)
+    invocation = _invocation()
+    invocation.broadcast.side_effect = Exception("nonce too low")
+    handle = poller.track(invocation, "write")
+    handle.submitted_at -= 1
+
+    poller.poll_once()
+
+    assert handle.status == PENDING
+    assert handle.error == "Rebroadcast failed: nonce too low"
+
+
+def test_transactions_filters_by_wallet():
+    """Test that transactions can be listed per wallet."""
+    poller = _idle_poller()
+    mine = poller.track(_invocation(), "mine")
+    poller.track(_invocation("other-wallet"), "theirs")
+    poller.track(_invocation(None), "unknown wallet")
+
+    assert poller.transactions(MOCK_WALLET_ID) == [mine]
+    assert len(poller.transactions()) == 3
+
+
+def test_resolved_history_is_bounded():
+    """Test that only the most recent resolved transactions are kept."""
+    poller = _idle_poller(max_history=1)
+    invocations = [_invocation(), _invocation()]
+    for invocation in invocations:
+        _land(invocation, "complete")
+    first, second = (poller.track(invocation, "write") for invocation in invocations)
+
+    poller.poll_once()
+
+    assert poller.get(first.id) is None
+    assert poller.get(second.id) is second
+
+
+def test_background_thread_resolves_handles():
+    """Test that the background thread confirms tracked transactions on its own."""
+    poller = ConfirmationPoller(interval_seconds=0)
+    invocation = _invocation()
+    _land(invocation, "complete")
+
+    handle = poller.track(invocation, "write")
+
+    assert handle.wait(timeout=5)
+    assert handle.status == COMPLETE
+
+
+def test_background_thread_survives_failed_rounds():
+    """Test that the background thread keeps polling after a round raises."""
+    poller = ConfirmationPoller(interval_seconds=0)
+    invocation = _invocation()
+    _land(invocation, "complete")
+    poll_once = poller.poll_once
+    rounds = []
+
+    def failing_first_round():
+        rounds.append(None)
+        if len(rounds) == 1:
+            raise RuntimeError("SDK error")
+        poll_once()
+
+    with patch.object(poller, "poll_once", side_effect=failing_first_round):
+        handle = poller.track(invocation, "write")
+
+        assert handle.wait(timeout=5)
+
+    assert handle.status == COMPLETE
+
+
+def test_poll_once_ignores_wall_clock_jumps():
+    """Test that a jump of the system clock does not time out or rebroadcast transactions."""
+    poller = _idle_poller(timeout_seconds=60, rebroadcast_after_seconds=30)
+    invocation = _invocation()
+    handle = poller.track(invocation, "write")
+
+    with patch("time.time", return_value=4102444800.0):
+        poller.poll_once()
+
+    assert handle.status == PENDING
+    invocation.broadcast.assert_not_called()
+
+
+def test_wait_or_submit_waits_by_default():
+    """Test that writes wait for confirmation outside submit-only mode."""
+    invocation = _invocation()
+    invocation.wait.return_value = invocation
+
+    assert not is_submit_only()
+    assert wait_or_submit(invocation, "write") is invocation
+    invocation.wait.assert_called_once_with()
+
+
+def test_wait_or_submit_within_deadline():
+    """Test that writes only wait until the deadline, then are handed to the poller."""
+    invocation = _invocation()
+    invocation.wait.side_effect = TimeoutError("Contract Invocation timed out")
+
+    with deadline(5):
+        handle = wait_or_submit(invocation, "write")
+
+    assert 0 < invocation.wait.call_args.kwargs["timeout_seconds"] <= 5
+    assert isinstance(handle, PendingTransaction)
+    assert get_confirmation_poller().get(handle.id) is handle
+
+
+def test_await_or_submit_keeps_confirming_cancelled_writes():
+    """Test that a write whose caller was cancelled is still confirmed in the background."""
+    invocation = _invocation()
+
+    async def cancel():
+        waiter = asyncio.create_task(await_or_submit(invocation, "write"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(cancel())
+
+    assert any(handle.resource is invocation for handle in get_confirmation_poller().transactions())
+
+
+def test_wait_or_submit_in_submit_only_mode():
+    """Test that writes are handed to the shared poller in submit-only mode."""
+    invocation = _invocation()
+
+    with submit_only():
+        handle = wait_or_submit(invocation, "write")
+
+    assert isinstance(handle, PendingTransaction)
+    assert get_confirmation_poller().get(handle.id) is handle
+    assert not is_submit_only()
+    invocation.wait.assert_not_called()
+
+
+def test_await_or_submit_in_submit_only_mode():
+    """Test that async writes are handed to the shared poller in submit-only mode."""
+    invocation = _invocation()
+
+    async def submit():
+        with submit_only():
+            return await await_or_submit(invocation, "write")
+
+    handle = asyncio.run(submit())
+
+    assert isinstance(handle, PendingTransaction)
+    assert "get_transaction_status" in handle.submitted_message()
+    assert handle.id in handle.submitted_message()
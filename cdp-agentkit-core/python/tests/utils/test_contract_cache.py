@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+from eth_abi import encode
+
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_V3_ABI
+from cdp_agentkit_core.utils.contract_cache import (
+    CONTRACT_CACHE_ENV_VAR,
+    ContractCache,
+    cached_read,
+    get_contract_cache,
+)
+from cdp_agentkit_core.utils.multicall import Call, multicall
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x4200000000000000000000000000000000000006"
+
+
+def test_contract_cache_persists_across_instances(contract_cache_path):
+    """Test that reads stored by one cache instance are visible to another on the same file."""
+    ContractCache(contract_cache_path).set(
+        MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "slot0", None, {"sqrtPriceX96": 2**160}
+    )
+
+    cache = ContractCache(contract_cache_path)
+
+    assert cache.get(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS.lower(), "slot0") == {
+        "sqrtPriceX96": 2**160
+    }
+    assert cache.get("base-mainnet", MOCK_POOL_ADDRESS, "slot0") is None
+
+
+def test_contract_cache_clear(contract_cache_path):
+    """Test that clear removes every cached read."""
+    cache = ContractCache(contract_cache_path)
+    cache.set(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "fee", None, 3000)
+
+    cache.clear()
+
+    assert cache.get(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "fee") is None
+
+
+def test_cached_read_immutable_method():
+    """Test that an immutable read reaches the network only once."""
+    with patch(
+        "cdp.smart_contract.SmartContract.read",
+        return_value=MOCK_POOL_ADDRESS,
+    ) as mock_read:
+        first = cached_read(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "poolAddress", abi=WOW_ABI)
+        second = cached_read(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "poolAddress", abi=WOW_ABI)
+
+    assert first == second == MOCK_POOL_ADDRESS
+    mock_read.assert_called_once()
+
+
+def test_cached_read_mutable_method():
+    """Test that reads of other methods always reach the network."""
+    with patch("cdp.smart_contract.SmartContract.read", return_value=1000) as mock_read:
+        cached_read(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "liquidity", abi=UNISWAP_V3_ABI)
+        cached_read(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "liquidity", abi=UNISWAP_V3_ABI)
+
+    assert mock_read.call_count == 2
+
+
+def test_cached_read_of_unregistered_abi():
+    """Test that a method is only cached for the ABIs it is registered as immutable with."""
+    fee_abi = [entry for entry in UNISWAP_V3_ABI if entry.get("name") == "fee"]
+
+    with patch("cdp.smart_contract.SmartContract.read", return_value=3000) as mock_read:
+        cached_read(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "fee", abi=fee_abi)
+        cached_read(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "fee", abi=fee_abi)
+        cached_read(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "fee")
+
+    assert mock_read.call_count == 3
+
+
+def test_contract_cache_disabled(monkeypatch):
+    """Test that an empty CDP_AGENTKIT_CONTRACT_CACHE disables the cache."""
+    monkeypatch.setenv(CONTRACT_CACHE_ENV_VAR, "")
+
+    assert get_contract_cache() is None
+
+    with patch("cdp.smart_contract.SmartContract.read", return_value=3000) as mock_read:
+        cached_read(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "fee", abi=UNISWAP_V3_ABI)
+        cached_read(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, "fee", abi=UNISWAP_V3_ABI)
+
+    assert mock_read.call_count == 2
+
+
+def test_multicall_only_sends_uncached_calls():
+    """Test that multicall serves immutable calls from the cache and sends the rest."""
+    calls = [
+        Call(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, "fee"),
+        Call(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, "liquidity"),
+    ]
+
+    with patch(
+        "cdp.smart_contract.SmartContract.read",
+        side_effect=[
+            [
+                {"success": True, "returnData": "0x" + encode(["uint24"], [3000]).hex()},
+                {"success": True, "returnData": "0x" + encode(["uint128"], [10]).hex()},
+            ],
+            [{"success": True, "returnData": "0x" + encode(["uint128"], [20]).hex()}],
+        ],
+    ) as mock_read:
+        assert multicall(MOCK_NETWORK_ID, calls) == [3000, 10]
+        assert multicall(MOCK_NETWORK_ID, calls) == [3000, 20]
+        assert multicall(MOCK_NETWORK_ID, calls[:1]) == [3000]
+
+    assert mock_read.call_count == 2
+    assert len(mock_read.call_args.kwargs["args"]["calls"]) == 1
@@ -0,0 +1,49 @@
+import pytest
+
+from cdp_agentkit_core.utils.deadline import (
+    DeadlineExceededError,
+    bounded_timeout,
+    check_deadline,
+    deadline,
+    remaining_seconds,
+)
+
+
+def test_no_deadline():
+    """Test that steps keep their own timeout outside a deadline."""
+    assert remaining_seconds() is None
+    assert bounded_timeout(20) == 20
+    check_deadline("step")
+
+
+def test_deadline_bounds_timeouts():
+    """Test that timeouts are bounded by the time left before the deadline."""
+    with deadline(5):
+        assert 0 < remaining_seconds() <= 5
+        assert bounded_timeout(20) <= 5
+        assert bounded_timeout(1) == 1
+
+    assert remaining_seconds() is None
+
+
+def test_nested_deadlines_only_shorten():
+    """Test that a nested deadline cannot extend the enclosing one."""
+    with deadline(5):
+        with deadline(60):
+            assert remaining_seconds() <= 5
+        with deadline(None):
+            assert remaining_seconds() <= 5
+        with deadline(1):
+            assert remaining_seconds() <= 1
+
+
+def test_check_deadline_once_passed():
+    """Test that no step starts once the deadline has passed."""
+    with deadline(0), pytest.raises(DeadlineExceededError, match="Deadline exceeded before step"):
+        check_deadline("step")
+
+
+def test_negative_deadline():
+    """Test that negative timeouts are rejected."""
+    with pytest.raises(ValueError), deadline(-1):
+        pass
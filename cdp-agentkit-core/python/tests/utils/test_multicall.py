@@ -0,0 +1,129 @@
+from unittest.mock import patch
+
+import pytest
+from eth_abi import decode, encode
+
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
+from cdp_agentkit_core.utils.multicall import (
+    MULTICALL3_ADDRESS,
+    Call,
+    MulticallError,
+    multicall,
+)
+
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x4200000000000000000000000000000000000006"
+
+
+def test_call_encode_simple_args():
+    """Test that a call encodes its selector and arguments keyed by input name."""
+    call = Call(MOCK_TOKEN_ADDRESS, WOW_ABI, "balanceOf", {"account": MOCK_POOL_ADDRESS.lower()})
+
+    data = call.encode()
+
+    assert data[:4].hex() == "70a08231"
+    assert decode(["address"], data[4:]) == (MOCK_POOL_ADDRESS.lower(),)
+
+
+def test_call_encode_tuple_args():
+    """Test that struct arguments may be given as a dict keyed by component name."""
+    call = Call(
+        MOCK_POOL_ADDRESS,
+        UNISWAP_QUOTER_ABI,
+        "quoteExactInputSingle",
+        {
+            "params": {
+                "tokenIn": MOCK_TOKEN_ADDRESS,
+                "tokenOut": MOCK_POOL_ADDRESS,
+                "amountIn": "1000",
+                "fee": 3000,
+                "sqrtPriceLimitX96": 0,
+            }
+        },
+    )
+
+    data = call.encode()
+
+    assert data[:4].hex() == "c6a5026a"
+    ((_, _, amount_in, fee, _),) = decode(["(address,address,uint256,uint24,uint160)"], data[4:])
+    assert (amount_in, fee) == (1000, 3000)
+
+
+def test_call_decode_multiple_outputs():
+    """Test that multiple outputs decode into a dict keyed by output name."""
+    call = Call(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, "slot0")
+    return_data = encode(
+        ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"],
+        [2**96, -100, 1, 2, 3, 0, True],
+    )
+
+    slot0 = call.decode(return_data)
+
+    assert slot0["sqrtPriceX96"] == 2**96
+    assert slot0["tick"] == -100
+    assert slot0["unlocked"] is True
+
+
+def test_call_unknown_method():
+    """Test that a method missing from the ABI raises MulticallError."""
+    with pytest.raises(MulticallError):
+        Call(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, "notAMethod").encode()
+
+
+def test_multicall_single_read():
+    """Test that multicall issues one aggregate3 read and decodes every result in order."""
+    calls = [
+        Call(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, "token0"),
+        Call(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, "fee"),
+    ]
+    aggregate_results = [
+        {"success": True, "returnData": "0x" + encode(["address"], [MOCK_TOKEN_ADDRESS]).hex()},
+        {"success": True, "returnData": "0x" + encode(["uint24"], [3000]).hex()},
+    ]
+
+    with patch(
+        "cdp.smart_contract.SmartContract.read", return_value=aggregate_results
+    ) as mock_read:
+        results = multicall("base-sepolia", calls)
+
+    assert results == [MOCK_TOKEN_ADDRESS, 3000]
+    mock_read.assert_called_once()
+    args, kwargs = mock_read.call_args
+    assert args[:3] == ("base-sepolia", MULTICALL3_ADDRESS, "aggregate3")
+    assert [c["callData"] for c in kwargs["args"]["calls"]] == [
+        "0x" + call.encode().hex() for call in calls
+    ]
+
+
+def test_multicall_allow_failure():
+    """Test that a reverted call that allows failure yields None."""
+    calls = [Call(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, "fee", allow_failure=True)]
+
+    with patch(
+        "cdp.smart_contract.SmartContract.read",
+        return_value=[{"success": False, "returnData": "0x"}],
+    ):
+        assert multicall("base-sepolia", calls) == [None]
+
+
+def test_multicall_failure():
+    """Test that a reverted call that does not allow failure raises MulticallError."""
+    calls = [Call(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, "fee")]
+
+    with (
+        patch(
+            "cdp.smart_contract.SmartContract.read",
+            return_value=[{"success": False, "returnData": "0x"}],
+        ),
+        pytest.raises(MulticallError),
+    ):
+        multicall("base-sepolia", calls)
+
+
+def test_multicall_no_calls():
+    """Test that an empty batch does not issue a read."""
+    with patch("cdp.smart_contract.SmartContract.read") as mock_read:
+        assert multicall("base-sepolia", []) == []
+
+    mock_read.assert_not_called()
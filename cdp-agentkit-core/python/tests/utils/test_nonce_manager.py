@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from cdp import ContractInvocation, Transaction, Transfer
+
+from cdp_agentkit_core.utils.nonce_manager import (
+    NonceManager,
+    transaction_nonce,
+    transaction_sender,
+)
+
+MOCK_ADDRESS_ID = "0xAbC0000000000000000000000000000000000001"
+MOCK_NETWORK_ID = "base-sepolia"
+
+
+def _handle(nonce, address_id=MOCK_ADDRESS_ID, transaction_hash=None):
+    invocation = Mock(spec=ContractInvocation)
+    invocation.transaction_hash = transaction_hash or f"0xhash{nonce}"
+    invocation.address_id = address_id
+    invocation.network_id = MOCK_NETWORK_ID
+    invocation.transaction = Mock(spec=Transaction)
+    invocation.transaction.raw.as_dict.return_value = {"nonce": nonce}
+    return SimpleNamespace(resource=invocation)
+
+
+def test_transaction_nonce_and_sender():
+    """Test reading the server-assigned nonce and the sender of a resource."""
+    handle = _handle(7)
+
+    assert transaction_nonce(handle.resource) == 7
+    assert transaction_sender(handle.resource) == (MOCK_NETWORK_ID, MOCK_ADDRESS_ID.lower())
+
+
+def test_transaction_nonce_without_transaction():
+    """Test that resources without a transaction, e.g. gasless transfers, have no nonce."""
+    transfer = Mock(spec=Transfer)
+    transfer.transaction = None
+
+    assert transaction_nonce(transfer) is None
+
+
+def test_in_flight_is_ordered_by_nonce():
+    """Test that the in-flight transactions of an address are listed lowest nonce first."""
+    manager = NonceManager()
+    handles = [_handle(nonce) for nonce in (3, 1, 2)]
+    for handle in handles:
+        assert manager.submitted(handle)
+    manager.submitted(_handle(1, address_id="0x0000000000000000000000000000000000000002"))
+
+    in_flight = manager.in_flight(MOCK_ADDRESS_ID.upper().replace("0X", "0x"), MOCK_NETWORK_ID)
+
+    assert in_flight == [(1, handles[1]), (2, handles[2]), (3, handles[0])]
+
+
+def test_landed_replaces_only_same_nonce_with_other_hash():
+    """Test that a landed transaction only replaces different transactions with its nonce."""
+    manager = NonceManager()
+    lower = _handle(4)
+    other = _handle(5, transaction_hash="0xother")
+    duplicate = _handle(5, transaction_hash="0xlanded")
+    landed = _handle(5, transaction_hash="0xlanded")
+    higher = _handle(6)
+    for handle in (lower, other, duplicate, landed, higher):
+        manager.submitted(handle)
+
+    replaced = manager.landed(landed)
+
+    # The lower nonce was mined already, most likely by that very transaction: keep polling it.
+    assert replaced == [other]
+    assert manager.in_flight(MOCK_ADDRESS_ID) == [(4, lower), (5, duplicate), (6, higher)]
+
+
+def test_submitted_after_nonce_landed():
+    """Test that a transaction whose nonce already landed is reported as unable to land."""
+    manager = NonceManager()
+    landed = _handle(5)
+    manager.submitted(landed)
+    manager.landed(landed)
+
+    assert not manager.submitted(_handle(5, transaction_hash="0xother"))
+    assert manager.submitted(_handle(5))
+    assert manager.submitted(_handle(4))
+    assert manager.submitted(_handle(6))
+
+
+def test_released():
+    """Test that released transactions are no longer in flight."""
+    manager = NonceManager()
+    dropped, kept = _handle(1), _handle(2)
+    manager.submitted(dropped)
+    manager.submitted(kept)
+
+    manager.released(dropped)
+
+    assert manager.in_flight(MOCK_ADDRESS_ID) == [(2, kept)]
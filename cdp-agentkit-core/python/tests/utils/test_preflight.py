@@ -0,0 +1,166 @@
+from unittest.mock import patch
+
+import pytest
+from eth_abi import encode
+
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.utils.multicall import CallResult
+from cdp_agentkit_core.utils.preflight import (
+    ERC721_ABI,
+    PreflightError,
+    decode_revert,
+    erc20_balance_check,
+    erc721_transfer_checks,
+    preflight,
+    preflight_many,
+    simulate,
+)
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_OWNER = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+MOCK_OPERATOR = "0x4200000000000000000000000000000000000006"
+MOCK_TOKEN_ID = "1000"
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def _ok(types, values):
+    return CallResult(success=True, return_data=encode(types, values))
+
+
+def _reverted(data=b""):
+    return CallResult(success=False, return_data=data)
+
+
+def _aggregate(*results):
+    return patch("cdp_agentkit_core.utils.preflight.aggregate", return_value=list(results))
+
+
+def test_decode_revert_error_string():
+    """Test that Error(string) reverts decode into their message."""
+    data = bytes.fromhex("08c379a0") + encode(["string"], ["Ownable: caller is not the owner"])
+
+    assert decode_revert(data) == "Ownable: caller is not the owner"
+
+
+def test_decode_revert_panic():
+    """Test that Panic(uint256) reverts decode into the panic reason."""
+    data = bytes.fromhex("4e487b71") + encode(["uint256"], [0x11])
+
+    assert decode_revert(data) == "panic: arithmetic overflow or underflow"
+
+
+def test_decode_revert_custom_error():
+    """Test that custom errors decode with their arguments using the given ABIs."""
+    data = bytes.fromhex("7e273289") + encode(["uint256"], [1000])
+
+    assert decode_revert(data, WOW_ABI, ERC721_ABI) == "ERC721NonexistentToken(tokenId=1000)"
+
+
+def test_decode_revert_unknown():
+    """Test that unknown and empty revert data are reported as is."""
+    assert decode_revert(b"") == "execution reverted"
+    assert decode_revert(bytes.fromhex("deadbeef")) == "execution reverted with data 0xdeadbeef"
+
+
+def test_preflight_passes():
+    """Test that a write whose checks pass is not rejected."""
+    check = erc20_balance_check(MOCK_CONTRACT_ADDRESS, MOCK_OWNER, "100")
+
+    with _aggregate(_ok(["uint256"], [100])) as mock_aggregate:
+        preflight(MOCK_NETWORK_ID, [check])
+
+    mock_aggregate.assert_called_once()
+    (call,) = mock_aggregate.call_args.args[1]
+    assert call.method == "balanceOf"
+    assert call.allow_failure
+
+
+def test_preflight_rejects_failed_checks():
+    """Test that a failed check rejects the write with its reason."""
+    check = erc20_balance_check(MOCK_CONTRACT_ADDRESS, MOCK_OWNER, "100")
+
+    with _aggregate(_ok(["uint256"], [99])), pytest.raises(PreflightError) as error:
+        preflight(MOCK_NETWORK_ID, [check])
+
+    assert str(error.value) == (
+        "Simulation shows the call would revert: "
+        f"{MOCK_OWNER} holds 99 of token {MOCK_CONTRACT_ADDRESS}, less than the 100 needed"
+    )
+
+
+def test_preflight_decodes_reverted_reads():
+    """Test that a check whose read reverts is rejected with the decoded revert reason."""
+    checks = erc721_transfer_checks(MOCK_CONTRACT_ADDRESS, MOCK_TOKEN_ID, MOCK_OWNER, MOCK_OWNER)
+    revert_data = bytes.fromhex("7e273289") + encode(["uint256"], [1000])
+
+    with _aggregate(_reverted(revert_data)), pytest.raises(PreflightError) as error:
+        preflight(MOCK_NETWORK_ID, checks)
+
+    assert "ownerOf reverted: ERC721NonexistentToken(tokenId=1000)" in str(error.value)
+
+
+def test_preflight_rejects_non_contracts():
+    """Test that a read that returns no data, e.g. from an address without code, is rejected."""
+    check = erc20_balance_check(MOCK_CONTRACT_ADDRESS, MOCK_OWNER, "100")
+
+    with _aggregate(CallResult(success=True, return_data=b"")), pytest.raises(PreflightError):
+        preflight(MOCK_NETWORK_ID, [check])
+
+
+def test_preflight_lets_writes_through_when_simulation_fails():
+    """Test that a write goes ahead if the simulation read itself fails."""
+    check = erc20_balance_check(MOCK_CONTRACT_ADDRESS, MOCK_OWNER, "100")
+
+    with patch("cdp_agentkit_core.utils.preflight.aggregate", side_effect=Exception("API error")):
+        preflight(MOCK_NETWORK_ID, [check])
+
+
+def test_simulate_skips_unencodable_arguments():
+    """Test that arguments that are not addresses yet, e.g. ENS names, skip the simulation."""
+    check = erc20_balance_check(MOCK_CONTRACT_ADDRESS, "example.eth", "100")
+
+    assert simulate(MOCK_NETWORK_ID, [check]) == [None]
+
+
+def test_erc721_transfer_checks_approval():
+    """Test that transfers from another address check the operator's approval."""
+    checks = erc721_transfer_checks(MOCK_CONTRACT_ADDRESS, MOCK_TOKEN_ID, MOCK_OWNER, MOCK_OPERATOR)
+
+    assert len(checks) == 2
+
+    with _aggregate(
+        _ok(["address"], [MOCK_OWNER]),
+        _ok(["address"], [ZERO_ADDRESS]),
+        _ok(["bool"], [True]),
+    ):
+        assert simulate(MOCK_NETWORK_ID, checks) == [None, None]
+
+    with _aggregate(
+        _ok(["address"], [MOCK_OWNER]),
+        _ok(["address"], [ZERO_ADDRESS]),
+        _ok(["bool"], [False]),
+    ):
+        assert simulate(MOCK_NETWORK_ID, checks) == [
+            None,
+            f"{MOCK_OPERATOR} is not approved to transfer NFT (ID: {MOCK_TOKEN_ID}) from {MOCK_OWNER}",
+        ]
+
+
+def test_preflight_many_simulates_every_write_with_one_read():
+    """Test that several writes are simulated with a single read and rejected independently."""
+    writes = [
+        erc721_transfer_checks(MOCK_CONTRACT_ADDRESS, token_id, MOCK_OWNER, MOCK_OWNER)
+        for token_id in ("1", "2")
+    ]
+
+    with _aggregate(
+        _ok(["address"], [MOCK_OWNER]), _ok(["address"], [MOCK_OPERATOR])
+    ) as mock_aggregate:
+        rejections = preflight_many(MOCK_NETWORK_ID, writes)
+
+    mock_aggregate.assert_called_once()
+    assert rejections[0] is None
+    assert isinstance(rejections[1], PreflightError)
+    assert f"NFT (ID: 2) is owned by {MOCK_OPERATOR}" in str(rejections[1])
@@ -0,0 +1,140 @@
+from unittest.mock import Mock
+
+from cdp import ContractInvocation, Transaction
+from cdp.client.models.ethereum_token_transfer import EthereumTokenTransfer
+from cdp.client.models.ethereum_transaction import EthereumTransaction
+from cdp.client.models.ethereum_transaction_flattened_trace import (
+    EthereumTransactionFlattenedTrace,
+)
+from cdp.client.models.token_transfer_type import TokenTransferType
+from cdp.client.models.transaction_content import TransactionContent
+from eth_abi import encode
+
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI, WOW_FACTORY_ABI
+from cdp_agentkit_core.utils.receipts import (
+    ZERO_ADDRESS,
+    call_result,
+    confirmed_transaction,
+    eth_sent,
+    internal_eth_received,
+    minted_token_ids,
+    token_balance_change,
+)
+
+MOCK_WALLET_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_OTHER_ADDRESS = "0x4200000000000000000000000000000000000006"
+
+
+def _transfer(from_address, to_address, value=None, token_id=None, log_index=0):
+    return EthereumTokenTransfer(
+        contract_address=MOCK_CONTRACT_ADDRESS,
+        from_address=from_address,
+        to_address=to_address,
+        value=value,
+        token_id=token_id,
+        log_index=log_index,
+        token_transfer_type=TokenTransferType.ERC721 if token_id else TokenTransferType.ERC20,
+    )
+
+
+def _trace(trace_address, to, value="0", output=None, error=None):
+    return EthereumTransactionFlattenedTrace(
+        trace_address=trace_address, to=to, value=value, output=output, error=error
+    )
+
+
+def _invocation(content):
+    invocation = Mock(spec=ContractInvocation)
+    invocation.transaction = Mock(spec=Transaction)
+    invocation.transaction.content = (
+        None if content is None else TransactionContent(actual_instance=content)
+    )
+    return invocation
+
+
+def _content(token_transfers=None, flattened_traces=None, value="0"):
+    return EthereumTransaction(
+        **{"from": MOCK_WALLET_ADDRESS},
+        to=MOCK_CONTRACT_ADDRESS,
+        value=value,
+        token_transfers=token_transfers,
+        flattened_traces=flattened_traces,
+    )
+
+
+def test_confirmed_transaction_unavailable():
+    """Test that nothing is read from a transaction without content."""
+    invocation = _invocation(None)
+
+    assert confirmed_transaction(invocation) is None
+    assert token_balance_change(invocation, MOCK_CONTRACT_ADDRESS, MOCK_WALLET_ADDRESS) is None
+    assert internal_eth_received(invocation, MOCK_WALLET_ADDRESS) is None
+    assert eth_sent(invocation) is None
+    assert call_result(invocation, WOW_ABI, "buy") is None
+
+
+def test_token_balance_change():
+    """Test that the net token transfers to and from an address are added up."""
+    invocation = _invocation(
+        _content(
+            token_transfers=[
+                _transfer(ZERO_ADDRESS, MOCK_WALLET_ADDRESS.lower(), value="1000"),
+                _transfer(MOCK_WALLET_ADDRESS, MOCK_OTHER_ADDRESS, value="10", log_index=1),
+            ]
+        )
+    )
+
+    assert token_balance_change(invocation, MOCK_CONTRACT_ADDRESS, MOCK_WALLET_ADDRESS) == 990
+    assert token_balance_change(invocation, MOCK_OTHER_ADDRESS, MOCK_WALLET_ADDRESS) == 0
+
+
+def test_minted_token_ids():
+    """Test that NFTs transferred from the zero address to the destination count as minted."""
+    invocation = _invocation(
+        _content(
+            token_transfers=[
+                _transfer(ZERO_ADDRESS, MOCK_WALLET_ADDRESS, token_id="8", log_index=1),
+                _transfer(ZERO_ADDRESS, MOCK_WALLET_ADDRESS, token_id="7", log_index=0),
+                _transfer(MOCK_OTHER_ADDRESS, MOCK_WALLET_ADDRESS, token_id="3", log_index=2),
+            ]
+        )
+    )
+
+    assert minted_token_ids(invocation, MOCK_CONTRACT_ADDRESS, MOCK_WALLET_ADDRESS) == ["7", "8"]
+
+
+def test_internal_eth_received():
+    """Test that only successful internal calls count towards the ETH an address received."""
+    invocation = _invocation(
+        _content(
+            value="1000",
+            flattened_traces=[
+                _trace([], MOCK_CONTRACT_ADDRESS, value="1000"),
+                _trace([0], MOCK_WALLET_ADDRESS, value="300"),
+                _trace([1], MOCK_WALLET_ADDRESS, value="0x64"),
+                _trace([2], MOCK_WALLET_ADDRESS, value="5", error="Reverted"),
+                _trace([3], MOCK_OTHER_ADDRESS, value="50"),
+            ],
+        )
+    )
+
+    assert eth_sent(invocation) == 1000
+    assert internal_eth_received(invocation, MOCK_WALLET_ADDRESS) == 400
+
+
+def test_call_result():
+    """Test that the return data of the top-level call is decoded with the contract ABI."""
+    token_address = "0x1234567890123456789012345678901234567890"
+    output = "0x" + encode(["address"], [token_address]).hex()
+    invocation = _invocation(
+        _content(
+            flattened_traces=[
+                _trace([0], MOCK_OTHER_ADDRESS, output="0x"),
+                _trace([], MOCK_CONTRACT_ADDRESS, output=output),
+            ]
+        )
+    )
+
+    assert call_result(invocation, WOW_FACTORY_ABI, "deploy") == token_address
+    assert call_result(invocation, WOW_FACTORY_ABI, "notAMethod") is None
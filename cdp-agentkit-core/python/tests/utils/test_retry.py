@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from cdp.client.exceptions import ApiException
+from cdp.errors import ApiError
+
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, deadline
+from cdp_agentkit_core.utils.errors import is_transient
+from cdp_agentkit_core.utils.retry import RetryPolicy, aretry_call, read_contract, retry_call
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+
+def _api_error(status):
+    return ApiError(ApiException(status=status, reason="error"))
+
+
+def _http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep():
+    """Skip the backoff delays."""
+    with patch("cdp_agentkit_core.utils.retry.time.sleep") as mock:
+        yield mock
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _api_error(429),
+        _api_error(503),
+        _http_error(502),
+        requests.ConnectionError("connection reset"),
+        requests.Timeout("read timed out"),
+        TimeoutError("timed out"),
+    ],
+)
+def test_transient_errors(error):
+    """Test that rate limits, server errors, connection errors and timeouts are transient."""
+    assert is_transient(error)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _api_error(400),
+        _http_error(404),
+        ValueError("execution reverted"),
+        DeadlineExceededError("Deadline exceeded"),
+    ],
+)
+def test_permanent_errors(error):
+    """Test that invalid requests, reverts and exceeded deadlines are not retried."""
+    assert not is_transient(error)
+
+
+def test_retry_call_retries_transient_errors(mock_sleep):
+    """Test that transient errors are retried with growing backoff until the call succeeds."""
+    func = Mock(side_effect=[_api_error(503), _api_error(429), "result"])
+
+    assert retry_call(func, "arg", key="value") == "result"
+
+    assert func.call_count == 3
+    func.assert_called_with("arg", key="value")
+    assert mock_sleep.call_count == 2
+
+
+def test_retry_call_raises_permanent_errors_at_once(mock_sleep):
+    """Test that a permanent error is raised without retrying."""
+    func = Mock(side_effect=_api_error(400))
+
+    with pytest.raises(ApiError):
+        retry_call(func)
+
+    func.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_retry_call_gives_up_after_max_attempts():
+    """Test that the last error is raised once every attempt has failed."""
+    func = Mock(side_effect=requests.ConnectionError("connection reset"))
+
+    with pytest.raises(requests.ConnectionError):
+        retry_call(func, policy=RetryPolicy(max_attempts=4))
+
+    assert func.call_count == 4
+
+
+def test_retry_call_stops_at_the_deadline(mock_sleep):
+    """Test that no retry is made if its delay would overrun the deadline."""
+    func = Mock(side_effect=_api_error(503))
+    policy = RetryPolicy(base_delay_seconds=10, max_delay_seconds=10)
+
+    with (
+        patch("cdp_agentkit_core.utils.retry.random.uniform", return_value=10),
+        deadline(1),
+        pytest.raises(ApiError),
+    ):
+        retry_call(func, policy=policy)
+
+    func.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_retry_delay_honors_retry_after():
+    """Test that a Retry-After header sets the minimum delay, up to the maximum delay."""
+    policy = RetryPolicy(base_delay_seconds=0.001, max_delay_seconds=4)
+
+    assert policy.delay(0, _http_error(429, {"Retry-After": "2"})) == 2
+    assert policy.delay(0, _http_error(429, {"Retry-After": "60"})) == 4
+    assert policy.delay(0, _http_error(429)) <= 0.001
+
+
+def test_aretry_call_retries_transient_errors():
+    """Test that async calls are retried like sync ones."""
+    func = Mock(side_effect=[requests.Timeout("read timed out"), "result"])
+    policy = RetryPolicy(base_delay_seconds=0)
+
+    assert asyncio.run(aretry_call(func, "arg", policy=policy)) == "result"
+    assert func.call_count == 2
+
+
+def test_read_contract_retries_transient_errors():
+    """Test that contract reads are retried through the shared policy."""
+    with patch(
+        "cdp.smart_contract.SmartContract.read", side_effect=[_api_error(502), 1000]
+    ) as mock_read:
+        assert read_contract(MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "totalSupply") == 1000
+
+    assert mock_read.call_count == 2
+    mock_read.assert_called_with(
+        MOCK_NETWORK_ID, MOCK_CONTRACT_ADDRESS, "totalSupply", abi=None, args=None
+    )
@@ -0,0 +1,58 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from cdp import ContractInvocation, Transaction, Transfer
+
+from cdp_agentkit_core.utils.transactions import async_wait, is_terminal
+
+
+def test_is_terminal_contract_invocation():
+    """Test that contract invocations are terminal once their transaction is."""
+    invocation = Mock(spec=ContractInvocation)
+    invocation.transaction = Mock(spec=Transaction)
+    invocation.transaction.terminal_state = False
+
+    assert not is_terminal(invocation)
+
+    invocation.transaction.terminal_state = True
+
+    assert is_terminal(invocation)
+
+
+def test_is_terminal_transfer():
+    """Test that transfers use their own terminal state."""
+    transfer = Mock(spec=Transfer)
+    transfer.terminal_state = False
+
+    assert not is_terminal(transfer)
+
+
+def test_async_wait_polls_until_terminal():
+    """Test that async_wait reloads the resource until it reaches a terminal state."""
+    invocation = Mock(spec=ContractInvocation)
+    invocation.transaction = Mock(spec=Transaction)
+    invocation.transaction.terminal_state = False
+
+    reloads = []
+
+    def reload():
+        reloads.append(True)
+        invocation.transaction.terminal_state = len(reloads) == 2
+
+    invocation.reload.side_effect = reload
+
+    result = asyncio.run(async_wait(invocation, interval_seconds=0))
+
+    assert result is invocation
+    assert len(reloads) == 2
+
+
+def test_async_wait_timeout():
+    """Test that async_wait raises TimeoutError when the resource never lands."""
+    invocation = Mock(spec=ContractInvocation)
+    invocation.transaction = Mock(spec=Transaction)
+    invocation.transaction.terminal_state = False
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(async_wait(invocation, interval_seconds=0, timeout_seconds=0))
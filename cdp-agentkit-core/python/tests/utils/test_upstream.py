@@ -0,0 +1,174 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from cdp.client.exceptions import ApiException
+from cdp.errors import ApiError
+
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, deadline
+from cdp_agentkit_core.utils.upstream import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AdaptiveLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    Upstream,
+    call_upstream,
+    upstream_metrics,
+)
+
+
+def _api_error(status):
+    return ApiError(ApiException(status=status, reason="error"))
+
+
+def test_limiter_increases_additively_and_decreases_multiplicatively():
+    """Test that the limit grows by about one per window of successes and halves on overload."""
+    limiter = AdaptiveLimiter(initial_limit=4, latency_target_seconds=1)
+
+    for _ in range(4):
+        assert limiter.acquire()
+        limiter.release(0.1)
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        assert limiter.acquire()
+        limiter.release(0.1)
+    assert limiter.limit == 5
+
+    limiter.acquire()
+    limiter.release(0.1, overloaded=True)
+    assert limiter.limit == 2
+
+    limiter.acquire()
+    limiter.release(5.0)
+    assert limiter.limit == 1
+
+    limiter.acquire()
+    limiter.release(5.0)
+    assert limiter.limit == 1
+
+
+def test_limiter_queues_calls_over_the_limit():
+    """Test that a call over the limit waits for a slot, and gives up at its timeout."""
+    limiter = AdaptiveLimiter(initial_limit=1)
+    assert limiter.acquire()
+
+    assert not limiter.acquire(timeout=0.01)
+    assert limiter.waiting == 0
+
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: limiter.acquire() and acquired.set())
+    waiter.start()
+    while limiter.waiting != 1:
+        time.sleep(0.001)
+
+    limiter.release(0.1)
+    waiter.join(timeout=5)
+
+    assert acquired.is_set()
+    assert limiter.in_flight == 1
+
+
+def test_limiter_invalid_limits():
+    """Test that inconsistent limits are rejected."""
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial_limit=8, max_limit=4)
+
+
+def test_circuit_breaker_opens_and_recovers_through_a_probe():
+    """Test that the circuit opens on consecutive failures and closes after a successful probe."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=0.05)
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    # Only one probe at a time.
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+def test_upstream_counts_only_transient_errors_as_failures():
+    """Test that reverts and other permanent errors do not open the circuit."""
+    upstream = Upstream("test", breaker=CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(ValueError):
+        upstream.call(Mock(side_effect=ValueError("execution reverted")))
+    assert upstream.breaker.state == CLOSED
+
+    with pytest.raises(ApiError):
+        upstream.call(Mock(side_effect=_api_error(503)))
+    assert upstream.breaker.state == OPEN
+
+
+def test_upstream_rejects_calls_while_the_circuit_is_open():
+    """Test that an open circuit rejects calls without calling the API."""
+    upstream = Upstream("test", breaker=CircuitBreaker(failure_threshold=1))
+    with pytest.raises(ApiError):
+        upstream.call(Mock(side_effect=_api_error(429)))
+
+    func = Mock()
+    with pytest.raises(CircuitOpenError, match="The test API is failing"):
+        upstream.call(func)
+
+    func.assert_not_called()
+    assert upstream.metrics().rejected == 1
+
+
+def test_upstream_waits_for_a_slot_until_the_deadline():
+    """Test that a call that cannot get a slot before the deadline is not made."""
+    upstream = Upstream("test", limiter=AdaptiveLimiter(initial_limit=1))
+    upstream.limiter.acquire()
+
+    func = Mock()
+    with deadline(0.01), pytest.raises(DeadlineExceededError):
+        upstream.call(func)
+
+    func.assert_not_called()
+
+
+def test_upstream_metrics():
+    """Test that the metrics report calls, failures and latencies."""
+    upstream = Upstream("test", limiter=AdaptiveLimiter(initial_limit=2))
+
+    assert upstream.call(Mock(return_value="result"), "arg") == "result"
+    with pytest.raises(ApiError):
+        upstream.call(Mock(side_effect=_api_error(500)))
+
+    metrics = upstream.metrics()
+
+    assert metrics.name == "test"
+    assert metrics.calls == 2
+    assert metrics.failures == 1
+    assert metrics.in_flight == 0
+    assert metrics.limit == 1
+    assert metrics.circuit_state == CLOSED
+    assert metrics.consecutive_failures == 1
+    assert metrics.latency_p50_seconds is not None
+    assert metrics.latency_p99_seconds >= metrics.latency_p50_seconds
+
+
+def test_call_upstream_uses_the_cdp_upstream():
+    """Test that wallet and contract calls share the process-wide CDP upstream."""
+    calls = upstream_metrics().get("cdp")
+    before = 0 if calls is None else calls.calls
+
+    assert call_upstream(Mock(return_value=1)) == 1
+
+    assert upstream_metrics()["cdp"].calls == before + 1
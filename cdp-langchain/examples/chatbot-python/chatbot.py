@@ -9,10 +9,11 @@ from langgraph.prebuilt import create_react_agent
 
 # Import CDP Agentkit Langchain Extension.
 from cdp_langchain.agent_toolkits import CdpToolkit
-from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils import CdpAgentkitWrapper, SqliteWalletStore
 
-# Configure a file to persist the agent's CDP MPC Wallet Data.
-wallet_data_file = "wallet_data.txt"
+# Configure an encrypted store to persist the agent's CDP MPC Wallet Data.
+wallet_store_file = "wallets.db"
+wallet_tenant_id = "chatbot"
 
 
 def initialize_agent():
@@ -20,11 +21,8 @@ def initialize_agent():
     # Initialize LLM.
     llm = ChatOpenAI(model="gpt-4o-mini")
 
-    wallet_data = None
-
-    if os.path.exists(wallet_data_file):
-        with open(wallet_data_file) as f:
-            wallet_data = f.read()
+    wallet_store = SqliteWalletStore(wallet_store_file, os.environ["CDP_WALLET_STORE_KEY"])
+    wallet_data = wallet_store.get(wallet_tenant_id)
 
     # Configure CDP Agentkit Langchain Extension.
     values = {}
@@ -34,10 +32,9 @@ def initialize_agent():
 
     agentkit = CdpAgentkitWrapper(**values)
 
-    # persist the agent's CDP MPC Wallet Data.
-    wallet_data = agentkit.export_wallet()
-    with open(wallet_data_file, "w") as f:
-        f.write(wallet_data)
+    # Persist the agent's CDP MPC Wallet Data the first time the wallet is created.
+    if wallet_data is None:
+        wallet_store.put(wallet_tenant_id, agentkit.export_wallet())
 
     # Initialize CDP Agentkit Toolkit and get tools.
     cdp_toolkit = CdpToolkit.from_cdp_agentkit_wrapper(agentkit)
@@ -3,7 +3,7 @@
 from langchain_core.tools import BaseTool
 from langchain_core.tools.base import BaseToolkit
 
-from cdp_agentkit_core.actions import CDP_ACTIONS
+from cdp_agentkit_core.actions import get_cdp_action_specs
 from cdp_langchain.tools import CdpTool
 from cdp_langchain.utils import CdpAgentkitWrapper
 
@@ -54,6 +54,7 @@ class CdpToolkit(BaseToolkit):
             get_wallet_details
             get_balance
             get_balance_nft
+            get_portfolio
             request_faucet_funds
             transfer
             transfer_nft
@@ -65,7 +66,12 @@ class CdpToolkit(BaseToolkit):
             wow_create_token
             wow_buy_token
             wow_sell_token
+            wow_quote_ladder
             wrap_eth
+            get_transaction_status
+            batch_transfer
+            batch_mint_nft
+            batch_transfer_nft
     Use within an agent:
         .. code-block:: python
 
@@ -116,27 +122,39 @@ class CdpToolkit(BaseToolkit):
     tools: list[BaseTool] = []  # noqa: RUF012
 
     @classmethod
-    def from_cdp_agentkit_wrapper(cls, cdp_agentkit_wrapper: CdpAgentkitWrapper) -> "CdpToolkit":
+    def from_cdp_agentkit_wrapper(
+        cls, cdp_agentkit_wrapper: CdpAgentkitWrapper | None = None
+    ) -> "CdpToolkit":
         """Create a CdpToolkit from a CdpAgentkitWrapper.
 
+        Tools are built from the precomputed action manifest, so no action module is imported
+        until its tool is first invoked.
+
+        The tools are stateless: build the toolkit once and share it between sessions, passing
+        each session's tenant (and, for a toolkit without a wrapper, its wrapper) in the config of
+        the run, e.g. `{"configurable": {"cdp_tenant_id": user_id}}`.
+
         Args:
-            cdp_agentkit_wrapper: CdpAgentkitWrapper. The CDP Agentkit wrapper.
+            cdp_agentkit_wrapper: CdpAgentkitWrapper. The CDP Agentkit wrapper, or None to give
+                one in the config of every run.
 
         Returns:
             CdpToolkit. The CDP toolkit.
 
         """
-        actions = CDP_ACTIONS
+        specs = get_cdp_action_specs()
 
         tools = [
             CdpTool(
-                name=action.name,
-                description=action.description,
+                name=spec.name,
+                description=spec.description,
                 cdp_agentkit_wrapper=cdp_agentkit_wrapper,
-                args_schema=action.args_schema,
-                func=action.func,
+                args_schema=spec.args_schema,
+                func=spec.func,
+                afunc=spec.afunc,
+                writes=spec.writes,
             )
-            for action in actions
+            for spec in specs
         ]
 
         return cls(tools=tools)  # type: ignore[arg-type]
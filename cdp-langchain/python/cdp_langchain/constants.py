@@ -2,3 +2,9 @@
 
 # CDP_LANGCHAIN_DEFAULT_SOURCE (str): Denotes the default source for CDP Langchain Agentkit extensions.
 CDP_LANGCHAIN_DEFAULT_SOURCE = "cdp-langchain"
+
+# TENANT_CONFIG_KEY (str): The `RunnableConfig` "configurable" key of the tenant whose wallet a tool call uses.
+TENANT_CONFIG_KEY = "cdp_tenant_id"
+
+# WRAPPER_CONFIG_KEY (str): The `RunnableConfig` "configurable" key of the CdpAgentkitWrapper a tool call runs with.
+WRAPPER_CONFIG_KEY = "cdp_agentkit_wrapper"
@@ -7,24 +7,46 @@ To use this tool, you must first set as environment variables:
 
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
-from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.runnables.config import ensure_config
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
 
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, deadline
+from cdp_langchain.constants import TENANT_CONFIG_KEY, WRAPPER_CONFIG_KEY
 from cdp_langchain.utils.cdp_agentkit_wrapper import CdpAgentkitWrapper
+from cdp_langchain.utils.wallet_pool import tenant
 
 
 class CdpTool(BaseTool):  # type: ignore[override]
-    """Tool for interacting with the CDP SDK."""
+    """Tool for interacting with the CDP SDK.
 
-    cdp_agentkit_wrapper: CdpAgentkitWrapper
+    The tool holds no per-session state, so one instance can serve every session: a call runs with
+    the `cdp_agentkit_wrapper` and tenant (see `cdp_langchain.utils.tenant`) given in the
+    "configurable" of its `RunnableConfig` under `WRAPPER_CONFIG_KEY` and `TENANT_CONFIG_KEY`, and
+    otherwise with the tool's own wrapper and the current tenant.
+    """
+
+    # The wrapper calls run with when their config gives none.
+    cdp_agentkit_wrapper: CdpAgentkitWrapper | None = None
     name: str = ""
     description: str = ""
-    args_schema: type[BaseModel] | None = None
+    args_schema: type[BaseModel] | dict[str, Any] | None = None
     func: Callable[..., str]
+    afunc: Callable[..., Awaitable[str]] | None = None
+    # Whether the action sends transactions; such tools run one at a time per address.
+    writes: bool = False
+    # The time a call may take, in seconds, or None to take the timeout of the action from the
+    # call's wrapper (see `CdpAgentkitWrapper.action_timeouts`). Writes that have not landed by
+    # then return a pending transaction ID, to check on with get_transaction_status.
+    timeout_seconds: float | None = None
 
     def _run(
         self,
@@ -33,12 +55,81 @@ class CdpTool(BaseTool):  # type: ignore[override]
         **kwargs: Any,
     ) -> str:
         """Use the CDP SDK to run an operation."""
+        parsed_input_args = self._parse_action_args(instructions, **kwargs)
+        with self._session() as wrapper:
+            try:
+                if self.writes:
+                    with wrapper.serialize_writes():
+                        return wrapper.run_action(self.func, **parsed_input_args)
+                return wrapper.run_action(self.func, **parsed_input_args)
+            except DeadlineExceededError as e:
+                return f"Error: {e!s}"
+
+    async def _arun(
+        self,
+        instructions: str | None = "",
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Use the CDP SDK to run an operation without blocking the event loop.
+
+        Falls back to running `func` in a thread executor when the action has no `afunc`.
+        """
+        if self.afunc is None:
+            return await super()._arun(instructions, run_manager=run_manager, **kwargs)
+
+        parsed_input_args = self._parse_action_args(instructions, **kwargs)
+        with self._session() as wrapper:
+            try:
+                if self.writes:
+                    async with wrapper.aserialize_writes():
+                        return await wrapper.arun_action(self.afunc, **parsed_input_args)
+                return await wrapper.arun_action(self.afunc, **parsed_input_args)
+            except DeadlineExceededError as e:
+                return f"Error: {e!s}"
+
+    @contextmanager
+    def _session(self) -> Iterator[CdpAgentkitWrapper]:
+        """Resolve the wrapper, tenant and deadline of a call from the config of its run.
+
+        Yields:
+            CdpAgentkitWrapper: The wrapper to run the call with, within the call's tenant and
+            deadline.
+
+        Raises:
+            ValueError: If neither the config nor the tool gives a wrapper.
+
+        """
+        configurable = ensure_config().get("configurable") or {}
+        wrapper = configurable.get(WRAPPER_CONFIG_KEY) or self.cdp_agentkit_wrapper
+        if wrapper is None:
+            raise ValueError(
+                f"No CdpAgentkitWrapper for tool {self.name}; pass one in the config under "
+                f"configurable.{WRAPPER_CONFIG_KEY}"
+            )
+
+        timeout = self.timeout_seconds
+        if timeout is None:
+            # Looked up per call, so a wrapper given in the config sets the deadline too.
+            timeout = wrapper.action_timeout(self.name)
+
+        tenant_id = configurable.get(TENANT_CONFIG_KEY)
+        with deadline(timeout):
+            if tenant_id is None:
+                yield wrapper
+                return
+            with tenant(tenant_id):
+                yield wrapper
+
+    def _parse_action_args(self, instructions: str | None = "", **kwargs: Any) -> dict[str, Any]:
+        """Validate the tool input and convert it to the action's keyword arguments."""
         if not instructions or instructions == "{}":
             # Catch other forms of empty input that GPT-4 likes to send.
             instructions = ""
+        if isinstance(self.args_schema, dict):
+            # JSON schema from the action manifest; the lazily loaded action validates the input.
+            return kwargs
         if self.args_schema is not None:
             validated_input_data = self.args_schema(**kwargs)
-            parsed_input_args = validated_input_data.model_dump()
-        else:
-            parsed_input_args = {"instructions": instructions}
-        return self.cdp_agentkit_wrapper.run_action(self.func, **parsed_input_args)
+            return validated_input_data.model_dump()
+        return {"instructions": instructions}
@@ -1,5 +1,36 @@
 """**Utilities** are the integration wrappers that LangChain uses to interact with third-party systems and packages."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from cdp_langchain.utils.cdp_agentkit_wrapper import CdpAgentkitWrapper
+from cdp_langchain.utils.wallet_pool import WalletPool, current_tenant, tenant
+
+if TYPE_CHECKING:
+    from cdp_langchain.utils.wallet_store import SqliteWalletStore, WalletStore
+
+# The wallet store imports cryptography, so it is only imported on first access.
+_LAZY_MODULES = {
+    "SqliteWalletStore": "cdp_langchain.utils.wallet_store",
+    "WalletStore": "cdp_langchain.utils.wallet_store",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the wallet store on first access."""
+    if name not in _LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["CdpAgentkitWrapper"]
+__all__ = [
+    "CdpAgentkitWrapper",
+    "SqliteWalletStore",
+    "WalletPool",
+    "WalletStore",
+    "current_tenant",
+    "tenant",
+]
@@ -1,62 +1,103 @@
 """Util that calls CDP."""
 
+import asyncio
 import inspect
 import json
-from collections.abc import Callable
-from typing import Any
+import sys
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
-from cdp import MnemonicSeedPhrase, Wallet
+from cdp_agentkit_core.utils.concurrency import FifoLock
+from cdp_agentkit_core.utils.confirmation_poller import (
+    PendingTransaction,
+    get_confirmation_poller,
+    submit_only,
+)
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, remaining_seconds
 from cdp_langchain import __version__
 from cdp_langchain.constants import CDP_LANGCHAIN_DEFAULT_SOURCE
+from cdp_langchain.utils.wallet_pool import WalletPool, current_tenant
+
+if TYPE_CHECKING:
+    # The CDP SDK takes over a second to import, so it is only imported once a wrapper is built.
+    from cdp import Wallet
+
+# How long an async action may overrun its deadline before it is cancelled.
+DEADLINE_GRACE_SECONDS = 5.0
 
 
 class CdpAgentkitWrapper(BaseModel):
     """Wrapper for CDP Agentkit Core."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # The wallet of the wrapper, created or imported when an action first needs it.
     wallet: Any = None  #: :meta private:
+    # The wallets of many tenants. Within `cdp_langchain.utils.tenant(tenant_id)`, tools use the
+    # wallet of that tenant instead of `wallet`.
+    wallet_pool: WalletPool | None = None
     cdp_api_key_name: str | None = None
     cdp_api_key_private_key: str | None = None
     network_id: str | None = None
+    # The persisted wallet data or mnemonic phrase to import the wallet from, if any.
+    cdp_wallet_data: str | None = Field(default=None, repr=False)
+    mnemonic_phrase: str | None = Field(default=None, repr=False)
+    # Whether write actions return a pending transaction ID as soon as they are broadcast, instead
+    # of waiting for confirmation. Several writes can then be pipelined from one address; check on
+    # them with the get_transaction_status action, or wait for them with wait_for_transactions.
+    submit_only: bool = False
+    # The time each tool call may take, in seconds, by action name, and for the other actions.
+    # A write that has not landed by then returns a pending transaction ID instead of blocking.
+    action_timeouts: dict[str, float] = Field(default_factory=dict)
+    default_action_timeout: float | None = None
+
+    # One write queue per sending address: write actions run one at a time, in the order they were
+    # called, while read actions run in parallel. A queue is dropped once no write holds or waits
+    # on it, so the queues of a wallet pool's many addresses do not pile up.
+    _write_queues: dict[str, FifoLock] = PrivateAttr(default_factory=dict)
+    _write_queue_users: dict[str, int] = PrivateAttr(default_factory=dict)
+    _write_queues_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _wallet_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     @model_validator(mode="before")
     @classmethod
     def validate_environment(cls, values: dict) -> Any:
-        """Validate that CDP API Key and python package exists in the environment and configure the CDP SDK."""
+        """Validate that CDP API Key and python package exists in the environment and configure the CDP SDK.
+
+        This makes no network call: the wallet is created or imported when an action first needs
+        it (see `active_wallet`), so actions without a wallet, such as pyth_fetch_price, never wait
+        for it.
+        """
         cdp_api_key_name = get_from_dict_or_env(values, "cdp_api_key_name", "CDP_API_KEY_NAME")
         cdp_api_key_private_key = get_from_dict_or_env(
             values, "cdp_api_key_private_key", "CDP_API_KEY_PRIVATE_KEY"
         ).replace("\\n", "\n")
         mnemonic_phrase = get_from_dict_or_env(values, "mnemonic_phrase", "MNEMONIC_PHRASE", "")
         network_id = get_from_dict_or_env(values, "network_id", "NETWORK_ID", "base-sepolia")
-        wallet_data_json = values.get("cdp_wallet_data")
 
         try:
-            from cdp import Cdp, Wallet, WalletData
+            import cdp  # noqa: F401
         except Exception:
             raise ImportError(
-                "CDP SDK is not installed. " "Please install it with `pip install cdp-sdk`"
+                "CDP SDK is not installed. Please install it with `pip install cdp-sdk`"
             ) from None
 
-        Cdp.configure(
+        from cdp_agentkit_core.utils.cdp_client import configure_cdp
+
+        # Wrappers of the same API key share its clients and their connections.
+        configure_cdp(
             api_key_name=cdp_api_key_name,
             private_key=cdp_api_key_private_key,
             source=CDP_LANGCHAIN_DEFAULT_SOURCE,
             source_version=__version__,
         )
 
-        if wallet_data_json:
-            wallet_data = WalletData.from_dict(json.loads(wallet_data_json))
-            wallet = Wallet.import_data(wallet_data)
-        elif mnemonic_phrase:
-            phrase = MnemonicSeedPhrase(mnemonic_phrase)
-            wallet = Wallet.import_wallet(phrase, network_id)
-        else:
-            wallet = Wallet.create(network_id=network_id)
-
-        values["wallet"] = wallet
         values["cdp_api_key_name"] = cdp_api_key_name
         values["cdp_api_key_private_key"] = cdp_api_key_private_key
         values["mnemonic_phrase"] = mnemonic_phrase
@@ -71,19 +112,214 @@ class CdpAgentkitWrapper(BaseModel):
             str: The json string of wallet data including the wallet_id and seed.
 
         """
-        wallet_data_dict = self.wallet.export_data().to_dict()
+        wallet = self.active_wallet
+        wallet_data_dict = wallet.export_data().to_dict()
 
-        wallet_data_dict["default_address_id"] = self.wallet.default_address.address_id
+        wallet_data_dict["default_address_id"] = wallet.default_address.address_id
 
         return json.dumps(wallet_data_dict)
 
+    @property
+    def active_wallet(self) -> "Wallet":
+        """The wallet tool calls use in this context: the current tenant's, or else `wallet`.
+
+        Raises:
+            KeyError: If the wallet pool has no wallet data for the current tenant.
+            ValueError: If there is no wallet to use.
+
+        """
+        tenant_id = current_tenant()
+        if tenant_id is not None:
+            self.use_own_clients()
+            if self.wallet_pool is None:
+                raise ValueError(f"Tenant {tenant_id} is set, but the wrapper has no wallet pool")
+            return self.wallet_pool.get(tenant_id)
+        wallet = self._load_wallet()
+        if wallet is None:
+            raise ValueError("No tenant is set to pick a wallet from the wallet pool")
+        return wallet
+
+    def _load_wallet(self) -> "Wallet | None":
+        """Get the wrapper's wallet, creating or importing it on first use.
+
+        Returns:
+            Wallet | None: The wallet, or None if the wrapper only serves the wallets of its pool.
+
+        """
+        if self.wallet is not None:
+            return self.wallet
+
+        from cdp import MnemonicSeedPhrase, Wallet, WalletData
+
+        with self._wallet_lock:
+            if self.wallet is not None:
+                return self.wallet
+            self.use_own_clients()
+            if self.cdp_wallet_data:
+                wallet_data = WalletData.from_dict(json.loads(self.cdp_wallet_data))
+                self.wallet = Wallet.import_data(wallet_data)
+            elif self.mnemonic_phrase:
+                phrase = MnemonicSeedPhrase(self.mnemonic_phrase)
+                self.wallet = Wallet.import_wallet(phrase, self.network_id)
+            elif self.wallet_pool is None:
+                self.wallet = Wallet.create(network_id=self.network_id)
+            # Otherwise every tool call uses the wallet of its tenant.
+            return self.wallet
+
+    def use_own_clients(self) -> None:
+        """Install the clients of the wrapper's API key as the CDP SDK's clients.
+
+        The SDK has one set of clients for the whole process, so a wrapper of another API key may
+        have installed its own since this one was built. Every action, and every wallet import,
+        installs the wrapper's clients again first, so its calls are made under its own key.
+        """
+        from cdp_agentkit_core.utils.cdp_client import configure_cdp
+
+        configure_cdp(
+            api_key_name=self.cdp_api_key_name,
+            private_key=self.cdp_api_key_private_key,
+            source=CDP_LANGCHAIN_DEFAULT_SOURCE,
+            source_version=__version__,
+        )
+
     def run_action(self, func: Callable[..., str], **kwargs) -> str:
         """Run a CDP Action."""
+        self.use_own_clients()
+        with submit_only(self.submit_only):
+            if self._requires_wallet(func):
+                return func(self.active_wallet, **kwargs)
+            else:
+                return func(**kwargs)
+
+    async def arun_action(self, afunc: Callable[..., Awaitable[str]], **kwargs) -> str:
+        """Run a CDP Action's async function.
+
+        Within a deadline, the action is cancelled if it overruns the deadline by more than
+        `DEADLINE_GRACE_SECONDS`, e.g. when a step cannot bound its own timeout.
+        """
+        self.use_own_clients()
+        with submit_only(self.submit_only):
+            if self._requires_wallet(afunc):
+                # Importing a tenant's wallet calls the CDP API.
+                wallet = await asyncio.to_thread(lambda: self.active_wallet)
+                action = afunc(wallet, **kwargs)
+            else:
+                action = afunc(**kwargs)
+
+            remaining = remaining_seconds()
+            if remaining is None:
+                return await action
+            try:
+                return await asyncio.wait_for(action, remaining + DEADLINE_GRACE_SECONDS)
+            except asyncio.TimeoutError:
+                return (
+                    "Error: the action did not finish by its deadline and was cancelled; "
+                    "check on any submitted transactions with get_transaction_status"
+                )
+
+    def action_timeout(self, name: str) -> float | None:
+        """Get the time a call of an action may take.
+
+        Args:
+            name: The action name.
+
+        Returns:
+            float | None: The timeout in seconds, or None if the action runs without a deadline.
+
+        """
+        return self.action_timeouts.get(name, self.default_action_timeout)
+
+    @contextmanager
+    def serialize_writes(self) -> Iterator[None]:
+        """Queue behind the other writes from the wallet's default address, and hold the queue.
+
+        Wrap write actions in this so concurrent tool calls, e.g. parallel tool calls in
+        LangGraph, cannot race transactions from the same address.
+
+        Raises:
+            DeadlineExceededError: If the current deadline passes while waiting in the queue.
+
+        """
+        address_id = self._write_address()
+        with self._write_queue(address_id) as queue:
+            if not queue.acquire(remaining_seconds()):
+                raise DeadlineExceededError(self._queue_timeout_message(address_id))
+            try:
+                yield
+            finally:
+                queue.release()
+
+    @asynccontextmanager
+    async def aserialize_writes(self) -> AsyncIterator[None]:
+        """Queue behind the other writes from the wallet's default address, without blocking.
+
+        Async version of `serialize_writes`; sync and async writes share the same queue.
+
+        Raises:
+            DeadlineExceededError: If the current deadline passes while waiting in the queue.
+
+        """
+        # Importing a tenant's wallet calls the CDP API.
+        address_id = await asyncio.to_thread(self._write_address)
+        with self._write_queue(address_id) as queue:
+            if not await queue.aacquire(remaining_seconds()):
+                raise DeadlineExceededError(self._queue_timeout_message(address_id))
+            try:
+                yield
+            finally:
+                queue.release()
+
+    @staticmethod
+    def _queue_timeout_message(address_id: str) -> str:
+        return f"Deadline exceeded while waiting for earlier writes from {address_id} to finish"
+
+    def _write_address(self) -> str:
+        """Get the sending address of writes: the active wallet's default address."""
+        return str(self.active_wallet.default_address.address_id).lower()
+
+    @contextmanager
+    def _write_queue(self, address_id: str) -> Iterator[FifoLock]:
+        """Use the write queue of an address, and drop it once no write holds or waits on it."""
+        with self._write_queues_lock:
+            queue = self._write_queues.setdefault(address_id, FifoLock())
+            self._write_queue_users[address_id] = self._write_queue_users.get(address_id, 0) + 1
+        try:
+            yield queue
+        finally:
+            with self._write_queues_lock:
+                self._write_queue_users[address_id] -= 1
+                if not self._write_queue_users[address_id]:
+                    del self._write_queue_users[address_id]
+                    del self._write_queues[address_id]
+
+    def wait_for_transactions(self, timeout: float | None = None) -> list[PendingTransaction]:
+        """Wait for the wallet's transactions submitted in submit-only mode to be resolved.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait until the confirmation
+                poller resolves every transaction.
+
+        Returns:
+            list[PendingTransaction]: The wallet's submitted transactions, oldest first.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        transactions = get_confirmation_poller().transactions(self.active_wallet.id)
+
+        for transaction in transactions:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not transaction.wait(remaining):
+                break
+
+        return transactions
+
+    @staticmethod
+    def _requires_wallet(func: Callable[..., Any]) -> bool:
+        """Check whether an action function takes the wallet as its first argument."""
         func_signature = inspect.signature(func)
 
         first_kwarg = next(iter(func_signature.parameters.values()), None)
 
-        if first_kwarg and first_kwarg.annotation is Wallet:
-            return func(self.wallet, **kwargs)
-        else:
-            return func(**kwargs)
+        # An action that takes the wallet has imported the SDK to annotate it.
+        cdp = sys.modules.get("cdp")
+        return cdp is not None and first_kwarg is not None and first_kwarg.annotation is cdp.Wallet
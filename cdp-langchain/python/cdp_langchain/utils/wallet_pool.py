@@ -0,0 +1,208 @@
+"""Pool of the wallets of many tenants, hydrated on demand."""
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    # The CDP SDK takes over a second to import, so it is only imported to import a wallet.
+    from cdp import Wallet, WalletData
+
+DEFAULT_WALLET_POOL_SIZE = 1000
+
+# Wallet data as exported by `CdpAgentkitWrapper.export_wallet` (a JSON string), its dict, or the
+# SDK's `WalletData`.
+WalletDataLike = Union["WalletData", dict[str, Any], str]
+
+_tenant: ContextVar[str | None] = ContextVar("cdp_langchain_tenant", default=None)
+
+
+@contextmanager
+def tenant(tenant_id: str | None) -> Iterator[None]:
+    """Run tool calls within this context with the wallet of a tenant.
+
+    Args:
+        tenant_id: The tenant whose wallet the tools use, e.g. the end user's ID.
+
+    """
+    token = _tenant.set(tenant_id)
+    try:
+        yield
+    finally:
+        _tenant.reset(token)
+
+
+def current_tenant() -> str | None:
+    """Get the tenant whose wallet tool calls use in this context, if any."""
+    return _tenant.get()
+
+
+def to_wallet_data(wallet_data: WalletDataLike) -> "WalletData":
+    """Convert exported wallet data to the SDK's `WalletData`.
+
+    Args:
+        wallet_data: The wallet data, as a `WalletData`, a dict or a JSON string.
+
+    Returns:
+        WalletData: The wallet data.
+
+    """
+    from cdp import WalletData
+
+    if isinstance(wallet_data, WalletData):
+        return wallet_data
+    if isinstance(wallet_data, str):
+        wallet_data = json.loads(wallet_data)
+    return WalletData.from_dict(wallet_data)
+
+
+class WalletPool:
+    """Wallets of many tenants, imported on first use and kept in a bounded LRU.
+
+    The wallet data of each tenant comes from `register`, or from `loader` for tenants that were
+    not registered, e.g. to read it from a database. A wallet is imported from its data the first
+    time a tenant needs it; the `max_size` most recently used wallets are kept, and the least
+    recently used one is evicted to make room for another.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], WalletDataLike | None] | None = None,
+        max_size: int = DEFAULT_WALLET_POOL_SIZE,
+    ) -> None:
+        """Create an empty pool.
+
+        Args:
+            loader: Looks up the wallet data of a tenant, returning None if it has none.
+            max_size: The maximum number of wallets kept imported.
+
+        Raises:
+            ValueError: If `max_size` is less than 1.
+
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.loader = loader
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._wallets: OrderedDict[str, Wallet] = OrderedDict()
+        self._wallet_data: dict[str, WalletDataLike] = {}
+        # One lock per tenant being imported, so concurrent calls import a wallet only once.
+        self._hydrating: dict[str, threading.Lock] = {}
+
+    def __len__(self) -> int:
+        """Count the wallets kept imported."""
+        with self._lock:
+            return len(self._wallets)
+
+    def __contains__(self, tenant_id: object) -> bool:
+        """Check whether the wallet of a tenant is imported."""
+        with self._lock:
+            return tenant_id in self._wallets
+
+    def register(self, tenant_id: str, wallet_data: WalletDataLike) -> None:
+        """Register the wallet data of a tenant, replacing any wallet it had.
+
+        Args:
+            tenant_id: The tenant.
+            wallet_data: The tenant's wallet data.
+
+        """
+        with self._lock:
+            self._wallet_data[tenant_id] = wallet_data
+            self._wallets.pop(tenant_id, None)
+
+    def add(self, tenant_id: str, wallet: "Wallet") -> None:
+        """Add an already imported wallet, e.g. one just created for a new tenant.
+
+        Args:
+            tenant_id: The tenant.
+            wallet: The tenant's wallet.
+
+        """
+        with self._lock:
+            self._insert(tenant_id, wallet)
+
+    def get(self, tenant_id: str) -> "Wallet":
+        """Get the wallet of a tenant, importing it if it is not in the pool.
+
+        Args:
+            tenant_id: The tenant.
+
+        Returns:
+            Wallet: The tenant's wallet.
+
+        Raises:
+            KeyError: If there is no wallet data for the tenant.
+
+        """
+        with self._lock:
+            wallet = self._lookup(tenant_id)
+            if wallet is not None:
+                return wallet
+            hydrating = self._hydrating.setdefault(tenant_id, threading.Lock())
+
+        try:
+            with hydrating:
+                with self._lock:
+                    # Another call may have imported it while we waited.
+                    wallet = self._lookup(tenant_id)
+                    if wallet is not None:
+                        return wallet
+                    registered = self._wallet_data.get(tenant_id)
+
+                wallet_data = registered
+                if wallet_data is None and self.loader is not None:
+                    wallet_data = self.loader(tenant_id)
+                if wallet_data is None:
+                    raise KeyError(f"No wallet data for tenant {tenant_id}")
+
+                from cdp import Wallet
+
+                wallet = Wallet.import_data(to_wallet_data(wallet_data))
+
+                with self._lock:
+                    self.misses += 1
+                    # A `register` during the import replaced the data this wallet came from.
+                    if self._wallet_data.get(tenant_id) is registered:
+                        self._insert(tenant_id, wallet)
+                return wallet
+        finally:
+            with self._lock:
+                if self._hydrating.get(tenant_id) is hydrating:
+                    del self._hydrating[tenant_id]
+
+    def evict(self, tenant_id: str) -> "Wallet | None":
+        """Drop the wallet of a tenant from the pool; it is imported again on its next use.
+
+        Args:
+            tenant_id: The tenant.
+
+        Returns:
+            Wallet | None: The evicted wallet, if it was in the pool.
+
+        """
+        with self._lock:
+            return self._wallets.pop(tenant_id, None)
+
+    def _lookup(self, tenant_id: str) -> "Wallet | None":
+        wallet = self._wallets.get(tenant_id)
+        if wallet is not None:
+            self._wallets.move_to_end(tenant_id)
+            self.hits += 1
+        return wallet
+
+    def _insert(self, tenant_id: str, wallet: "Wallet") -> None:
+        self._wallets[tenant_id] = wallet
+        self._wallets.move_to_end(tenant_id)
+        while len(self._wallets) > self.max_size:
+            self._wallets.popitem(last=False)
+            self.evictions += 1
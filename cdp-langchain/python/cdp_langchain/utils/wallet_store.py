@@ -0,0 +1,277 @@
+"""Persistent, encrypted storage of the wallet data of many tenants."""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from cdp_langchain.utils.wallet_pool import WalletDataLike, WalletPool
+
+
+def _wallet_data_json(wallet_data: WalletDataLike) -> tuple[str, str]:
+    """Get the wallet ID and JSON string of exported wallet data."""
+    if hasattr(wallet_data, "to_dict"):
+        # The SDK's `WalletData`.
+        wallet_data = wallet_data.to_dict()
+    elif isinstance(wallet_data, str):
+        wallet_data = json.loads(wallet_data)
+    wallet_id = wallet_data.get("wallet_id")
+    if not wallet_id:
+        raise ValueError("Wallet data has no wallet_id")
+    return wallet_id, json.dumps(wallet_data)
+
+
+class WalletStore(ABC):
+    """Storage of the wallet data of tenants, one wallet per tenant.
+
+    Wallet data is stored as exported by `CdpAgentkitWrapper.export_wallet`, and returned as that
+    JSON string, ready to pass as `cdp_wallet_data` or to `WalletPool.register`.
+    """
+
+    @abstractmethod
+    def get(self, tenant_id: str) -> str | None:
+        """Get the wallet data of a tenant.
+
+        Args:
+            tenant_id: The tenant.
+
+        Returns:
+            str | None: The wallet data, or None if the tenant has no wallet.
+
+        """
+
+    @abstractmethod
+    def get_by_wallet_id(self, wallet_id: str) -> tuple[str, str] | None:
+        """Get the tenant and wallet data of a wallet.
+
+        Args:
+            wallet_id: The wallet ID.
+
+        Returns:
+            tuple[str, str] | None: The tenant and wallet data, or None if the wallet is not stored.
+
+        """
+
+    @abstractmethod
+    def put_many(self, wallets: Mapping[str, WalletDataLike]) -> None:
+        """Store the wallet data of many tenants at once, replacing the wallets they had.
+
+        Args:
+            wallets: The wallet data, by tenant.
+
+        """
+
+    @abstractmethod
+    def load_many(self, tenant_ids: Iterable[str] | None = None) -> dict[str, str]:
+        """Get the wallet data of many tenants at once.
+
+        Args:
+            tenant_ids: The tenants, or None for every stored tenant.
+
+        Returns:
+            dict[str, str]: The wallet data, by tenant, of the tenants that have a wallet.
+
+        """
+
+    @abstractmethod
+    def delete(self, tenant_id: str) -> bool:
+        """Delete the wallet data of a tenant.
+
+        Args:
+            tenant_id: The tenant.
+
+        Returns:
+            bool: Whether the tenant had a wallet.
+
+        """
+
+    def put(self, tenant_id: str, wallet_data: WalletDataLike) -> None:
+        """Store the wallet data of a tenant, replacing the wallet it had.
+
+        Args:
+            tenant_id: The tenant.
+            wallet_data: The tenant's wallet data.
+
+        """
+        self.put_many({tenant_id: wallet_data})
+
+    def export_all(self) -> dict[str, str]:
+        """Get the wallet data of every stored tenant, e.g. to back it up or move it to another store.
+
+        Returns:
+            dict[str, str]: The wallet data, by tenant.
+
+        """
+        return self.load_many()
+
+    def register_all(self, pool: WalletPool, tenant_ids: Iterable[str] | None = None) -> int:
+        """Register stored wallet data with a wallet pool, e.g. when a process starts.
+
+        The wallets are imported by the pool when their tenants first need them.
+
+        Args:
+            pool: The wallet pool.
+            tenant_ids: The tenants to register, or None for every stored tenant.
+
+        Returns:
+            int: The number of tenants registered.
+
+        """
+        wallets = self.load_many(tenant_ids)
+        for tenant_id, wallet_data in wallets.items():
+            pool.register(tenant_id, wallet_data)
+        return len(wallets)
+
+
+class SqliteWalletStore(WalletStore):
+    """A `WalletStore` in a SQLite database, with the wallet data encrypted at rest.
+
+    Wallet data is encrypted with Fernet (AES-128-CBC with an HMAC-SHA256) under `key`; tenant
+    and wallet IDs are stored in the clear, and indexed, to look wallets up by either. Use
+    `generate_key` to make a key, and keep it outside the database, e.g. in a secret manager.
+    """
+
+    def __init__(self, path: str, key: str | bytes) -> None:
+        """Open the store, creating its database if need be.
+
+        Args:
+            path: The path of the SQLite database, or `:memory:`.
+            key: The URL-safe base64-encoded 32-byte Fernet key to encrypt wallet data with.
+
+        """
+        self._fernet = Fernet(key)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS wallets ("
+                "tenant_id TEXT PRIMARY KEY, "
+                "wallet_id TEXT NOT NULL, "
+                "wallet_data BLOB NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS wallets_wallet_id ON wallets (wallet_id)"
+            )
+
+    @staticmethod
+    def generate_key() -> str:
+        """Generate a new key to encrypt wallet data with."""
+        return Fernet.generate_key().decode()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, tenant_id: str) -> str | None:
+        """Get the wallet data of a tenant.
+
+        Args:
+            tenant_id: The tenant.
+
+        Returns:
+            str | None: The wallet data, or None if the tenant has no wallet.
+
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT wallet_data FROM wallets WHERE tenant_id = ?", (tenant_id,)
+            ).fetchone()
+        return None if row is None else self._decrypt(row[0])
+
+    def get_by_wallet_id(self, wallet_id: str) -> tuple[str, str] | None:
+        """Get the tenant and wallet data of a wallet.
+
+        Args:
+            wallet_id: The wallet ID.
+
+        Returns:
+            tuple[str, str] | None: The tenant and wallet data, or None if the wallet is not stored.
+
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT tenant_id, wallet_data FROM wallets WHERE wallet_id = ?", (wallet_id,)
+            ).fetchone()
+        return None if row is None else (row[0], self._decrypt(row[1]))
+
+    def put_many(self, wallets: Mapping[str, WalletDataLike]) -> None:
+        """Store the wallet data of many tenants in one transaction.
+
+        Args:
+            wallets: The wallet data, by tenant.
+
+        """
+        now = time.time()
+        rows = []
+        for tenant_id, wallet_data in wallets.items():
+            wallet_id, wallet_data_json = _wallet_data_json(wallet_data)
+            rows.append(
+                (tenant_id, wallet_id, self._fernet.encrypt(wallet_data_json.encode()), now)
+            )
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO wallets (tenant_id, wallet_id, wallet_data, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def load_many(self, tenant_ids: Iterable[str] | None = None) -> dict[str, str]:
+        """Get the wallet data of many tenants in one query.
+
+        Args:
+            tenant_ids: The tenants, or None for every stored tenant.
+
+        Returns:
+            dict[str, str]: The wallet data, by tenant, of the tenants that have a wallet.
+
+        """
+        with self._lock:
+            if tenant_ids is None:
+                rows = self._connection.execute(
+                    "SELECT tenant_id, wallet_data FROM wallets"
+                ).fetchall()
+            else:
+                # A temporary table keeps the query within SQLite's limit on bound parameters.
+                with self._connection:
+                    self._connection.execute(
+                        "CREATE TEMP TABLE IF NOT EXISTS wanted (tenant_id TEXT PRIMARY KEY)"
+                    )
+                    self._connection.execute("DELETE FROM wanted")
+                    self._connection.executemany(
+                        "INSERT OR IGNORE INTO wanted VALUES (?)",
+                        ((tenant_id,) for tenant_id in tenant_ids),
+                    )
+                    rows = self._connection.execute(
+                        "SELECT tenant_id, wallet_data FROM wallets JOIN wanted USING (tenant_id)"
+                    ).fetchall()
+        return {tenant_id: self._decrypt(wallet_data) for tenant_id, wallet_data in rows}
+
+    def delete(self, tenant_id: str) -> bool:
+        """Delete the wallet data of a tenant.
+
+        Args:
+            tenant_id: The tenant.
+
+        Returns:
+            bool: Whether the tenant had a wallet.
+
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM wallets WHERE tenant_id = ?", (tenant_id,)
+            )
+        return cursor.rowcount > 0
+
+    def _decrypt(self, token: bytes) -> str:
+        try:
+            return self._fernet.decrypt(token).decode()
+        except InvalidToken:
+            raise ValueError("Cannot decrypt wallet data; is the store's key right?") from None
@@ -0,0 +1,78 @@
+"""Tests for the CDP Toolkit."""
+
+import asyncio
+from unittest.mock import Mock
+
+from cdp_agentkit_core.actions import get_cdp_action_specs
+from cdp_langchain.agent_toolkits import CdpToolkit
+from cdp_langchain.utils import CdpAgentkitWrapper, current_tenant
+
+
+def test_from_cdp_agentkit_wrapper_uses_manifest():
+    """Test that the toolkit builds one tool per manifest entry."""
+    wrapper = Mock(spec=CdpAgentkitWrapper)
+    wrapper.action_timeout.return_value = None
+
+    tools = CdpToolkit.from_cdp_agentkit_wrapper(wrapper).get_tools()
+
+    specs = get_cdp_action_specs()
+    assert [tool.name for tool in tools] == [spec.name for spec in specs]
+    assert [tool.args_schema for tool in tools] == [spec.args_schema for spec in specs]
+    assert [tool.writes for tool in tools] == [spec.writes for spec in specs]
+    assert next(tool for tool in tools if tool.name == "transfer").writes
+    assert not next(tool for tool in tools if tool.name == "get_balance").writes
+
+
+def test_tool_invokes_lazy_action():
+    """Test that invoking a tool loads the action and runs it through the wrapper."""
+    wallet = Mock()
+    wallet.id = "test-wallet-id"
+    wallet.addresses = []
+    wrapper = Mock(spec=CdpAgentkitWrapper)
+    wrapper.action_timeout.return_value = None
+    wrapper.run_action.side_effect = lambda func, **kwargs: func(wallet, **kwargs)
+
+    tools = CdpToolkit.from_cdp_agentkit_wrapper(wrapper).get_tools()
+    tool = next(tool for tool in tools if tool.name == "get_balance")
+    result = tool.invoke({"asset_id": "eth"})
+
+    assert result == "Balances for wallet test-wallet-id:\n"
+
+
+def test_tool_ainvokes_lazy_action():
+    """Test that invoking a tool asynchronously runs the action's afunc through the wrapper."""
+    wallet = Mock()
+    wallet.id = "test-wallet-id"
+    wallet.network_id = "base-sepolia"
+    wallet.default_address.address_id = "0xdefaultAddress"
+
+    async def arun_action(afunc, **kwargs):
+        return await afunc(wallet, **kwargs)
+
+    wrapper = Mock(spec=CdpAgentkitWrapper)
+    wrapper.action_timeout.return_value = None
+    wrapper.arun_action.side_effect = arun_action
+
+    tools = CdpToolkit.from_cdp_agentkit_wrapper(wrapper).get_tools()
+    tool = next(tool for tool in tools if tool.name == "get_wallet_details")
+    result = asyncio.run(tool.ainvoke({}))
+
+    assert result == (
+        "Wallet: test-wallet-id on network: base-sepolia with default address: 0xdefaultAddress"
+    )
+    wrapper.run_action.assert_not_called()
+
+
+def test_shared_toolkit_resolves_wallet_per_run():
+    """Test that one toolkit without a wrapper serves sessions given their wrapper and tenant."""
+    wrapper = Mock(spec=CdpAgentkitWrapper)
+    wrapper.action_timeout.return_value = None
+    wrapper.run_action.side_effect = lambda func, **kwargs: f"{current_tenant()}: ok"
+
+    tools = CdpToolkit.from_cdp_agentkit_wrapper().get_tools()
+    tool = next(tool for tool in tools if tool.name == "get_wallet_details")
+
+    assert all(tool.cdp_agentkit_wrapper is None for tool in tools)
+    for tenant_id in ("alice", "bob"):
+        config = {"configurable": {"cdp_agentkit_wrapper": wrapper, "cdp_tenant_id": tenant_id}}
+        assert tool.invoke({}, config=config) == f"{tenant_id}: ok"
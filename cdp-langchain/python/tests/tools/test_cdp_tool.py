@@ -1,5 +1,7 @@
 """Tests for the CDP Tool."""
 
+import asyncio
+from contextlib import nullcontext
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -7,8 +9,9 @@ import pytest
 from langchain_core.callbacks import CallbackManager
 from pydantic import BaseModel
 
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, remaining_seconds
 from cdp_langchain.tools import CdpTool
-from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils import CdpAgentkitWrapper, current_tenant, tenant
 
 
 class TestArgsSchema(BaseModel):
@@ -22,6 +25,7 @@ def mock_cdp_agentkit_wrapper():
     """Fixture for mocked CDP Agentkit wrapper."""
     with patch("cdp_langchain.tools.cdp_tool.CdpAgentkitWrapper") as mock:
         cdp_agentkit_wrapper = Mock(spec=CdpAgentkitWrapper)
+        cdp_agentkit_wrapper.action_timeout.return_value = None
         mock.return_value = cdp_agentkit_wrapper
         yield cdp_agentkit_wrapper
 
@@ -131,3 +135,162 @@ def test_run_with_different_valid_inputs(cdp_tool_with_schema, input_data: dict[
         cdp_tool_with_schema.func, **input_data
     )
     assert result == "success"
+
+
+def test_run_with_json_schema(mock_cdp_agentkit_wrapper):
+    """Test running CDP Tool with a JSON schema args schema from the action manifest."""
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_action_with_json_schema",
+        description="Test CDP Tool",
+        args_schema=TestArgsSchema.model_json_schema(),
+        func=lambda x: x,
+    )
+    tool.cdp_agentkit_wrapper.run_action.return_value = "success"
+
+    result = tool._run(test_param="test")
+
+    tool.cdp_agentkit_wrapper.run_action.assert_called_once_with(tool.func, test_param="test")
+    assert result == "success"
+
+
+def test_arun_with_afunc(mock_cdp_agentkit_wrapper):
+    """Test running CDP Tool asynchronously with a native async function."""
+
+    async def afunc(test_param: str) -> str:
+        return test_param
+
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_action_with_afunc",
+        description="Test CDP Tool",
+        args_schema=TestArgsSchema,
+        func=lambda x: x,
+        afunc=afunc,
+    )
+    mock_cdp_agentkit_wrapper.arun_action.return_value = "async success"
+
+    result = asyncio.run(tool._arun(test_param="test"))
+
+    mock_cdp_agentkit_wrapper.arun_action.assert_awaited_once_with(afunc, test_param="test")
+    mock_cdp_agentkit_wrapper.run_action.assert_not_called()
+    assert result == "async success"
+
+
+def test_arun_without_afunc(cdp_tool_with_schema):
+    """Test running CDP Tool asynchronously falls back to the sync function."""
+    cdp_tool_with_schema.cdp_agentkit_wrapper.run_action.return_value = "success"
+
+    result = asyncio.run(cdp_tool_with_schema._arun(test_param="test"))
+
+    cdp_tool_with_schema.cdp_agentkit_wrapper.run_action.assert_called_once_with(
+        cdp_tool_with_schema.func, test_param="test"
+    )
+    assert result == "success"
+
+
+def test_run_write_action_is_serialized(mock_cdp_agentkit_wrapper):
+    """Test that write tools run inside the wrapper's per-address write queue."""
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_write_action",
+        description="Test CDP Tool",
+        args_schema=TestArgsSchema,
+        func=lambda x: x,
+        writes=True,
+    )
+    mock_cdp_agentkit_wrapper.serialize_writes.return_value = nullcontext()
+    mock_cdp_agentkit_wrapper.run_action.return_value = "success"
+
+    result = tool._run(test_param="test")
+
+    mock_cdp_agentkit_wrapper.serialize_writes.assert_called_once_with()
+    mock_cdp_agentkit_wrapper.run_action.assert_called_once_with(tool.func, test_param="test")
+    assert result == "success"
+
+
+def test_run_read_action_is_not_serialized(cdp_tool_with_schema):
+    """Test that read tools do not wait on the write queue."""
+    cdp_tool_with_schema._run(test_param="test")
+
+    cdp_tool_with_schema.cdp_agentkit_wrapper.serialize_writes.assert_not_called()
+
+
+def test_run_within_timeout(mock_cdp_agentkit_wrapper):
+    """Test that a tool's timeout becomes the deadline of the action it runs."""
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_action",
+        description="Test CDP Tool",
+        func=lambda x: x,
+        timeout_seconds=30,
+    )
+    mock_cdp_agentkit_wrapper.run_action.side_effect = lambda func, **kwargs: remaining_seconds()
+
+    assert 0 < tool._run() <= 30
+    assert remaining_seconds() is None
+
+
+def test_run_within_timeout_of_wrapper_from_config(mock_cdp_agentkit_wrapper):
+    """Test that a call takes its deadline from the wrapper given in its config."""
+    tool = CdpTool(name="test_action", description="Test CDP Tool", func=lambda x: x)
+    mock_cdp_agentkit_wrapper.action_timeout.return_value = 30
+    mock_cdp_agentkit_wrapper.run_action.side_effect = lambda func, **kwargs: remaining_seconds()
+    config = {"configurable": {"cdp_agentkit_wrapper": mock_cdp_agentkit_wrapper}}
+
+    assert 0 < tool.invoke({"instructions": ""}, config=config) <= 30
+    mock_cdp_agentkit_wrapper.action_timeout.assert_called_with("test_action")
+    assert remaining_seconds() is None
+
+
+def test_run_write_action_past_deadline(mock_cdp_agentkit_wrapper):
+    """Test that a write that runs out of time in the write queue returns an error."""
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_write_action",
+        description="Test CDP Tool",
+        args_schema=TestArgsSchema,
+        func=lambda x: x,
+        writes=True,
+        timeout_seconds=1,
+    )
+    mock_cdp_agentkit_wrapper.serialize_writes.side_effect = DeadlineExceededError(
+        "Deadline exceeded while waiting for earlier writes"
+    )
+
+    result = tool._run(test_param="test")
+
+    assert result == "Error: Deadline exceeded while waiting for earlier writes"
+    mock_cdp_agentkit_wrapper.run_action.assert_not_called()
+
+
+def test_run_with_wrapper_and_tenant_from_config(mock_cdp_agentkit_wrapper):
+    """Test that a call runs with the wrapper and tenant given in its config."""
+    tool = CdpTool(name="test_action", description="Test CDP Tool", func=lambda x: x)
+    mock_cdp_agentkit_wrapper.run_action.side_effect = lambda func, **kwargs: current_tenant()
+    config = {
+        "configurable": {
+            "cdp_agentkit_wrapper": mock_cdp_agentkit_wrapper,
+            "cdp_tenant_id": "alice",
+        }
+    }
+
+    assert tool.invoke({"instructions": ""}, config=config) == "alice"
+    assert asyncio.run(tool.ainvoke({"instructions": ""}, config=config)) == "alice"
+    assert current_tenant() is None
+
+
+def test_run_keeps_current_tenant_without_config(cdp_tool):
+    """Test that a call without a tenant in its config uses the current tenant."""
+    cdp_tool.cdp_agentkit_wrapper.run_action.side_effect = lambda func, **kwargs: current_tenant()
+
+    with tenant("bob"):
+        assert cdp_tool.invoke({"instructions": ""}) == "bob"
+
+
+def test_run_without_wrapper():
+    """Test that a call fails when neither the tool nor its config gives a wrapper."""
+    tool = CdpTool(name="test_action", description="Test CDP Tool", func=lambda x: x)
+
+    with pytest.raises(ValueError, match="No CdpAgentkitWrapper for tool test_action"):
+        tool._run(instructions="")
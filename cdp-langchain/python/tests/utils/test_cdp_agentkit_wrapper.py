@@ -1,23 +1,32 @@
 """Tests for the CDP Agentkit Wrapper."""
 
+import asyncio
 import json
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 from pydantic import ValidationError
 
 from cdp import Cdp, Wallet, WalletData
+from cdp.api_clients import ApiClients
+from cdp_agentkit_core.utils.confirmation_poller import (
+    COMPLETE,
+    get_confirmation_poller,
+    is_submit_only,
+)
+from cdp_agentkit_core.utils.deadline import DeadlineExceededError, deadline
 from cdp_langchain import __version__
 from cdp_langchain.constants import CDP_LANGCHAIN_DEFAULT_SOURCE
-from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils import CdpAgentkitWrapper, WalletPool, tenant
 
 
 @pytest.fixture
 def mock_cdp_configure():
     """Fixture for mocked CDP SDK."""
-    with patch("cdp.Cdp.configure") as mock_cdp:
-        mock_cdp_instance = Mock(spec=Cdp)
-        mock_cdp.return_value = mock_cdp_instance
+    with patch("cdp_agentkit_core.utils.cdp_client.configure_cdp") as mock_cdp:
+        mock_cdp.return_value = Mock(spec=ApiClients)
         yield mock_cdp
 
 
@@ -70,7 +79,6 @@ def test_initialization_with_env_vars(
     assert wrapper.cdp_api_key_name == env_vars["CDP_API_KEY_NAME"]
     assert wrapper.cdp_api_key_private_key == env_vars["CDP_API_KEY_PRIVATE_KEY"]
     assert wrapper.network_id == env_vars["NETWORK_ID"]
-    assert wrapper.wallet is not None
 
     mock_cdp_configure.assert_called_once_with(
         api_key_name=env_vars["CDP_API_KEY_NAME"],
@@ -79,6 +87,9 @@ def test_initialization_with_env_vars(
         source_version=__version__,
     )
 
+    # The wallet is created or imported when first needed.
+    mock_wallet_create.assert_not_called()
+    assert wrapper.active_wallet is mock_wallet_create.return_value
     mock_wallet_create.assert_called_once_with(network_id=env_vars["NETWORK_ID"])
 
 
@@ -103,6 +114,9 @@ def test_initialization_with_direct_values(mock_cdp_configure: Mock, mock_wallet
         source_version=__version__,
     )
 
+    # The wallet is created or imported when first needed.
+    mock_wallet_create.assert_not_called()
+    assert wrapper.active_wallet is mock_wallet_create.return_value
     mock_wallet_create.assert_called_once_with(network_id=test_values["network_id"])
 
 
@@ -133,6 +147,9 @@ def test_initialization_with_direct_values_and_persisted_wallet(
         source_version=__version__,
     )
 
+    # The wallet is created or imported when first needed.
+    mock_wallet_import_data.assert_not_called()
+    assert wrapper.active_wallet is mock_wallet_import_data.return_value
     mock_wallet_import_data.assert_called_once()
 
 
@@ -161,9 +178,67 @@ def test_initialization_with_direct_values_and_mnemonic_phrase(
         source_version=__version__,
     )
 
+    # The wallet is created or imported when first needed.
+    mock_wallet_import_wallet.assert_not_called()
+    assert wrapper.active_wallet is mock_wallet_import_wallet.return_value
     mock_wallet_import_wallet.assert_called_once()
 
 
+def test_wallet_is_created_only_for_actions_that_need_it(
+    env_vars: dict[str, str], mock_cdp_configure: Mock, mock_wallet_create: Mock
+):
+    """Test that actions without a wallet never create one, and the others create it once."""
+
+    def echo(message: str):
+        return message
+
+    async def aecho(message: str):
+        return message
+
+    def wallet_id(wallet: Wallet):
+        return wallet.id
+
+    wrapper = CdpAgentkitWrapper()
+
+    assert wrapper.run_action(echo, message="hello") == "hello"
+    assert asyncio.run(wrapper.arun_action(aecho, message="hello")) == "hello"
+    mock_wallet_create.assert_not_called()
+
+    threads = [threading.Thread(target=wrapper.run_action, args=(wallet_id,)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    mock_wallet_create.assert_called_once_with(network_id=env_vars["NETWORK_ID"])
+    assert wrapper.wallet is mock_wallet_create.return_value
+
+
+def test_wrappers_of_different_api_keys_use_their_own_clients():
+    """Test that each wrapper makes its SDK calls under its own API key, whichever was built last."""
+
+    def api_key_name():
+        return Cdp.api_key_name
+
+    async def aapi_key_name():
+        return Cdp.api_key_name
+
+    api_clients = Cdp.api_clients
+    try:
+        wrapper_a = CdpAgentkitWrapper(cdp_api_key_name="key-a", cdp_api_key_private_key="a")
+        wrapper_b = CdpAgentkitWrapper(cdp_api_key_name="key-b", cdp_api_key_private_key="b")
+
+        with patch("cdp.Wallet.create", side_effect=lambda network_id: Cdp.api_key_name):
+            assert wrapper_a._load_wallet() == "key-a"
+            assert wrapper_b._load_wallet() == "key-b"
+
+        assert wrapper_a.run_action(api_key_name) == "key-a"
+        assert wrapper_b.run_action(api_key_name) == "key-b"
+        assert asyncio.run(wrapper_a.arun_action(aapi_key_name)) == "key-a"
+    finally:
+        Cdp.api_clients = api_clients
+
+
 def test_missing_environment_variables(monkeypatch: pytest.MonkeyPatch):
     """Test initialization with missing environment variables."""
     # Clear environment variables
@@ -205,6 +280,234 @@ def test_run_action_valid_modes(
     assert result is True
 
 
+def test_arun_action_valid_modes(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test async run method with and without a wallet argument."""
+
+    async def is_wallet_valid(wallet: Wallet):
+        return wallet is not None
+
+    async def echo(message: str):
+        return message
+
+    wrapper = CdpAgentkitWrapper()
+
+    assert asyncio.run(wrapper.arun_action(is_wallet_valid)) is True
+    assert asyncio.run(wrapper.arun_action(echo, message="hello")) == "hello"
+
+
+def test_run_action_submit_only(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that actions run in submit-only mode when the wrapper is configured for it."""
+
+    def mode(wallet: Wallet):
+        return is_submit_only()
+
+    async def amode(wallet: Wallet):
+        return is_submit_only()
+
+    assert CdpAgentkitWrapper().run_action(mode) is False
+
+    wrapper = CdpAgentkitWrapper(submit_only=True)
+
+    assert wrapper.run_action(mode) is True
+    assert asyncio.run(wrapper.arun_action(amode)) is True
+    assert is_submit_only() is False
+
+
+def test_serialize_writes_orders_writes_and_keeps_reads_parallel(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that writes from one address run one at a time, in order, while reads do not wait."""
+    wrapper = CdpAgentkitWrapper()
+    wrapper.active_wallet.default_address.address_id = "0xAddress"
+    events = []
+
+    def read(wallet: Wallet):
+        return "read"
+
+    def write(index: int):
+        with wrapper.serialize_writes():
+            events.append(("start", index))
+            time.sleep(0.01)
+            events.append(("end", index))
+
+    with wrapper.serialize_writes():
+        threads = []
+        for index in range(3):
+            threads.append(threading.Thread(target=write, args=(index,)))
+            threads[-1].start()
+            while wrapper._write_queues["0xaddress"].waiting != index + 2:
+                time.sleep(0.001)
+
+        # Reads never touch the queue, so they run while a write holds it.
+        assert wrapper.run_action(read) == "read"
+        assert events == []
+
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert events == [(kind, index) for index in range(3) for kind in ("start", "end")]
+    # Idle queues are dropped.
+    assert wrapper._write_queues == {}
+
+
+def test_aserialize_writes_shares_the_queue(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that async writes wait behind sync writes from the same address."""
+    wrapper = CdpAgentkitWrapper()
+    wrapper.active_wallet.default_address.address_id = "0xAddress"
+    events = []
+
+    async def awrite():
+        async with wrapper.aserialize_writes():
+            events.append("async write")
+
+    async def run():
+        with wrapper.serialize_writes():
+            task = asyncio.create_task(awrite())
+            await asyncio.sleep(0.01)
+            events.append("sync write")
+        await task
+
+    asyncio.run(run())
+
+    assert events == ["sync write", "async write"]
+
+
+def test_action_timeout(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that per-action timeouts override the default timeout."""
+    wrapper = CdpAgentkitWrapper(action_timeouts={"transfer": 60}, default_action_timeout=30)
+
+    assert wrapper.action_timeout("transfer") == 60
+    assert wrapper.action_timeout("get_balance") == 30
+    assert CdpAgentkitWrapper().action_timeout("transfer") is None
+
+
+def test_serialize_writes_within_deadline(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that a write gives up its place in the queue once its deadline passes."""
+    wrapper = CdpAgentkitWrapper()
+    wrapper.active_wallet.default_address.address_id = "0xAddress"
+
+    async def awrite():
+        async with wrapper.aserialize_writes():
+            pass
+
+    with wrapper.serialize_writes():
+        with deadline(0.01), pytest.raises(DeadlineExceededError), wrapper.serialize_writes():
+            pass
+        with deadline(0.01), pytest.raises(DeadlineExceededError):
+            asyncio.run(awrite())
+
+    with deadline(1), wrapper.serialize_writes():
+        assert wrapper._write_queues["0xaddress"].waiting == 1
+    assert wrapper._write_queues == {}
+
+
+def test_arun_action_cancelled_past_deadline(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that an async action that overruns its deadline is cancelled."""
+    wrapper = CdpAgentkitWrapper()
+
+    async def stuck():
+        await asyncio.sleep(60)
+
+    async def run():
+        with deadline(0):
+            return await wrapper.arun_action(stuck)
+
+    with patch("cdp_langchain.utils.cdp_agentkit_wrapper.DEADLINE_GRACE_SECONDS", 0.01):
+        result = asyncio.run(run())
+
+    assert result.startswith("Error: the action did not finish by its deadline")
+
+
+def test_wait_for_transactions(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test waiting for the wallet's pipelined transactions to be confirmed together."""
+    wrapper = CdpAgentkitWrapper(submit_only=True)
+    wrapper.active_wallet.id = "test-wallet-id"
+
+    invocations = [Mock(wallet_id="test-wallet-id", status="complete") for _ in range(3)]
+    poller = get_confirmation_poller()
+    with patch.object(poller, "interval_seconds", 0):
+        handles = [poller.track(invocation, "write") for invocation in invocations]
+
+        transactions = wrapper.wait_for_transactions(timeout=5)
+
+    assert transactions[-3:] == handles
+    assert all(handle.status == COMPLETE for handle in handles)
+
+
+def test_wallet_pool_resolves_wallet_per_tenant(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that tool calls within a tenant context use that tenant's wallet from the pool."""
+    wallets = {"alice": Mock(spec=Wallet), "bob": Mock(spec=Wallet)}
+    pool = WalletPool()
+    for tenant_id, wallet in wallets.items():
+        pool.add(tenant_id, wallet)
+
+    wrapper = CdpAgentkitWrapper(wallet_pool=pool)
+
+    def which(wallet: Wallet):
+        return wallet
+
+    async def awhich(wallet: Wallet):
+        return wallet
+
+    mock_wallet_create.assert_not_called()
+    assert wrapper.wallet is None
+
+    with tenant("alice"):
+        assert wrapper.run_action(which) is wallets["alice"]
+    with tenant("bob"):
+        assert asyncio.run(wrapper.arun_action(awhich)) is wallets["bob"]
+
+    with pytest.raises(ValueError, match="No tenant is set"):
+        wrapper.run_action(which)
+
+
+def test_tenant_without_wallet_pool(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that a tenant context is an error for a wrapper without a wallet pool."""
+    wrapper = CdpAgentkitWrapper()
+
+    assert wrapper.active_wallet is wrapper.wallet
+    with tenant("alice"), pytest.raises(ValueError, match="has no wallet pool"):
+        wrapper.active_wallet  # noqa: B018
+
+
 def test_cdp_configuration_error(
     env_vars: dict[str, str], mock_cdp_configure: Mock, mock_wallet_create: Mock
 ):
@@ -0,0 +1,168 @@
+"""Tests for the wallet pool."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cdp import Wallet, WalletData
+from cdp_langchain.utils import WalletPool, current_tenant, tenant
+
+MOCK_WALLET_DATA = {"wallet_id": "test-wallet-id", "seed": "test-seed"}
+
+
+@pytest.fixture
+def mock_wallet_import_data():
+    """Fixture for mocked CDP SDK Wallet import data, returning a new wallet per import."""
+    with patch("cdp.Wallet.import_data") as mock_import_data:
+        mock_import_data.side_effect = lambda wallet_data: Mock(
+            spec=Wallet, id=wallet_data.wallet_id
+        )
+        yield mock_import_data
+
+
+def test_tenant_context():
+    """Test that the tenant is only set within its context, and nested contexts restore it."""
+    assert current_tenant() is None
+
+    with tenant("alice"):
+        assert current_tenant() == "alice"
+        with tenant("bob"):
+            assert current_tenant() == "bob"
+        assert current_tenant() == "alice"
+
+    assert current_tenant() is None
+
+
+def test_get_imports_registered_wallet_once(mock_wallet_import_data: Mock):
+    """Test that a registered wallet is imported on first use and then served from the pool."""
+    pool = WalletPool()
+    pool.register("alice", MOCK_WALLET_DATA)
+
+    assert "alice" not in pool
+
+    wallet = pool.get("alice")
+
+    assert pool.get("alice") is wallet
+    assert wallet.id == "test-wallet-id"
+    assert (pool.hits, pool.misses) == (1, 1)
+    mock_wallet_import_data.assert_called_once()
+    assert isinstance(mock_wallet_import_data.call_args.args[0], WalletData)
+
+
+def test_get_with_loader(mock_wallet_import_data: Mock):
+    """Test that the wallet data of unregistered tenants comes from the loader."""
+    loader = Mock(side_effect=lambda tenant_id: {"wallet_id": f"w-{tenant_id}", "seed": "s"})
+    pool = WalletPool(loader=loader)
+
+    assert pool.get("alice").id == "w-alice"
+    loader.assert_called_once_with("alice")
+
+
+def test_get_without_wallet_data(mock_wallet_import_data: Mock):
+    """Test that getting the wallet of an unknown tenant fails."""
+    pool = WalletPool(loader=lambda tenant_id: None)
+
+    with pytest.raises(KeyError, match="No wallet data for tenant alice"):
+        pool.get("alice")
+
+    mock_wallet_import_data.assert_not_called()
+    assert not pool._hydrating
+
+
+def test_least_recently_used_wallet_is_evicted(mock_wallet_import_data: Mock):
+    """Test that the pool keeps at most `max_size` wallets, evicting the least recently used."""
+    pool = WalletPool(max_size=2)
+    for tenant_id in ("alice", "bob", "carol"):
+        pool.register(tenant_id, {"wallet_id": tenant_id, "seed": "s"})
+
+    pool.get("alice")
+    pool.get("bob")
+    pool.get("alice")
+    pool.get("carol")
+
+    assert len(pool) == 2
+    assert "alice" in pool
+    assert "bob" not in pool
+    assert pool.evictions == 1
+
+    pool.get("bob")
+
+    assert mock_wallet_import_data.call_count == 4
+
+
+def test_register_and_evict_drop_imported_wallet(mock_wallet_import_data: Mock):
+    """Test that re-registering or evicting a tenant makes its next use import the wallet again."""
+    pool = WalletPool()
+    pool.register("alice", MOCK_WALLET_DATA)
+    wallet = pool.get("alice")
+
+    assert pool.evict("alice") is wallet
+    assert pool.evict("alice") is None
+
+    pool.get("alice")
+    pool.register("alice", {"wallet_id": "new-wallet-id", "seed": "s"})
+
+    assert pool.get("alice").id == "new-wallet-id"
+    assert mock_wallet_import_data.call_count == 3
+
+
+def test_add_wallet(mock_wallet_import_data: Mock):
+    """Test that an added wallet is served without importing it."""
+    pool = WalletPool()
+    wallet = Mock(spec=Wallet)
+    pool.add("alice", wallet)
+
+    assert pool.get("alice") is wallet
+    mock_wallet_import_data.assert_not_called()
+
+
+def test_concurrent_gets_import_once(mock_wallet_import_data: Mock):
+    """Test that concurrent first uses of a tenant's wallet import it only once."""
+
+    def slow_import(wallet_data):
+        time.sleep(0.02)
+        return Mock(spec=Wallet)
+
+    mock_wallet_import_data.side_effect = slow_import
+    pool = WalletPool()
+    pool.register("alice", MOCK_WALLET_DATA)
+    wallets = []
+
+    threads = [threading.Thread(target=lambda: wallets.append(pool.get("alice"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(wallets) == 5
+    assert all(wallet is wallets[0] for wallet in wallets)
+    mock_wallet_import_data.assert_called_once()
+
+
+def test_register_during_import_wins(mock_wallet_import_data: Mock):
+    """Test that a wallet imported from data replaced during the import is not kept."""
+    pool = WalletPool()
+    pool.register("alice", MOCK_WALLET_DATA)
+
+    def import_while_registering(wallet_data):
+        pool.register("alice", {"wallet_id": "new-wallet-id", "seed": "s"})
+        return Mock(spec=Wallet, id=wallet_data.wallet_id)
+
+    mock_wallet_import_data.side_effect = import_while_registering
+
+    assert pool.get("alice").id == "test-wallet-id"
+    assert "alice" not in pool
+
+    mock_wallet_import_data.side_effect = lambda wallet_data: Mock(
+        spec=Wallet, id=wallet_data.wallet_id
+    )
+
+    assert pool.get("alice").id == "new-wallet-id"
+
+
+def test_invalid_max_size():
+    """Test that the pool must hold at least one wallet."""
+    with pytest.raises(ValueError, match="max_size must be at least 1"):
+        WalletPool(max_size=0)
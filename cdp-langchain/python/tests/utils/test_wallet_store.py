@@ -0,0 +1,119 @@
+"""Tests for the wallet store."""
+
+import json
+import sqlite3
+import subprocess
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from cdp import WalletData
+from cdp_langchain.utils import SqliteWalletStore, WalletPool
+
+
+def _wallet_data(wallet_id: str) -> str:
+    return json.dumps(
+        {"wallet_id": wallet_id, "seed": f"seed-{wallet_id}", "default_address_id": "0x123"}
+    )
+
+
+def test_toolkit_import_does_not_import_cryptography():
+    """Test that importing the toolkit and utilities only imports cryptography for the store."""
+    code = (
+        "import sys\n"
+        "import cdp_langchain.agent_toolkits, cdp_langchain.utils\n"
+        "assert 'cryptography' not in sys.modules\n"
+        "from cdp_langchain.utils import SqliteWalletStore\n"
+        "assert 'cryptography' in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fixture for a wallet store in a temporary database."""
+    store = SqliteWalletStore(str(tmp_path / "wallets.db"), SqliteWalletStore.generate_key())
+    yield store
+    store.close()
+
+
+def test_put_and_get(store: SqliteWalletStore):
+    """Test that wallet data is returned as stored, by tenant and by wallet ID."""
+    store.put("alice", _wallet_data("wallet-1"))
+
+    assert store.get("alice") == _wallet_data("wallet-1")
+    assert store.get_by_wallet_id("wallet-1") == ("alice", _wallet_data("wallet-1"))
+    assert store.get("bob") is None
+    assert store.get_by_wallet_id("wallet-2") is None
+
+
+def test_put_accepts_wallet_data_forms(store: SqliteWalletStore):
+    """Test that wallet data can be stored as a dict or a WalletData."""
+    store.put("alice", {"wallet_id": "wallet-1", "seed": "seed"})
+    store.put("bob", WalletData(wallet_id="wallet-2", seed="seed"))
+
+    assert json.loads(store.get("alice"))["wallet_id"] == "wallet-1"
+    assert json.loads(store.get("bob"))["wallet_id"] == "wallet-2"
+
+    with pytest.raises(ValueError, match="no wallet_id"):
+        store.put("carol", {"seed": "seed"})
+
+
+def test_wallet_data_is_encrypted_at_rest(tmp_path):
+    """Test that the database holds no plaintext seed, and another key cannot read it."""
+    path = str(tmp_path / "wallets.db")
+    store = SqliteWalletStore(path, SqliteWalletStore.generate_key())
+    store.put("alice", _wallet_data("wallet-1"))
+    store.close()
+
+    with open(path, "rb") as f:
+        assert b"seed-wallet-1" not in f.read()
+    connection = sqlite3.connect(path)
+    (wallet_data,) = connection.execute("SELECT wallet_data FROM wallets").fetchone()
+    connection.close()
+    assert b"seed-wallet-1" not in wallet_data
+
+    other = SqliteWalletStore(path, SqliteWalletStore.generate_key())
+    with pytest.raises(ValueError, match="Cannot decrypt wallet data"):
+        other.get("alice")
+    other.close()
+
+
+def test_bulk_put_load_and_export(store: SqliteWalletStore):
+    """Test storing and loading the wallet data of many tenants at once."""
+    wallets = {f"tenant-{i}": _wallet_data(f"wallet-{i}") for i in range(2000)}
+    store.put_many(wallets)
+
+    assert store.export_all() == wallets
+    assert store.load_many(["tenant-1", "tenant-1999", "unknown"]) == {
+        "tenant-1": wallets["tenant-1"],
+        "tenant-1999": wallets["tenant-1999"],
+    }
+    assert store.load_many(f"tenant-{i}" for i in range(1500)) == {
+        f"tenant-{i}": wallets[f"tenant-{i}"] for i in range(1500)
+    }
+
+
+def test_put_replaces_and_delete(store: SqliteWalletStore):
+    """Test that a tenant has one wallet, which can be replaced and deleted."""
+    store.put("alice", _wallet_data("wallet-1"))
+    store.put("alice", _wallet_data("wallet-2"))
+
+    assert store.get("alice") == _wallet_data("wallet-2")
+    assert store.get_by_wallet_id("wallet-1") is None
+
+    assert store.delete("alice") is True
+    assert store.delete("alice") is False
+    assert store.get("alice") is None
+
+
+def test_register_all(store: SqliteWalletStore):
+    """Test that stored wallet data is registered with a wallet pool."""
+    store.put_many({"alice": _wallet_data("wallet-1"), "bob": _wallet_data("wallet-2")})
+    pool = Mock(spec=WalletPool)
+
+    assert store.register_all(pool) == 2
+    pool.register.assert_any_call("alice", _wallet_data("wallet-1"))
+    pool.register.assert_any_call("bob", _wallet_data("wallet-2"))